@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+analysis_dag.py — Declared analysis nodes + on-disk result cache for doge_analysis.py
+
+Every analysis is a Node naming its inputs: data sources ("spending",
+"taxonomy", "budgets", ...) and the outputs of other nodes. A node's cache key
+is a sha256 over its code digest and the keys of everything it reads, so
+editing one detector, or one council's spending.json, invalidates only that
+node (for that council) and the nodes downstream of it. Everything else is
+unpickled from the cache instead of recomputed.
+
+Per-council nodes (per_council=True) are keyed and cached per council and
+called with a one-council {council_id: records} dict; cross-council nodes get
+the full inputs.
+
+Cache layout (data/.analysis_cache/):
+    {node}/{council_id}-{key[:16]}.pickle   per-council nodes
+    {node}/_all-{key[:16]}.pickle           cross-council nodes
+
+Usage:
+    from analysis_dag import Node, run_nodes
+    results = run_nodes(NODES, councils, value_of, source_keys, enabled, cache_dir, compute_per_council)
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import types
+from collections import namedtuple
+from pathlib import Path
+
+# Bump to invalidate every cached result (e.g. after changing the pickle layout)
+CACHE_VERSION = 1
+
+# name: result key; fn: callable; inputs: names passed positionally to fn
+# (data sources or other nodes); extra: data sources that affect the result
+# but are read by fn itself (e.g. procurement.json); option: --analysis name
+# gating the node (None = always runs); header: banner printed when computed.
+Node = namedtuple("Node", "name fn inputs extra per_council option header")
+
+_code_digests = {}
+
+
+def file_digest(path):
+    """sha256 of a file's bytes ("-" when it doesn't exist)."""
+    path = Path(path)
+    if not path.exists():
+        return "-"
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _hash(*parts):
+    h = hashlib.sha256()
+    for p in parts:
+        h.update(str(p).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _is_local_module(obj, root):
+    path = getattr(obj, "__file__", None)
+    return bool(path) and os.path.dirname(os.path.abspath(path)) == root
+
+
+def _stable_repr(value):
+    if isinstance(value, (set, frozenset)):
+        return repr(sorted(value, key=repr))
+    return repr(value)
+
+
+def code_digest(fn):
+    """sha256 over fn's source plus everything it reaches by global name:
+    functions defined in this script directory (recursively), local modules
+    such as benford (whole file) and module-level constants. Editing a helper
+    therefore invalidates every node that calls it."""
+    if fn in _code_digests:
+        return _code_digests[fn]
+    root = os.path.dirname(os.path.abspath(inspect.getsourcefile(fn)))
+    parts, seen, stack = [str(CACHE_VERSION)], set(), [fn]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        try:
+            parts.append(inspect.getsource(obj))
+        except (OSError, TypeError):
+            parts.append(repr(obj))
+        if inspect.ismodule(obj):
+            continue
+        codes, names = [obj.__code__], set()
+        while codes:
+            code = codes.pop()
+            names.update(code.co_names)
+            codes.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+        for name in sorted(names):
+            if name not in obj.__globals__:
+                continue
+            ref = obj.__globals__[name]
+            if inspect.isfunction(ref) and _is_local_module(inspect.getmodule(ref), root):
+                stack.append(ref)
+            elif inspect.ismodule(ref):
+                if _is_local_module(ref, root):
+                    stack.append(ref)
+            elif not callable(ref) and not name.startswith("__"):
+                parts.append(f"{name}={_stable_repr(ref)}")
+    digest = _hash(*parts)
+    _code_digests[fn] = digest
+    return digest
+
+
+def _source_key(source_keys, name, council_id=None):
+    """Key for a data source, for one council or (council_id=None) for all."""
+    value = source_keys[name]
+    if isinstance(value, dict):
+        if council_id is not None:
+            return value.get(council_id, "-")
+        return _hash(*sorted(value.items()))
+    return value
+
+
+def _cache_path(cache_dir, node, scope, key):
+    return Path(cache_dir) / node / f"{scope}-{key[:16]}.pickle"
+
+
+def _cache_load(cache_dir, node, scope, key):
+    """(True, value) on a hit, (False, None) on a miss or unreadable entry."""
+    if not cache_dir:
+        return False, None
+    path = _cache_path(cache_dir, node, scope, key)
+    try:
+        with open(path, "rb") as f:
+            stored_key, value = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return False, None
+    return (stored_key == key), value
+
+
+def _cache_store(cache_dir, node, scope, key, value):
+    """Pickle value atomically and drop older entries for the same node/scope."""
+    if not cache_dir:
+        return
+    path = _cache_path(cache_dir, node, scope, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        print(f"  cache: {node}/{scope} not cacheable ({e})")
+        tmp.unlink(missing_ok=True)
+        return
+    os.replace(tmp, path)
+    for old in path.parent.glob(f"{scope}-*.pickle"):
+        if old != path:
+            old.unlink(missing_ok=True)
+
+
+def run_nodes(nodes, councils, value_of, source_keys, enabled, cache_dir, compute_per_council):
+    """Evaluate nodes in declaration order (must be topological), using the cache.
+
+    value_of:    callable(source name) → data passed to node functions (only
+                 called when a cross-council node actually has to run)
+    source_keys: data source → digest, or {council_id: digest} for per-council sources
+    enabled:     callable(node) → False to skip a node (its result is {})
+    cache_dir:   cache root, or None to recompute everything
+    compute_per_council: callable({node name: [council_id, ...]}) →
+                 {node name: {council_id: result}} for the per-council cache misses
+
+    Returns {node name: result}, per-council results as {council_id: result}
+    in `councils` order (councils with no result are omitted, as before).
+    """
+    results, keys = {}, {}
+    per_council_keys = {}
+    missing = {}
+    found = {}
+
+    # ── Per-council nodes: look up each (node, council) pair ──
+    for node in nodes:
+        if not node.per_council:
+            continue
+        if not enabled(node):
+            keys[node.name] = _hash("off", node.name)
+            continue
+        code = code_digest(node.fn)
+        council_keys, hits = {}, {}
+        for c in councils:
+            k = _hash(node.name, code, *(_source_key(source_keys, s, c) for s in node.inputs + node.extra))
+            council_keys[c] = k
+            hit, value = _cache_load(cache_dir, node.name, c, k)
+            if hit:
+                hits[c] = value
+            else:
+                missing.setdefault(node.name, []).append(c)
+        per_council_keys[node.name] = council_keys
+        found[node.name] = hits
+        keys[node.name] = _hash(*sorted(council_keys.items()))
+        todo = len(missing.get(node.name, []))
+        if todo < len(councils):
+            print(f"  cache: {node.name} — {len(councils) - todo}/{len(councils)} councils cached")
+
+    computed = compute_per_council(missing) if missing else {}
+
+    for node in nodes:
+        if not node.per_council:
+            continue
+        if node.name not in found:
+            results[node.name] = {}
+            continue
+        merged = {}
+        fresh = computed.get(node.name, {})
+        for c in councils:
+            if c in found[node.name]:
+                present, value = found[node.name][c]
+            elif c in missing.get(node.name, []):
+                present, value = (c in fresh), fresh.get(c)
+                _cache_store(cache_dir, node.name, c, per_council_keys[node.name][c], (present, value))
+            else:
+                continue
+            if present:
+                merged[c] = value
+        results[node.name] = merged
+
+    # ── Cross-council nodes, in order ──
+    for node in nodes:
+        if node.per_council:
+            continue
+        if not enabled(node):
+            keys[node.name] = _hash("off", node.name)
+            results[node.name] = {}
+            continue
+        deps = [keys[i] if i in keys else _source_key(source_keys, i) for i in node.inputs + node.extra]
+        k = keys[node.name] = _hash(node.name, code_digest(node.fn), *deps)
+        hit, value = _cache_load(cache_dir, node.name, "_all", k)
+        if hit:
+            print(f"  cache: {node.name} — cached")
+            results[node.name] = value
+            continue
+        print("\n" + "=" * 60)
+        print(node.header)
+        print("=" * 60)
+        args = [results[i] if i in results else value_of(i) for i in node.inputs]
+        results[node.name] = node.fn(*args)
+        _cache_store(cache_dir, node.name, "_all", k, results[node.name])
+
+    return results
@@ -361,11 +361,13 @@ def download_csv(council_id, url):
         return None
 
 
-def run_etl(council_id):
+def run_etl(council_id, incremental=True):
     """Run council_etl.py for a single council.
 
     Args:
         council_id: Council identifier.
+        incremental: Only reparse new/changed source files (council_etl.py
+            falls back to a full parse when it has no previous state).
 
     Returns:
         True if ETL completed successfully.
@@ -378,10 +380,10 @@ def run_etl(council_id):
     # Large councils (v4 monthly) need more time
     timeout = 900 if council_id in MONTHLY_CHUNK_COUNCILS else 600
 
-    success, stdout, stderr = run_command(
-        [sys.executable, str(etl_script), '--council', council_id],
-        timeout=timeout, cwd=str(SCRIPT_DIR),
-    )
+    cmd = [sys.executable, str(etl_script), '--council', council_id]
+    if incremental:
+        cmd.append('--incremental')
+    success, stdout, stderr = run_command(cmd, timeout=timeout, cwd=str(SCRIPT_DIR))
     if success:
         log.info(f'ETL completed for {_council_name(council_id)}')
     else:
@@ -401,7 +403,7 @@ def run_analysis():
         return False
 
     success, stdout, stderr = run_command(
-        [sys.executable, str(analysis_script)],
+        [sys.executable, str(analysis_script), '--workers', '0'],
         timeout=600, cwd=str(SCRIPT_DIR),
     )
     if success:
@@ -613,7 +615,7 @@ def process_council(council_id, force=False, skip_analysis=False, dry_run=False)
 
     # Step 1: Run ETL
     log.info(f'--- Processing {name} ---')
-    if not run_etl(council_id):
+    if not run_etl(council_id, incremental=not force):
         result['errors'].append('ETL failed')
         if HAS_NOTIFIER:
             notify_failure(council_id, 'ETL script failed')
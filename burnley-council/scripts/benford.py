@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+"""
+benford.py — Vectorised Benford's Law engine for doge_analysis.py
+
+Every digit feature the Benford suite needs (first digit, second digit,
+first-two digits, last-two pound digits) is extracted from a NumPy amount
+array in one pass using integer arithmetic on pence — no str() round trips.
+The individual tests then reduce those features with np.bincount, so the
+whole Benford stage costs one vectorised scan per council instead of six
+Python loops over every record.
+
+Test functions return the same result dicts doge_analysis has always
+written to doge_findings.json; printing stays with the callers.
+
+numpy is optional: without it the features are plain lists and the few
+array operations below (_gt/_ge, _and, _count, _bincount, _supplier_grid)
+loop in Python. The tests themselves are written once for both.
+
+Usage:
+    from benford import features_from_records, first_digit_test
+    feats = features_from_records(records)
+    result = first_digit_test(feats)
+
+References: Nigrini (2012) "Benford's Law", ACFE Fraud Examiners Manual.
+"""
+
+import math
+import operator
+from array import array
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Expected first-digit proportions (rounded, as published in the findings)
+FIRST_DIGIT_EXPECTED = {
+    1: 0.301, 2: 0.176, 3: 0.125, 4: 0.097, 5: 0.079,
+    6: 0.067, 7: 0.058, 8: 0.051, 9: 0.046,
+}
+
+# Expected second-digit proportions (Nigrini)
+SECOND_DIGIT_EXPECTED = [0.1197, 0.1139, 0.1088, 0.1043, 0.1003,
+                         0.0967, 0.0934, 0.0904, 0.0876, 0.0850]
+
+# Expected first-two-digit proportions, log10(1 + 1/d) for d = 10..99
+FIRST_TWO_EXPECTED = {d: math.log10(1 + 1 / d) for d in range(10, 100)}
+
+# Supplier names never scored individually
+EXCLUDED_SUPPLIERS = {"UNKNOWN", "NAME WITHHELD", "REDACTED", "VARIOUS", "SUNDRY"}
+
+_POW10 = 10 ** np.arange(19, dtype=np.int64) if HAS_NUMPY else None
+
+
+def _classify(chi_squared, critical):
+    """Map χ² onto (conformity, p_description) given (p05, p01, p001) critical values."""
+    p05, p01, p001 = critical
+    if chi_squared > p001:
+        return "non_conforming", "p < 0.001 (highly significant)"
+    if chi_squared > p01:
+        return "marginal", "p < 0.01 (very significant)"
+    if chi_squared > p05:
+        return "acceptable", "p < 0.05 (significant)"
+    return "conforming", "p > 0.05 (not significant)"
+
+
+def _mad_conformity(mad):
+    """Nigrini's first-digit MAD thresholds."""
+    if mad < 0.006:
+        return "close"
+    if mad < 0.012:
+        return "acceptable"
+    if mad < 0.015:
+        return "marginally_acceptable"
+    return "nonconforming"
+
+
+# ─── Array operations (numpy, or plain lists without it) ──────────────
+
+def _compare(op, values, threshold):
+    if HAS_NUMPY:
+        return op(values, threshold)
+    return [op(v, threshold) for v in values]
+
+
+def _gt(values, threshold):
+    """Boolean mask values > threshold."""
+    return _compare(operator.gt, values, threshold)
+
+
+def _ge(values, threshold):
+    """Boolean mask values >= threshold."""
+    return _compare(operator.ge, values, threshold)
+
+
+def _and(a, b):
+    if HAS_NUMPY:
+        return a & b
+    return [x and y for x, y in zip(a, b)]
+
+
+def _count(mask):
+    if HAS_NUMPY:
+        return int(np.count_nonzero(mask))
+    return sum(mask)
+
+
+def _bincount(values, mask, minlength, weights=None):
+    """np.bincount(values[mask], weights[mask], minlength) as a list."""
+    if HAS_NUMPY:
+        return np.bincount(values[mask], weights=None if weights is None else weights[mask],
+                           minlength=minlength).tolist()
+    counts = [0 if weights is None else 0.0] * minlength
+    for i, (v, keep) in enumerate(zip(values, mask)):
+        if keep:
+            counts[v] += 1 if weights is None else weights[i]
+    return counts
+
+
+def _supplier_grid(feats, min_amount, excluded):
+    """Per-supplier first-digit counts over rows with amount > min_amount whose
+    supplier is not excluded: ({code: [count per digit 0-9]}, {code: spend})
+    with codes in first-appearance order."""
+    codes = feats["supplier_codes"]
+    if HAS_NUMPY:
+        excluded = np.array(excluded, dtype=bool)
+        mask = (feats["amount"] > min_amount) & ~excluded[codes]
+        sup = codes[mask]
+        n_sup = len(excluded)
+        grid = np.bincount(sup * 10 + feats["first"][mask], minlength=n_sup * 10).reshape(n_sup, 10)
+        spend = np.bincount(sup, weights=feats["amount"][mask], minlength=n_sup)
+        _, first_idx = np.unique(sup, return_index=True)
+        order = sup[np.sort(first_idx)].tolist()
+        return {c: grid[c].tolist() for c in order}, {c: float(spend[c]) for c in order}
+    grid, spend = {}, {}
+    for code, amount, digit in zip(codes, feats["amount"], feats["first"]):
+        if amount > min_amount and not excluded[code]:
+            if code not in grid:
+                grid[code], spend[code] = [0] * 10, 0.0
+            grid[code][digit] += 1
+            spend[code] += amount
+    return grid, spend
+
+
+# ─── Feature extraction ───────────────────────────────────────────────
+
+def digit_features(amounts, supplier_codes=None, supplier_names=None):
+    """Extract every Benford digit feature from an amount array in one pass.
+
+    amounts: array-like of pounds. supplier_codes/supplier_names: optional
+    dictionary-encoded supplier column (as written by spending_store).
+
+    Returns dict of equal-length arrays (lists without numpy): amount, pence,
+    first (1-9, 0 when pence == 0), first_two (10-99, 0 when fewer than two
+    digits), second (0-9), last_two (integer pounds mod 100), plus the
+    supplier column.
+    """
+    if not HAS_NUMPY:
+        return _digit_features_lists(amounts, supplier_codes, supplier_names)
+    amount = np.asarray(amounts, dtype=np.float64)
+    pence = np.rint(np.abs(amount) * 100).astype(np.int64)
+
+    # Number of digits - 1, via log10 then corrected for float error at powers of ten
+    exponent = np.zeros(len(pence), dtype=np.int64)
+    pos = pence > 0
+    exponent[pos] = np.floor(np.log10(pence[pos])).astype(np.int64)
+    np.clip(exponent, 0, 18, out=exponent)
+    exponent -= (_POW10[exponent] > pence) & pos & (exponent > 0)
+    exponent += (exponent < 18) & (_POW10[np.minimum(exponent + 1, 18)] <= pence)
+
+    first = np.where(pos, pence // _POW10[exponent], 0)
+    first_two = np.where(exponent >= 1, pence // _POW10[np.maximum(exponent - 1, 0)], 0)
+
+    return {
+        "amount": amount,
+        "pence": pence,
+        "first": first,
+        "first_two": first_two,
+        "second": first_two % 10,
+        "last_two": (pence // 100) % 100,
+        "supplier_codes": None if supplier_codes is None else np.asarray(supplier_codes),
+        "supplier_names": supplier_names,
+    }
+
+
+def _digit_features_lists(amounts, supplier_codes, supplier_names):
+    """digit_features() without numpy: the same integer pence arithmetic per value."""
+    amount = [float(a) for a in amounts]
+    pence = [int(round(abs(a) * 100)) for a in amount]
+    first, first_two = [], []
+    for p in pence:
+        digits = len(str(p)) if p else 0
+        first.append(p // 10 ** (digits - 1) if p else 0)
+        first_two.append(p // 10 ** (digits - 2) if digits >= 2 else 0)
+    return {
+        "amount": amount,
+        "pence": pence,
+        "first": first,
+        "first_two": first_two,
+        "second": [ft % 10 for ft in first_two],
+        "last_two": [(p // 100) % 100 for p in pence],
+        "supplier_codes": None if supplier_codes is None else list(supplier_codes),
+        "supplier_names": supplier_names,
+    }
+
+
+def features_from_records(records):
+    """digit_features() for a list of spending record dicts.
+
+    Supplier key matches the historic per-supplier test:
+    supplier_canonical, falling back to supplier.
+    """
+    amounts = array("d")
+    codes = array("l")
+    lookup = {}
+    for r in records:
+        amounts.append(r.get("amount", 0) or 0)
+        s = r.get("supplier_canonical", r.get("supplier", "")) or ""
+        code = lookup.get(s)
+        if code is None:
+            code = lookup[s] = len(lookup)
+        codes.append(code)
+    return digit_features(amounts, codes, list(lookup.keys()))
+
+
+# ─── Tests ────────────────────────────────────────────────────────────
+
+def first_digit_test(feats, min_amount=100, min_count=100):
+    """First-digit χ² (df=8) + MAD. Returns result dict, or None if nothing countable."""
+    mask = _gt(feats["amount"], min_amount)
+    count = _count(mask)
+    if count < min_count:
+        return {"status": "insufficient_data", "count": count}
+
+    digit_counts = _bincount(feats["first"], mask, 10)
+    total = sum(digit_counts[1:10])
+    if total == 0:
+        return None
+
+    digit_analysis = []
+    chi_squared = 0
+    mad = 0
+    max_deviation = 0
+    max_deviation_digit = 0
+    for d in range(1, 10):
+        observed = digit_counts[d] / total
+        expected = FIRST_DIGIT_EXPECTED[d]
+        deviation = observed - expected
+        expected_count = expected * total
+        chi_squared += ((digit_counts[d] - expected_count) ** 2) / expected_count
+        mad += abs(deviation)
+        if abs(deviation) > max_deviation:
+            max_deviation = abs(deviation)
+            max_deviation_digit = d
+        digit_analysis.append({
+            "digit": d,
+            "observed_count": digit_counts[d],
+            "observed_pct": round(observed * 100, 1),
+            "expected_pct": round(expected * 100, 1),
+            "deviation_pct": round((deviation / expected) * 100, 1) if expected > 0 else 0,
+        })
+
+    # Critical values (df=8): 15.51 (p=0.05), 20.09 (p=0.01), 26.12 (p=0.001)
+    chi_squared = round(chi_squared, 2)
+    conformity, _ = _classify(chi_squared, (15.51, 20.09, 26.12))
+    conformity_label = {
+        "non_conforming": "Significant deviation from Benford's Law (p < 0.001)",
+        "marginal": "Marginal deviation (p < 0.01)",
+        "acceptable": "Mild deviation (p < 0.05) — within normal range",
+        "conforming": "Conforms to Benford's Law (p > 0.05) — no anomaly",
+    }[conformity]
+    mad = mad / 9
+
+    return {
+        "total_amounts_tested": total,
+        "chi_squared": chi_squared,
+        "conformity": conformity,
+        "conformity_label": conformity_label,
+        "mad": round(mad, 4),
+        "mad_conformity": _mad_conformity(mad),
+        "max_deviation_digit": max_deviation_digit,
+        "max_deviation_pct": round(max_deviation * 100, 1),
+        "digit_analysis": digit_analysis,
+    }
+
+
+def second_digit_test(feats, min_amount=9, min_count=100):
+    """Second-digit χ² (df=9)."""
+    mask = _gt(feats["amount"], min_amount)
+    count = _count(mask)
+    if count < min_count:
+        return {"status": "insufficient_data", "count": count}
+
+    mask = _and(mask, _ge(feats["first_two"], 10))
+    digit_counts = _bincount(feats["second"], mask, 10)
+    n = sum(digit_counts)
+    if n < 50:
+        return {"status": "insufficient_data", "count": n}
+
+    chi_squared = 0
+    digit_analysis = []
+    max_deviation = 0
+    max_deviation_digit = 0
+    for d in range(10):
+        observed_pct = digit_counts[d] / n
+        expected_pct = SECOND_DIGIT_EXPECTED[d]
+        expected_count = expected_pct * n
+        chi_squared += ((digit_counts[d] - expected_count) ** 2) / expected_count
+        deviation = abs(observed_pct - expected_pct)
+        if deviation > max_deviation:
+            max_deviation = deviation
+            max_deviation_digit = d
+        digit_analysis.append({
+            "digit": d,
+            "observed_count": digit_counts[d],
+            "observed_pct": round(observed_pct * 100, 2),
+            "expected_pct": round(expected_pct * 100, 2),
+            "deviation_pct": round((observed_pct - expected_pct) / expected_pct * 100, 1) if expected_pct > 0 else 0,
+        })
+
+    # Critical values (df=9): 16.92 (p=0.05), 21.67 (p=0.01), 27.88 (p=0.001)
+    chi_squared = round(chi_squared, 2)
+    conformity, p_description = _classify(chi_squared, (16.92, 21.67, 27.88))
+
+    return {
+        "total_amounts_tested": n,
+        "chi_squared": chi_squared,
+        "df": 9,
+        "conformity": conformity,
+        "p_description": p_description,
+        "max_deviation_digit": max_deviation_digit,
+        "max_deviation_pct": round(max_deviation * 100, 2),
+        "digit_analysis": digit_analysis,
+    }
+
+
+def first_two_digits_test(feats, min_amount=10, min_count=500):
+    """First-two digits χ² (df=89) with spike detection."""
+    mask = _ge(feats["amount"], min_amount)
+    count = _count(mask)
+    if count < min_count:
+        return {"status": "insufficient_data", "count": count}
+
+    mask = _and(mask, _ge(feats["first_two"], 10))
+    digit_counts = _bincount(feats["first_two"], mask, 100)
+    n = sum(digit_counts[10:100])
+    if n < min_count:
+        return {"status": "insufficient_data", "count": n}
+
+    chi_squared = 0
+    digit_analysis = []
+    spikes = []
+    for d in range(10, 100):
+        obs = digit_counts[d]
+        exp_count = FIRST_TWO_EXPECTED[d] * n
+        exp_pct = FIRST_TWO_EXPECTED[d] * 100
+        obs_pct = (obs / n) * 100 if n > 0 else 0
+        chi_squared += ((obs - exp_count) ** 2) / exp_count if exp_count > 0 else 0
+        digit_analysis.append({
+            "digits": d,
+            "observed": obs,
+            "observed_pct": round(obs_pct, 2),
+            "expected_pct": round(exp_pct, 2),
+            "deviation": round(obs_pct - exp_pct, 2),
+        })
+        # Flag significant spikes (>50% above expected with 20+ observations)
+        if obs > 20 and exp_count > 0 and obs / exp_count > 1.5:
+            spikes.append({
+                "digits": d,
+                "observed": obs,
+                "expected": round(exp_count, 1),
+                "ratio": round(obs / exp_count, 2),
+                "amount_range": f"£{d}0-£{d}9" if d < 100 else f"£{d}00+",
+            })
+
+    # Critical values (df=89): 112.02 (p=0.05), 122.94 (p=0.01), 135.81 (p=0.001)
+    chi_squared = round(chi_squared, 2)
+    conformity, p_desc = _classify(chi_squared, (112.02, 122.94, 135.81))
+    spikes.sort(key=lambda x: -x["ratio"])
+
+    return {
+        "total_tested": n,
+        "chi_squared": chi_squared,
+        "df": 89,
+        "conformity": conformity,
+        "p_description": p_desc,
+        "digit_analysis": digit_analysis,
+        "spikes": spikes[:10],
+    }
+
+
+def last_two_digits_test(feats, min_amount=100, min_count=500):
+    """Last-two (integer pound) digits uniformity χ² (df=99)."""
+    mask = _ge(feats["amount"], min_amount)
+    n = _count(mask)
+    if n < min_count:
+        return {"status": "insufficient_data", "count": n}
+
+    digit_counts = _bincount(feats["last_two"], mask, 100)
+    expected_count = n / 100
+    chi_squared = 0
+    digit_analysis = []
+    round_number_excess = 0
+    for d in range(100):
+        obs = digit_counts[d]
+        obs_pct = (obs / n) * 100
+        chi_squared += ((obs - expected_count) ** 2) / expected_count
+        digit_analysis.append({
+            "last_two": f"{d:02d}",
+            "observed": obs,
+            "observed_pct": round(obs_pct, 2),
+            "expected_pct": 1.0,
+            "excess": round(obs_pct - 1.0, 2),
+        })
+        if d in (0, 50):
+            round_number_excess += obs - expected_count
+
+    # Critical values (df=99): 123.23 (p=0.05), 135.81 (p=0.01), 149.45 (p=0.001)
+    chi_squared = round(chi_squared, 2)
+    conformity, p_desc = _classify(chi_squared, (123.23, 135.81, 149.45))
+    top_endings = sorted(digit_analysis, key=lambda x: -x["excess"])[:10]
+
+    return {
+        "total_tested": n,
+        "chi_squared": chi_squared,
+        "df": 99,
+        "conformity": conformity,
+        "p_description": p_desc,
+        "round_number_excess": round(round_number_excess, 1),
+        "round_number_excess_pct": round((round_number_excess / n) * 100, 2) if n > 0 else 0,
+        "top_endings": top_endings,
+        "digit_analysis": digit_analysis,
+    }
+
+
+def summation_test(feats, min_count=100):
+    """Summation test: share of total value by first digit (~11.1% each expected)."""
+    mask = _gt(feats["amount"], 0)
+    count = _count(mask)
+    if count < min_count:
+        return {"status": "insufficient_data", "count": count}
+
+    mask = _and(mask, _ge(feats["first"], 1))
+    digit_sums = _bincount(feats["first"], mask, 10, weights=feats["amount"])
+    digit_counts = _bincount(feats["first"], mask, 10)
+    total_sum = sum(digit_sums[1:10])
+    if total_sum == 0:
+        return None
+
+    expected_pct = 100 / 9
+    digit_analysis = []
+    distortions = []
+    for d in range(1, 10):
+        actual_pct = (digit_sums[d] / total_sum) * 100
+        deviation = actual_pct - expected_pct
+        avg_amount = round(digit_sums[d] / digit_counts[d], 2) if digit_counts[d] > 0 else 0
+        digit_analysis.append({
+            "digit": d,
+            "sum": round(digit_sums[d], 2),
+            "count": digit_counts[d],
+            "pct_of_total": round(actual_pct, 2),
+            "expected_pct": round(expected_pct, 2),
+            "deviation": round(deviation, 2),
+            "avg_amount": avg_amount,
+        })
+        # Flag significant distortions (>5pp above expected)
+        if deviation > 5:
+            distortions.append({
+                "digit": d,
+                "pct_of_total": round(actual_pct, 2),
+                "excess_pct": round(deviation, 2),
+                "excess_value": round(digit_sums[d] - (expected_pct / 100 * total_sum), 2),
+                "count": digit_counts[d],
+                "avg_amount": avg_amount,
+            })
+    distortions.sort(key=lambda x: -x["excess_pct"])
+
+    return {
+        "total_sum": round(total_sum, 2),
+        "total_amounts": count,
+        "digit_analysis": digit_analysis,
+        "distortions": distortions,
+        "max_digit_pct": max(d["pct_of_total"] for d in digit_analysis),
+    }
+
+
+def per_supplier_mad(feats, min_amount=100, min_transactions=50, top_n=20):
+    """First-digit MAD per supplier, via one grouped bincount over (supplier, digit)."""
+    codes = feats["supplier_codes"]
+    names = feats["supplier_names"]
+    if codes is None or not names:
+        return {"suppliers_tested": 0, "nonconforming": 0, "nonconforming_spend": 0,
+                "marginally_acceptable": 0, "top_20_outliers": []}
+
+    excluded = [not s or s.upper() in EXCLUDED_SUPPLIERS for s in names]
+    # Suppliers come back in first-appearance order so ties sort as they always have
+    grid, spend = _supplier_grid(feats, min_amount, excluded)
+
+    supplier_scores = []
+    for code, row in grid.items():
+        if sum(row) < min_transactions:
+            continue
+        n = sum(row[1:10])
+        if n < min_transactions:
+            continue
+        mad = 0
+        for d in range(1, 10):
+            mad += abs(row[d] / n - FIRST_DIGIT_EXPECTED[d])
+        mad = mad / 9
+        supplier_scores.append({
+            "supplier": names[code],
+            "mad": round(mad, 4),
+            "conformity": _mad_conformity(mad),
+            "transaction_count": n,
+            "total_spend": round(spend[code], 2),
+        })
+
+    supplier_scores.sort(key=lambda x: -x["mad"])
+    nonconforming = [s for s in supplier_scores if s["conformity"] == "nonconforming"]
+    marginal = [s for s in supplier_scores if s["conformity"] == "marginally_acceptable"]
+
+    return {
+        "suppliers_tested": len(supplier_scores),
+        "nonconforming": len(nonconforming),
+        "nonconforming_spend": round(sum(s["total_spend"] for s in nonconforming), 2),
+        "marginally_acceptable": len(marginal),
+        "top_20_outliers": supplier_scores[:top_n],
+    }
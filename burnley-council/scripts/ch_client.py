@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+ch_client.py — Shared Companies House API client for AI DOGE ETLs
+
+One client for councillor_integrity_etl.py and council_etl.py instead of each
+script sleeping a fixed delay before every call and retrying on its own:
+
+  - Sliding-window limiter matched to the CH quota (600 requests per rolling
+    5 minutes per key), shared by every thread, so requests go out as fast as
+    the quota allows and only block once it is used up.
+  - Bounded thread pool (fetch_many) for fanning out independent lookups,
+    e.g. officers + PSC for every company a councillor is linked to.
+  - On-disk SQLite response cache (data/.ch_cache.sqlite) keyed by URL with
+    per-endpoint TTLs, so a company profile, officer list or PSC list already
+    fetched in this or a previous run is not fetched again. 404s are cached
+    too (as None) — dissolved/unknown numbers are otherwise re-queried every run.
+
+Only successful (200) and not-found (404) responses are cached; rate limits,
+server errors and network failures are retried with backoff and never stored.
+
+Usage:
+    from ch_client import get_client
+    ch = get_client()                           # CH_API_KEY / COMPANIES_HOUSE_API_KEY
+    profile = ch.get("/company/01234567")
+    officers, pscs = ch.fetch_many(["/company/01234567/officers",
+                                    "/company/01234567/persons-with-significant-control"])
+"""
+
+import base64
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+DATA_DIR = SCRIPT_DIR.parent / "data"
+
+CH_API_BASE = "https://api.company-information.service.gov.uk"
+CACHE_PATH = DATA_DIR / ".ch_cache.sqlite"
+
+# Companies House quota: 600 requests per rolling 5 minutes per API key
+RATE_LIMIT_REQUESTS = 600
+RATE_LIMIT_WINDOW = 300
+DEFAULT_WORKERS = 4
+
+DAY = 86400
+# (path pattern, TTL seconds) — first match wins. Registered company data
+# changes slowly; searches and filing history are cheap to refresh.
+ENDPOINT_TTLS = [
+    (re.compile(r"^/company/[^/]+$"), 7 * DAY),
+    (re.compile(r"^/company/[^/]+/officers"), 7 * DAY),
+    (re.compile(r"^/company/[^/]+/persons-with-significant-control"), 7 * DAY),
+    (re.compile(r"^/company/[^/]+/charges"), 14 * DAY),
+    (re.compile(r"^/company/[^/]+/insolvency"), 14 * DAY),
+    (re.compile(r"^/company/[^/]+/filing-history"), 1 * DAY),
+    (re.compile(r"^/officers/[^/]+/appointments"), 7 * DAY),
+    (re.compile(r"^/search/"), 3 * DAY),
+]
+DEFAULT_TTL = 1 * DAY
+
+
+def endpoint_ttl(path):
+    """Cache TTL in seconds for an API path (query string ignored)."""
+    path = path.split("?", 1)[0]
+    for pattern, ttl in ENDPOINT_TTLS:
+        if pattern.match(path):
+            return ttl
+    return DEFAULT_TTL
+
+
+class SlidingWindowLimiter:
+    """Thread-safe sliding-window log: at most `capacity` acquire()s in any
+    `window` seconds, the same rolling window Companies House counts over.
+    acquire() blocks until the oldest request in the window ages out, so no
+    burst can exceed the quota in any window, including the first."""
+
+    def __init__(self, capacity=RATE_LIMIT_REQUESTS, window=RATE_LIMIT_WINDOW):
+        self.capacity = capacity
+        self.window = window
+        self.sent = deque()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                while self.sent and now - self.sent[0] >= self.window:
+                    self.sent.popleft()
+                if len(self.sent) < self.capacity:
+                    self.sent.append(now)
+                    return
+                wait = self.window - (now - self.sent[0])
+            time.sleep(wait)
+
+    def drain(self):
+        """Treat the window as full from now (after a 429 the server's count
+        includes requests we never saw, e.g. another process on the same key)."""
+        with self.lock:
+            now = time.monotonic()
+            self.sent.clear()
+            self.sent.extend([now] * self.capacity)
+
+
+class ResponseCache:
+    """SQLite URL → JSON body cache shared across threads and runs."""
+
+    def __init__(self, path=CACHE_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                body TEXT,
+                fetched_at REAL NOT NULL
+            )""")
+        self.db.commit()
+
+    def get(self, url, ttl):
+        """(True, data) for a fresh entry (data None for a cached 404), else (False, None)."""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT status, body, fetched_at FROM responses WHERE url = ?", (url,)).fetchone()
+        if not row or time.time() - row[2] > ttl:
+            return False, None
+        status, body, _ = row
+        if status == 404 or body is None:
+            return True, None
+        try:
+            return True, json.loads(body)
+        except ValueError:
+            return False, None
+
+    def put(self, url, status, data):
+        body = None if data is None else json.dumps(data, separators=(",", ":"))
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses (url, status, body, fetched_at) VALUES (?, ?, ?, ?)",
+                (url, status, body, time.time()))
+            self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class CHClient:
+    """Rate-limited, cached Companies House GET client (safe to share across threads)."""
+
+    def __init__(self, api_key=None, cache_path=CACHE_PATH, workers=DEFAULT_WORKERS,
+                 limiter=None, use_cache=True, user_agent="AI-DOGE-CHClient/1.0"):
+        if api_key is None:
+            api_key = os.environ.get("CH_API_KEY") or os.environ.get("COMPANIES_HOUSE_API_KEY", "")
+        self.api_key = api_key
+        self.auth = "Basic " + base64.b64encode(f"{api_key}:".encode()).decode()
+        self.limiter = limiter or SlidingWindowLimiter()
+        self.cache = ResponseCache(cache_path) if use_cache and cache_path else None
+        self.workers = max(1, workers)
+        self.user_agent = user_agent
+        self.stats = defaultdict(int)
+        self.stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def url_for(self, path, params=None):
+        url = path if path.startswith("http") else f"{CH_API_BASE}{path}"
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        return url
+
+    def get(self, path, params=None, ttl=None, refresh=False):
+        """GET an API path → parsed JSON, or None on 404 / persistent failure."""
+        url = self.url_for(path, params)
+        if ttl is None:
+            ttl = endpoint_ttl(path)
+        if self.cache and not refresh:
+            hit, data = self.cache.get(url, ttl)
+            if hit:
+                self._count("cache_hits")
+                return data
+        status, data = self._fetch(url)
+        if self.cache and status in (200, 404):
+            self.cache.put(url, status, data)
+        return data
+
+    def fetch_many(self, requests, ttl=None):
+        """Fetch several paths (or (path, params) tuples) on the worker pool.
+        Returns results in input order."""
+        requests = [r if isinstance(r, tuple) else (r, None) for r in requests]
+        if len(requests) <= 1 or self.workers == 1:
+            return [self.get(path, params, ttl) for path, params in requests]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(requests))) as pool:
+            return list(pool.map(lambda r: self.get(r[0], r[1], ttl), requests))
+
+    def _fetch(self, url):
+        """Network GET with retries. Returns (status, data); status 0 = gave up."""
+        rate_limited = server_errors = network_errors = 0
+        while True:
+            self.limiter.acquire()
+            self._count("requests")
+            req = urllib.request.Request(url)
+            req.add_header("Authorization", self.auth)
+            req.add_header("Accept", "application/json")
+            req.add_header("User-Agent", self.user_agent)
+            try:
+                with urllib.request.urlopen(req, timeout=20) as resp:
+                    return 200, json.loads(resp.read().decode())
+            except urllib.error.HTTPError as e:
+                if e.code == 404:
+                    self._count("not_found")
+                    return 404, None
+                if e.code == 429 and rate_limited < 3:
+                    self.limiter.drain()
+                    retry_after = e.headers.get("Retry-After") if e.headers else None
+                    wait = int(retry_after) if retry_after and retry_after.isdigit() else 60 * (2 ** rate_limited)
+                    rate_limited += 1
+                    self._count("rate_limited")
+                    print(f"    [CH RATE LIMITED] Waiting {wait}s...")
+                    time.sleep(wait)
+                    continue
+                if e.code in (502, 503, 504) and server_errors < 2:
+                    wait = 10 * (2 ** server_errors)
+                    server_errors += 1
+                    print(f"    [CH {e.code}] Retrying in {wait}s...")
+                    time.sleep(wait)
+                    continue
+                print(f"    [CH HTTP {e.code}] {url[:100]}")
+                self._count("errors")
+                return 0, None
+            except (urllib.error.URLError, OSError) as e:
+                if network_errors < 2:
+                    wait = 5 * (2 ** network_errors)
+                    network_errors += 1
+                    print(f"    [CH NETWORK ERROR] {str(e)[:50]} — retrying in {wait}s...")
+                    time.sleep(wait)
+                    continue
+                print(f"    [CH ERROR] {str(e)[:80]}")
+                self._count("errors")
+                return 0, None
+            except ValueError as e:
+                print(f"    [CH ERROR] bad JSON from {url[:80]}: {str(e)[:50]}")
+                self._count("errors")
+                return 0, None
+
+    def summary(self):
+        """'1234 requests, 5678 cache hits, ...' for end-of-run logging."""
+        with self.stats_lock:
+            return ", ".join(f"{v} {k.replace('_', ' ')}" for k, v in sorted(self.stats.items())) or "no calls"
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(api_key=None, **kwargs):
+    """Process-wide client per API key, so every caller shares one rate limiter."""
+    if api_key is None:
+        api_key = os.environ.get("CH_API_KEY") or os.environ.get("COMPANIES_HOUSE_API_KEY", "")
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = CHClient(api_key, **kwargs)
+        return client
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+ch_snapshot.py — Local Companies House bulk snapshot for AI DOGE ETLs
+
+council_etl.py (supplier → company matching, deep enrichment) and
+councillor_integrity_etl.py (company profiles, PSC, phantom company checks)
+asked the CH REST API about one company at a time. Companies House publishes
+free monthly bulk files covering every live company:
+
+  - Basic Company Data: BasicCompanyDataAsOneFile-YYYY-MM-01.zip (or the
+    BasicCompanyData-...-part*.zip files) — one CSV row per company.
+  - PSC snapshot: persons-with-significant-control-snapshot-YYYY-MM-DD.zip
+    (or its part files) — one JSON line per PSC / PSC statement.
+
+This module imports them from local paths into one SQLite file
+(data/.ch_snapshot.sqlite, or CH_SNAPSHOT=/path) indexed by company number
+and by normalised name, and answers in the REST API's JSON shapes:
+
+  /company/{number}                                  → profile
+  /company/{number}/persons-with-significant-control → {"items": [...]}
+  search(name)                                       → /search/companies items
+
+Only live companies are in the bulk files, so a number the snapshot does not
+know (dissolved, or newer than the snapshot) still falls through to the API,
+as do officer searches and appointments. Re-importing replaces the previous
+snapshot table in one transaction.
+
+The bulk file has no registered-office flags and only the current status, not
+insolvency history. Profiles therefore carry None (unknown) for
+undeliverable_registered_office_address and registered_office_is_in_dispute,
+and for has_insolvency_history / has_been_liquidated unless the current status
+proves them; those keys are listed in the profile's "_snapshot_unknown". Callers
+that act on them ask the API (council_etl deep enrichment does).
+
+Usage:
+    python3 ch_snapshot.py --companies BasicCompanyDataAsOneFile-2026-10-01.zip \\
+                           --psc persons-with-significant-control-snapshot-2026-10-15.zip
+    python3 ch_snapshot.py --info
+
+    from ch_snapshot import open_snapshot
+    snapshot = open_snapshot()               # None if no snapshot was imported
+    profile = snapshot.get("/company/01234567") if snapshot else None
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zipfile
+from datetime import date, datetime
+from pathlib import Path
+
+from name_index import sequence_ratio
+
+SCRIPT_DIR = Path(__file__).parent
+DATA_DIR = SCRIPT_DIR.parent / "data"
+SNAPSHOT_PATH = DATA_DIR / ".ch_snapshot.sqlite"
+
+BATCH_SIZE = 50000
+SEARCH_LIMIT = 50
+# Prefix rows read per search before ranking (common prefixes such as
+# "NORTH WEST" match thousands of companies)
+SEARCH_SCAN_LIMIT = 5000
+COMPANY_SUFFIXES = ("LTD", "PLC", "LLP", "CIC")
+
+COMPANY_PATH = re.compile(r"^/company/([A-Z0-9]+)(/persons-with-significant-control)?/?(?:\?.*)?$")
+
+# Basic Company Data status / category text → API company_status / type
+STATUS_MAP = {
+    "active - proposal to strike off": ("active", "active-proposal-to-strike-off"),
+    "in administration": ("administration", None),
+    "administration order": ("administration", None),
+    "in administration/administrative receiver": ("administration", None),
+    "in administration/receiver manager": ("administration", None),
+    "receiver action": ("receivership", None),
+    "live but receiver manager on at least one charge": ("active", None),
+}
+INSOLVENCY_STATUSES = {"liquidation", "administration", "receivership",
+                       "voluntary-arrangement", "insolvency-proceedings"}
+# Profile keys the bulk file can't answer: None in a snapshot profile (unknown),
+# never False. History flags are only set when the current status proves them.
+UNKNOWN_PROFILE_KEYS = ("undeliverable_registered_office_address", "registered_office_is_in_dispute",
+                        "has_insolvency_history", "has_been_liquidated")
+TYPE_MAP = {
+    "private limited company": "ltd",
+    "public limited company": "plc",
+    "limited liability partnership": "llp",
+    "private unlimited company": "private-unlimited",
+    "private unlimited": "private-unlimited",
+    "pri/ltd by guar/nsc (private, limited by guarantee, no share capital)": "private-limited-guarant-nsc",
+    "pri/lbg/nsc (private, limited by guarantee, no share capital, use of 'limited' exemption)":
+        "private-limited-guarant-nsc-limited-exemption",
+    "community interest company": "ltd",
+    "charitable incorporated organisation": "charitable-incorporated-organisation",
+    "scottish charitable incorporated organisation": "scottish-charitable-incorporated-organisation",
+    "registered society": "registered-society-non-jurisdictional",
+    "overseas entity": "registered-overseas-entity",
+}
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", (text or "").strip().lower()).strip("-")
+
+
+def normalise_name(name):
+    """Upper-case company name with standard suffixes and no punctuation (index key)."""
+    n = str(name or "").upper().replace("&", " AND ")
+    n = re.sub(r"\bPUBLIC LIMITED COMPANY\b", "PLC", n)  # before LIMITED → LTD
+    n = re.sub(r"\bLIMITED\b", "LTD", n)
+    n = re.sub(r"[^A-Z0-9 ]+", " ", n)
+    n = re.sub(r"^THE\s+", "", n.strip())
+    return " ".join(n.split())
+
+
+def _iso(value):
+    """'31/12/2024' → '2024-12-31' ('' if empty/unparseable)."""
+    value = (value or "").strip()
+    if not value:
+        return ""
+    try:
+        return datetime.strptime(value, "%d/%m/%Y").date().isoformat()
+    except ValueError:
+        return value if re.match(r"^\d{4}-\d{2}-\d{2}$", value) else ""
+
+
+def _open_members(path, suffixes):
+    """Text streams for a plain file or every matching member of a zip."""
+    path = Path(path)
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            for member in sorted(zf.namelist()):
+                if member.lower().endswith(suffixes):
+                    with zf.open(member) as raw:
+                        yield member, io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+    else:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            yield path.name, f
+
+
+def _company_row(rec):
+    """Basic Company Data CSV record (header names stripped) → companies table row."""
+    number = (rec.get("CompanyNumber") or "").strip().upper()
+    if not number:
+        return None
+    name = (rec.get("CompanyName") or "").strip()
+    sic = [s.split(" - ", 1)[0].strip() for s in
+           (rec.get(f"SICCode.SicText_{i}") or "" for i in range(1, 5)) if s.strip()]
+    sic = [s for s in sic if s.isdigit()]
+    address = {
+        "care_of": rec.get("RegAddress.CareOf", ""),
+        "po_box": rec.get("RegAddress.POBox", ""),
+        "address_line_1": rec.get("RegAddress.AddressLine1", ""),
+        "address_line_2": rec.get("RegAddress.AddressLine2", ""),
+        "locality": rec.get("RegAddress.PostTown", ""),
+        "region": rec.get("RegAddress.County", ""),
+        "country": rec.get("RegAddress.Country", ""),
+        "postal_code": rec.get("RegAddress.PostCode", ""),
+    }
+    address = {k: v.strip() for k, v in address.items() if v and v.strip()}
+    previous = []
+    for i in range(1, 11):
+        prev_name = (rec.get(f"PreviousName_{i}.CompanyName") or "").strip()
+        if prev_name:
+            previous.append({"name": prev_name, "ceased_on": _iso(rec.get(f"PreviousName_{i}.CONDATE"))})
+    try:
+        charges = int(rec.get("Mortgages.NumMortCharges") or 0)
+    except ValueError:
+        charges = 0
+    return (
+        number, name, normalise_name(name),
+        (rec.get("CompanyStatus") or "").strip(), (rec.get("CompanyCategory") or "").strip(),
+        _iso(rec.get("IncorporationDate")), _iso(rec.get("DissolutionDate")),
+        json.dumps(address, separators=(",", ":")), " ".join(sic),
+        (rec.get("Accounts.AccountCategory") or "").strip(),
+        _iso(rec.get("Accounts.LastMadeUpDate")), _iso(rec.get("Accounts.NextDueDate")),
+        (rec.get("Accounts.AccountRefDay") or "").strip(), (rec.get("Accounts.AccountRefMonth") or "").strip(),
+        _iso(rec.get("ConfStmtLastMadeUpDate")), _iso(rec.get("ConfStmtNextDueDate")),
+        charges, json.dumps(previous, separators=(",", ":")) if previous else "",
+    )
+
+
+COMPANY_COLUMNS = """
+    company_number TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    norm_name TEXT NOT NULL,
+    status TEXT,
+    category TEXT,
+    created TEXT,
+    dissolved TEXT,
+    address TEXT,
+    sic TEXT,
+    accounts_category TEXT,
+    accounts_last TEXT,
+    accounts_next TEXT,
+    ref_day TEXT,
+    ref_month TEXT,
+    confirmation_last TEXT,
+    confirmation_next TEXT,
+    charges INTEGER,
+    previous_names TEXT
+"""
+
+
+class CHSnapshot:
+    """SQLite store of the CH bulk snapshots, answering in REST API shapes (thread-safe)."""
+
+    def __init__(self, path=SNAPSHOT_PATH, readonly=True):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        if readonly:
+            self.db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.db.execute(f"CREATE TABLE IF NOT EXISTS companies ({COMPANY_COLUMNS})")
+            self.db.execute("CREATE TABLE IF NOT EXISTS psc (company_number TEXT NOT NULL, item TEXT NOT NULL)")
+        self.meta = dict(self.db.execute("SELECT key, value FROM meta"))
+        self.has_psc = "psc_imported_at" in self.meta
+
+    # ── Import ──
+
+    def _set_meta(self, **values):
+        self.db.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                            [(k, str(v)) for k, v in values.items()])
+        self.meta.update({k: str(v) for k, v in values.items()})
+
+    def _swap(self, table, staging, indexes):
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            self.db.execute(f"DROP TABLE IF EXISTS {table}")
+            self.db.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+            for name, cols in indexes:
+                self.db.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({cols})")
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+
+    def import_companies(self, paths):
+        """Load Basic Company Data CSV/zip files, replacing the current companies table."""
+        started, count = time.time(), 0
+        self.db.execute("PRAGMA synchronous=OFF")
+        self.db.execute("DROP TABLE IF EXISTS companies_import")
+        self.db.execute(f"CREATE TABLE companies_import ({COMPANY_COLUMNS})")
+        placeholders = ", ".join("?" * 18)
+        for path in paths:
+            for member, stream in _open_members(path, (".csv",)):
+                reader = csv.reader(stream)
+                header = [h.strip() for h in next(reader, [])]
+                batch = []
+                for values in reader:
+                    row = _company_row(dict(zip(header, values)))
+                    if row:
+                        batch.append(row)
+                    if len(batch) >= BATCH_SIZE:
+                        self._insert("companies_import", placeholders, batch)
+                        count += len(batch)
+                        batch = []
+                        print(f"  {member}: {count:,} companies", end="\r")
+                self._insert("companies_import", placeholders, batch)
+                count += len(batch)
+                print(f"  {member}: {count:,} companies")
+        self._swap("companies", "companies_import", [("companies_norm_name", "norm_name")])
+        self._set_meta(companies_imported_at=datetime.now().isoformat(timespec="seconds"),
+                       companies_count=count, companies_files=", ".join(Path(p).name for p in paths))
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        print(f"  Imported {count:,} companies in {time.time() - started:.0f}s")
+        return count
+
+    def import_psc(self, paths):
+        """Load PSC snapshot JSONL/zip files, replacing the current psc table."""
+        started, count = time.time(), 0
+        self.db.execute("PRAGMA synchronous=OFF")
+        self.db.execute("DROP TABLE IF EXISTS psc_import")
+        self.db.execute("CREATE TABLE psc_import (company_number TEXT NOT NULL, item TEXT NOT NULL)")
+        for path in paths:
+            for member, stream in _open_members(path, (".txt", ".json", ".jsonl")):
+                batch = []
+                for line in stream:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue
+                    number = (rec.get("company_number") or "").strip().upper()
+                    if not number or not isinstance(rec.get("data"), dict):
+                        continue  # e.g. the snapshot's trailing totals record
+                    batch.append((number, json.dumps(rec["data"], separators=(",", ":"))))
+                    if len(batch) >= BATCH_SIZE:
+                        self._insert("psc_import", "?, ?", batch)
+                        count += len(batch)
+                        batch = []
+                        print(f"  {member}: {count:,} PSC records", end="\r")
+                self._insert("psc_import", "?, ?", batch)
+                count += len(batch)
+                print(f"  {member}: {count:,} PSC records")
+        self._swap("psc", "psc_import", [("psc_company_number", "company_number")])
+        self._set_meta(psc_imported_at=datetime.now().isoformat(timespec="seconds"),
+                       psc_count=count, psc_files=", ".join(Path(p).name for p in paths))
+        self.has_psc = True
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        print(f"  Imported {count:,} PSC records in {time.time() - started:.0f}s")
+        return count
+
+    def _insert(self, table, placeholders, rows):
+        if not rows:
+            return
+        self.db.execute("BEGIN")
+        self.db.executemany(f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})", rows)
+        self.db.execute("COMMIT")
+
+    # ── Lookups ──
+
+    def _row(self, company_number):
+        with self.lock:
+            return self.db.execute("SELECT * FROM companies WHERE company_number = ?",
+                                   (company_number.strip().upper(),)).fetchone()
+
+    def profile(self, company_number):
+        """/company/{number} response built from the snapshot, or None if not in it."""
+        row = self._row(company_number or "")
+        return self._profile(row) if row else None
+
+    def _profile(self, row):
+        (number, name, _, status_text, category, created, dissolved, address, sic, acc_cat,
+         acc_last, acc_next, ref_day, ref_month, conf_last, conf_next, charges, previous) = row
+        status, detail = STATUS_MAP.get(status_text.lower(), (_slug(status_text), None))
+        today = date.today().isoformat()
+        accounts_overdue = bool(acc_next) and acc_next < today
+        confirmation_overdue = bool(conf_next) and conf_next < today
+        accounts = {
+            "accounting_reference_date": {"day": ref_day, "month": ref_month},
+            "last_accounts": {"made_up_to": acc_last, "type": _slug(acc_cat)},
+            "next_due": acc_next,
+            "next_accounts": {"due_on": acc_next, "overdue": accounts_overdue},
+            "overdue": accounts_overdue,
+        }
+        profile = {
+            "company_number": number,
+            "company_name": name,
+            "company_status": status,
+            "type": TYPE_MAP.get(category.lower(), _slug(category)),
+            "date_of_creation": created,
+            "registered_office_address": json.loads(address) if address else {},
+            "sic_codes": sic.split() if sic else [],
+            "accounts": accounts,
+            "confirmation_statement": {"last_made_up_to": conf_last, "next_due": conf_next,
+                                       "overdue": confirmation_overdue},
+            "has_overdue_accounts": accounts_overdue,
+            "has_overdue_confirmation_statement": confirmation_overdue,
+            "has_charges": charges > 0,
+            "has_insolvency_history": True if status in INSOLVENCY_STATUSES else None,
+            "has_been_liquidated": True if status == "liquidation" else None,
+            "undeliverable_registered_office_address": None,
+            "registered_office_is_in_dispute": None,
+            "_snapshot": self.meta.get("companies_imported_at", ""),
+        }
+        profile["_snapshot_unknown"] = [k for k in UNKNOWN_PROFILE_KEYS if profile[k] is None]
+        if detail:
+            profile["company_status_detail"] = detail
+        if dissolved:
+            profile["date_of_cessation"] = dissolved
+        if previous:
+            profile["previous_company_names"] = json.loads(previous)
+        return profile
+
+    def psc(self, company_number):
+        """PSC items for a company in the snapshot; None if the snapshot can't say
+        (no PSC file imported, or the company isn't in the companies table)."""
+        number = (company_number or "").strip().upper()
+        if not self.has_psc or not self._row(number):
+            return None
+        with self.lock:
+            rows = self.db.execute("SELECT item FROM psc WHERE company_number = ?", (number,)).fetchall()
+        return [json.loads(item) for (item,) in rows]
+
+    def get(self, path):
+        """API-shaped response for a profile or PSC path, or None to fall back to the API."""
+        m = COMPANY_PATH.match(path or "")
+        if not m:
+            return None
+        if not m.group(2):
+            return self.profile(m.group(1))
+        items = self.psc(m.group(1))
+        if items is None:
+            return None
+        active = sum(1 for i in items if not i.get("ceased_on") and not i.get("ceased"))
+        return {"items": items, "total_results": len(items), "active_count": active,
+                "ceased_count": len(items) - active}
+
+    def covers(self, path):
+        return self.get(path) is not None
+
+    def _prefix_rows(self, prefix, exclude):
+        with self.lock:
+            return self.db.execute(
+                "SELECT * FROM companies WHERE norm_name >= ? AND norm_name < ? AND norm_name != ? LIMIT ?",
+                (prefix, prefix + "\U0010ffff", exclude, SEARCH_SCAN_LIMIT)).fetchall()
+
+    def search(self, name, limit=SEARCH_LIMIT):
+        """/search/companies-style items: exact normalised-name matches first, then
+        fuzzy candidates ranked by similarity to the name — companies whose name
+        starts with the whole name (company suffix dropped), or, if there are
+        none, with its first two words."""
+        norm = normalise_name(name)
+        words = norm.split()
+        if not words:
+            return []
+        if len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+            words = words[:-1]
+        with self.lock:
+            rows = self.db.execute("SELECT * FROM companies WHERE norm_name = ?", (norm,)).fetchall()
+        candidates = self._prefix_rows(" ".join(words), norm)
+        if not candidates and len(words) > 2:
+            candidates = self._prefix_rows(" ".join(words[:2]), norm)
+        candidates.sort(key=lambda row: sequence_ratio(norm, row[2]), reverse=True)
+        rows += candidates
+        items = []
+        for row in rows[:limit]:
+            profile = self._profile(row)
+            address = profile["registered_office_address"]
+            items.append({
+                "title": profile["company_name"],
+                "company_number": profile["company_number"],
+                "company_status": profile["company_status"],
+                "company_type": profile["type"],
+                "date_of_creation": profile["date_of_creation"],
+                "sic_codes": profile["sic_codes"],
+                "address_snippet": ", ".join(address.get(k, "") for k in
+                                             ("address_line_1", "locality", "postal_code") if address.get(k)),
+            })
+        return items
+
+    def summary(self):
+        return {k: v for k, v in self.meta.items()}
+
+
+_snapshots = {}
+_snapshots_lock = threading.Lock()
+
+
+def open_snapshot(path=None):
+    """Shared read-only snapshot (CH_SNAPSHOT or data/.ch_snapshot.sqlite), or None
+    if no companies file has been imported there."""
+    path = Path(path or os.environ.get("CH_SNAPSHOT") or SNAPSHOT_PATH)
+    with _snapshots_lock:
+        if path not in _snapshots:
+            snapshot = None
+            if path.exists():
+                try:
+                    snapshot = CHSnapshot(path)
+                    if "companies_imported_at" not in snapshot.meta:
+                        snapshot = None
+                except sqlite3.Error:
+                    snapshot = None
+            _snapshots[path] = snapshot
+        return _snapshots[path]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import Companies House bulk snapshots into a local SQLite store")
+    parser.add_argument("--companies", nargs="+", metavar="FILE",
+                        help="Basic Company Data CSV or zip file(s) (all parts of one month)")
+    parser.add_argument("--psc", nargs="+", metavar="FILE", help="PSC snapshot JSONL or zip file(s)")
+    parser.add_argument("--db", default=os.environ.get("CH_SNAPSHOT") or str(SNAPSHOT_PATH),
+                        help="SQLite path (default: data/.ch_snapshot.sqlite or $CH_SNAPSHOT)")
+    parser.add_argument("--info", action="store_true", help="Show what the snapshot holds")
+    args = parser.parse_args()
+
+    if not (args.companies or args.psc or args.info):
+        parser.print_help()
+        sys.exit(1)
+    snapshot = CHSnapshot(args.db, readonly=False)
+    if args.companies:
+        snapshot.import_companies(args.companies)
+    if args.psc:
+        snapshot.import_psc(args.psc)
+    for key, value in sorted(snapshot.summary().items()):
+        print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
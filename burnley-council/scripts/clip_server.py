@@ -8,16 +8,36 @@ on-demand clips from Mediasite webcasts.
 Endpoints:
     GET /clips/{meeting_id}/{clip_id}.mp4     — serve pre-clipped file
     GET /clip?meeting=ID&start=S&end=E        — on-demand extraction
+    GET /ytclip?video=ID&start=S&end=E        — YouTube extraction
+    GET /jobs/{job_id}                         — status of a queued extraction
+    GET /preclip?meeting=ID&min_score=7        — queue pre-clipping of a meeting
     GET /meetings                              — list available meetings
     GET /health                                — health check
 
+Requests are handled on threads; yt-dlp/ffmpeg work runs on a bounded job
+pool (CLIP_WORKERS at a time, MAX_QUEUED_JOBS waiting, then 503). Requests
+for the same clip share one job. /clip and /ytclip block until the clip is
+ready, or with &async=1 return 202 + {"job", "poll"} at once — poll
+/jobs/{id} until "done", then GET the returned url. Files are served with
+byte ranges (206 Partial Content, via sendfile) so players can seek.
+
 On-demand workflow:
     1. Look up webcast URL from meeting metadata
     2. yt-dlp --download-sections to grab just the needed chunk
     3. ffmpeg to trim precisely and re-encode
-    4. Cache for 24h, then auto-delete
+    4. Add to the clip cache (see below)
     5. Serve the clip
 
+Clip cache: on-demand clips live in /opt/clips/_cache/, tracked by a SQLite
+index (_index.sqlite: size, last access, hit count, priority). The cache is
+kept under CACHE_MAX_BYTES (CLIP_CACHE_GB, default 20) by evicting the clip
+with the oldest "effective" last access — last access plus CACHE_BONUS_HOURS
+per hit or priority point (capped) — so popular clips outlive one-off ones.
+Clips idle (by that measure) for CACHE_TTL_HOURS are dropped too.
+preclip_meeting warms the cache with the next-best moments (scores from
+PREWARM_MIN_SCORE up to the pre-clip threshold) at the timings the
+Transcripts page requests, using their score as priority.
+
 Pre-clipped clips live in /opt/clips/{meeting_id}/ and are served directly.
 
 Usage:
@@ -35,9 +55,11 @@ import hashlib
 import subprocess
 import threading
 import re
+import sqlite3
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, urlencode
 import mimetypes
 
 # Directories
@@ -49,8 +71,17 @@ CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # Config
 PORT = 8420
-CACHE_TTL_HOURS = 24
+CACHE_TTL_HOURS = 72  # drop clips idle this long (after hit/priority bonus)
+CACHE_MAX_BYTES = int(float(os.environ.get("CLIP_CACHE_GB", "20")) * 1024 ** 3)
+CACHE_BONUS_HOURS = 6  # each hit / priority point counts as this much extra recency...
+CACHE_BONUS_CAP = 10   # ...for at most this many points
+PREWARM_MIN_SCORE = 5
+PREWARM_MAX_CLIPS = 30
 MAX_CLIP_SECONDS = 300  # 5 minute max per clip
+CLIP_WORKERS = 3  # concurrent yt-dlp/ffmpeg extractions (ffmpeg uses several cores each)
+MAX_QUEUED_JOBS = 12  # queued + running extractions before new ones get 503
+SYNC_WAIT_SECONDS = 900  # how long a blocking /clip request waits for its job
+JOB_RETENTION = 3600  # keep finished job status for polling this long
 FFMPEG = "ffmpeg"
 YTDLP = "yt-dlp"
 
@@ -101,6 +132,138 @@ def clip_cache_key(meeting_id, start, end):
     return f"{meeting_id}_{int(start)}_{int(end)}_{h}.mp4"
 
 
+def youtube_cache_key(video_id, start, end):
+    """Generate cache filename for a YouTube clip."""
+    raw = f"yt_{video_id}_{start:.1f}_{end:.1f}"
+    h = hashlib.md5(raw.encode()).hexdigest()[:12]
+    return f"yt_{video_id}_{int(start)}_{int(end)}_{h}.mp4"
+
+
+class ClipCacheIndex:
+    """SQLite index over CACHE_DIR: size, last access, hits and priority per
+    clip, with byte-budget eviction. Safe across threads and processes (WAL)."""
+
+    def __init__(self, cache_dir, max_bytes=CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(str(self.cache_dir / "_index.sqlite"), check_same_thread=False,
+                                  timeout=30, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS clips (
+                key TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                last_access REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                priority REAL NOT NULL DEFAULT 0
+            )""")
+
+    # Effective last access: recency plus a capped bonus for hits / priority (LRU + LFU)
+    EFFECTIVE = "last_access + ? * MIN(hits + priority, ?)"
+
+    def _effective_args(self):
+        return (CACHE_BONUS_HOURS * 3600, CACHE_BONUS_CAP)
+
+    def reconcile(self):
+        """Sync the index with the directory (one walk, at startup): index
+        clips it doesn't know about, forget rows whose file is gone."""
+        on_disk = {}
+        for f in self.cache_dir.iterdir():
+            if f.name.startswith('_') or f.suffix != ".mp4":
+                continue
+            st = f.stat()
+            on_disk[f.name] = (st.st_size, st.st_mtime)
+        with self.lock:
+            known = {k for (k,) in self.db.execute("SELECT key FROM clips")}
+            gone = known - set(on_disk)
+            self.db.executemany("DELETE FROM clips WHERE key = ?", [(k,) for k in gone])
+            self.db.executemany(
+                "INSERT INTO clips (key, size, created, last_access) VALUES (?, ?, ?, ?)",
+                [(k, size, mtime, mtime) for k, (size, mtime) in on_disk.items() if k not in known])
+        added = len(set(on_disk) - known)
+        if added or gone:
+            print(f"  Cache index: +{added} untracked clips, -{len(gone)} missing")
+        self.evict()
+
+    def lookup(self, key, touch=True):
+        """Path of a cached clip (recording the hit), or None."""
+        path = self.cache_dir / key
+        with self.lock:
+            row = self.db.execute("SELECT size FROM clips WHERE key = ?", (key,)).fetchone()
+            if not row:
+                return None
+            if not path.exists():
+                self.db.execute("DELETE FROM clips WHERE key = ?", (key,))
+                return None
+            if touch:
+                self.db.execute("UPDATE clips SET hits = hits + 1, last_access = ? WHERE key = ?",
+                                (time.time(), key))
+        return str(path)
+
+    def add(self, key, priority=0.0):
+        """Index a freshly written clip (keeping hits if it was re-extracted), then evict to budget."""
+        size = (self.cache_dir / key).stat().st_size
+        now = time.time()
+        with self.lock:
+            self.db.execute("""
+                INSERT INTO clips (key, size, created, last_access, priority) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET size = excluded.size, last_access = excluded.last_access,
+                    priority = MAX(priority, excluded.priority)""", (key, size, now, now, priority))
+        self.evict(keep=key)
+
+    def _remove(self, rows):
+        for key, _ in rows:
+            (self.cache_dir / key).unlink(missing_ok=True)
+        self.db.executemany("DELETE FROM clips WHERE key = ?", [(k,) for k, _ in rows])
+        return sum(size for _, size in rows)
+
+    def evict(self, keep=None):
+        """Remove lowest-value clips until the cache fits in max_bytes. Returns clips removed."""
+        removed = 0
+        with self.lock:
+            total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM clips").fetchone()[0]
+            while total > self.max_bytes:
+                rows = self.db.execute(
+                    f"SELECT key, size FROM clips WHERE key != ? ORDER BY {self.EFFECTIVE} LIMIT 20",
+                    (keep or "",) + self._effective_args()).fetchall()
+                if not rows:
+                    break
+                victims = []
+                for key, size in rows:
+                    victims.append((key, size))
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+                self._remove(victims)
+                removed += len(victims)
+        return removed
+
+    def expire(self):
+        """Remove clips idle for more than CACHE_TTL_HOURS (after bonus). Returns clips removed."""
+        cutoff = time.time() - CACHE_TTL_HOURS * 3600
+        with self.lock:
+            rows = self.db.execute(f"SELECT key, size FROM clips WHERE {self.EFFECTIVE} < ?",
+                                   self._effective_args() + (cutoff,)).fetchall()
+            self._remove(rows)
+        return len(rows)
+
+    def stats(self):
+        with self.lock:
+            count, size, hits = self.db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM clips").fetchone()
+        return {"clips": count, "bytes": size, "max_bytes": self.max_bytes, "hits": hits}
+
+
+clip_cache = ClipCacheIndex(CACHE_DIR)
+
+
+def cached_clip(cache_key, touch=True):
+    """Path of an indexed clip in the cache, else None."""
+    return clip_cache.lookup(cache_key, touch=touch)
+
+
 def get_clip_lock(key):
     """Get or create a lock for a specific clip to prevent duplicate generation."""
     with _locks_lock:
@@ -123,10 +286,9 @@ def extract_clip_ondemand(meeting_id, start, end, padding=2):
     # Check cache first
     cache_key = clip_cache_key(meeting_id, start, end)
     cache_path = CACHE_DIR / cache_key
-    if cache_path.exists():
-        age_hours = (time.time() - cache_path.stat().st_mtime) / 3600
-        if age_hours < CACHE_TTL_HOURS:
-            return str(cache_path), None
+    cached = cached_clip(cache_key)
+    if cached:
+        return cached, None
 
     # Get webcast URL
     url = get_webcast_url(meeting_id)
@@ -231,6 +393,7 @@ def extract_clip_ondemand(meeting_id, start, end, padding=2):
             cache_path.unlink(missing_ok=True)
             return None, f"Clip extraction failed. Try a pre-clipped moment or adjust timing."
 
+        clip_cache.add(cache_key)
         size_mb = cache_path.stat().st_size / (1024 * 1024)
         print(f"  Clip ready: {cache_key} ({size_mb:.1f}MB)")
         return str(cache_path), None
@@ -254,16 +417,13 @@ def extract_youtube_clip(video_id, start, end, padding=2):
         return None, f"Invalid duration: {duration:.0f}s (max {MAX_CLIP_SECONDS}s)"
 
     # Cache key
-    raw = f"yt_{video_id}_{start:.1f}_{end:.1f}"
-    h = hashlib.md5(raw.encode()).hexdigest()[:12]
-    cache_key = f"yt_{video_id}_{int(start)}_{int(end)}_{h}.mp4"
+    cache_key = youtube_cache_key(video_id, start, end)
     cache_path = CACHE_DIR / cache_key
 
     # Check cache
-    if cache_path.exists():
-        age_hours = (time.time() - cache_path.stat().st_mtime) / 3600
-        if age_hours < CACHE_TTL_HOURS:
-            return str(cache_path), None
+    cached = cached_clip(cache_key)
+    if cached:
+        return cached, None
 
     # Lock to prevent duplicate extraction
     lock = get_clip_lock(cache_key)
@@ -321,6 +481,7 @@ def extract_youtube_clip(video_id, start, end, padding=2):
             cache_path.unlink(missing_ok=True)
             return None, "YouTube clip extraction failed"
 
+        clip_cache.add(cache_key)
         size_mb = cache_path.stat().st_size / (1024 * 1024)
         print(f"  YouTube clip ready: {cache_key} ({size_mb:.1f}MB)")
         return str(cache_path), None
@@ -334,18 +495,55 @@ def extract_youtube_clip(video_id, start, end, padding=2):
 
 
 def cleanup_cache():
-    """Remove cached clips older than CACHE_TTL_HOURS."""
-    now = time.time()
-    removed = 0
-    for f in CACHE_DIR.iterdir():
-        if f.name.startswith('_'):
+    """Drop idle clips and enforce the byte budget (via the index — no directory walk)."""
+    expired = clip_cache.expire()
+    evicted = clip_cache.evict()
+    if expired or evicted:
+        print(f"  Cache cleanup: removed {expired} idle, {evicted} over-budget clips")
+
+
+def prewarm_cache(meeting_id, video_path, moments, max_score):
+    """Cut cache clips for moments scoring PREWARM_MIN_SCORE..max_score from an
+    already-downloaded meeting video, keyed as the Transcripts page requests
+    them (whole-second start/end, same padding as extract_clip_ondemand)."""
+    candidates = [m for m in moments if PREWARM_MIN_SCORE <= m.get("composite_score", 0) < max_score]
+    candidates.sort(key=lambda m: -m.get("composite_score", 0))
+    warmed = 0
+    for moment in candidates[:PREWARM_MAX_CLIPS]:
+        start, end = float(int(moment["start"])), float(int(moment["end"]))
+        if not 0 < end - start <= MAX_CLIP_SECONDS:
             continue
-        age_hours = (now - f.stat().st_mtime) / 3600
-        if age_hours > CACHE_TTL_HOURS:
-            f.unlink()
-            removed += 1
-    if removed:
-        print(f"  Cache cleanup: removed {removed} expired clips")
+        cache_key = clip_cache_key(meeting_id, start, end)
+        if cached_clip(cache_key, touch=False):
+            continue
+        cache_path = CACHE_DIR / cache_key
+        dl_start = max(0, start - 2)
+        cmd = [
+            FFMPEG, "-y",
+            "-ss", str(dl_start),
+            "-i", str(video_path),
+            "-t", str(end + 2 - dl_start),
+            "-c:v", "libx264", "-preset", "fast", "-crf", "23",
+            "-c:a", "aac", "-b:a", "128k",
+            "-movflags", "+faststart",
+            str(cache_path),
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            # One bad cut mustn't stop the rest (or preclip_meeting deleting the source video)
+            reason = "timed out" if isinstance(e, subprocess.TimeoutExpired) else str(e)[:100]
+            print(f"    Prewarm failed: {cache_key} ({reason})")
+            cache_path.unlink(missing_ok=True)
+            continue
+        if result.returncode == 0 and cache_path.exists() and cache_path.stat().st_size >= 1000:
+            clip_cache.add(cache_key, priority=moment.get("composite_score", 0))
+            warmed += 1
+        else:
+            cache_path.unlink(missing_ok=True)
+    if warmed:
+        print(f"  Warmed cache with {warmed} clips (score {PREWARM_MIN_SCORE}-{max_score})")
+    return warmed
 
 
 def preclip_meeting(meeting_id, min_score=7):
@@ -461,6 +659,9 @@ def preclip_meeting(meeting_id, min_score=7):
     with open(manifest_path, "w") as f:
         json.dump(manifest, f, indent=2)
 
+    # Next-best moments go into the on-demand cache while the video is here
+    prewarm_cache(meeting_id, actual_video, moments, min_score)
+
     # Delete full video
     if actual_video.exists():
         size_gb = actual_video.stat().st_size / (1024**3)
@@ -471,6 +672,96 @@ def preclip_meeting(meeting_id, min_score=7):
     return clipped
 
 
+class JobQueueFull(Exception):
+    """Raised when the extraction queue is at MAX_QUEUED_JOBS."""
+
+
+class ClipJobs:
+    """Bounded worker pool for extraction jobs, one job per clip key.
+
+    A request for a clip already queued or running joins that job instead of
+    starting another extraction. Job functions return (result, error) like
+    extract_clip_ondemand().
+    """
+
+    def __init__(self, workers=CLIP_WORKERS, max_queued=MAX_QUEUED_JOBS, name="clip"):
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+        self.max_queued = max_queued
+        self.jobs = {}  # job id → job dict
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def job_id(key):
+        return hashlib.md5(key.encode()).hexdigest()[:16]
+
+    def submit(self, key, fn, *args, url=None):
+        """Job for key — the existing one while it is queued/running, else a new one.
+        Raises JobQueueFull when too many jobs are waiting."""
+        job_id = self.job_id(key)
+        with self.lock:
+            self._prune()
+            job = self.jobs.get(job_id)
+            if job and job["status"] in ("queued", "running"):
+                return job
+            active = sum(1 for j in self.jobs.values() if j["status"] in ("queued", "running"))
+            if active >= self.max_queued:
+                raise JobQueueFull()
+            job = {"id": job_id, "key": key, "status": "queued", "url": url, "result": None,
+                   "error": None, "created": time.time(), "finished": None}
+            self.jobs[job_id] = job
+            job["future"] = self.pool.submit(self._run, job, fn, args)
+            return job
+
+    def _run(self, job, fn, args):
+        job["status"] = "running"
+        try:
+            result, error = fn(*args)
+        except Exception as e:
+            result, error = None, str(e)
+        job["result"], job["error"] = result, error
+        job["status"] = "failed" if error else "done"
+        job["finished"] = time.time()
+        return result, error
+
+    def _prune(self):
+        now = time.time()
+        for job_id in [k for k, j in self.jobs.items() if j["finished"] and now - j["finished"] > JOB_RETENTION]:
+            del self.jobs[job_id]
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    @staticmethod
+    def describe(job):
+        """Public status of a job (JSON-safe)."""
+        out = {"job": job["id"], "status": job["status"], "poll": f"/jobs/{job['id']}"}
+        if job["status"] == "done" and job["url"]:
+            out["url"] = job["url"]
+        if job["error"]:
+            out["error"] = job["error"]
+        return out
+
+    def stats(self):
+        with self.lock:
+            counts = {}
+            for j in self.jobs.values():
+                counts[j["status"]] = counts.get(j["status"], 0) + 1
+            return counts
+
+
+def preclip_job(meeting_id, min_score):
+    """preclip_meeting() as a job function: (number of clips, error)."""
+    clipped = preclip_meeting(meeting_id, min_score=min_score)
+    return len(clipped), None
+
+
+# Extractions (minutes each) and pre-clipping (downloads whole meetings) get
+# separate pools so a pre-clip run never holds up on-demand clips.
+clip_jobs = ClipJobs()
+preclip_jobs = ClipJobs(workers=1, max_queued=4, name="preclip")
+
+
 class ClipHandler(BaseHTTPRequestHandler):
     """HTTP handler for clip requests."""
 
@@ -478,35 +769,72 @@ class ClipHandler(BaseHTTPRequestHandler):
         """Suppress default access log, use custom."""
         pass
 
+    def parse_range(self, size):
+        """(start, end) inclusive for a single "Range: bytes=..." header,
+        None to send the whole file, or "invalid" for an unsatisfiable range."""
+        header = self.headers.get("Range", "")
+        m = re.match(r"^bytes=(\d*)-(\d*)$", header.strip())
+        if not m or (not m.group(1) and not m.group(2)):
+            return None  # absent, multi-range or malformed → full response
+        if not m.group(1):
+            length = int(m.group(2))
+            if length == 0:
+                return "invalid"
+            return max(0, size - length), size - 1
+        start = int(m.group(1))
+        end = min(int(m.group(2)), size - 1) if m.group(2) else size - 1
+        if start >= size or end < start:
+            return "invalid"
+        return start, end
+
     def send_file(self, path, content_type="video/mp4"):
-        """Send a file with proper headers."""
+        """Send a file (or the requested byte range of it) with proper headers."""
         try:
-            size = os.path.getsize(path)
+            f = open(path, "rb")
+        except OSError as e:
+            self.send_error(404 if isinstance(e, FileNotFoundError) else 500, str(e))
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            byte_range = self.parse_range(size)
+            if byte_range == "invalid":
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                return
+            start, end = byte_range or (0, size - 1)
+            length = end - start + 1 if size else 0
             filename = os.path.basename(path)
-            self.send_response(200)
+            self.send_response(206 if byte_range else 200)
             self.send_header("Content-Type", content_type)
-            self.send_header("Content-Length", str(size))
+            self.send_header("Content-Length", str(length))
+            if byte_range:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
             self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
             self.send_header("Accept-Ranges", "bytes")
             self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Expose-Headers", "Content-Length, Content-Range, Accept-Ranges")
             self.send_header("Cache-Control", "public, max-age=86400")
             self.end_headers()
-            with open(path, "rb") as f:
-                while True:
-                    chunk = f.read(65536)
-                    if not chunk:
-                        break
-                    self.wfile.write(chunk)
-        except Exception as e:
-            self.send_error(500, str(e))
+            if self.command == "HEAD" or not length:
+                return
+            try:
+                # socket.sendfile uses os.sendfile (zero-copy) where available
+                self.connection.sendfile(f, offset=start, count=length)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # player seeked elsewhere / closed the tab
 
-    def send_json(self, data, status=200):
+    def send_json(self, data, status=200, headers=None):
         """Send JSON response."""
         body = json.dumps(data, indent=2).encode()
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
         self.send_header("Access-Control-Allow-Origin", "*")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
         self.wfile.write(body)
 
@@ -515,9 +843,55 @@ class ClipHandler(BaseHTTPRequestHandler):
         self.send_response(200)
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, Range")
         self.end_headers()
 
+    def serve_clip(self, cache_key, url, params, extract, source_id, start, end):
+        """Serve a cached clip, or run extract(source_id, start, end) on the job
+        pool: wait for it, or with async=1 answer 202 and let the client poll."""
+        duration = end - start
+        if duration <= 0 or duration > MAX_CLIP_SECONDS:
+            self.send_json({"error": f"Invalid duration: {duration:.0f}s (max {MAX_CLIP_SECONDS}s)"}, 400)
+            return
+
+        # Players fetch a clip in many ranges; count a hit only for the first
+        rng = self.headers.get("Range", "")
+        cached = cached_clip(cache_key, touch=not rng or rng.startswith("bytes=0-"))
+        if cached:
+            self.send_file(cached)
+            return
+
+        try:
+            job = clip_jobs.submit(cache_key, extract, source_id, start, end, url=url)
+        except JobQueueFull:
+            self.send_json({"error": "Clip server busy, try again shortly"}, 503, {"Retry-After": "30"})
+            return
+
+        if params.get('async', ['0'])[0] in ('1', 'true'):
+            done = job["status"] == "done"
+            self.send_json(ClipJobs.describe(job), 200 if done else 202,
+                           None if done else {"Location": f"/jobs/{job['id']}"})
+            return
+
+        try:
+            clip_path, error = job["future"].result(timeout=SYNC_WAIT_SECONDS)
+        except FutureTimeout:
+            self.send_json({"error": "Clip extraction still running", **ClipJobs.describe(job)}, 504)
+            return
+        if error:
+            self.send_json({"error": error}, 500)
+            return
+        self.send_file(clip_path)
+
+    def do_HEAD(self):
+        """Headers only, for pre-clipped files (players probe size before seeking)."""
+        path = urlparse(self.path).path.rstrip('/')
+        clip_match = re.match(r'^/clips/([^/]+)/([^/]+\.mp4)$', path)
+        if not clip_match:
+            self.send_error(404, "Not found")
+            return
+        self.send_file(str(CLIPS_DIR / clip_match.group(1) / clip_match.group(2)))
+
     def do_GET(self):
         parsed = urlparse(self.path)
         path = parsed.path.rstrip('/')
@@ -525,7 +899,8 @@ class ClipHandler(BaseHTTPRequestHandler):
 
         # Health check
         if path == '/health':
-            self.send_json({"status": "ok", "clips_dir": str(CLIPS_DIR)})
+            self.send_json({"status": "ok", "clips_dir": str(CLIPS_DIR), "cache": clip_cache.stats(),
+                            "jobs": clip_jobs.stats(), "preclip_jobs": preclip_jobs.stats()})
             return
 
         # List meetings with clips
@@ -569,6 +944,19 @@ class ClipHandler(BaseHTTPRequestHandler):
                 self.send_error(404, "No manifest for this meeting")
             return
 
+        # Job status: /jobs/{job_id}
+        job_match = re.match(r'^/jobs/([0-9a-f]+)$', path)
+        if job_match:
+            job = clip_jobs.get(job_match.group(1)) or preclip_jobs.get(job_match.group(1))
+            if not job:
+                self.send_json({"error": "Unknown or expired job"}, 404)
+                return
+            status = ClipJobs.describe(job)
+            if job["status"] == "done" and job["url"] is None and job["result"] is not None:
+                status["clips"] = job["result"]
+            self.send_json(status)
+            return
+
         # On-demand clip: /clip?meeting=ID&start=S&end=E
         if path == '/clip':
             meeting_id = params.get('meeting', [None])[0]
@@ -588,12 +976,9 @@ class ClipHandler(BaseHTTPRequestHandler):
 
             print(f"  On-demand clip: {meeting_id} [{start:.0f}-{end:.0f}]")
 
-            clip_path, error = extract_clip_ondemand(meeting_id, start, end)
-            if error:
-                self.send_json({"error": error}, 500)
-                return
-
-            self.send_file(clip_path)
+            url = "/clip?" + urlencode({"meeting": meeting_id, "start": params['start'][0], "end": params['end'][0]})
+            self.serve_clip(clip_cache_key(meeting_id, start, end), url, params,
+                            extract_clip_ondemand, meeting_id, start, end)
             return
 
         # Pre-clip endpoint: /preclip?meeting=ID&min_score=7
@@ -605,13 +990,13 @@ class ClipHandler(BaseHTTPRequestHandler):
                 self.send_json({"error": "Required: meeting"}, 400)
                 return
 
-            # Run in thread to not block server
-            def do_preclip():
-                preclip_meeting(meeting_id, min_score=min_score)
-
-            t = threading.Thread(target=do_preclip, daemon=True)
-            t.start()
-            self.send_json({"status": "pre-clipping started", "meeting_id": meeting_id})
+            # Queued on the pre-clip pool so the server isn't blocked
+            try:
+                job = preclip_jobs.submit(f"preclip_{meeting_id}_{min_score}", preclip_job, meeting_id, min_score)
+            except JobQueueFull:
+                self.send_json({"error": "Pre-clip queue full, try again later"}, 503)
+                return
+            self.send_json({"status": "pre-clipping started", "meeting_id": meeting_id, **ClipJobs.describe(job)}, 202)
             return
 
         # YouTube clip extraction: /ytclip?video=VIDEO_ID&start=S&end=E
@@ -631,19 +1016,11 @@ class ClipHandler(BaseHTTPRequestHandler):
                 self.send_json({"error": "start and end must be numbers"}, 400)
                 return
 
-            duration = end - start
-            if duration <= 0 or duration > MAX_CLIP_SECONDS:
-                self.send_json({"error": f"Invalid duration: {duration:.0f}s (max {MAX_CLIP_SECONDS}s)"}, 400)
-                return
-
             print(f"  YouTube clip: {video_id} [{start:.0f}-{end:.0f}]")
 
-            clip_path, error = extract_youtube_clip(video_id, start, end)
-            if error:
-                self.send_json({"error": error}, 500)
-                return
-
-            self.send_file(clip_path)
+            url = "/ytclip?" + urlencode({"video": video_id, "start": params['start'][0], "end": params['end'][0]})
+            self.serve_clip(youtube_cache_key(video_id, start, end), url, params,
+                            extract_youtube_clip, video_id, start, end)
             return
 
         self.send_error(404, "Not found")
@@ -673,18 +1050,23 @@ def main():
         print(f"Done: {len(clipped)} clips extracted")
         return
 
-    # Start cache cleanup thread
+    # Index any clips cached before the index existed, then keep it trimmed
+    clip_cache.reconcile()
+    cleanup_cache()
     cleanup_thread = threading.Thread(target=run_cache_cleanup_thread, daemon=True)
     cleanup_thread.start()
 
     # Start server
-    server = HTTPServer(("0.0.0.0", args.port), ClipHandler)
+    server = ThreadingHTTPServer(("0.0.0.0", args.port), ClipHandler)
+    server.daemon_threads = True
     print(f"Clip server running on port {args.port}")
     print(f"  Pre-clips: {CLIPS_DIR}")
-    print(f"  Cache: {CACHE_DIR}")
+    print(f"  Cache: {CACHE_DIR} (budget {CACHE_MAX_BYTES / 1024 ** 3:.0f}GB)")
     print(f"  Endpoints:")
     print(f"    GET /clips/{{meeting_id}}/{{clip}}.mp4  — pre-clipped")
-    print(f"    GET /clip?meeting=ID&start=S&end=E      — on-demand")
+    print(f"    GET /clip?meeting=ID&start=S&end=E      — on-demand (&async=1 → 202 + /jobs/ID)")
+    print(f"    GET /ytclip?video=ID&start=S&end=E      — YouTube")
+    print(f"    GET /jobs/{{job_id}}                      — extraction status")
     print(f"    GET /meetings                            — list")
     print(f"    GET /health                              — health")
     print(f"    GET /preclip?meeting=ID                  — trigger pre-clip")
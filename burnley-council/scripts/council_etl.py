@@ -8,18 +8,26 @@ Usage:
     python council_etl.py --council hyndburn --download
     python council_etl.py --council burnley --retrofit
     python council_etl.py --council hyndburn --insights-only
+    python council_etl.py --council blackpool --incremental   # reparse only new/changed CSVs
+    python council_etl.py --council lancashire_cc --stream    # file-at-a-time, low-memory export
+    python ch_snapshot.py --companies BasicCompanyData*.zip --psc persons-with-*.zip
+    python council_etl.py --companies-house                   # supplier matching from the snapshot
 """
 
 import argparse
 import csv
+import filecmp
+import hashlib
 import io
 import json
 import os
 import re
+import shutil
+import sqlite3
 import sys
 from collections import defaultdict
 from datetime import datetime
-from difflib import SequenceMatcher
+from itertools import chain
 from pathlib import Path
 from urllib.parse import urljoin
 
@@ -36,6 +44,20 @@ try:
 except ImportError:
     HAS_BS4 = False
 
+# Optional: typed columnar store for doge_analysis (needs numpy)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+try:
+    from spending_store import write_spending_columns
+    HAS_SPENDING_STORE = True
+except ImportError:
+    HAS_SPENDING_STORE = False
+
+# Shared Companies House client (sliding-window rate limit + SQLite response cache)
+from ch_client import get_client as get_ch_client
+# Local CH bulk snapshot (ch_snapshot.py) — answers profiles/PSC/name search offline
+from ch_snapshot import open_snapshot
+from name_index import sequence_ratio
+
 # ─── Paths ───────────────────────────────────────────────────────────
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
@@ -46,6 +68,9 @@ SPA_DATA_DIR = BASE_DIR / "burnley-app" / "public" / "data"
 # These get v4 monthly chunking with field stripping in export_council().
 MONTHLY_CHUNK_COUNCILS = {'lancashire_cc', 'blackpool', 'blackburn'}
 
+# Scratch dir under data/{council}/ where SpendingSink spools records during export
+SPOOL_DIRNAME = ".spool"
+
 # ─── Council Registry ────────────────────────────────────────────────
 COUNCIL_REGISTRY = {
     "hyndburn": {
@@ -318,24 +343,72 @@ def fy_to_start_year(fy_str):
         return 0
 
 
-def read_csv_safe(filepath):
-    """Read CSV with fallback encodings, return list of dicts."""
-    encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'iso-8859-1']
+CSV_ENCODINGS = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'iso-8859-1']
+
+
+def detect_encoding(filepath, encodings=CSV_ENCODINGS):
+    """Return the first encoding that decodes the whole file, or None.
+    Reads in 1 MB blocks so large CSVs are never held in memory."""
     for enc in encodings:
         try:
             with open(filepath, 'r', encoding=enc) as f:
-                # Skip any BOM and detect if header is present
-                content = f.read()
-                # Some CSVs have empty first lines
-                lines = content.strip().split('\n')
-                if not lines:
-                    return []
-                reader = csv.DictReader(lines)
-                return list(reader)
-        except (UnicodeDecodeError, csv.Error):
+                while f.read(1 << 20):
+                    pass
+            return enc
+        except (UnicodeDecodeError, UnicodeError):
             continue
-    print(f"  WARNING: Could not read {filepath} with any encoding")
-    return []
+    return None
+
+
+def iter_text_lines(filepath, encoding):
+    """Yield lines lazily with the same result as f.read().strip().split('\\n').
+
+    Leading/trailing blank lines are dropped and the first/last lines are
+    stripped; blank lines in the middle are kept.
+    """
+    with open(filepath, 'r', encoding=encoding) as f:
+        held = None   # last non-blank line, held back in case it is the final one
+        blanks = []   # whitespace-only lines seen since `held`
+        for line in f:
+            if line.endswith('\n'):
+                line = line[:-1]
+            if not line.strip():
+                if held is not None:
+                    blanks.append(line)
+                continue
+            if held is None:
+                held = line.lstrip()
+                continue
+            yield held
+            yield from blanks
+            blanks = []
+            held = line
+        if held is not None:
+            yield held.rstrip()
+
+
+def iter_csv_rows(filepath):
+    """Yield CSV rows as dicts one at a time, with fallback encodings."""
+    enc = detect_encoding(filepath)
+    if enc is None:
+        print(f"  WARNING: Could not read {filepath} with any encoding")
+        return
+    try:
+        yield from csv.DictReader(iter_text_lines(filepath, enc))
+    except csv.Error as e:
+        print(f"  WARNING: {filepath}: {e} — remaining rows skipped")
+
+
+def read_csv_safe(filepath):
+    """Read CSV with fallback encodings, return list of dicts."""
+    return list(iter_csv_rows(filepath))
+
+
+def iter_csv_dicts(filepath, encoding="utf-8-sig", drop_nul=False):
+    """Yield csv.DictReader rows straight off the file handle (errors='replace')."""
+    with open(filepath, encoding=encoding, errors="replace") as f:
+        lines = (line.replace("\x00", "") for line in f) if drop_nul else f
+        yield from csv.DictReader(lines)
 
 
 # ─── Taxonomy ────────────────────────────────────────────────────────
@@ -364,58 +437,181 @@ def save_taxonomy(taxonomy):
     print(f"  Taxonomy saved to {TAXONOMY_PATH}")
 
 
-def apply_taxonomy(record, taxonomy, council_id):
-    """Apply taxonomy mappings to a record. Returns modified record."""
+# Compiled taxonomy index — alias → canonical hash maps built once per run,
+# so normalising N records is O(N) rather than O(N × suppliers × aliases).
+_taxonomy_index_memo = {}
+
+
+def _taxonomy_digest(taxonomy):
+    """Hash the sections apply_taxonomy() reads. Key order matters (first match wins)."""
+    payload = json.dumps([
+        taxonomy.get("departments", {}),
+        taxonomy.get("suppliers", {}),
+        taxonomy.get("hyndburn_cost_centre_keywords", {}),
+    ], ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _build_keyword_automaton(patterns):
+    """Aho-Corasick automaton over (keyword, rank) pairs.
+
+    Each state stores the lowest rank of any keyword ending there (directly or
+    via its failure chain), so one scan of a string yields the best-ranked match.
+    """
+    goto = [{}]
+    best = [None]
+    for kw, rank in patterns:
+        state = 0
+        for ch in kw:
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto[state][ch] = nxt
+                goto.append({})
+                best.append(None)
+            state = nxt
+        if best[state] is None or rank < best[state]:
+            best[state] = rank
+
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    head = 0
+    while head < len(queue):
+        state = queue[head]
+        head += 1
+        for ch, nxt in goto[state].items():
+            queue.append(nxt)
+            f = fail[state]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[nxt] = goto[f].get(ch, 0) if goto[f].get(ch, 0) != nxt else 0
+            inherited = best[fail[nxt]]
+            if inherited is not None and (best[nxt] is None or inherited < best[nxt]):
+                best[nxt] = inherited
+    return {"goto": goto, "fail": fail, "best": best}
+
+
+def _automaton_best_rank(automaton, text):
+    """Lowest keyword rank found anywhere in text, or None."""
+    goto, fail, best = automaton["goto"], automaton["fail"], automaton["best"]
+    state = 0
+    found = None
+    for ch in text:
+        while state and ch not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(ch, 0)
+        rank = best[state]
+        if rank is not None and (found is None or rank < found):
+            found = rank
+            if found == 0:
+                break
+    return found
+
+
+def build_taxonomy_index(taxonomy):
+    """Compile taxonomy.json into lookup tables for apply_taxonomy().
+
+    - departments: {council_id: {alias: canonical}}
+    - suppliers: {alias: [canonical, company_number, company_url]} (CH pre-joined)
+    - hyndburn_keywords: Aho-Corasick automaton over cost-centre keywords,
+      ranked by canonical order so the first-listed department still wins.
+    """
+    departments = {}
+    for canonical, info in taxonomy.get("departments", {}).items():
+        for council_id, aliases in (info.get("aliases") or {}).items():
+            council_map = departments.setdefault(council_id, {})
+            for alias in aliases:
+                council_map.setdefault(alias, canonical)
+
+    suppliers = {}
+    for canonical, info in taxonomy.get("suppliers", {}).items():
+        ch = info.get("companies_house")
+        if ch and isinstance(ch, dict):
+            entry = [canonical, ch.get("company_number"), ch.get("url")]
+        else:
+            entry = [canonical, None, None]
+        for alias in info.get("aliases", []):
+            suppliers.setdefault(alias, entry)
+
+    keyword_canonicals = []
+    patterns = []
+    always_rank = None  # an empty keyword matches every non-empty field
+    for rank, (canonical, keywords) in enumerate(taxonomy.get("hyndburn_cost_centre_keywords", {}).items()):
+        keyword_canonicals.append(canonical)
+        for kw in keywords:
+            kw = kw.upper()
+            if not kw:
+                if always_rank is None:
+                    always_rank = rank
+                continue
+            patterns.append((kw, rank))
+
+    return {
+        "departments": departments,
+        "suppliers": suppliers,
+        "hyndburn_keywords": _build_keyword_automaton(patterns),
+        "hyndburn_keyword_canonicals": keyword_canonicals,
+        "hyndburn_keyword_always": always_rank,
+    }
+
+
+def get_taxonomy_index(taxonomy):
+    """Return the compiled index for this taxonomy, building it on first use.
+
+    Memoised on a hash of the taxonomy content, so edits made during a run
+    (e.g. Companies House matching) produce a fresh index.
+    """
+    digest = _taxonomy_digest(taxonomy)
+    index = _taxonomy_index_memo.get(digest)
+    if index is None:
+        index = build_taxonomy_index(taxonomy)
+        _taxonomy_index_memo.clear()
+        _taxonomy_index_memo[digest] = index
+    return index
+
+
+def apply_taxonomy(record, taxonomy, council_id, index=None):
+    """Apply taxonomy mappings to a record. Returns modified record.
+
+    Pass a prebuilt index (get_taxonomy_index) when normalising many records.
+    """
+    if index is None:
+        index = get_taxonomy_index(taxonomy)
+
     # Department mapping — exact alias match first
     dept_raw = record.get("department_raw", "")
     record["department"] = dept_raw  # default: keep raw
-    matched = False
-    for canonical, info in taxonomy.get("departments", {}).items():
-        aliases = info.get("aliases", {}).get(council_id, [])
-        if dept_raw in aliases:
-            record["department"] = canonical
-            matched = True
-            break
+    canonical = index["departments"].get(council_id, {}).get(dept_raw)
+    matched = canonical is not None
+    if matched:
+        record["department"] = canonical
 
     # Keyword-based mapping for old-format Hyndburn (Service Cost Centre)
     # Also used as fallback when department_raw is empty but service_area_raw exists
     if not matched and council_id == "hyndburn":
-        search_fields = [dept_raw]
+        field_val = dept_raw
         if not dept_raw and record.get("service_area_raw"):
-            search_fields = [record["service_area_raw"]]
-        for field_val in search_fields:
-            if not field_val:
-                continue
-            field_upper = field_val.upper()
-            keywords_map = taxonomy.get("hyndburn_cost_centre_keywords", {})
-            for canonical, keywords in keywords_map.items():
-                for kw in keywords:
-                    if kw.upper() in field_upper:
-                        record["department"] = canonical
-                        matched = True
-                        break
-                if matched:
-                    break
-            if matched:
-                break
+            field_val = record["service_area_raw"]
+        if field_val:
+            rank = _automaton_best_rank(index["hyndburn_keywords"], field_val.upper())
+            always = index["hyndburn_keyword_always"]
+            if always is not None and (rank is None or always < rank):
+                rank = always
+            if rank is not None:
+                record["department"] = index["hyndburn_keyword_canonicals"][rank]
+                matched = True
         if not matched and (dept_raw or record.get("service_area_raw")):
             record["department"] = "Other"
 
-    # Supplier canonical mapping
+    # Supplier canonical mapping (Companies House fields pre-joined in the index)
     supplier = record.get("supplier", "")
-    record["supplier_canonical"] = supplier  # default: same as raw
-    record["supplier_company_number"] = None
-    record["supplier_company_url"] = None
-
-    for canonical, info in taxonomy.get("suppliers", {}).items():
-        if supplier in info.get("aliases", []):
-            record["supplier_canonical"] = canonical
-            # Companies House data
-            ch = info.get("companies_house")
-            if ch and isinstance(ch, dict):
-                record["supplier_company_number"] = ch.get("company_number")
-                record["supplier_company_url"] = ch.get("url")
-            break
+    entry = index["suppliers"].get(supplier)
+    if entry:
+        record["supplier_canonical"], record["supplier_company_number"], record["supplier_company_url"] = entry
+    else:
+        record["supplier_canonical"] = supplier  # default: same as raw
+        record["supplier_company_number"] = None
+        record["supplier_company_url"] = None
 
     return record
 
@@ -607,7 +803,7 @@ def parse_hyndburn_new(rows, filename):
 
 def parse_hyndburn(csv_files, data_start_fy="2016/17"):
     """Parse all Hyndburn CSVs, handling both old and new schemas."""
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for csv_path in csv_files:
@@ -627,13 +823,13 @@ def parse_hyndburn(csv_files, data_start_fy="2016/17"):
                 records = parse_hyndburn_old(rows, csv_path.name)
 
         filtered = filter_records_by_fy(records, data_start_fy)
-        all_records.extend(filtered)
+        yield from filtered
+        total += len(filtered)
 
         if records:
             print(f"  {csv_path.name}: {len(records)} records ({schema} format)")
 
-    print(f"  Total Hyndburn records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Hyndburn records (from {data_start_fy}): {total}")
 
 
 # ─── Burnley Retrofit Adapter ────────────────────────────────────────
@@ -685,7 +881,7 @@ def parse_pendle(csv_files, data_start_fy="2021/22"):
     Date format: DD/MM/YYYY
     Amount: Net Amount (decimal, no currency symbol)
     """
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for csv_path in csv_files:
@@ -740,13 +936,13 @@ def parse_pendle(csv_files, data_start_fy="2021/22"):
             ))
 
         filtered = filter_records_by_fy(records, data_start_fy)
-        all_records.extend(filtered)
+        yield from filtered
+        total += len(filtered)
 
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
 
-    print(f"  Total Pendle records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Pendle records (from {data_start_fy}): {total}")
 
 
 # ─── Lancaster Adapter ──────────────────────────────────────────────
@@ -762,7 +958,7 @@ def parse_lancaster(csv_files, data_start_fy="2021/22"):
     Date format: D Mon YYYY (e.g. "9 Jan 2025")
     Amount: quoted with commas and minus signs for credits
     """
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for csv_path in csv_files:
@@ -805,13 +1001,13 @@ def parse_lancaster(csv_files, data_start_fy="2021/22"):
             ))
 
         filtered = filter_records_by_fy(records, data_start_fy)
-        all_records.extend(filtered)
+        yield from filtered
+        total += len(filtered)
 
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
 
-    print(f"  Total Lancaster records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Lancaster records (from {data_start_fy}): {total}")
 
 
 # ─── Ribble Valley Adapter ──────────────────────────────────────────
@@ -819,28 +1015,20 @@ def parse_lancaster(csv_files, data_start_fy="2021/22"):
 def read_csv_with_header_search(filepath, header_marker):
     """Read a CSV file that has title/blank rows before the real header.
     Searches for a row containing header_marker and uses it as the header."""
-    raw_lines = []
-    for enc in ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']:
-        try:
-            with open(str(filepath), 'r', encoding=enc) as f:
-                raw_lines = f.read().strip().split('\n')
-            break
-        except UnicodeDecodeError:
-            continue
-    if not raw_lines:
+    enc = detect_encoding(str(filepath), ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252'])
+    if enc is None:
         return []
 
-    header_idx = None
-    for i, line in enumerate(raw_lines):
+    lines = iter_text_lines(str(filepath), enc)
+    for line in lines:
         if header_marker in line:
-            header_idx = i
             break
-    if header_idx is None:
+    else:
         return []
 
-    csv_content = '\n'.join(raw_lines[header_idx:])
-    reader = csv.DictReader(io.StringIO(csv_content))
-    return list(reader)
+    # Re-attach line endings so quoted multi-line fields parse as before
+    rest = (l + '\n' for l in chain([line], lines))
+    return list(csv.DictReader(rest))
 
 
 def parse_ribble_valley(csv_files, data_start_fy="2021/22"):
@@ -858,7 +1046,7 @@ def parse_ribble_valley(csv_files, data_start_fy="2021/22"):
     Amount: decimal, no currency symbol
     Has 2-3 title rows before actual header with numbered columns.
     """
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for csv_path in csv_files:
@@ -914,13 +1102,13 @@ def parse_ribble_valley(csv_files, data_start_fy="2021/22"):
             ))
 
         filtered = filter_records_by_fy(records, data_start_fy)
-        all_records.extend(filtered)
+        yield from filtered
+        total += len(filtered)
 
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
 
-    print(f"  Total Ribble Valley records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Ribble Valley records (from {data_start_fy}): {total}")
 
 
 # ─── Chorley Adapter ────────────────────────────────────────────────
@@ -942,7 +1130,7 @@ def parse_chorley(csv_files, data_start_fy="2021/22"):
     Date format: DD/MM/YYYY
     Amount: may include £ symbol and commas (older CIPFA files) or plain numbers (newer).
     """
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for csv_path in csv_files:
@@ -1019,14 +1207,14 @@ def parse_chorley(csv_files, data_start_fy="2021/22"):
             records.append(record)
 
         filtered = filter_records_by_fy(records, data_start_fy)
-        all_records.extend(filtered)
+        yield from filtered
+        total += len(filtered)
 
         fmt_label = "CIPFA" if is_cipfa else "PCard"
         if records:
             print(f"  {csv_path.name} [{fmt_label}]: {len(records)} records")
 
-    print(f"  Total Chorley records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Chorley records (from {data_start_fy}): {total}")
 
 
 # ─── South Ribble Adapter ───────────────────────────────────────────
@@ -1043,7 +1231,7 @@ def parse_south_ribble(csv_files, data_start_fy="2021/22"):
     Date format: DD/MM/YYYY
     Amount: includes £ symbol and commas
     """
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for csv_path in csv_files:
@@ -1088,13 +1276,13 @@ def parse_south_ribble(csv_files, data_start_fy="2021/22"):
             ))
 
         filtered = filter_records_by_fy(records, data_start_fy)
-        all_records.extend(filtered)
+        yield from filtered
+        total += len(filtered)
 
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
 
-    print(f"  Total South Ribble records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total South Ribble records (from {data_start_fy}): {total}")
 
 
 # ─── Lancashire CC Adapter ──────────────────────────────────────────
@@ -1111,16 +1299,12 @@ def parse_lancashire_cc(csv_files, data_start_fy="2024/25"):
     Volume: ~25,000-50,000 records/month (upper-tier authority)
     Note: CSV rows have a trailing comma — handled by csv.DictReader as empty final column
     """
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for csv_path in csv_files:
-        rows = read_csv_safe(str(csv_path))
-        if not rows:
-            continue
-
         records = []
-        for row in rows:
+        for row in iter_csv_rows(str(csv_path)):
             cleaned = {k.strip(): v for k, v in row.items() if k and k.strip()}
 
             supplier = cleaned.get('Supplier name', '')
@@ -1160,13 +1344,13 @@ def parse_lancashire_cc(csv_files, data_start_fy="2024/25"):
             ))
 
         filtered = filter_records_by_fy(records, data_start_fy)
-        all_records.extend(filtered)
+        yield from filtered
+        total += len(filtered)
 
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
 
-    print(f"  Total Lancashire CC records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Lancashire CC records (from {data_start_fy}): {total}")
 
 
 def parse_blackpool(csv_files, data_start_fy="2019/20"):
@@ -1209,66 +1393,58 @@ def parse_blackpool(csv_files, data_start_fy="2019/20"):
     Date format: DD/MM/YYYY (sometimes D/MM/YYYY)
     Amount: may include commas in quoted strings (e.g. "1,754.86")
     """
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for csv_path in csv_files:
         is_pcard = csv_path.name.startswith('pcard-')
 
-        # --- Read raw lines to handle CIAXLONE / DefnSheetName headers ---
-        raw_lines = []
-        for enc in ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']:
-            try:
-                with open(str(csv_path), 'r', encoding=enc) as f:
-                    raw_lines = f.read().strip().split('\n')
-                break
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-        if not raw_lines:
+        # --- Stream lines, handling CIAXLONE / DefnSheetName headers ---
+        enc = detect_encoding(str(csv_path), ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252'])
+        if enc is None:
+            continue
+        lines = iter_text_lines(str(csv_path), enc)
+        first_line = next(lines, None)
+        if first_line is None:
             continue
 
         # Detect and handle CIAXLONE format
         is_ciaxlone = False
-        if raw_lines[0].startswith('FORMAT CIAXLONE REPORT') or raw_lines[0].startswith('\ufeffFORMAT CIAXLONE REPORT'):
+        if first_line.startswith('FORMAT CIAXLONE REPORT') or first_line.startswith('\ufeffFORMAT CIAXLONE REPORT'):
             is_ciaxlone = True
             # Row 0: FORMAT CIAXLONE REPORT,...
             # Row 1: *,Body Name,Supplier Name,...
             # Row 2+: LIST,Blackpool Council,...
-            if len(raw_lines) < 3:
+            header_line = next(lines, None)
+            if header_line is None:
                 continue
             # Parse column headers from row 1 (skip leading *)
-            header_line = raw_lines[1]
             if header_line.startswith('*,'):
                 header_line = header_line[2:]
             elif header_line.startswith('\ufeff*,'):
                 header_line = header_line[3:]
-            # Build new lines: header + data rows (strip LIST, prefix)
-            data_lines = []
-            for line in raw_lines[2:]:
-                if line.startswith('LIST,'):
-                    data_lines.append(line[5:])  # strip "LIST,"
-                elif line.strip():
-                    data_lines.append(line)
-            raw_lines = [header_line] + data_lines
+            # Header + data rows (strip "LIST," prefix, drop blank lines)
+            data_lines = (line[5:] if line.startswith('LIST,') else line
+                          for line in lines if line.startswith('LIST,') or line.strip())
+            csv_lines = chain([header_line], data_lines)
 
         # Skip DefnSheetName header line (non-CIAXLONE variant)
-        elif 'DefnSheetName=' in raw_lines[0]:
-            raw_lines = raw_lines[1:]
-
-        if not raw_lines:
-            continue
+        elif 'DefnSheetName=' in first_line:
+            csv_lines = lines
+        else:
+            csv_lines = chain([first_line], lines)
 
         # Parse CSV from cleaned lines
-        reader = csv.DictReader(raw_lines)
-        rows = list(reader)
-        if not rows:
+        reader = csv.DictReader(csv_lines)
+        first_row = next(reader, None)
+        if first_row is None:
             continue
 
         # Detect format from column keys
-        first_keys = set(k.strip() for k in rows[0].keys() if k and k.strip())
+        first_keys = set(k.strip() for k in first_row.keys() if k and k.strip())
 
         records = []
-        for row in rows:
+        for row in chain([first_row], reader):
             cleaned = {k.strip(): v for k, v in row.items() if k and k.strip()}
 
             # --- Extract supplier ---
@@ -1366,14 +1542,14 @@ def parse_blackpool(csv_files, data_start_fy="2019/20"):
             ))
 
         filtered = filter_records_by_fy(records, data_start_fy)
-        all_records.extend(filtered)
+        yield from filtered
+        total += len(filtered)
 
         fmt_label = "PCard" if is_pcard else ("CIAXLONE" if is_ciaxlone else "Spend")
         if records:
             print(f"  {csv_path.name} [{fmt_label}]: {len(records)} records")
 
-    print(f"  Total Blackpool records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Blackpool records (from {data_start_fy}): {total}")
 
 
 def parse_west_lancashire(csv_files, data_start_fy="2016/17"):
@@ -1385,7 +1561,7 @@ def parse_west_lancashire(csv_files, data_start_fy="2016/17"):
     Amount may contain commas and leading/trailing spaces. One file is XLSX (Q4 2021-22).
     """
     start_year = fy_to_start_year(data_start_fy)
-    all_records = []
+    total = 0
     for csv_path in csv_files:
         if csv_path.suffix.lower() == ".xlsx":
             try:
@@ -1402,12 +1578,7 @@ def parse_west_lancashire(csv_files, data_start_fy="2016/17"):
                 print(f"  SKIP {csv_path.name}: {e}")
                 continue
         else:
-            try:
-                text = csv_path.read_text(encoding="utf-8-sig", errors="replace")
-            except Exception:
-                text = csv_path.read_text(encoding="latin-1", errors="replace")
-            reader = csv.DictReader(io.StringIO(text))
-            rows = list(reader)
+            rows = iter_csv_dicts(csv_path)
 
         records = []
         for row in rows:
@@ -1447,10 +1618,10 @@ def parse_west_lancashire(csv_files, data_start_fy="2016/17"):
             ))
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
-        all_records.extend(records)
+        yield from records
+        total += len(records)
 
-    print(f"  Total West Lancashire records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total West Lancashire records (from {data_start_fy}): {total}")
 
 
 def parse_blackburn(csv_files, data_start_fy="2019/20"):
@@ -1462,19 +1633,11 @@ def parse_blackburn(csv_files, data_start_fy="2019/20"):
     Headers may have trailing whitespace. Amounts have no commas.
     """
     start_year = fy_to_start_year(data_start_fy)
-    all_records = []
+    total = 0
     for csv_path in csv_files:
-        try:
-            text = csv_path.read_text(encoding="utf-8-sig", errors="replace")
-        except Exception:
-            text = csv_path.read_text(encoding="latin-1", errors="replace")
-        reader = csv.DictReader(io.StringIO(text))
-        # Strip whitespace from field names
-        if reader.fieldnames:
-            reader.fieldnames = [f.strip() for f in reader.fieldnames]
-
         records = []
-        for row in reader:
+        for row in iter_csv_dicts(csv_path):
+            # Strip whitespace from field names and values
             row = {k.strip(): v.strip() if v else "" for k, v in row.items()}
 
             date_str = row.get("Date") or row.get("Dateexpenditureoccurred") or ""
@@ -1511,10 +1674,10 @@ def parse_blackburn(csv_files, data_start_fy="2019/20"):
             ))
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
-        all_records.extend(records)
+        yield from records
+        total += len(records)
 
-    print(f"  Total Blackburn with Darwen records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Blackburn with Darwen records (from {data_start_fy}): {total}")
 
 
 def parse_wyre(csv_files, data_start_fy="2017/18"):
@@ -1528,7 +1691,7 @@ def parse_wyre(csv_files, data_start_fy="2017/18"):
     Some files are XLSX (Jan/Feb 2021, Oct 2024). Trailing comma on some files.
     """
     start_year = fy_to_start_year(data_start_fy)
-    all_records = []
+    total = 0
     for csv_path in csv_files:
         if csv_path.suffix.lower() == ".xlsx":
             try:
@@ -1545,13 +1708,7 @@ def parse_wyre(csv_files, data_start_fy="2017/18"):
                 print(f"  SKIP {csv_path.name}: {e}")
                 continue
         else:
-            try:
-                text = csv_path.read_text(encoding="utf-8-sig", errors="replace")
-            except Exception:
-                text = csv_path.read_text(encoding="latin-1", errors="replace")
-            text = text.replace("\x00", "")  # Remove NUL bytes
-            reader = csv.DictReader(io.StringIO(text))
-            rows = list(reader)
+            rows = iter_csv_dicts(csv_path, drop_nul=True)  # Remove NUL bytes
 
         records = []
         for row in rows:
@@ -1589,10 +1746,10 @@ def parse_wyre(csv_files, data_start_fy="2017/18"):
             ))
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
-        all_records.extend(records)
+        yield from records
+        total += len(records)
 
-    print(f"  Total Wyre records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Wyre records (from {data_start_fy}): {total}")
 
 
 def parse_preston(csv_files, data_start_fy="2019/20"):
@@ -1605,7 +1762,7 @@ def parse_preston(csv_files, data_start_fy="2019/20"):
     2019-21 use XLS format, 2022+ use XLSX.
     """
     start_year = fy_to_start_year(data_start_fy)
-    all_records = []
+    total = 0
     for csv_path in csv_files:
         rows = []
         header = []
@@ -1687,10 +1844,10 @@ def parse_preston(csv_files, data_start_fy="2019/20"):
             ))
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
-        all_records.extend(records)
+        yield from records
+        total += len(records)
 
-    print(f"  Total Preston records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Preston records (from {data_start_fy}): {total}")
 
 
 def parse_fylde(csv_files, data_start_fy="2015/16"):
@@ -1702,7 +1859,7 @@ def parse_fylde(csv_files, data_start_fy="2015/16"):
       Service Area/Department, Transaction Ref/Number
     """
     start_year = fy_to_start_year(data_start_fy)
-    all_records = []
+    total = 0
     for csv_path in csv_files:
         rows = []
         header = []
@@ -1831,10 +1988,10 @@ def parse_fylde(csv_files, data_start_fy="2015/16"):
             ))
         if records:
             print(f"  {csv_path.name}: {len(records)} records")
-        all_records.extend(records)
+        yield from records
+        total += len(records)
 
-    print(f"  Total Fylde records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Fylde records (from {data_start_fy}): {total}")
 
 
 def parse_lancashire_pcc(xlsx_files, data_start_fy="2018/19"):
@@ -1847,7 +2004,7 @@ def parse_lancashire_pcc(xlsx_files, data_start_fy="2018/19"):
     Threshold: £500
     """
     import openpyxl
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for xlsx_path in xlsx_files:
@@ -1918,15 +2075,15 @@ def parse_lancashire_pcc(xlsx_files, data_start_fy="2018/19"):
                 ))
 
             filtered = filter_records_by_fy(records, data_start_fy)
-            all_records.extend(filtered)
+            yield from filtered
+            total += len(filtered)
             file_records += len(filtered)
 
         wb.close()
         if file_records:
             print(f"  {xlsx_path.name}: {file_records} records")
 
-    print(f"  Total Lancashire PCC records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Lancashire PCC records (from {data_start_fy}): {total}")
 
 
 def parse_lancashire_fire(xlsx_files, data_start_fy="2022/23"):
@@ -1939,7 +2096,7 @@ def parse_lancashire_fire(xlsx_files, data_start_fy="2022/23"):
     Threshold: £500
     """
     import openpyxl
-    all_records = []
+    total = 0
     start_year = fy_to_start_year(data_start_fy)
 
     for xlsx_path in xlsx_files:
@@ -2020,215 +2177,507 @@ def parse_lancashire_fire(xlsx_files, data_start_fy="2022/23"):
                 ))
 
             filtered = filter_records_by_fy(records, data_start_fy)
-            all_records.extend(filtered)
+            yield from filtered
+            total += len(filtered)
             file_records += len(filtered)
 
         wb.close()
         if file_records:
             print(f"  {xlsx_path.name}: {file_records} records")
 
-    print(f"  Total Lancashire Fire records (from {data_start_fy}): {len(all_records)}")
-    return all_records
+    print(f"  Total Lancashire Fire records (from {data_start_fy}): {total}")
 
 
-# ─── Normalise & Insights ────────────────────────────────────────────
+# ─── Incremental ETL ─────────────────────────────────────────────────
+# Per-source-file manifest so --incremental only reparses new/changed CSVs.
+# State lives in data/{council}/etl_state/: manifest.json maps each source file
+# (size, mtime, sha256) to its [start, start+count) range in parsed_records.json,
+# which holds the pre-taxonomy records in file order.
 
-def normalise_records(records, taxonomy, council_id):
-    """Apply taxonomy mappings to all records."""
-    for r in records:
-        apply_taxonomy(r, taxonomy, council_id)
-    return records
+ETL_STATE_VERSION = 1
 
 
-def compute_metadata(records, council_info):
-    """Generate metadata.json content for the SPA."""
-    if not records:
-        return {"total_records": 0}
+def _etl_state_dir(council_id):
+    return DATA_DIR / council_id / "etl_state"
 
-    fys = sorted(set(r["financial_year"] for r in records if r.get("financial_year")))
-    types = sorted(set(r["type"] for r in records if r.get("type")))
-    depts = sorted(set(r["department"] for r in records if r.get("department") and r["department"] != "UNKNOWN"))
-    dept_raws = sorted(set(r["department_raw"] for r in records if r.get("department_raw")))
 
-    # Department stats
-    dept_stats = defaultdict(lambda: {"spend": 0, "count": 0, "suppliers": set()})
-    for r in records:
-        d = r.get("department", "Other")
-        dept_stats[d]["spend"] += r.get("amount", 0)
-        dept_stats[d]["count"] += 1
-        dept_stats[d]["suppliers"].add(r.get("supplier", ""))
-
-    dept_options = []
-    for d, stats in sorted(dept_stats.items(), key=lambda x: -x[1]["spend"]):
-        dept_options.append({
-            "name": d,
-            "spend": round(stats["spend"], 2),
-            "count": stats["count"],
-            "suppliers": len(stats["suppliers"])
-        })
+def _file_sha256(path):
+    """Content hash of a source file (streamed, 1MB blocks)."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _source_key(source_file):
+    """'file.xlsx/Sheet1' → 'file.xlsx' (XLSX adapters tag records per sheet)."""
+    return (source_file or "").split('/')[0]
 
+
+def load_etl_state(council_id):
+    """Load (manifest, parsed_records) from a previous run, or (None, None)."""
+    state_dir = _etl_state_dir(council_id)
+    try:
+        with open(state_dir / "manifest.json") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != ETL_STATE_VERSION:
+            return None, None
+        with open(state_dir / "parsed_records.json") as f:
+            records = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None, None
+    if len(records) != manifest.get("record_count"):
+        return None, None
+    return manifest, records
+
+
+def save_etl_state(council_id, manifest, records):
+    """Write manifest + parsed records atomically (records first, manifest last)."""
+    state_dir = _etl_state_dir(council_id)
+    state_dir.mkdir(parents=True, exist_ok=True)
+    manifest["record_count"] = len(records)
+    for name, obj in (("parsed_records.json", records), ("manifest.json", manifest)):
+        tmp = state_dir / f"{name}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(obj, f)
+        os.replace(tmp, state_dir / name)
+
+
+def _file_entry(path, start, count, digest=None):
+    st = path.stat()
     return {
-        "council": council_info.get("short_name", "Unknown"),
-        "council_id": council_info.get("ons_code", ""),
-        "council_type": council_info.get("type", ""),
-        "spending_threshold": council_info.get("spending_threshold", 500),
-        "total_records": len(records),
-        "financial_years": fys,
-        "data_types": types,
-        "filters": {
-            "departments": dept_options,
-            "department_raws": dept_raws,
-        },
-        "total_spend": round(sum(r.get("amount", 0) for r in records), 2),
-        "unique_suppliers": len(set(r.get("supplier", "") for r in records)),
-        "date_range": {
-            "min": min((r["date"] for r in records if r.get("date")), default=None),
-            "max": max((r["date"] for r in records if r.get("date")), default=None),
-        }
+        "path": str(path),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": digest or _file_sha256(path),
+        "start": start,
+        "count": count,
     }
 
 
-def compute_insights(records, council_info):
-    """Generate insights.json with DOGE-level scrutiny analysis."""
-    if not records:
-        return {}
+def parse_with_manifest(parser, files, data_start_fy, council_id, incremental=False, stream=False):
+    """Run a council adapter, reusing cached records for unchanged source files.
+
+    Full mode calls parser(files) as before and records the manifest. Incremental
+    mode reparses only files whose size/mtime changed *and* whose content hash
+    differs, splices them into the cached record set in file order, and drops
+    files that have disappeared. Falls back to a full parse if there is no usable
+    state or the adapter/start year changed.
+
+    Stream mode returns the adapter's record generator untouched (no ETL state
+    is saved) so export_council_stream() can consume it one file at a time.
+    """
+    files = [Path(f) for f in files]
+    if stream:
+        return parser(files, data_start_fy)
+    manifest, cached = load_etl_state(council_id) if incremental else (None, None)
+    if manifest and (manifest.get("parser") != parser.__name__ or
+                     manifest.get("data_start_fy") != data_start_fy):
+        print("  Incremental: adapter or data_start_fy changed — full reparse")
+        manifest = None
+
+    if not manifest:
+        if incremental:
+            print("  Incremental: no previous ETL state — full parse")
+        records = list(parser(files, data_start_fy))
+
+        # Split the adapter's output back into per-file ranges
+        by_file = defaultdict(list)
+        for r in records:
+            by_file[_source_key(r.get("_source_file"))].append(r)
+        names = {f.name for f in files}
+        if set(by_file) - names:
+            print("  WARNING: records not attributable to a source file — ETL state not saved")
+            return records
+        ordered, entries = [], {}
+        for f in files:
+            recs = by_file.get(f.name, [])
+            entries[f.name] = _file_entry(f, len(ordered), len(recs))
+            ordered.extend(recs)
+        save_etl_state(council_id, {
+            "version": ETL_STATE_VERSION,
+            "parser": parser.__name__,
+            "data_start_fy": data_start_fy,
+            "files": entries,
+        }, ordered)
+        return ordered
+
+    old_files = manifest.get("files", {})
+    records, entries = [], {}
+    reparsed, touched = [], 0
+    for f in files:
+        entry = old_files.get(f.name)
+        st = f.stat()
+        digest = None
+        unchanged = bool(entry) and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns
+        if entry and not unchanged:
+            digest = _file_sha256(f)
+            unchanged = digest == entry["sha256"]
+            touched += unchanged
+        if unchanged:
+            recs = cached[entry["start"]:entry["start"] + entry["count"]]
+            digest = entry["sha256"]
+        else:
+            recs = list(parser([f], data_start_fy))
+            reparsed.append(f.name)
+        entries[f.name] = _file_entry(f, len(records), len(recs), digest)
+        records.extend(recs)
+
+    removed = sorted(set(old_files) - set(entries))
+    print(f"  Incremental: {len(reparsed)} reparsed, {len(files) - len(reparsed)} cached"
+          f" ({touched} touched but identical), {len(removed)} removed")
+    for name in removed:
+        print(f"    - removed {name}")
+
+    if reparsed or removed or touched:
+        manifest["files"] = entries
+        save_etl_state(council_id, manifest, records)
+    return records
+
+
+def _write_json_if_changed(path, obj, **dump_kwargs):
+    """json.dump obj to path only if the serialised bytes differ. Returns True if written."""
+    data = json.dumps(obj, **dump_kwargs)
+    try:
+        if path.stat().st_size == len(data.encode('utf-8')):
+            with open(path, encoding='utf-8') as f:
+                if f.read() == data:
+                    return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(data)
+    return True
+
+
+# ─── Normalise & Insights ────────────────────────────────────────────
+
+def normalise_records(records, taxonomy, council_id):
+    """Apply taxonomy mappings to all records (index compiled once per run)."""
+    index = get_taxonomy_index(taxonomy)
+    for r in records:
+        apply_taxonomy(r, taxonomy, council_id, index)
+    return records
+
+
+class SpendingSummary:
+    """Single-pass accumulator behind compute_metadata() and compute_insights().
+
+    add() each normalised record once; metadata()/insights() then build the same
+    dicts the list-based code produced, so the streaming export never needs the
+    full record list. In memory it holds only per-supplier/department/year
+    aggregates. The per-transaction state — one row per distinct
+    date|supplier|amount, which gives both the same-day duplicates and the
+    median — is flushed every TX_KEY_BATCH keys to a temporary on-disk SQLite
+    table, so memory stays bounded however many transactions a council has.
+    close() when done (deletes the temporary table's file).
+    """
 
-    tx = [r for r in records if r.get("amount", 0) > 0]
-    total_spend = sum(r["amount"] for r in tx)
+    TX_KEY_BATCH = 50000
+
+    def __init__(self):
+        self.count = 0
+        # metadata.json
+        self.fys, self.types, self.depts, self.dept_raws = set(), set(), set(), set()
+        self.dept_stats = defaultdict(lambda: {"spend": 0, "count": 0, "suppliers": set()})
+        self.total_spend = 0
+        self.suppliers = set()
+        self.date_min = self.date_max = None
+        # insights.json (amount > 0 only)
+        self.tx_count = 0
+        self.tx_spend = 0
+        self.tx_date_min = self.tx_date_max = None
+        self.supplier_totals = defaultdict(lambda: {"total": 0, "count": 0, "company_number": None, "company_url": None})
+        self.fy_spend = defaultdict(float)
+        self.fy_count = defaultdict(int)
+        self.dept_spend = defaultdict(float)
+        self.dept_count = defaultdict(int)
+        self.tx_keys = {}  # unflushed "date|supplier|amount" → [supplier, amount, date, occurrences]
+        self._tx_db = None
+        self.round_count = 0
+        self.round_total = 0
+        self.supplier_small = defaultdict(int)
+        self.has_dates = self.has_suppliers = self.has_departments = 0
+
+    def add(self, r):
+        self.count += 1
+        if r.get("financial_year"):
+            self.fys.add(r["financial_year"])
+        if r.get("type"):
+            self.types.add(r["type"])
+        if r.get("department") and r["department"] != "UNKNOWN":
+            self.depts.add(r["department"])
+        if r.get("department_raw"):
+            self.dept_raws.add(r["department_raw"])
+        d = r.get("department", "Other")
+        stats = self.dept_stats[d]
+        stats["spend"] += r.get("amount", 0)
+        stats["count"] += 1
+        stats["suppliers"].add(r.get("supplier", ""))
+        self.total_spend += r.get("amount", 0)
+        self.suppliers.add(r.get("supplier", ""))
+        date = r.get("date")
+        if date:
+            if self.date_min is None or date < self.date_min:
+                self.date_min = date
+            if self.date_max is None or date > self.date_max:
+                self.date_max = date
+
+        if not r.get("amount", 0) > 0:
+            return
+        amount = r["amount"]
+        self.tx_count += 1
+        self.tx_spend += amount
+        if date:
+            self.has_dates += 1
+            if self.tx_date_min is None or date < self.tx_date_min:
+                self.tx_date_min = date
+            if self.tx_date_max is None or date > self.tx_date_max:
+                self.tx_date_max = date
+        if r.get("supplier") != "UNKNOWN":
+            self.has_suppliers += 1
+        if r.get("department_raw"):
+            self.has_departments += 1
 
-    # ── Supplier Analysis ──
-    supplier_totals = defaultdict(lambda: {"total": 0, "count": 0, "company_number": None, "company_url": None})
-    for r in tx:
         s = r.get("supplier_canonical", r.get("supplier", "UNKNOWN"))
-        supplier_totals[s]["total"] += r["amount"]
-        supplier_totals[s]["count"] += 1
+        totals = self.supplier_totals[s]
+        totals["total"] += amount
+        totals["count"] += 1
         if r.get("supplier_company_number"):
-            supplier_totals[s]["company_number"] = r["supplier_company_number"]
-            supplier_totals[s]["company_url"] = r["supplier_company_url"]
-
-    sorted_suppliers = sorted(supplier_totals.items(), key=lambda x: -x[1]["total"])
-    top_20 = sorted_suppliers[:20]
-    top_20_spend = sum(s[1]["total"] for s in top_20)
+            totals["company_number"] = r["supplier_company_number"]
+            totals["company_url"] = r["supplier_company_url"]
 
-    # ── Year-on-Year ──
-    fy_spend = defaultdict(float)
-    fy_count = defaultdict(int)
-    for r in tx:
         fy = r.get("financial_year")
         if fy:
-            fy_spend[fy] += r["amount"]
-            fy_count[fy] += 1
+            self.fy_spend[fy] += amount
+            self.fy_count[fy] += 1
+        self.dept_spend[d] += amount
+        self.dept_count[d] += 1
+
+        key = f"{r.get('date')}|{r.get('supplier')}|{amount}"
+        seen = self.tx_keys.get(key)
+        if seen:
+            seen[3] += 1
+        else:
+            self.tx_keys[key] = [r.get("supplier", ""), amount, r.get("date"), 1]
+            if len(self.tx_keys) >= self.TX_KEY_BATCH:
+                self._flush_tx_keys()
+
+        if amount > 1000 and amount % 1000 == 0:
+            self.round_count += 1
+            self.round_total += amount
+        if amount < 500:
+            self.supplier_small[r.get("supplier", "")] += 1
+
+    def _flush_tx_keys(self):
+        """Merge the in-memory tx_keys batch into the SQLite table. rowid order
+        is first-seen order, as the dict's insertion order was."""
+        if self._tx_db is None:
+            # "" = private temporary database on disk, removed on close
+            self._tx_db = sqlite3.connect("")
+            self._tx_db.execute("""
+                CREATE TABLE tx_keys (
+                    key TEXT PRIMARY KEY,
+                    supplier TEXT,
+                    amount NOT NULL,
+                    date TEXT,
+                    occurrences INTEGER NOT NULL
+                )""")
+        with self._tx_db:
+            self._tx_db.executemany(
+                "INSERT INTO tx_keys (key, supplier, amount, date, occurrences) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET occurrences = occurrences + excluded.occurrences",
+                ((key, *row) for key, row in self.tx_keys.items()))
+        self.tx_keys = {}
+
+    def _median_amount(self):
+        """sorted(positive amounts)[n // 2], read off the table in amount order."""
+        target = self.tx_count // 2
+        seen = 0
+        for amount, occurrences in self._tx_db.execute(
+                "SELECT amount, SUM(occurrences) FROM tx_keys GROUP BY amount ORDER BY amount"):
+            seen += occurrences
+            if seen > target:
+                return amount
+        return 0
 
-    # ── Department Breakdown ──
-    dept_spend = defaultdict(float)
-    dept_count = defaultdict(int)
-    for r in tx:
-        d = r.get("department", "Other")
-        dept_spend[d] += r["amount"]
-        dept_count[d] += 1
-
-    # ── Efficiency Flags ──
-    flags = []
-
-    # 1. Same-day duplicates
-    tx_keys = defaultdict(list)
-    for i, r in enumerate(tx):
-        key = f"{r.get('date')}|{r.get('supplier')}|{r.get('amount')}"
-        tx_keys[key].append(i)
-
-    duplicates = []
-    for key, indices in tx_keys.items():
-        if len(indices) > 1:
-            r = tx[indices[0]]
+    def close(self):
+        if self._tx_db is not None:
+            self._tx_db.close()
+            self._tx_db = None
+
+    def metadata(self, council_info):
+        """metadata.json content for the SPA."""
+        if not self.count:
+            return {"total_records": 0}
+
+        dept_options = []
+        for d, stats in sorted(self.dept_stats.items(), key=lambda x: -x[1]["spend"]):
+            dept_options.append({
+                "name": d,
+                "spend": round(stats["spend"], 2),
+                "count": stats["count"],
+                "suppliers": len(stats["suppliers"])
+            })
+
+        return {
+            "council": council_info.get("short_name", "Unknown"),
+            "council_id": council_info.get("ons_code", ""),
+            "council_type": council_info.get("type", ""),
+            "spending_threshold": council_info.get("spending_threshold", 500),
+            "total_records": self.count,
+            "financial_years": sorted(self.fys),
+            "data_types": sorted(self.types),
+            "filters": {
+                "departments": dept_options,
+                "department_raws": sorted(self.dept_raws),
+            },
+            "total_spend": round(self.total_spend, 2),
+            "unique_suppliers": len(self.suppliers),
+            "date_range": {
+                "min": self.date_min,
+                "max": self.date_max,
+            }
+        }
+
+    def insights(self, council_info):
+        """insights.json content — DOGE-level scrutiny analysis."""
+        if not self.count:
+            return {}
+
+        n = self.tx_count
+        total_spend = self.tx_spend
+
+        # ── Supplier Analysis ──
+        sorted_suppliers = sorted(self.supplier_totals.items(), key=lambda x: -x[1]["total"])
+        top_20 = sorted_suppliers[:20]
+        top_20_spend = sum(s[1]["total"] for s in top_20)
+
+        # ── Efficiency Flags ──
+        flags = []
+
+        # 1. Same-day duplicates
+        self._flush_tx_keys()
+        duplicates = []
+        for supplier, amount, date, occurrences in self._tx_db.execute(
+                "SELECT supplier, amount, date, occurrences FROM tx_keys WHERE occurrences > 1 ORDER BY rowid"):
             duplicates.append({
-                "supplier": r.get("supplier", ""),
-                "amount": r["amount"],
-                "date": r.get("date"),
-                "occurrences": len(indices),
-                "potential_overpayment": round(r["amount"] * (len(indices) - 1), 2)
+                "supplier": supplier,
+                "amount": amount,
+                "date": date,
+                "occurrences": occurrences,
+                "potential_overpayment": round(amount * (occurrences - 1), 2)
             })
 
-    if duplicates:
-        duplicates.sort(key=lambda x: -x["potential_overpayment"])
-        flags.append({
-            "type": "same_day_duplicates",
-            "severity": "high",
-            "description": "Identical payments to same supplier on same day",
-            "count": len(duplicates),
-            "potential_value": round(sum(d["potential_overpayment"] for d in duplicates), 2),
-            "items": duplicates[:20]
-        })
+        if duplicates:
+            duplicates.sort(key=lambda x: -x["potential_overpayment"])
+            flags.append({
+                "type": "same_day_duplicates",
+                "severity": "high",
+                "description": "Identical payments to same supplier on same day",
+                "count": len(duplicates),
+                "potential_value": round(sum(d["potential_overpayment"] for d in duplicates), 2),
+                "items": duplicates[:20]
+            })
 
-    # 2. Round-number payments
-    round_payments = [r for r in tx if r["amount"] > 1000 and r["amount"] % 1000 == 0]
-    if round_payments:
-        flags.append({
-            "type": "round_number_payments",
-            "severity": "low",
-            "description": "Large round-number payments (may indicate estimates)",
-            "count": len(round_payments),
-            "total_value": round(sum(r["amount"] for r in round_payments), 2),
-        })
+        # 2. Round-number payments
+        if self.round_count:
+            flags.append({
+                "type": "round_number_payments",
+                "severity": "low",
+                "description": "Large round-number payments (may indicate estimates)",
+                "count": self.round_count,
+                "total_value": round(self.round_total, 2),
+            })
 
-    # 3. High-frequency small transactions
-    supplier_small = defaultdict(int)
-    for r in tx:
-        if r["amount"] < 500:
-            supplier_small[r.get("supplier", "")] += 1
-    frequent_small = {k: v for k, v in supplier_small.items() if v >= 10}
-    if frequent_small:
-        flags.append({
-            "type": "frequent_small_transactions",
-            "severity": "medium",
-            "description": "Suppliers with 10+ transactions under £500",
-            "count": len(frequent_small),
-        })
+        # 3. High-frequency small transactions
+        frequent_small = {k: v for k, v in self.supplier_small.items() if v >= 10}
+        if frequent_small:
+            flags.append({
+                "type": "frequent_small_transactions",
+                "severity": "medium",
+                "description": "Suppliers with 10+ transactions under £500",
+                "count": len(frequent_small),
+            })
 
-    insights = {
-        "summary": {
-            "total_spend": round(total_spend, 2),
-            "transaction_count": len(tx),
-            "unique_suppliers": len(supplier_totals),
-            "avg_transaction": round(total_spend / len(tx), 2) if tx else 0,
-            "median_transaction": round(sorted(r["amount"] for r in tx)[len(tx) // 2], 2) if tx else 0,
-            "date_range": {
-                "min": min((r["date"] for r in tx if r.get("date")), default=None),
-                "max": max((r["date"] for r in tx if r.get("date")), default=None),
-            }
-        },
-        "supplier_analysis": {
-            "top_20_suppliers": [
-                {
-                    "supplier": s[0],
-                    "total": round(s[1]["total"], 2),
-                    "transactions": s[1]["count"],
-                    "company_number": s[1]["company_number"],
-                    "company_url": s[1]["company_url"],
+        insights = {
+            "summary": {
+                "total_spend": round(total_spend, 2),
+                "transaction_count": n,
+                "unique_suppliers": len(self.supplier_totals),
+                "avg_transaction": round(total_spend / n, 2) if n else 0,
+                "median_transaction": round(self._median_amount(), 2) if n else 0,
+                "date_range": {
+                    "min": self.tx_date_min,
+                    "max": self.tx_date_max,
                 }
-                for s in top_20
+            },
+            "supplier_analysis": {
+                "top_20_suppliers": [
+                    {
+                        "supplier": s[0],
+                        "total": round(s[1]["total"], 2),
+                        "transactions": s[1]["count"],
+                        "company_number": s[1]["company_number"],
+                        "company_url": s[1]["company_url"],
+                    }
+                    for s in top_20
+                ],
+                "concentration_ratio": round(top_20_spend / total_spend, 4) if total_spend > 0 else 0,
+                "total_unique_suppliers": len(self.supplier_totals),
+                "single_transaction_suppliers": len([s for s in self.supplier_totals.values() if s["count"] == 1]),
+            },
+            "efficiency_flags": flags,
+            "department_breakdown": [
+                {"department": d, "spend": round(self.dept_spend[d], 2), "count": self.dept_count[d]}
+                for d in sorted(self.dept_spend, key=lambda x: -self.dept_spend[x])
             ],
-            "concentration_ratio": round(top_20_spend / total_spend, 4) if total_spend > 0 else 0,
-            "total_unique_suppliers": len(supplier_totals),
-            "single_transaction_suppliers": len([s for s in supplier_totals.values() if s["count"] == 1]),
-        },
-        "efficiency_flags": flags,
-        "department_breakdown": [
-            {"department": d, "spend": round(dept_spend[d], 2), "count": dept_count[d]}
-            for d in sorted(dept_spend, key=lambda x: -dept_spend[x])
-        ],
-        "yoy_analysis": {
-            "spend_by_year": {k: round(v, 2) for k, v in sorted(fy_spend.items())},
-            "transactions_by_year": {k: v for k, v in sorted(fy_count.items())},
-        },
-        "transparency_metrics": {
-            "has_dates": round(len([r for r in tx if r.get("date")]) / len(tx) * 100, 1) if tx else 0,
-            "has_suppliers": round(len([r for r in tx if r.get("supplier") != "UNKNOWN"]) / len(tx) * 100, 1) if tx else 0,
-            "has_departments": round(len([r for r in tx if r.get("department_raw")]) / len(tx) * 100, 1) if tx else 0,
-            "total_records": len(tx),
+            "yoy_analysis": {
+                "spend_by_year": {k: round(v, 2) for k, v in sorted(self.fy_spend.items())},
+                "transactions_by_year": {k: v for k, v in sorted(self.fy_count.items())},
+            },
+            "transparency_metrics": {
+                "has_dates": round(self.has_dates / n * 100, 1) if n else 0,
+                "has_suppliers": round(self.has_suppliers / n * 100, 1) if n else 0,
+                "has_departments": round(self.has_departments / n * 100, 1) if n else 0,
+                "total_records": n,
+            }
         }
-    }
 
-    return insights
+        return insights
+
+
+def summarise_records(records):
+    """Feed an iterable of records through a SpendingSummary."""
+    summary = SpendingSummary()
+    for r in records:
+        summary.add(r)
+    return summary
+
+
+def compute_metadata(records, council_info, summary=None):
+    """Generate metadata.json content for the SPA.
+    Pass the SpendingSummary of records (summarise_records) to reuse one pass
+    for compute_insights too; the caller then closes it."""
+    if summary is not None:
+        return summary.metadata(council_info)
+    summary = summarise_records(records)
+    try:
+        return summary.metadata(council_info)
+    finally:
+        summary.close()
+
+
+def compute_insights(records, council_info, summary=None):
+    """Generate insights.json with DOGE-level scrutiny analysis (summary: as compute_metadata)."""
+    if summary is not None:
+        return summary.insights(council_info)
+    summary = summarise_records(records)
+    try:
+        return summary.insights(council_info)
+    finally:
+        summary.close()
 
 
 def validate_records(records, council_id, sample_size=10):
@@ -2299,175 +2748,278 @@ def strip_record_for_chunks(record):
     return out
 
 
-def export_council(records, metadata, insights, council_id):
-    """Write spending.json, metadata.json, insights.json for a council."""
-    output_dir = DATA_DIR / council_id
-    output_dir.mkdir(parents=True, exist_ok=True)
+def _clean_record(r):
+    """Drop internal (_-prefixed) fields and add SPA compatibility aliases."""
+    clean = {k: v for k, v in r.items() if not k.startswith('_')}
+    # SPA compatibility: Spending.jsx expects service_division + expenditure_category
+    if 'service_division' not in clean:
+        clean['service_division'] = clean.get('department', '')
+    if 'expenditure_category' not in clean:
+        clean['expenditure_category'] = clean.get('service_area', '')
+    return clean
 
-    # Remove internal fields and add SPA compatibility aliases
-    clean_records = []
-    for r in records:
-        clean = {k: v for k, v in r.items() if not k.startswith('_')}
-        # SPA compatibility: Spending.jsx expects service_division + expenditure_category
-        if 'service_division' not in clean:
-            clean['service_division'] = clean.get('department', '')
-        if 'expenditure_category' not in clean:
-            clean['expenditure_category'] = clean.get('service_area', '')
-        clean_records.append(clean)
-
-    # Build pre-computed filter options (saves client scanning 50k records)
-    filter_sets = {
-        'financial_years': set(),
-        'types': set(),
-        'service_divisions': set(),
-        'expenditure_categories': set(),
-        'capital_revenue': set(),
-        'suppliers': set(),
-    }
-    for r in clean_records:
-        if r.get('financial_year'): filter_sets['financial_years'].add(r['financial_year'])
-        if r.get('type'): filter_sets['types'].add(r['type'])
-        if r.get('service_division'): filter_sets['service_divisions'].add(r['service_division'])
-        if r.get('expenditure_category'): filter_sets['expenditure_categories'].add(r['expenditure_category'])
-        if r.get('capital_revenue'): filter_sets['capital_revenue'].add(r['capital_revenue'])
-        if r.get('supplier'): filter_sets['suppliers'].add(r['supplier'])
-
-    spending_output = {
-        "meta": {
-            "version": 2,
-            "council_id": council_id,
-            "record_count": len(clean_records),
-        },
-        "filterOptions": {
-            k: sorted(v) for k, v in filter_sets.items()
-        },
-        "records": clean_records,
-    }
 
-    with open(output_dir / "spending.json", 'w') as f:
-        json.dump(spending_output, f)
-    print(f"  spending.json (v2): {len(clean_records)} records, {sum(len(v) for v in filter_sets.values())} filter values → {output_dir / 'spending.json'}")
-
-    # ── Year-chunked files for mobile (v3 progressive loading) ──
-    by_year = {}
-    for r in clean_records:
-        fy = r.get('financial_year', 'unknown')
-        by_year.setdefault(fy, []).append(r)
-
-    years_manifest = {}
-    sorted_years = sorted(by_year.keys())
-    for fy in sorted_years:
-        year_records = by_year[fy]
-        fy_slug = fy.replace('/', '-')  # "2024/25" → "2024-25"
-        filename = f"spending-{fy_slug}.json"
-        total_spend = sum(abs(float(r.get('amount', 0))) for r in year_records)
-        years_manifest[fy] = {
-            "file": filename,
-            "record_count": len(year_records),
-            "total_spend": round(total_spend, 2),
+class SpendingSink:
+    """Incremental writer for spending.json, the year/month chunks and the index.
+
+    add() cleans each record and appends it as one JSON line to spool files in
+    data/{council}/.spool/ — one for everything, one per financial year and, for
+    MONTHLY_CHUNK_COUNCILS, one per month (already stripped). close() assembles
+    each output file from its spool lines, so only one record is ever held in
+    memory; the bytes match json.dumps() of the full lists. discard() removes
+    the spool and must always run (export_council uses try/finally).
+    """
+
+    def __init__(self, council_id):
+        self.council_id = council_id
+        self.monthly = council_id in MONTHLY_CHUNK_COUNCILS
+        self.output_dir = DATA_DIR / council_id
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.spool_dir = self.output_dir / SPOOL_DIRNAME
+        shutil.rmtree(self.spool_dir, ignore_errors=True)
+        self.spool_dir.mkdir()
+        self.count = 0
+        # Pre-computed filter options (saves client scanning 50k records)
+        self.filter_sets = {
+            'financial_years': set(),
+            'types': set(),
+            'service_divisions': set(),
+            'expenditure_categories': set(),
+            'capital_revenue': set(),
+            'suppliers': set(),
         }
-        with open(output_dir / filename, 'w') as f:
-            json.dump(year_records, f)
-
-    latest_year = sorted_years[-1] if sorted_years else None
-
-    spending_index = {
-        "meta": {
-            "version": 3,
-            "council_id": council_id,
-            "record_count": len(clean_records),
-            "chunked": True,
-        },
-        "filterOptions": {
-            k: sorted(v) for k, v in filter_sets.items()
-        },
-        "years": years_manifest,
-        "latest_year": latest_year,
-    }
+        self.years = {}    # fy → {"spool", "record_count", "total_spend"}
+        self.months = {}   # "YYYY-MM" → {"spool", "fy", "record_count", "total_spend"}
+        self._handles = {}
+
+    def _spool(self, name, line):
+        f = self._handles.get(name)
+        if f is None:
+            f = self._handles[name] = open(self.spool_dir / f"{name}.jsonl", 'w', encoding='utf-8')
+        f.write(line)
+        f.write('\n')
+
+    def _spooled_lines(self, name):
+        path = self.spool_dir / f"{name}.jsonl"
+        if not path.exists():
+            return
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                yield line[:-1]
+
+    def _write_spooled(self, path, name, prefix='[', suffix=']'):
+        """Write prefix + ', '.join(spool lines) + suffix if it differs from path."""
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(prefix)
+            for i, line in enumerate(self._spooled_lines(name)):
+                if i:
+                    f.write(', ')
+                f.write(line)
+            f.write(suffix)
+        if path.exists() and filecmp.cmp(tmp, path, shallow=False):
+            tmp.unlink()
+            return False
+        os.replace(tmp, path)
+        return True
 
-    with open(output_dir / "spending-index.json", 'w') as f:
-        json.dump(spending_index, f)
-    print(f"  spending-index.json (v3): {len(years_manifest)} year chunks, latest={latest_year}")
-    for fy, info in sorted(years_manifest.items()):
-        print(f"    {info['file']}: {info['record_count']} records, £{info['total_spend']:,.0f}")
-
-    # ── Monthly-chunked files for large councils (v4 progressive loading) ──
-    if council_id in MONTHLY_CHUNK_COUNCILS:
-        by_month = {}
-        for r in clean_records:
-            d = r.get('date', '')
+    def add(self, record):
+        clean = _clean_record(record)
+        self.count += 1
+        self._spool('all', json.dumps(clean))
+
+        fs = self.filter_sets
+        if clean.get('financial_year'): fs['financial_years'].add(clean['financial_year'])
+        if clean.get('type'): fs['types'].add(clean['type'])
+        if clean.get('service_division'): fs['service_divisions'].add(clean['service_division'])
+        if clean.get('expenditure_category'): fs['expenditure_categories'].add(clean['expenditure_category'])
+        if clean.get('capital_revenue'): fs['capital_revenue'].add(clean['capital_revenue'])
+        if clean.get('supplier'): fs['suppliers'].add(clean['supplier'])
+
+        spend = abs(float(clean.get('amount', 0)))
+        fy = clean.get('financial_year', 'unknown')
+        year = self.years.get(fy)
+        if year is None:
+            year = self.years[fy] = {"spool": f"year-{len(self.years)}", "record_count": 0, "total_spend": 0}
+        year["record_count"] += 1
+        year["total_spend"] += spend
+        self._spool(year["spool"], json.dumps(clean))
+
+        if self.monthly:
+            d = clean.get('date', '')
             if d and len(d) >= 7:
-                by_month.setdefault(d[:7], []).append(r)
-
-        # Group months into financial years for the manifest
-        fy_months = {}
-        sorted_month_keys = sorted(by_month.keys())
-        for month_key in sorted_month_keys:
-            month_records = by_month[month_key]
-            fy = month_records[0].get('financial_year', 'unknown')
-            if fy not in fy_months:
-                fy_months[fy] = {}
-
-            stripped = [strip_record_for_chunks(r) for r in month_records]
-            filename = f"spending-{month_key}.json"
-            total_spend = sum(abs(float(r.get('amount', 0))) for r in month_records)
-
-            fy_months[fy][month_key] = {
+                month = self.months.get(d[:7])
+                if month is None:
+                    month = self.months[d[:7]] = {"spool": f"month-{d[:7]}", "record_count": 0, "total_spend": 0,
+                                                  "fy": clean.get('financial_year', 'unknown')}
+                month["record_count"] += 1
+                month["total_spend"] += spend
+                self._spool(month["spool"], json.dumps(strip_record_for_chunks(clean)))
+
+    def close(self, metadata, insights):
+        """Assemble every output file from the spool (unchanged files are left alone)."""
+        for f in self._handles.values():
+            f.close()
+        self._handles = {}
+        output_dir = self.output_dir
+        filter_options = {k: sorted(v) for k, v in self.filter_sets.items()}
+
+        head = json.dumps({
+            "meta": {
+                "version": 2,
+                "council_id": self.council_id,
+                "record_count": self.count,
+            },
+            "filterOptions": filter_options,
+            "records": [],
+        })
+        spending_written = self._write_spooled(output_dir / "spending.json", 'all', head[:-2], ']}')
+        print(f"  spending.json (v2){'' if spending_written else ' unchanged'}: {self.count} records, {sum(len(v) for v in self.filter_sets.values())} filter values → {output_dir / 'spending.json'}")
+
+        # ── Columnar store (memory-mapped by doge_analysis.py) ──
+        if HAS_SPENDING_STORE:
+            write_spending_columns((json.loads(line) for line in self._spooled_lines('all')), output_dir)
+
+        # ── Year-chunked files for mobile (v3 progressive loading) ──
+        years_manifest = {}
+        chunks_written = 0
+        sorted_years = sorted(self.years.keys())
+        for fy in sorted_years:
+            year = self.years[fy]
+            fy_slug = fy.replace('/', '-')  # "2024/25" → "2024-25"
+            filename = f"spending-{fy_slug}.json"
+            years_manifest[fy] = {
                 "file": filename,
-                "record_count": len(month_records),
-                "total_spend": round(total_spend, 2),
+                "record_count": year["record_count"],
+                "total_spend": round(year["total_spend"], 2),
             }
+            chunks_written += self._write_spooled(output_dir / filename, year["spool"])
 
-            with open(output_dir / filename, 'w') as f:
-                json.dump(stripped, f)
+        latest_year = sorted_years[-1] if sorted_years else None
 
-        v4_latest_year = sorted(fy_months.keys())[-1] if fy_months else None
-        v4_latest_month = sorted(fy_months.get(v4_latest_year, {}).keys())[-1] if v4_latest_year else None
-
-        v4_years_manifest = {}
-        for fy, months in sorted(fy_months.items()):
-            fy_rc = sum(m['record_count'] for m in months.values())
-            fy_ts = sum(m['total_spend'] for m in months.values())
-            v4_years_manifest[fy] = {
-                "record_count": fy_rc,
-                "total_spend": round(fy_ts, 2),
-                "months": months,
-            }
-
-        v4_index = {
+        spending_index = {
             "meta": {
-                "version": 4,
-                "council_id": council_id,
-                "record_count": len(clean_records),
+                "version": 3,
+                "council_id": self.council_id,
+                "record_count": self.count,
                 "chunked": True,
-                "monthly": True,
-                "stripped": True,
-            },
-            "filterOptions": {
-                k: sorted(v) for k, v in filter_sets.items()
             },
-            "years": v4_years_manifest,
-            "latest_year": v4_latest_year,
-            "latest_month": v4_latest_month,
+            "filterOptions": filter_options,
+            "years": years_manifest,
+            "latest_year": latest_year,
         }
 
-        # Overwrite the v3 spending-index.json with v4
-        with open(output_dir / "spending-index.json", 'w') as f:
-            json.dump(v4_index, f)
+        if not self.monthly:
+            _write_json_if_changed(output_dir / "spending-index.json", spending_index)
+        print(f"  spending-index.json (v3): {len(years_manifest)} year chunks ({chunks_written} rewritten), latest={latest_year}")
+        for fy, info in sorted(years_manifest.items()):
+            print(f"    {info['file']}: {info['record_count']} records, £{info['total_spend']:,.0f}")
+
+        # ── Monthly-chunked files for large councils (v4 progressive loading) ──
+        if self.monthly:
+            # Group months into financial years for the manifest
+            fy_months = {}
+            for month_key in sorted(self.months.keys()):
+                month = self.months[month_key]
+                fy = month["fy"]
+                if fy not in fy_months:
+                    fy_months[fy] = {}
+
+                filename = f"spending-{month_key}.json"
+                fy_months[fy][month_key] = {
+                    "file": filename,
+                    "record_count": month["record_count"],
+                    "total_spend": round(month["total_spend"], 2),
+                }
+
+                chunks_written += self._write_spooled(output_dir / filename, month["spool"])
+
+            v4_latest_year = sorted(fy_months.keys())[-1] if fy_months else None
+            v4_latest_month = sorted(fy_months.get(v4_latest_year, {}).keys())[-1] if v4_latest_year else None
+
+            v4_years_manifest = {}
+            for fy, months in sorted(fy_months.items()):
+                fy_rc = sum(m['record_count'] for m in months.values())
+                fy_ts = sum(m['total_spend'] for m in months.values())
+                v4_years_manifest[fy] = {
+                    "record_count": fy_rc,
+                    "total_spend": round(fy_ts, 2),
+                    "months": months,
+                }
+
+            v4_index = {
+                "meta": {
+                    "version": 4,
+                    "council_id": self.council_id,
+                    "record_count": self.count,
+                    "chunked": True,
+                    "monthly": True,
+                    "stripped": True,
+                },
+                "filterOptions": filter_options,
+                "years": v4_years_manifest,
+                "latest_year": v4_latest_year,
+                "latest_month": v4_latest_month,
+            }
+
+            # v4 index replaces the v3 spending-index.json for monthly councils
+            _write_json_if_changed(output_dir / "spending-index.json", v4_index)
+
+            total_chunks = sum(len(m) for m in fy_months.values())
+            print(f"  spending-index.json (v4 monthly): {total_chunks} month chunks across {len(fy_months)} years ({chunks_written} chunks rewritten in total), latest={v4_latest_month}")
+            for fy, months in sorted(fy_months.items()):
+                fy_rc = sum(m['record_count'] for m in months.values())
+                print(f"    {fy}: {len(months)} months, {fy_rc} records")
+
+        _write_json_if_changed(output_dir / "metadata.json", metadata, indent=2)
+        print(f"  metadata.json → {output_dir / 'metadata.json'}")
+
+        _write_json_if_changed(output_dir / "insights.json", insights, indent=2)
+        print(f"  insights.json → {output_dir / 'insights.json'}")
+
+    def discard(self):
+        for f in self._handles.values():
+            f.close()
+        self._handles = {}
+        shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+
+def export_council(records, metadata, insights, council_id):
+    """Write spending.json, metadata.json, insights.json for a council."""
+    sink = SpendingSink(council_id)
+    try:
+        for r in records:
+            sink.add(r)
+        sink.close(metadata, insights)
+    finally:
+        sink.discard()
 
-        total_chunks = sum(len(m) for m in fy_months.values())
-        print(f"  spending-index.json (v4 monthly): {total_chunks} month chunks across {len(fy_months)} years, latest={v4_latest_month}")
-        for fy, months in sorted(fy_months.items()):
-            fy_rc = sum(m['record_count'] for m in months.values())
-            print(f"    {fy}: {len(months)} months, {fy_rc} records")
 
-    with open(output_dir / "metadata.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
-    print(f"  metadata.json → {output_dir / 'metadata.json'}")
+def export_council_stream(records, taxonomy, council_id, council_info):
+    """One pass over an adapter's record generator: taxonomy → summary → sink.
 
-    with open(output_dir / "insights.json", 'w') as f:
-        json.dump(insights, f, indent=2)
-    print(f"  insights.json → {output_dir / 'insights.json'}")
+    Peak memory is one source file's records (≈ one month chunk for LCC, one
+    sheet for the PCC/Fire workbooks) plus the per-supplier/department
+    aggregates and at most one SpendingSummary.TX_KEY_BATCH of transaction keys. Returns
+    (record_count, metadata, insights); nothing is written if no records arrive.
+    """
+    index = get_taxonomy_index(taxonomy)
+    summary = SpendingSummary()
+    sink = SpendingSink(council_id)
+    try:
+        for r in records:
+            apply_taxonomy(r, taxonomy, council_id, index)
+            summary.add(r)
+            sink.add(r)
+        if not summary.count:
+            return 0, None, None
+        metadata = summary.metadata(council_info)
+        insights = summary.insights(council_info)
+        sink.close(metadata, insights)
+    finally:
+        summary.close()
+        sink.discard()
+    return summary.count, metadata, insights
 
 
 # ─── Build Taxonomy from Data ────────────────────────────────────────
@@ -2563,25 +3115,10 @@ def _is_known_non_company(name):
     return False
 
 
-def _ch_search(name, api_key, session=None):
+def _ch_search(name, api_key):
     """Search Companies House for a company name. Returns list of results."""
-    if session is None:
-        session = requests.Session()
-    url = f"{CH_API_BASE}/search/companies"
-    params = {"q": name, "items_per_page": 5}
-    try:
-        resp = session.get(url, params=params, auth=(api_key, ""), timeout=15)
-        if resp.status_code == 429:
-            # Rate limited — wait and retry
-            import time
-            time.sleep(60)
-            resp = session.get(url, params=params, auth=(api_key, ""), timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        return data.get("items", [])
-    except Exception as e:
-        print(f"    CH API error for '{name}': {e}")
-        return []
+    data = get_ch_client(api_key).get("/search/companies", {"q": name, "items_per_page": 5})
+    return data.get("items", []) if data else []
 
 
 def _core_name(name):
@@ -2654,8 +3191,9 @@ def _match_company(supplier_name, ch_results):
         ch_core = _core_name(r.get("title", ""))
 
         # Compare both normalised and core forms, take the higher score
-        ratio_norm = SequenceMatcher(None, normalised, ch_normalised).ratio()
-        ratio_core = SequenceMatcher(None, supplier_core, ch_core).ratio()
+        # (sequence_ratio skips the full comparison when its upper bound is too low)
+        ratio_norm = sequence_ratio(normalised, ch_normalised, FUZZY_MATCH_THRESHOLD)
+        ratio_core = sequence_ratio(supplier_core, ch_core, FUZZY_MATCH_THRESHOLD)
         best_ratio = max(ratio_norm, ratio_core)
 
         if best_ratio >= FUZZY_MATCH_THRESHOLD:
@@ -2699,15 +3237,13 @@ def companies_house_lookup(taxonomy=None, councils=None, api_key=None, batch_siz
     Returns:
         Updated taxonomy dict with matches added to suppliers section
     """
-    if not HAS_REQUESTS and not dry_run:
-        print("ERROR: requests library required. Install with: pip install requests")
-        sys.exit(1)
-
     if api_key is None:
         api_key = os.environ.get("COMPANIES_HOUSE_API_KEY", "")
-    if not api_key and not dry_run:
+    snapshot = open_snapshot()
+    if not api_key and not dry_run and not snapshot:
         print("ERROR: No Companies House API key found.")
         print("  Set COMPANIES_HOUSE_API_KEY environment variable, or pass --ch-api-key")
+        print("  (or import a bulk snapshot first: python ch_snapshot.py --companies ...)")
         print("  Register at: https://developer.company-information.service.gov.uk/")
         sys.exit(1)
 
@@ -2785,30 +3321,46 @@ def companies_house_lookup(taxonomy=None, councils=None, api_key=None, batch_siz
             print(f"    - {s}")
         return taxonomy
 
-    # Process in batches (respecting rate limit: 600/5min = 120/min)
-    import time
-    session = requests.Session()
+    # With a bulk snapshot, candidates come from its normalised-name index (no
+    # API calls); a supplier with no active snapshot candidate falls back to the
+    # API search. Otherwise searches are fanned out 50 at a time on the shared CH
+    # client's worker pool (sliding-window limiter keeps us inside 600 requests / 5 min);
+    # matching stays serial.
+    client = None if snapshot else get_ch_client(api_key)
     to_process = needs_lookup[:batch_size]
     exact_matched = 0
     fuzzy_matched = 0
     unmatched = 0
+    deferred = 0
 
-    print(f"\n  Processing {len(to_process)} suppliers against Companies House API...")
-    print(f"  Rate limit: 600 requests per 5 minutes (120/min)")
+    if snapshot:
+        print(f"\n  Processing {len(to_process)} suppliers against CH bulk snapshot "
+              f"({snapshot.meta.get('companies_files', '')})...")
+    else:
+        print(f"\n  Processing {len(to_process)} suppliers against Companies House API...")
+        print(f"  Rate limit: 600 requests per 5 minutes (120/min)")
     print(f"  Fuzzy matching threshold: {FUZZY_MATCH_THRESHOLD * 100:.0f}%+")
 
     for i, supplier in enumerate(to_process):
         if i > 0 and i % 100 == 0:
             print(f"  ... {i}/{len(to_process)} done ({exact_matched} exact, {fuzzy_matched} fuzzy, {unmatched} unmatched)")
-            # Brief pause every 100 to stay well within rate limits
-            time.sleep(2)
 
         if i > 0 and i % 50 == 0:
             # Save progress periodically
             save_taxonomy(taxonomy)
 
+        if client and i % 50 == 0:
+            client.fetch_many([("/search/companies", {"q": _normalise_for_ch(s), "items_per_page": 5})
+                               for s in to_process[i:i + 50]])
+
         normalised = _normalise_for_ch(supplier)
-        results = _ch_search(normalised, api_key, session)
+        results = snapshot.search(normalised) if snapshot else None
+        if not any(r.get("company_status") == "active" for r in results or []):
+            if not api_key:
+                # Dissolved or newer than the snapshot — leave unchecked for a run with an API key
+                deferred += 1
+                continue
+            results = _ch_search(normalised, api_key)
 
         match = _match_company(supplier, results)
         if match:
@@ -2831,9 +3383,6 @@ def companies_house_lookup(taxonomy=None, councils=None, api_key=None, batch_siz
             }
             unmatched += 1
 
-        # Small delay to stay within rate limits (600/5min = ~0.5s per request)
-        time.sleep(0.5)
-
     # Final save
     save_taxonomy(taxonomy)
 
@@ -2845,6 +3394,8 @@ def companies_house_lookup(taxonomy=None, councils=None, api_key=None, batch_siz
     print(f"    Fuzzy matches (≥{FUZZY_MATCH_THRESHOLD * 100:.0f}%): {fuzzy_matched}")
     print(f"    Total matched: {matched}")
     print(f"    Unmatched: {unmatched}")
+    if deferred:
+        print(f"    No snapshot candidate, left for an API run: {deferred}")
     print(f"    Remaining to check: {max(0, len(needs_lookup) - batch_size)}")
 
     return taxonomy
@@ -2852,24 +3403,12 @@ def companies_house_lookup(taxonomy=None, councils=None, api_key=None, batch_siz
 
 # ─── Companies House Deep Enrichment & Compliance Checking ────────────
 
-def _ch_get(endpoint, api_key, session=None):
-    """GET request to Companies House API with rate limiting."""
-    if session is None:
-        session = requests.Session()
-    url = f"{CH_API_BASE}{endpoint}"
-    try:
-        resp = session.get(url, auth=(api_key, ""), timeout=15)
-        if resp.status_code == 429:
-            import time
-            time.sleep(60)
-            resp = session.get(url, auth=(api_key, ""), timeout=15)
-        if resp.status_code == 404:
-            return None
-        resp.raise_for_status()
-        return resp.json()
-    except Exception as e:
-        print(f"    CH API error for {endpoint}: {e}")
-        return None
+def _ch_get(endpoint, api_key):
+    """GET request to Companies House API (shared rate limiter + response cache).
+    Company profiles and PSC lists come from the bulk snapshot when it has them."""
+    snapshot = open_snapshot()
+    data = snapshot.get(endpoint) if snapshot else None
+    return data if data is not None else get_ch_client(api_key).get(endpoint)
 
 
 def _check_compliance(profile, officers_data=None, psc_data=None, insolvency_data=None):
@@ -3231,12 +3770,6 @@ def companies_house_enrich(taxonomy=None, api_key=None, batch_size=200, force=Fa
         batch_size: Max companies to process per run
         force: Re-enrich even if already enriched
     """
-    import time
-
-    if not HAS_REQUESTS:
-        print("ERROR: requests library required. Install with: pip install requests")
-        sys.exit(1)
-
     if api_key is None:
         api_key = os.environ.get("COMPANIES_HOUSE_API_KEY", "")
     if not api_key:
@@ -3246,7 +3779,8 @@ def companies_house_enrich(taxonomy=None, api_key=None, batch_size=200, force=Fa
     if taxonomy is None:
         taxonomy = load_taxonomy()
 
-    session = requests.Session()
+    client = get_ch_client(api_key)
+    snapshot = open_snapshot()
     suppliers = taxonomy.get("suppliers", {})
 
     # Find suppliers with CH match but no deep enrichment yet
@@ -3274,27 +3808,41 @@ def companies_house_enrich(taxonomy=None, api_key=None, batch_size=200, force=Fa
         if (i + 1) % 20 == 0:
             print(f"    [{i+1}/{len(to_process)}] {canonical}")
 
+        if i % 20 == 0:
+            # Fetch profile + officers + PSC for the next 20 companies concurrently;
+            # the per-company calls below are then served from the response cache.
+            # Profiles always come from the API (see step 1); PSC from the snapshot.
+            client.fetch_many([path for _, cn in to_process[i:i + 20]
+                               for path in (f"/company/{cn}{suffix}" for suffix in
+                                            ("", "/officers", "/persons-with-significant-control"))
+                               if path.endswith(cn) or not (snapshot and snapshot.covers(path))])
+
         ch_data = suppliers[canonical]["companies_house"]
 
-        # 1. Fetch full company profile
-        profile = _ch_get(f"/company/{company_number}", api_key, session)
+        # 1. Fetch full company profile — from the API, since the bulk snapshot
+        #    lacks the address flags and insolvency history checked below. The
+        #    snapshot profile (those keys None = unknown) is only a fallback.
+        profile = client.get(f"/company/{company_number}")
+        if not profile and snapshot:
+            profile = snapshot.profile(company_number)
         if not profile:
             ch_data["enriched"] = True
             ch_data["enriched_date"] = str(datetime.now().date())
             ch_data["enrichment_error"] = "Profile not found"
-            time.sleep(0.5)
             continue
 
         # 2. Fetch officers
-        officers_data = _ch_get(f"/company/{company_number}/officers", api_key, session)
+        officers_data = _ch_get(f"/company/{company_number}/officers", api_key)
 
         # 3. Fetch PSCs
-        psc_data = _ch_get(f"/company/{company_number}/persons-with-significant-control", api_key, session)
+        psc_data = _ch_get(f"/company/{company_number}/persons-with-significant-control", api_key)
 
-        # 4. Fetch insolvency if needed
+        # 4. Fetch insolvency if needed (None = unknown, from a snapshot profile)
         insolvency_data = None
-        if profile.get("has_insolvency_history"):
-            insolvency_data = _ch_get(f"/company/{company_number}/insolvency", api_key, session)
+        if profile.get("has_insolvency_history") is not False:
+            insolvency_data = _ch_get(f"/company/{company_number}/insolvency", api_key)
+            if profile.get("has_insolvency_history") is None:
+                profile["has_insolvency_history"] = bool(insolvency_data and insolvency_data.get("cases"))
 
         # 5. Store enriched profile data
         ch_data["enriched"] = True
@@ -3370,9 +3918,6 @@ def companies_house_enrich(taxonomy=None, api_key=None, batch_size=200, force=Fa
         critical_count += sum(1 for v in violations if v["severity"] == "critical")
         high_count += sum(1 for v in violations if v["severity"] == "high")
 
-        # Rate limiting: ~3 calls per company = need ~1.5s between companies
-        time.sleep(1.0)
-
         # Save every 50 companies
         if (i + 1) % 50 == 0:
             save_taxonomy(taxonomy)
@@ -3525,6 +4070,10 @@ def main():
                         help="Recompute insights without re-parsing CSVs")
     parser.add_argument("--validate", action="store_true",
                         help="Run validation checks only")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only reparse source files that are new or changed since the last run")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream records file-by-file straight into the chunk writers (low memory)")
     parser.add_argument("--csv-dir", type=str,
                         help="Override CSV directory path")
     parser.add_argument("--existing-json", type=str,
@@ -3546,6 +4095,8 @@ def main():
     parser.add_argument("--ch-fuzzy-rematch", action="store_true",
                         help="Re-check previously unmatched suppliers using fuzzy matching (90%+ threshold)")
     args = parser.parse_args()
+    if args.stream and args.incremental:
+        parser.error("--stream and --incremental are mutually exclusive")
 
     council_id = args.council
     council_info = COUNCIL_REGISTRY[council_id]
@@ -3606,8 +4157,12 @@ def main():
         with open(existing_path) as f:
             records = json.load(f)
         print(f"  Loaded {len(records)} existing records")
-        metadata = compute_metadata(records, council_info)
-        insights = compute_insights(records, council_info)
+        summary = summarise_records(records)
+        try:
+            metadata = compute_metadata(records, council_info, summary)
+            insights = compute_insights(records, council_info, summary)
+        finally:
+            summary.close()
         export_council(records, metadata, insights, council_id)
         return
 
@@ -3627,7 +4182,7 @@ def main():
 
         print(f"\n  Parsing {len(csv_files)} CSV files...")
         data_start = council_info.get("data_start_fy", "2016/17")
-        records = parse_hyndburn(csv_files, data_start)
+        records = parse_with_manifest(parse_hyndburn, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "burnley":
         if args.retrofit:
@@ -3652,7 +4207,7 @@ def main():
 
         print(f"\n  Parsing {len(csv_files)} CSV files...")
         data_start = council_info.get("data_start_fy", "2021/22")
-        records = parse_pendle(csv_files, data_start)
+        records = parse_with_manifest(parse_pendle, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "lancaster":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "lancaster_csvs"
@@ -3665,7 +4220,7 @@ def main():
 
         print(f"\n  Parsing {len(csv_files)} CSV files...")
         data_start = council_info.get("data_start_fy", "2021/22")
-        records = parse_lancaster(csv_files, data_start)
+        records = parse_with_manifest(parse_lancaster, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "ribble_valley":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "ribble_valley_csvs"
@@ -3678,7 +4233,7 @@ def main():
 
         print(f"\n  Parsing {len(csv_files)} CSV files...")
         data_start = council_info.get("data_start_fy", "2021/22")
-        records = parse_ribble_valley(csv_files, data_start)
+        records = parse_with_manifest(parse_ribble_valley, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "chorley":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "chorley_csvs"
@@ -3691,7 +4246,7 @@ def main():
 
         print(f"\n  Parsing {len(csv_files)} CSV files...")
         data_start = council_info.get("data_start_fy", "2021/22")
-        records = parse_chorley(csv_files, data_start)
+        records = parse_with_manifest(parse_chorley, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "south_ribble":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "south_ribble_csvs"
@@ -3704,7 +4259,7 @@ def main():
 
         print(f"\n  Parsing {len(csv_files)} CSV files...")
         data_start = council_info.get("data_start_fy", "2021/22")
-        records = parse_south_ribble(csv_files, data_start)
+        records = parse_with_manifest(parse_south_ribble, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "lancashire_cc":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "lancashire_cc_csvs"
@@ -3717,7 +4272,7 @@ def main():
 
         print(f"\n  Parsing {len(csv_files)} CSV files...")
         data_start = council_info.get("data_start_fy", "2024/25")
-        records = parse_lancashire_cc(csv_files, data_start)
+        records = parse_with_manifest(parse_lancashire_cc, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "blackpool":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "blackpool_csvs"
@@ -3730,7 +4285,7 @@ def main():
 
         print(f"\n  Parsing {len(csv_files)} CSV files...")
         data_start = council_info.get("data_start_fy", "2019/20")
-        records = parse_blackpool(csv_files, data_start)
+        records = parse_with_manifest(parse_blackpool, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "west_lancashire":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "westlancs_csvs"
@@ -3740,7 +4295,7 @@ def main():
             sys.exit(1)
         print(f"\n  Parsing {len(csv_files)} files...")
         data_start = council_info.get("data_start_fy", "2016/17")
-        records = parse_west_lancashire(csv_files, data_start)
+        records = parse_with_manifest(parse_west_lancashire, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "blackburn":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "blackburn_csvs"
@@ -3750,7 +4305,7 @@ def main():
             sys.exit(1)
         print(f"\n  Parsing {len(csv_files)} CSV files...")
         data_start = council_info.get("data_start_fy", "2019/20")
-        records = parse_blackburn(csv_files, data_start)
+        records = parse_with_manifest(parse_blackburn, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "wyre":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "wyre_csvs"
@@ -3760,7 +4315,7 @@ def main():
             sys.exit(1)
         print(f"\n  Parsing {len(csv_files)} files...")
         data_start = council_info.get("data_start_fy", "2017/18")
-        records = parse_wyre(csv_files, data_start)
+        records = parse_with_manifest(parse_wyre, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "preston":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "preston_csvs"
@@ -3770,7 +4325,7 @@ def main():
             sys.exit(1)
         print(f"\n  Parsing {len(csv_files)} files...")
         data_start = council_info.get("data_start_fy", "2019/20")
-        records = parse_preston(csv_files, data_start)
+        records = parse_with_manifest(parse_preston, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "fylde":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "fylde_csvs"
@@ -3780,7 +4335,7 @@ def main():
             sys.exit(1)
         print(f"\n  Parsing {len(csv_files)} files...")
         data_start = council_info.get("data_start_fy", "2015/16")
-        records = parse_fylde(csv_files, data_start)
+        records = parse_with_manifest(parse_fylde, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "lancashire_pcc":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "lancashire_pcc" / "csvs"
@@ -3790,7 +4345,7 @@ def main():
             sys.exit(1)
         print(f"\n  Parsing {len(csv_files)} XLSX files...")
         data_start = council_info.get("data_start_fy", "2018/19")
-        records = parse_lancashire_pcc(csv_files, data_start)
+        records = parse_with_manifest(parse_lancashire_pcc, csv_files, data_start, council_id, args.incremental, args.stream)
 
     elif council_id == "lancashire_fire":
         csv_dir = Path(args.csv_dir) if args.csv_dir else DATA_DIR / "lancashire_fire" / "csvs"
@@ -3800,42 +4355,56 @@ def main():
             sys.exit(1)
         print(f"\n  Parsing {len(csv_files)} XLSX files...")
         data_start = council_info.get("data_start_fy", "2022/23")
-        records = parse_lancashire_fire(csv_files, data_start)
-
-    if not records:
-        print("  No records parsed. Check your data source.")
-        sys.exit(1)
+        records = parse_with_manifest(parse_lancashire_fire, csv_files, data_start, council_id, args.incremental, args.stream)
+
+    if args.stream and not (args.extract_taxonomy or args.validate):
+        # ── Single pass: taxonomy → metadata/insights → chunk files ──
+        print(f"\n  Streaming records through taxonomy and export...")
+        record_count, metadata, insights = export_council_stream(records, taxonomy, council_id, council_info)
+        if not record_count:
+            print("  No records parsed. Check your data source.")
+            sys.exit(1)
+    else:
+        records = list(records)
+        if not records:
+            print("  No records parsed. Check your data source.")
+            sys.exit(1)
 
-    # ── Extract taxonomy values ──
-    if args.extract_taxonomy:
-        depts, suppliers = extract_unique_values(records, council_id)
-        return
+        # ── Extract taxonomy values ──
+        if args.extract_taxonomy:
+            depts, suppliers = extract_unique_values(records, council_id)
+            return
 
-    # ── Apply taxonomy ──
-    print(f"\n  Applying taxonomy mappings...")
-    records = normalise_records(records, taxonomy, council_id)
+        # ── Apply taxonomy ──
+        print(f"\n  Applying taxonomy mappings...")
+        records = normalise_records(records, taxonomy, council_id)
 
-    # ── Validate ──
-    issues = validate_records(records, council_id)
+        # ── Validate ──
+        issues = validate_records(records, council_id)
 
-    if args.validate:
-        return
+        if args.validate:
+            return
 
-    # ── Compute outputs ──
-    print(f"\n  Computing metadata and insights...")
-    metadata = compute_metadata(records, council_info)
-    insights = compute_insights(records, council_info)
+        # ── Compute outputs ──
+        print(f"\n  Computing metadata and insights...")
+        summary = summarise_records(records)
+        try:
+            metadata = compute_metadata(records, council_info, summary)
+            insights = compute_insights(records, council_info, summary)
+        finally:
+            summary.close()
 
-    # ── Export ──
-    print(f"\n  Exporting...")
-    export_council(records, metadata, insights, council_id)
+        # ── Export ──
+        print(f"\n  Exporting...")
+        export_council(records, metadata, insights, council_id)
+        record_count = len(records)
 
     # ── Summary ──
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
     print(f"  Council: {council_info['name']}")
-    print(f"  Records: {len(records):,}")
+    print(f"  Records: {record_count:,}")
     print(f"  Total Spend: £{insights['summary']['total_spend']:,.2f}")
     print(f"  Unique Suppliers: {insights['summary']['unique_suppliers']:,}")
     print(f"  Financial Years: {', '.join(metadata.get('financial_years', []))}")
@@ -73,29 +73,45 @@ Usage:
     python3 councillor_integrity_etl.py --council burnley
     python3 councillor_integrity_etl.py --all
     python3 councillor_integrity_etl.py --all --skip-ec --skip-fca    # CH only
+    python3 councillor_integrity_etl.py --all --concurrency 8         # 8 councillors in parallel
+    python3 councillor_integrity_etl.py --all --delta                 # Only changed councillors
     python3 councillor_integrity_etl.py --stubs-only                  # No API calls
     python3 councillor_integrity_etl.py --cross-council               # Cross-council analysis only
 
 Rate limits:
-    Companies House: 600 requests/5 min (0.5s delay). Primary bottleneck.
+    Companies House: 600 requests/5 min. Shared ch_client rate limiter + thread pool;
+        responses cached in data/.ch_cache.sqlite (profiles/officers/PSC 7 days).
+        With a bulk snapshot imported (ch_snapshot.py → data/.ch_snapshot.sqlite)
+        company profiles and PSC lists are read locally; the API is only used
+        for officer searches/appointments and companies missing from the snapshot.
     Electoral Commission: Undocumented. 1s delay.
     Charity Commission: ~1000/day. 1s delay.
     FCA Register: Undocumented. 1s delay.
+    The EC/Charity/FCA delays are per API, shared by all --concurrency workers.
 """
 
 import argparse
-import base64
+import copy
+import hashlib
 import json
 import os
 import re
 import sys
+import threading
 import time
 import urllib.request
 import urllib.error
 import urllib.parse
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ch_client import get_client as get_ch_client, SlidingWindowLimiter
+from ch_snapshot import open_snapshot
+from name_index import NameIndex
+from integrity_graph import build_network_graph, ASSOCIATE, COMPANY, COUNCILLOR, SUPPLIER
 
 # ── Config ──────────────────────────────────────────────────────────────────
 SCRIPT_DIR = Path(__file__).parent
@@ -126,8 +142,8 @@ FORMATION_AGENT_INDICATORS = [
     "lenta business centre", "regus house", "spaces", "wework",
 ]
 
-# Request delays to avoid rate limiting
-CH_DELAY = 0.5
+# Request delays to avoid rate limiting (Companies House is paced by the
+# shared ch_client rate limiter + response cache instead of a fixed delay)
 EC_DELAY = 1.0
 CHARITY_DELAY = 1.0
 FCA_DELAY = 1.0
@@ -180,18 +196,28 @@ LANCASHIRE_PARTIES = {
 
 # API call counter for rate limit awareness
 api_calls = defaultdict(int)
+_api_calls_lock = threading.Lock()
+
+# label → SlidingWindowLimiter(1 request per delay): paces each API across all workers
+_pacers = {}
+_pacers_lock = threading.Lock()
+
+
+def _pace(label, delay):
+    """Wait for this API's next slot (one request per `delay` seconds, shared by all threads)."""
+    if delay <= 0:
+        return
+    with _pacers_lock:
+        pacer = _pacers.get(label)
+        if pacer is None:
+            pacer = _pacers[label] = SlidingWindowLimiter(capacity=1, window=delay)
+    pacer.acquire()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # HTTP Helpers
 # ═══════════════════════════════════════════════════════════════════════════
 
-def ch_auth_header():
-    """Generate Companies House Basic auth header."""
-    token = base64.b64encode(f"{CH_KEY}:".encode()).decode()
-    return f"Basic {token}"
-
-
 def http_get_json(url, headers=None, delay=0.5, label="API", _retries=0):
     """Generic HTTP GET → JSON with retry + rate limit handling.
     Retries on 429, 503, 504 with exponential backoff.
@@ -204,8 +230,9 @@ def http_get_json(url, headers=None, delay=0.5, label="API", _retries=0):
     req.add_header("User-Agent", "AI-DOGE-IntegrityETL/3.0")
 
     try:
-        time.sleep(delay)
-        api_calls[label] += 1
+        _pace(label, delay)
+        with _api_calls_lock:
+            api_calls[label] += 1
         with urllib.request.urlopen(req, timeout=20) as resp:
             return json.loads(resp.read().decode())
     except urllib.error.HTTPError as e:
@@ -242,11 +269,39 @@ def http_get_json(url, headers=None, delay=0.5, label="API", _retries=0):
 
 
 def ch_request(path, params=None):
-    """Make an authenticated request to Companies House API."""
-    url = f"{CH_API_BASE}{path}"
-    if params:
-        url += "?" + urllib.parse.urlencode(params)
-    return http_get_json(url, {"Authorization": ch_auth_header()}, CH_DELAY, "CH")
+    """Make an authenticated request to Companies House API (rate-limited, cached)."""
+    return get_ch_client(CH_KEY or "").get(path, params)
+
+
+def prefetch_company_data(company_numbers, endpoints=("officers",)):
+    """Warm the CH response cache for many companies on the client's worker pool.
+
+    endpoints: "profile" and/or sub-resources ("officers", "psc") fetched with
+    the same params as get_company_*, so the serial analysis loops that follow
+    are served from the cache instead of waiting on one request at a time.
+    """
+    params = {
+        "officers": {"items_per_page": 100},
+        "persons-with-significant-control": {"items_per_page": 50},
+        "charges": {"items_per_page": 25},
+    }
+    snapshot = open_snapshot()
+    jobs = []
+    for cn in dict.fromkeys(c for c in company_numbers if c):
+        for ep in endpoints:
+            if ep == "profile":
+                path = f"/company/{cn}"
+            else:
+                ep = "persons-with-significant-control" if ep == "psc" else ep
+                path = f"/company/{cn}/{ep}"
+            if snapshot and snapshot.covers(path):
+                if ep == "profile" and CH_KEY:
+                    # get_company_profile still asks the API for insolvency history
+                    jobs.append((f"{path}/insolvency", None))
+                continue  # answered locally by get_company_profile / get_company_psc
+            jobs.append((path, params.get(ep)))
+    if jobs:
+        get_ch_client(CH_KEY or "").fetch_many(jobs)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -298,8 +353,26 @@ def get_officer_appointments(officer_id, items_per_page=50):
 
 
 def get_company_profile(company_number):
-    """Get full company profile from Companies House."""
-    return ch_request(f"/company/{company_number}")
+    """Get full company profile — local bulk snapshot first, then Companies House.
+
+    The snapshot can't show past insolvency, so for a snapshot profile that
+    leaves it unknown /company/{n}/insolvency is fetched (as council_etl's
+    deep enrichment does). Without an API key it stays None and
+    extract_red_flags records it as not checked.
+    """
+    snapshot = open_snapshot()
+    profile = snapshot.profile(company_number) if snapshot else None
+    if not profile:
+        return ch_request(f"/company/{company_number}")
+    if profile.get("has_insolvency_history") is None and CH_KEY:
+        insolvency = ch_request(f"/company/{company_number}/insolvency")
+        cases = insolvency.get("cases", []) if insolvency else []
+        profile["has_insolvency_history"] = bool(cases)
+        if profile.get("has_been_liquidated") is None:
+            profile["has_been_liquidated"] = any("liquidation" in (c.get("type") or "") for c in cases)
+        profile["_snapshot_unknown"] = [k for k in profile["_snapshot_unknown"]
+                                        if k not in ("has_insolvency_history", "has_been_liquidated")]
+    return profile
 
 
 def get_company_officers(company_number):
@@ -310,9 +383,12 @@ def get_company_officers(company_number):
 
 
 def get_company_psc(company_number):
-    """Get Persons with Significant Control for a company."""
-    data = ch_request(f"/company/{company_number}/persons-with-significant-control",
-                      {"items_per_page": 50})
+    """Get Persons with Significant Control for a company (bulk snapshot first)."""
+    path = f"/company/{company_number}/persons-with-significant-control"
+    snapshot = open_snapshot()
+    data = snapshot.get(path) if snapshot else None
+    if data is None:
+        data = ch_request(path, {"items_per_page": 50})
     return data.get("items", []) if data else []
 
 
@@ -773,6 +849,9 @@ def extract_red_flags(company):
     if company.get("has_insolvency_history"):
         flags.append({"type": "insolvency_history", "severity": "high",
                       "detail": "Company has insolvency history"})
+    elif company.get("has_insolvency_history") is None and "_snapshot" in company:
+        flags.append({"type": "insolvency_not_checked", "severity": "info",
+                      "detail": "Insolvency/liquidation history not checked (bulk snapshot only, no API key)"})
 
     if company.get("has_charges"):
         flags.append({"type": "has_charges", "severity": "info",
@@ -825,46 +904,74 @@ def extract_red_flags(company):
     return flags
 
 
-def cross_reference_suppliers(company_name, supplier_data):
-    """Check if a company name appears in council supplier list. Enhanced fuzzy match."""
-    if not supplier_data:
-        return []
+SUPPLIER_NAME_SUFFIXES = [" limited", " ltd", " plc", " llp", " inc", " corp",
+                          " uk", " (uk)", " group", " holdings"]
+
+
+def _normalize_supplier_name(name):
+    """Lower-case and drop company suffixes (anywhere in the name, as always)."""
+    n = name.lower().strip()
+    for suffix in SUPPLIER_NAME_SUFFIXES:
+        n = n.replace(suffix, "")
+    return n.strip()
+
+
+class SupplierIndex(list):
+    """A supplier list (entries unchanged, still usable as a list) with every
+    name normalised once: an exact-name hash map and an inverted word index
+    for the 80% word-overlap rule. Build one per supplier list per run and
+    pass it wherever the list went — cross_reference_suppliers() then probes
+    the index instead of re-normalising every supplier on every call."""
+
+    def __init__(self, supplier_data=()):
+        super().__init__(supplier_data)
+        self.names = []
+        self.totals = []
+        self.exact = {}  # normalised name → positions
+        self.words = NameIndex(tokenize=str.split)  # multi-word names only
+        for pos, supplier_entry in enumerate(self):
+            supplier = supplier_entry if isinstance(supplier_entry, str) else supplier_entry.get("supplier", "")
+            sn = _normalize_supplier_name(supplier)
+            self.names.append(supplier)
+            self.totals.append(supplier_entry.get("total", 0) if isinstance(supplier_entry, dict) else 0)
+            self.exact.setdefault(sn, []).append(pos)
+            if len(set(sn.split())) >= 2:
+                self.words.add(pos, sn)
+
+    @classmethod
+    def of(cls, supplier_data):
+        return supplier_data if isinstance(supplier_data, cls) else cls(supplier_data)
+
+    def match(self, company_name):
+        """Supplier matches for company_name, as cross_reference_suppliers returns them."""
+        cn = _normalize_supplier_name(company_name)
+        cn_words = frozenset(cn.split())
 
-    cn = company_name.lower().strip()
-    # Normalize company suffixes
-    for suffix in [" limited", " ltd", " plc", " llp", " inc", " corp",
-                   " uk", " (uk)", " group", " holdings"]:
-        cn = cn.replace(suffix, "")
-    cn = cn.strip()
-    cn_words = set(cn.split())
+        # Exact match (after normalization)
+        exact = self.exact.get(cn, [])
+        hits = [(pos, "exact", 100) for pos in exact]
+        # High word overlap — 80%, tightened from 0.6 to reduce false positives
+        if len(cn_words) >= 2:
+            hits += [(pos, "fuzzy", int(ratio * 100))
+                     for pos, ratio in self.words.overlap_matches(cn_words, 0.8) if pos not in exact]
+        hits.sort()  # supplier order, as a linear scan finds them
 
-    matches = []
-    for supplier_entry in supplier_data:
-        supplier = supplier_entry if isinstance(supplier_entry, str) else supplier_entry.get("supplier", "")
-        total = supplier_entry.get("total", 0) if isinstance(supplier_entry, dict) else 0
+        matches = [{"supplier": self.names[pos], "match_type": match_type,
+                    "confidence": confidence, "total_spend": self.totals[pos]}
+                   for pos, match_type, confidence in hits]
+        return sorted(matches, key=lambda x: x["confidence"], reverse=True)
 
-        sn = supplier.lower().strip()
-        for suffix in [" limited", " ltd", " plc", " llp", " inc", " corp",
-                       " uk", " (uk)", " group", " holdings"]:
-            sn = sn.replace(suffix, "")
-        sn = sn.strip()
-        sn_words = set(sn.split())
 
-        # Exact match (after normalization)
-        if cn == sn:
-            matches.append({"supplier": supplier, "match_type": "exact",
-                           "confidence": 100, "total_spend": total})
-            continue
-
-        # High word overlap
-        if len(cn_words) >= 2 and len(sn_words) >= 2:
-            overlap = cn_words & sn_words
-            ratio = len(overlap) / max(len(cn_words), len(sn_words))
-            if ratio >= 0.8:  # 80% word overlap — tightened from 0.6 to reduce false positives
-                matches.append({"supplier": supplier, "match_type": "fuzzy",
-                               "confidence": int(ratio * 100), "total_spend": total})
+def cross_reference_suppliers(company_name, supplier_data):
+    """Check if a company name appears in council supplier list. Enhanced fuzzy match.
 
-    return sorted(matches, key=lambda x: x["confidence"], reverse=True)
+    supplier_data is a SupplierIndex (load_all_supplier_data builds one per
+    council; process_council wraps load_supplier_data's plain list in one) or
+    a plain list, which is indexed for this one call.
+    """
+    if not supplier_data:
+        return []
+    return SupplierIndex.of(supplier_data).match(company_name)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -876,6 +983,8 @@ def build_co_director_network(companies, councillor_name):
     co_directors = {}  # name → {companies: [...], roles: [...]}
     formation_agent_companies = 0
 
+    prefetch_company_data([c.get("company_number", "") for c in companies
+                           if not c.get("resigned_on")])
     for company in companies:
         cn = company.get("company_number", "")
         if not cn or company.get("resigned_on"):
@@ -1621,6 +1730,8 @@ def analyse_psc(companies, councillor_name):
     """Check if councillor is a Person with Significant Control of any company."""
     psc_entries = []
 
+    prefetch_company_data([c.get("company_number", "") for c in companies
+                           if not c.get("resigned_on")], endpoints=("psc",))
     for company in companies:
         cn = company.get("company_number", "")
         if not cn or company.get("resigned_on"):
@@ -2091,6 +2202,7 @@ def cascade_co_directors(associates, councillor_companies, supplier_data, counci
                 })
 
         # For each of their other companies, check the officers (hop 3)
+        prefetch_company_data([oc["company_number"] for oc in other_companies[:5]])
         for oc in other_companies[:5]:  # Cap at 5 companies per associate
             cn = oc["company_number"]
             officers = get_company_officers(cn)
@@ -2175,19 +2287,21 @@ def cascade_co_directors(associates, councillor_companies, supplier_data, counci
     }
 
 
-def compute_graph_centrality(result, all_results):
-    """PageRank-inspired centrality scoring using betweenness heuristic.
+def compute_graph_centrality(result, graph):
+    """Graph centrality: weighted PageRank + betweenness on the council network graph.
+
+    PageRank runs over the councillor/company/co-director/supplier/donor/MP
+    graph (integrity_graph.WEIGHTS: supplier links 5, MP 4, donors and
+    cross-council suppliers 3, directorships and co-directors 2), so a
+    councillor is central when their neighbours are central too — not just
+    when they have many links. It is scaled 0..1 between an unconnected
+    councillor and the top councillor in the graph.
 
-    Measures how many distinct network paths pass through this councillor:
-    - Direct company connections (weight 1)
-    - Co-director connections (weight 2 — bridges networks)
-    - Cross-council connections (weight 3 — multi-authority exposure)
-    - Supplier conflicts (weight 5 — financial nexus)
-    - Cascading 3-hop links (weight 4 — hidden intermediary)
-    - MP connections (weight 3)
+    Betweenness is the share of shortest paths between pairs of other
+    councillors that run through this councillor (bridges between networks).
 
-    Returns PageRank-style score normalised against council peers,
-    plus hub/authority classification.
+    The old weighted link count is kept as weighted_score / components.
+    Returns the scaled PageRank plus hub/bridge/connector classification.
     """
     ch = result.get("companies_house", {})
     co_net = result.get("co_director_network", {})
@@ -2212,44 +2326,14 @@ def compute_graph_centrality(result, all_results):
         network_crossover * 4
     )
 
-    # Betweenness heuristic: councillors who bridge multiple networks are more central
-    distinct_networks = 0
-    if companies > 0: distinct_networks += 1
-    if associates > 0: distinct_networks += 1
-    if cross_council > 0: distinct_networks += 1
-    if supplier_conflicts > 0: distinct_networks += 1
-    if cascade_links > 0: distinct_networks += 1
-    if mp_findings > 0: distinct_networks += 1
-
-    betweenness_bonus = distinct_networks * 5  # Bridge bonus
-    raw_score = weighted_score + betweenness_bonus
-
-    # Normalise against all councillors in this council
-    max_score = 1
-    for r in all_results:
-        r_ch = r.get("companies_house", {})
-        r_co = r.get("co_director_network", {})
-        r_casc = r.get("cascading_network", {})
-        r_raw = (
-            r_ch.get("active_directorships", 0) * 1 +
-            r_co.get("total_unique_associates", 0) * 2 +
-            len(r.get("cross_council_conflicts", [])) * 3 +
-            len(r.get("supplier_conflicts", [])) * 5 +
-            r_casc.get("total_links", 0) * 4 +
-            len(r.get("mp_findings", [])) * 3 +
-            r.get("network_crossover", {}).get("total_links", 0) * 4
-        )
-        r_nets = sum(1 for v in [
-            r_ch.get("active_directorships", 0),
-            r_co.get("total_unique_associates", 0),
-            len(r.get("cross_council_conflicts", [])),
-            len(r.get("supplier_conflicts", [])),
-            r_casc.get("total_links", 0),
-            len(r.get("mp_findings", [])),
-        ] if v > 0) * 5
-        max_score = max(max_score, r_raw + r_nets)
-
-    pagerank = raw_score / max_score if max_score > 0 else 0
+    distinct_networks = sum(1 for v in [
+        companies, associates, cross_council, supplier_conflicts, cascade_links, mp_findings,
+    ] if v > 0)
+
+    c = graph.node_of(result)
+    raw_rank, pagerank = graph.councillor_pagerank(c)
+    betweenness = graph.councillor_betweenness(c)
+    floor = graph.pagerank()[1]
 
     # Classification
     if pagerank > 0.8:
@@ -2267,13 +2351,15 @@ def compute_graph_centrality(result, all_results):
 
     return {
         "pagerank": round(pagerank, 4),
+        "betweenness": round(betweenness, 4),
         "weighted_score": weighted_score,
-        "betweenness_bonus": betweenness_bonus,
-        "raw_score": raw_score,
-        "max_in_council": max_score,
+        "raw_score": round(raw_rank, 8),
+        "max_in_council": round(graph.pagerank_peak(), 8),
+        "isolated_score": round(floor, 8),
         "classification": classification,
         "amplifier": amplifier,
         "distinct_networks": distinct_networks,
+        "degree": len(graph.neighbours(c)),
         "components": {
             "companies": companies,
             "associates": associates,
@@ -2487,105 +2573,58 @@ def trace_beneficial_ownership_recursive(result, supplier_data, max_depth=3):
     }
 
 
-def detect_network_cliques(result, all_results):
+def detect_network_cliques(result, graph):
     """Clique detection: find tight clusters of councillors sharing companies/co-directors/suppliers.
 
-    A clique is 3+ councillors who all share connections (companies, co-directors, or suppliers).
+    A clique is 3+ councillors who ALL pairwise share a connection (company,
+    co-director or supplier) — the largest maximal clique containing this
+    councillor in the graph's councillor projection (ties broken by overlap).
     These represent coordinated groups with potential for collusion.
 
     Args:
         result: current councillor's result
-        all_results: list of all councillor results in this council
+        graph: integrity_graph.NetworkGraph built over the council's results
     """
     findings = []
     name = result.get("name", "")
-    my_associates = set()
-    my_suppliers = set()
-    my_companies = set()
-
-    # Build this councillor's connection sets
-    co_net = result.get("co_director_network", {})
-    for assoc in co_net.get("associates", []):
-        my_associates.add(assoc.get("name", "").lower().strip())
-
-    for sc in result.get("supplier_conflicts", []):
-        sm = sc.get("supplier_match", {})
-        my_suppliers.add(sm.get("supplier", "").upper())
-
-    ch = result.get("companies_house", {})
-    for comp in ch.get("companies", []):
-        my_companies.add(comp.get("company_number", ""))
-
-    if not (my_associates or my_suppliers or my_companies):
+    c = graph.node_of(result)
+    shared = graph.shared_entities(c)
+    if not shared:
         return findings
 
-    # Find other councillors who share connections
-    shared_connections = []
-    for other in all_results:
-        other_name = other.get("name", "")
-        if other_name == name:
-            continue
-
-        other_associates = set()
-        other_suppliers = set()
-        other_companies = set()
-
-        o_co = other.get("co_director_network", {})
-        for assoc in o_co.get("associates", []):
-            other_associates.add(assoc.get("name", "").lower().strip())
-
-        for sc in other.get("supplier_conflicts", []):
-            sm = sc.get("supplier_match", {})
-            other_suppliers.add(sm.get("supplier", "").upper())
-
-        o_ch = other.get("companies_house", {})
-        for comp in o_ch.get("companies", []):
-            other_companies.add(comp.get("company_number", ""))
-
-        # Calculate overlap
-        shared_assoc = my_associates & other_associates
-        shared_supp = my_suppliers & other_suppliers
-        shared_comp = my_companies & other_companies
-
-        overlap_score = len(shared_assoc) * 2 + len(shared_supp) * 3 + len(shared_comp) * 5
-        if overlap_score > 0:
-            shared_connections.append({
-                "councillor": other_name,
-                "party": other.get("party", ""),
-                "ward": other.get("ward", ""),
-                "shared_associates": list(shared_assoc)[:5],
-                "shared_suppliers": list(shared_supp)[:5],
-                "shared_companies": list(shared_comp)[:3],
-                "overlap_score": overlap_score,
-            })
-
-    # Sort by overlap score and find cliques (3+ councillors with mutual connections)
-    shared_connections.sort(key=lambda x: x["overlap_score"], reverse=True)
-
-    if len(shared_connections) >= 2:
-        # Top connections form a potential clique
-        clique_members = [name] + [sc["councillor"] for sc in shared_connections[:4]]
-        total_overlap = sum(sc["overlap_score"] for sc in shared_connections[:4])
-
-        # Classify by shared connection types
-        all_shared_suppliers = set()
-        all_shared_companies = set()
-        for sc in shared_connections[:4]:
-            all_shared_suppliers.update(sc["shared_suppliers"])
-            all_shared_companies.update(sc["shared_companies"])
-
-        if all_shared_suppliers or all_shared_companies:
-            findings.append({
-                "type": "network_clique",
-                "severity": "high" if total_overlap >= 10 else "warning",
-                "clique_size": len(clique_members),
-                "members": clique_members,
-                "shared_suppliers": list(all_shared_suppliers)[:5],
-                "shared_companies": list(all_shared_companies)[:3],
-                "overlap_score": total_overlap,
-                "detail": "Network clique: {} councillors share {} supplier(s) and {} company(ies)".format(
-                    len(clique_members), len(all_shared_suppliers), len(all_shared_companies)),
-            })
+    overlap = {d: graph.overlap(entities) for d, entities in shared.items()}
+    members = graph.clique_with(c, weight=overlap.get)
+    if len(members) < 2:
+        return findings
+    members.sort(key=lambda d: overlap[d], reverse=True)
+
+    clique_members = [name] + [graph.labels[d] for d in members]
+    total_overlap = sum(overlap[d] for d in members)
+
+    # Classify by shared connection types
+    all_shared_suppliers = []
+    all_shared_companies = []
+    for d in members:
+        for e in shared[d].get(SUPPLIER, []):
+            if graph.labels[e] not in all_shared_suppliers:
+                all_shared_suppliers.append(graph.labels[e])
+        for e in shared[d].get(COMPANY, []):
+            if graph.keys[e] not in all_shared_companies:
+                all_shared_companies.append(graph.keys[e])
+
+    if all_shared_suppliers or all_shared_companies:
+        findings.append({
+            "type": "network_clique",
+            "severity": "high" if total_overlap >= 10 else "warning",
+            "clique_size": len(clique_members),
+            "members": clique_members,
+            "councils": sorted({graph.councils[d] for d in [c] + members}),
+            "shared_suppliers": all_shared_suppliers[:5],
+            "shared_companies": all_shared_companies[:3],
+            "overlap_score": total_overlap,
+            "detail": "Network clique: {} councillors share {} supplier(s) and {} company(ies)".format(
+                len(clique_members), len(all_shared_suppliers), len(all_shared_companies)),
+        })
 
     return findings
 
@@ -2599,15 +2638,13 @@ def correlate_donations_to_contracts(result, supplier_data, council_id):
     return correlate_donations_to_contracts_v5(result, supplier_data, council_id)
 
 
-def calculate_network_centrality(result, all_results):
+def calculate_network_centrality(result, graph):
     """Calculate network centrality score for a councillor.
 
-    Centrality = normalised measure of how connected a councillor is:
-      - Companies count
-      - Unique co-director associates
-      - Cross-council links
-      - Supplier conflicts
-      - MP connections
+    Centrality = weighted degree in the council network graph (companies 2,
+    co-director associates 2, cross-council suppliers 3, MPs 4, supplier
+    conflicts 5 — see integrity_graph.WEIGHTS) normalised against the best
+    connected councillor in the graph.
 
     Returns centrality score (0.0-1.0) and amplification factor.
     """
@@ -2621,27 +2658,8 @@ def calculate_network_centrality(result, all_results):
     supplier_conflicts = len(result.get("supplier_conflicts", []))
     mp_findings = len(result.get("mp_findings", []))
 
-    raw_score = (
-        total_companies * 2 +
-        total_associates +
-        cross_council * 3 +
-        supplier_conflicts * 5 +
-        mp_findings * 4
-    )
-
-    # Normalise against all councillors in this council
-    max_score = 1
-    for r in all_results:
-        r_ch = r.get("companies_house", {})
-        r_co = r.get("co_director_network", {})
-        r_raw = (
-            r_ch.get("total_directorships", 0) * 2 +
-            r_co.get("total_unique_associates", 0) +
-            len(r.get("cross_council_conflicts", [])) * 3 +
-            len(r.get("supplier_conflicts", [])) * 5 +
-            len(r.get("mp_findings", [])) * 4
-        )
-        max_score = max(max_score, r_raw)
+    raw_score = graph.strength(graph.node_of(result))
+    max_score = max(1.0, graph.strength_peak())
 
     centrality = raw_score / max_score if max_score > 0 else 0
 
@@ -3039,21 +3057,26 @@ def detect_phantom_companies(result):
     """
     findings = []
     ch = result.get("companies_house", {})
+    snapshot = open_snapshot()
 
     for comp in ch.get("companies", []):
         indicators = []
         company_name = comp.get("company_name", "")
-        status = (comp.get("company_status") or "").lower()
+        # Fields the appointment record didn't carry come from the bulk snapshot
+        profile = (snapshot.profile(comp.get("company_number", "")) if snapshot else None) or {}
+        status = (comp.get("company_status") or profile.get("company_status") or "").lower()
 
         # Check SIC codes
-        sic_codes = set(comp.get("sic_codes", []))
+        sic_codes = set(comp.get("sic_codes") or profile.get("sic_codes", []))
         if sic_codes & SHELL_SIC_CODES:
             indicators.append("shell_sic_code")
         if sic_codes & PROPERTY_SIC_CODES and status == "dormant":
             indicators.append("dormant_property_vehicle")
 
         # Check registration address
-        addr = (comp.get("registered_office") or "").lower()
+        ro_addr = profile.get("registered_office_address", {})
+        addr = (comp.get("registered_office") or comp.get("registered_address_snippet")
+                or ", ".join(v for v in ro_addr.values() if v)).lower()
         if any(ind in addr for ind in FORMATION_AGENT_INDICATORS):
             indicators.append("formation_agent_address")
 
@@ -3062,7 +3085,7 @@ def detect_phantom_companies(result):
             indicators.append("dormant_status")
 
         # Check incorporation date (recent = more suspicious)
-        inc_date = comp.get("date_of_creation", "")
+        inc_date = comp.get("date_of_creation") or profile.get("date_of_creation", "")
         if inc_date:
             try:
                 inc = datetime.strptime(inc_date, "%Y-%m-%d")
@@ -3129,114 +3152,98 @@ def detect_dormant_to_active_supplier(result, supplier_data):
     return findings
 
 
-def detect_social_network_triangulation(result, all_results):
+def detect_social_network_triangulation(result, graph):
     """Detect 2-hop social network connections to council suppliers.
 
-    Path: Councillor → Company X → Co-Director Y → Company Z → Council supplier
-    This catches indirect connections that simple 1-hop analysis misses.
+    Path: Councillor → Co-Director Y → Company Z (another councillor's company)
+          → Council supplier
+    Walked on the network graph (associate → shared company edges), so it
+    catches indirect connections that simple 1-hop analysis misses.
 
     Returns list of findings.
     """
     findings = []
-    co_net = result.get("co_director_network", {})
-    associates = co_net.get("associates", [])
-
-    if not associates:
-        return findings
-
-    # Build set of all supplier company names across all councillors
-    supplier_names = set()
-    for r in all_results:
-        for sc in r.get("supplier_conflicts", []):
-            sn = (sc.get("company_name") or "").upper().strip()
-            if sn:
-                supplier_names.add(sn)
-
-    # For each co-director, check if THEIR companies are suppliers
-    councillor_name = result.get("name", "").upper()
+    c = graph.node_of(result)
+    council_id = graph.councils[c]
+    own_companies = set(graph.neighbours(c, COMPANY))
     seen = set()
 
-    for associate in associates:
-        assoc_name = (associate.get("name") or "").upper()
-        assoc_companies = associate.get("companies", [])
-
-        for other_r in all_results:
-            if other_r.get("name", "").upper() == councillor_name:
+    for a in graph.neighbours(c, ASSOCIATE):
+        for z in graph.neighbours(a, COMPANY):
+            if z in own_companies:
                 continue
-            other_ch = other_r.get("companies_house", {})
-            for other_comp in other_ch.get("companies", []):
-                other_name = (other_comp.get("company_name") or "").upper()
-                if other_name in supplier_names:
-                    # Check if associate connects to this other councillor
-                    for ac in assoc_companies:
-                        ac_name = (ac.get("company_name") or ac.get("name") or "").upper()
-                        if ac_name == other_name:
-                            key = (councillor_name, assoc_name, other_name)
-                            if key not in seen:
-                                seen.add(key)
-                                findings.append({
-                                    "type": "two_hop_supplier_link",
-                                    "severity": "high",
-                                    "intermediary": assoc_name,
-                                    "supplier_company": other_name,
-                                    "detail": "2-hop link: councillor → co-director '{}' → "
-                                              "supplier company '{}'".format(
-                                        associate.get("name", ""), other_comp.get("company_name", "")),
-                                })
+            if not any(graph.councils[s] == council_id for s in graph.neighbours(z, SUPPLIER)):
+                continue
+            others = [d for d in graph.neighbours(z, COUNCILLOR) if d != c]
+            if not others:
+                continue
+            company_name = graph.labels[z].upper()
+            key = (graph.labels[a].upper(), company_name)
+            if key in seen:
+                continue
+            seen.add(key)
+            findings.append({
+                "type": "two_hop_supplier_link",
+                "severity": "high",
+                "intermediary": graph.labels[a].upper(),
+                "supplier_company": company_name,
+                "other_councillor": graph.labels[others[0]],
+                "detail": "2-hop link: councillor → co-director '{}' → "
+                          "supplier company '{}'".format(graph.labels[a], graph.labels[z]),
+            })
 
     return findings[:10]  # Limit to top 10 to avoid noise
 
 
-def detect_reciprocal_appointments(result, all_results, all_supplier_data):
+def detect_reciprocal_appointments(result, graph):
     """Detect reciprocal cross-council appointment patterns.
 
     Pattern: Councillor A (Council X) directs company supplying Council Y,
     AND Councillor B (Council Y) directs company supplying Council X.
+    Only finds anything on a graph spanning several councils
+    (run_cross_council_analysis).
 
     Returns list of findings.
     """
     findings = []
-    councillor_name = result.get("name", "").upper()
-    council_id = result.get("_council_id_v5", "")
-    ch = result.get("companies_house", {})
-
-    # Find which OTHER councils this councillor's companies supply
-    other_council_suppliers = {}
-    for comp in ch.get("companies", []):
-        for cc in result.get("cross_council_conflicts", []):
-            other_council = cc.get("other_council", "")
-            if other_council and other_council != council_id:
-                other_council_suppliers[other_council] = comp.get("company_name", "")
-
+    c = graph.node_of(result)
+    council_id = graph.councils[c]
+
+    def supplied_councils(councillor):
+        """{other council: first company of the councillor supplying it}"""
+        supplied = {}
+        for comp in graph.neighbours(councillor, COMPANY):
+            for s in graph.neighbours(comp, SUPPLIER):
+                other = graph.councils[s]
+                if other and other != graph.councils[councillor]:
+                    supplied.setdefault(other, graph.labels[comp])
+        return supplied
+
+    other_council_suppliers = supplied_councils(c)
     if not other_council_suppliers:
         return findings
 
     # Check if councillors in those OTHER councils supply THIS council
-    for other_r in all_results:
-        other_name = other_r.get("name", "").upper()
-        other_council = other_r.get("_council_id_v5", "")
-
+    for d in graph.councillors:
+        other_council = graph.councils[d]
         if other_council not in other_council_suppliers:
             continue
-
-        # Does this other councillor's company supply our council?
-        for cc in other_r.get("cross_council_conflicts", []):
-            if cc.get("other_council", "") == council_id:
-                findings.append({
-                    "type": "reciprocal_cross_council",
-                    "severity": "critical",
-                    "our_councillor": result.get("name", ""),
-                    "our_council": council_id,
-                    "their_councillor": other_r.get("name", ""),
-                    "their_council": other_council,
-                    "our_company_there": other_council_suppliers.get(other_council, ""),
-                    "their_company_here": cc.get("company_name", ""),
-                    "detail": "RECIPROCAL: '{}' ({}) supplies {} council; "
-                              "'{}' ({}) supplies {} council — mutual cross-supply".format(
-                        result.get("name", ""), council_id, other_council,
-                        other_r.get("name", ""), other_council, council_id),
-                })
-                break
+        their_company = supplied_councils(d).get(council_id)
+        if their_company:
+            findings.append({
+                "type": "reciprocal_cross_council",
+                "severity": "critical",
+                "our_councillor": result.get("name", ""),
+                "our_council": council_id,
+                "their_councillor": graph.labels[d],
+                "their_council": other_council,
+                "our_company_there": other_council_suppliers[other_council],
+                "their_company_here": their_company,
+                "detail": "RECIPROCAL: '{}' ({}) supplies {} council; "
+                          "'{}' ({}) supplies {} council — mutual cross-supply".format(
+                    result.get("name", ""), council_id, other_council,
+                    graph.labels[d], other_council, council_id),
+            })
 
     return findings
 
@@ -4739,12 +4746,16 @@ def _load_full_supplier_data(council_id):
 
 
 def load_all_supplier_data(full=False):
-    """Load supplier data from ALL 15 councils for cross-council analysis."""
+    """Load supplier data from ALL 15 councils for cross-council analysis.
+
+    Each council's list comes back as a SupplierIndex, built once here and
+    shared by every detector that matches company names to suppliers.
+    """
     all_data = {}
     for council_id in ALL_COUNCILS:
         data = load_supplier_data(council_id, full=full)
         if data:
-            all_data[council_id] = data
+            all_data[council_id] = SupplierIndex(data)
     return all_data
 
 
@@ -5071,6 +5082,22 @@ def _cross_ref_suppliers(company_entry, result, supplier_data, all_supplier_data
                 })
 
 
+def refresh_supplier_cross_reference(result, councillor, supplier_data, all_supplier_data):
+    """Re-run the supplier cross-reference on a result carried forward by
+    --delta, against today's supplier lists, then rescore it.
+
+    Local only — no API calls — so a spending refresh doesn't force every
+    councillor back through Companies House.
+    """
+    result["supplier_conflicts"] = []
+    result["cross_council_conflicts"] = []
+    for company_entry in result.get("companies_house", {}).get("companies", []):
+        company_entry.pop("supplier_match", None)
+        _cross_ref_suppliers(company_entry, result, supplier_data, all_supplier_data, councillor)
+    score_councillor(result)
+    return result
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Main Councillor Processing
 # ═══════════════════════════════════════════════════════════════════════════
@@ -5774,6 +5801,16 @@ def process_councillor(councillor, supplier_data, all_supplier_data=None,
 
     del result["_council_id_v5"]
 
+    score_councillor(result)
+    return result
+
+
+def score_councillor(result):
+    """Steps 11-12 of process_councillor: aggregate every finding into
+    red_flags, then set integrity_score, risk_level and network_investigation.
+    Re-runnable on a stored result (see refresh_supplier_cross_reference)."""
+    misconduct = result.get("misconduct_patterns", [])
+
     # ── 11. Aggregate ALL Red Flags ──
     all_flags = []
 
@@ -6100,17 +6137,168 @@ def process_councillor(councillor, supplier_data, all_supplier_data=None,
         "priority": "high" if len(network_reasons) >= 3 else "medium" if network_reasons else "none"
     }
 
-    return result
-
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Council Processing
 # ═══════════════════════════════════════════════════════════════════════════
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Delta Re-scan
+# ═══════════════════════════════════════════════════════════════════════════
+# --delta re-investigates only councillors whose inputs changed since the last
+# run. State lives in data/{council}/etl_state/integrity_state.json: per
+# councillor, the fingerprint of its inputs and the raw process_councillor()
+# result (before the council-wide passes, which always re-run over everyone).
+#
+# A councillor is carried forward when all of these match the stored entry:
+#   - run stamp: ETL options, the shared reference files (EC bulk donations,
+#     Hansard, MP interests) and its own council's elections.json
+#   - its councillors.json entry, including its register of interests entry
+#   - the first appointments page of each CH officer it was matched to
+#     (etag, refreshed — one API call per investigated officer)
+#   - the last full check is younger than --delta-max-age days, so officer
+#     records CH matches that did not exist last time are still found
+#
+# Supplier lists are deliberately not fingerprinted: they change with every
+# spending refresh. A carried-forward result instead has its own-council and
+# cross-council supplier cross-reference re-run against today's lists (local,
+# no API calls) and its red flags and score recomputed. The other
+# supplier-aware detectors, and the cross-council candidate registry, catch up
+# at the next full check (--delta-max-age).
+
+INTEGRITY_STATE_VERSION = 2
+DELTA_MAX_AGE_DAYS = 30
+DELTA_OFFICER_CONFIDENCE = 55  # officers process_councillor fetches appointments for
+DELTA_REFERENCE_FILES = ("shared/ec_donations.json", "shared/hansard_cross_reference.json",
+                         "shared/mp_interests.json")
+
+
+def _stable_hash(*parts):
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _integrity_state_path(council_id):
+    return DATA_DIR / council_id / "etl_state" / "integrity_state.json"
+
+
+def load_integrity_state(council_id):
+    """councillor key → state entry from the previous run ({} if none/unusable)."""
+    try:
+        with open(_integrity_state_path(council_id)) as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if state.get("version") != INTEGRITY_STATE_VERSION:
+        return {}
+    return state.get("councillors", {})
+
+
+def save_integrity_state(council_id, entries):
+    path = _integrity_state_path(council_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump({"version": INTEGRITY_STATE_VERSION, "councillors": entries}, f)
+    os.replace(tmp, path)
+
+
+def _councillor_key(councillor):
+    return str(councillor.get("id") or councillor.get("name", ""))
+
+
+def integrity_run_stamp(council_id, options):
+    """Fingerprint of the non-CH inputs every councillor of council_id reads
+    (supplier lists excluded — see refresh_supplier_cross_reference)."""
+    files = [DATA_DIR / rel for rel in DELTA_REFERENCE_FILES]
+    files.append(DATA_DIR / council_id / "elections.json")
+    stamps = []
+    for path in files:
+        try:
+            st = path.stat()
+            stamps.append((str(path.relative_to(DATA_DIR)), st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamps.append((str(path), None))
+    return _stable_hash(options, stamps)
+
+
+def councillor_input_stamp(councillor):
+    return _stable_hash({k: v for k, v in councillor.items() if k != "_council_id"})
+
+
+def ch_appointments_stamp(result, refresh=False):
+    """Etag (or content hash) of the first appointments page of each officer the
+    councillor was matched to; None if CH could not be reached. refresh=True
+    bypasses the response cache (and re-caches the fresh page)."""
+    stamps = []
+    for match in result.get("companies_house", {}).get("officer_matches", []):
+        officer_id = match.get("officer_id")
+        if not officer_id or match.get("confidence", 0) < DELTA_OFFICER_CONFIDENCE:
+            continue
+        data = get_ch_client(CH_KEY or "").get(f"/officers/{officer_id}/appointments",
+                                              {"items_per_page": 50, "start_index": 0}, refresh=refresh)
+        if data is None:
+            return None
+        stamps.append(data.get("etag") or _stable_hash(data.get("total_results"), [
+            (item.get("appointed_to", {}).get("company_number"), item.get("appointed_on"),
+             item.get("resigned_on")) for item in data.get("items", [])]))
+    return stamps
+
+
+def delta_unchanged(entry, input_stamp, run_stamp, max_age_days):
+    """True if the stored entry can be carried forward (makes the CH etag calls)."""
+    if not entry or entry.get("run") != run_stamp or entry.get("input") != input_stamp:
+        return False
+    try:
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(entry.get("checked_at", ""))
+    except (TypeError, ValueError):
+        return False
+    if age.days >= max_age_days:
+        return False
+    ch = ch_appointments_stamp(entry["result"], refresh=True)
+    return ch is not None and ch == entry.get("ch")
+
+
+def warm_shared_caches():
+    """Load the lazily-cached reference data (MP interests, EC bulk donations,
+    Hansard, candidate registry) once, before worker threads race to do it."""
+    get_mp_interests()
+    get_ec_bulk_data()
+    get_hansard_data()
+    build_candidate_registry()
+
+
+def submit_councillors(councillors, process, concurrency=1):
+    """One zero-argument callable per councillor returning process(councillor).
+
+    With concurrency > 1 councillors run on a thread pool: the work is I/O
+    bound and every API is paced across threads (shared ch_client
+    rate limiter, http_get_json pacers). Each callable waits for its own result,
+    so results are still consumed — and logged — in councillor order.
+    Returns (callables, pool or None).
+    """
+    if concurrency <= 1 or len(councillors) <= 1:
+        return [lambda c=c: process(c) for c in councillors], None
+    warm_shared_caches()
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="councillor")
+    futures = [pool.submit(process, c) for c in councillors]
+    return [f.result for f in futures], pool
+
+
 def process_council(council_id, all_supplier_data=None,
                     skip_ec=False, skip_fca=False, skip_network=False,
-                    full_supplier_match=True):
-    """Process all councillors for a given council."""
+                    full_supplier_match=True, concurrency=1,
+                    delta=False, delta_max_age=DELTA_MAX_AGE_DAYS):
+    """Process all councillors for a given council.
+
+    concurrency > 1 fans the per-councillor checks out over that many worker
+    threads; the council-wide passes (board analysis, network graph,
+    centrality, cliques) run once every councillor is back.
+
+    delta=True carries forward councillors whose inputs are unchanged since
+    the last run (see Delta Re-scan above); the council-wide passes still run
+    over every councillor.
+    """
     councillors_path = DATA_DIR / council_id / "councillors.json"
     if not councillors_path.exists():
         print("[SKIP] No councillors.json for {}".format(council_id))
@@ -6147,12 +6335,13 @@ def process_council(council_id, all_supplier_data=None,
         c["_register_data"] = register_data.get(cid) if register_data else None
 
     # Load supplier data — full=True loads ALL suppliers from spending data (not just top-20)
-    supplier_data = load_supplier_data(council_id, full=full_supplier_match)
-    print("  {} suppliers loaded for cross-reference{}".format(
-        len(supplier_data), " (full spending data)" if full_supplier_match else " (top-20 only)"))
-
     if not all_supplier_data:
         all_supplier_data = load_all_supplier_data(full=full_supplier_match)
+    # Same list load_supplier_data would return, already indexed
+    supplier_data = all_supplier_data.get(council_id) or SupplierIndex(
+        load_supplier_data(council_id, full=full_supplier_match))
+    print("  {} suppliers loaded for cross-reference{}".format(
+        len(supplier_data), " (full spending data)" if full_supplier_match else " (top-20 only)"))
     print("  {} councils loaded for cross-council analysis".format(len(all_supplier_data)))
 
     sources = ["Companies House (officers, PSC, charges, disqualifications — DOB-verified)"]
@@ -6324,12 +6513,47 @@ def process_council(council_id, all_supplier_data=None,
 
     affected_councils = set()
 
+    # Delta state: previous entries of councillors still on the council are kept
+    # until replaced, so an interrupted run loses nothing
+    previous_state = load_integrity_state(council_id)
+    run_stamp = integrity_run_stamp(council_id, {
+        "version": results["version"], "skip_ec": skip_ec, "skip_fca": skip_fca,
+        "skip_network": skip_network, "full_supplier_match": full_supplier_match,
+    })
+    state = {}
+    for councillor in councillors:
+        key = _councillor_key(councillor)
+        if key in previous_state:
+            state[key] = previous_state[key]
+    carried = set()
+
+    def process_or_carry(councillor):
+        key = _councillor_key(councillor)
+        entry = previous_state.get(key)
+        input_stamp = councillor_input_stamp(councillor)
+        if delta and delta_unchanged(entry, input_stamp, run_stamp, delta_max_age):
+            carried.add(key)
+            return refresh_supplier_cross_reference(
+                copy.deepcopy(entry["result"]), councillor, supplier_data, all_supplier_data)
+        result = process_councillor(councillor, supplier_data, all_supplier_data,
+                                    skip_ec=skip_ec, skip_fca=skip_fca, skip_network=skip_network)
+        if result:
+            state[key] = {
+                "run": run_stamp,
+                "input": input_stamp,
+                "ch": ch_appointments_stamp(result),
+                "checked_at": datetime.now(timezone.utc).isoformat(),
+                "result": copy.deepcopy(result),
+            }
+        return result
+
+    for councillor in councillors:
+        councillor["_council_id"] = council_id  # Tag for cross-council matching
+    jobs, pool = submit_councillors(councillors, process_or_carry, concurrency)
+
     for i, councillor in enumerate(councillors):
         try:
-            councillor["_council_id"] = council_id  # Tag for cross-council matching
-            result = process_councillor(
-                councillor, supplier_data, all_supplier_data,
-                skip_ec=skip_ec, skip_fca=skip_fca, skip_network=skip_network)
+            result = jobs[i]()
 
             if result:
                 results["councillors"].append(result)
@@ -6459,10 +6683,11 @@ def process_council(council_id, all_supplier_data=None,
                 verification_str = " [{}]".format(ch.get("verification_method", "?"))
                 eliminated = result.get("false_positives_eliminated", 0)
                 elim_str = " [{}✗ eliminated]".format(eliminated) if eliminated else ""
-                print("    [{}/{}] ✓ {} — {} active, {} resigned{}{}{}{}".format(
+                carried_str = " [unchanged]" if _councillor_key(councillor) in carried else ""
+                print("    [{}/{}] ✓ {} — {} active, {} resigned{}{}{}{}{}".format(
                     i + 1, len(councillors), result["name"],
                     ch["active_directorships"], ch["resigned_directorships"],
-                    flags_str, misconduct_str, verification_str, elim_str))
+                    flags_str, misconduct_str, verification_str, elim_str, carried_str))
 
         except KeyboardInterrupt:
             print("\n  ⚠ Interrupted at {}/{}. Saving partial results...".format(
@@ -6474,6 +6699,13 @@ def process_council(council_id, all_supplier_data=None,
                 i + 1, len(councillors), councillor.get("name", "?"), e))
             traceback.print_exc()
 
+    if pool:
+        pool.shutdown(wait=False, cancel_futures=True)
+    save_integrity_state(council_id, dict(state))
+    if delta:
+        print("  Delta: {} re-processed, {} carried forward".format(
+            results["councillors_checked"] - len(carried), len(carried)))
+
     # ── v7.1 Post-Processing: Multi-Councillor Board Analysis ──
     # If 3+ councillors from 2+ parties sit on the same company board,
     # it's almost certainly a council-appointed role, not a personal conflict.
@@ -6652,15 +6884,23 @@ def process_council(council_id, all_supplier_data=None,
                     info["name"], info["councillor_count"],
                     ", ".join(info["linked_councillors"][:4])))
 
+    # ── Council network graph: councillors, companies, co-directors, suppliers,
+    # donors, MPs — built once here, shared by every network post-pass below ──
+    graph = None
+    if len(results["councillors"]) >= 2:
+        graph_start = time.time()
+        graph = build_network_graph({council_id: results["councillors"]})
+        print("\n  Network graph: {} nodes, {} edges ({:.2f}s)".format(
+            len(graph), len(graph.indices) // 2, time.time() - graph_start))
+
     # ── v5 Post-Processing: Social Network Triangulation + Reciprocal Appointments ──
     # These need all_results, so run after all councillors processed
     if len(results["councillors"]) >= 2:
         print("\n  Running v5 post-processing (social network + reciprocal appointments)...")
         all_results = results["councillors"]
         for r in all_results:
-            r["_council_id_v5"] = council_id
             # Social network triangulation
-            sn_findings = detect_social_network_triangulation(r, all_results)
+            sn_findings = detect_social_network_triangulation(r, graph)
             r["social_network"] = sn_findings
             for f in sn_findings:
                 r["red_flags"].append({
@@ -6668,14 +6908,13 @@ def process_council(council_id, all_supplier_data=None,
                     "detail": f["detail"]
                 })
             # Reciprocal appointments
-            recip_findings = detect_reciprocal_appointments(r, all_results, all_supplier_data)
+            recip_findings = detect_reciprocal_appointments(r, graph)
             r.setdefault("reciprocal_appointments", []).extend(recip_findings)
             for f in recip_findings:
                 r["red_flags"].append({
                     "type": f["type"], "severity": f["severity"],
                     "detail": f["detail"]
                 })
-            del r["_council_id_v5"]
 
         # Recount red flags after post-processing
         results["summary"]["red_flags_total"] = sum(
@@ -6693,11 +6932,11 @@ def process_council(council_id, all_supplier_data=None,
 
         for r in all_results:
             # v4/v5 basic centrality
-            centrality = calculate_network_centrality(r, all_results)
+            centrality = calculate_network_centrality(r, graph)
             r["network_centrality"] = centrality
 
-            # v7 enhanced graph centrality (PageRank-inspired)
-            graph_cent = compute_graph_centrality(r, all_results)
+            # v7 enhanced graph centrality (PageRank + betweenness)
+            graph_cent = compute_graph_centrality(r, graph)
             r["graph_centrality"] = graph_cent
 
             # Use v7 amplifier if available, fall back to basic
@@ -6734,7 +6973,7 @@ def process_council(council_id, all_supplier_data=None,
         print("  Detecting network cliques...")
         clique_count = 0
         for r in all_results:
-            cliques = detect_network_cliques(r, all_results)
+            cliques = detect_network_cliques(r, graph)
             r["network_cliques"] = cliques
             if cliques:
                 clique_count += len(cliques)
@@ -6829,6 +7068,7 @@ def process_council(council_id, all_supplier_data=None,
         s["risk_distribution"]["low"], s["risk_distribution"]["medium"],
         s["risk_distribution"]["elevated"], s["risk_distribution"]["high"]))
     print("  API calls: {}".format(dict(api_calls)))
+    print("  Companies House: {}".format(get_ch_client(CH_KEY or "").summary()))
     print("  Saved: {}".format(output_path))
 
     return results
@@ -6838,8 +7078,37 @@ def process_council(council_id, all_supplier_data=None,
 # Cross-Council Analysis (Global View)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def run_cross_council_analysis():
-    """Run analysis across ALL councils looking for cross-council fraud patterns."""
+def _cross_council_state_path():
+    return DATA_DIR / "shared" / "etl_state" / "integrity_cross_state.json"
+
+
+def load_cross_council_state():
+    """component digest → {"cliques", "betweenness"} from the previous cross-council run."""
+    try:
+        with open(_cross_council_state_path()) as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if state.get("version") != INTEGRITY_STATE_VERSION:
+        return {}
+    return state.get("components", {})
+
+
+def save_cross_council_state(components):
+    path = _cross_council_state_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump({"version": INTEGRITY_STATE_VERSION, "components": components}, f)
+    os.replace(tmp, path)
+
+
+def run_cross_council_analysis(delta=False):
+    """Run analysis across ALL councils looking for cross-council fraud patterns.
+
+    delta=True reuses the cliques and betweenness of network components that
+    are unchanged since the last run.
+    """
     print("\n" + "=" * 70)
     print("CROSS-COUNCIL FRAUD ANALYSIS — ALL 17 LANCASHIRE BODIES")
     print("=" * 70)
@@ -6876,6 +7145,9 @@ def run_cross_council_analysis():
         "family_networks_across_councils": [],
         "supplier_councillor_overlaps": [],
         "mp_cross_council_links": [],
+        "reciprocal_appointments": [],
+        "network_cliques": [],
+        "network_hubs": [],
         "investigation_priorities": [],
         "cross_council_risk_summary": {},
     }
@@ -6958,6 +7230,74 @@ def run_cross_council_analysis():
                     })
         print("  MP cross-council supplier links: {}".format(len(findings["mp_cross_council_links"])))
 
+    # 4b. Cross-council network graph: reciprocal supply, cliques and hubs spanning bodies
+    graph_start = time.time()
+    results_by_node = {}
+    graph = build_network_graph({cid: integrity.get("councillors", [])
+                                 for cid, integrity in all_integrity.items()})
+    for integrity in all_integrity.values():
+        for c in integrity.get("councillors", []):
+            results_by_node[graph.node_of(c)] = c
+    print("  Cross-council network graph: {} nodes, {} edges, {} councillors".format(
+        len(graph), len(graph.indices) // 2, len(graph.councillors)))
+
+    for node in graph.councillors:
+        findings["reciprocal_appointments"].extend(
+            detect_reciprocal_appointments(results_by_node[node], graph))
+
+    # Cliques and betweenness never cross a connected component, so with --delta
+    # only components whose digest changed since the last run are recomputed
+    previous_components = load_cross_council_state() if delta else {}
+    components = {}
+    changed_sources = []
+    for nodes in graph.components():
+        digest = graph.component_digest(nodes)
+        if digest in previous_components:
+            components[digest] = previous_components[digest]
+            continue
+        members = [v for v in nodes if v in results_by_node]
+        cliques, seen_cliques = [], set()
+        for node in members:
+            for clique in detect_network_cliques(results_by_node[node], graph):
+                key = (tuple(sorted(clique["members"])), tuple(clique["councils"]))
+                if len(clique["councils"]) >= 2 and key not in seen_cliques:
+                    seen_cliques.add(key)
+                    cliques.append(clique)
+        components[digest] = {"members": members, "cliques": cliques}
+        changed_sources.extend(members)
+
+    raw_betweenness = graph.betweenness(sources=changed_sources)
+    for digest, comp in components.items():
+        if "betweenness" not in comp:
+            comp["betweenness"] = {"\t".join(graph.identity(v)[1:]): raw_betweenness[v]
+                                   for v in comp.pop("members")}
+        findings["network_cliques"].extend(comp["cliques"])
+    save_cross_council_state(components)
+
+    betweenness = {}
+    for comp in components.values():
+        betweenness.update(comp["betweenness"])
+    hubs = []
+    for node in graph.councillors:
+        raw_rank, pagerank = graph.councillor_pagerank(node)
+        if pagerank > 0:
+            raw = betweenness.get("\t".join(graph.identity(node)[1:]), 0.0)
+            hubs.append({
+                "councillor": graph.labels[node],
+                "council": graph.councils[node],
+                "pagerank": round(pagerank, 4),
+                "betweenness": round(graph.councillor_betweenness(node, raw), 4),
+                "degree": len(graph.neighbours(node)),
+            })
+    hubs.sort(key=lambda h: (h["pagerank"], h["betweenness"]), reverse=True)
+    findings["network_hubs"] = hubs[:25]
+    print("  Reciprocal cross-council supply: {}, cross-council cliques: {}, hubs: {} ({:.2f}s)".format(
+        len(findings["reciprocal_appointments"]), len(findings["network_cliques"]),
+        len(findings["network_hubs"]), time.time() - graph_start))
+    if delta:
+        print("  Delta: {} of {} network components recomputed".format(
+            sum(1 for d in components if d not in previous_components), len(components)))
+
     # 5. Build investigation priorities (highest risk findings across all bodies)
     for council_id, integrity in all_integrity.items():
         for c in integrity.get("councillors", []):
@@ -7126,6 +7466,8 @@ Examples:
   %(prog)s --council burnley                    Full scan of Burnley
   %(prog)s --council burnley --skip-ec --skip-fca  CH only (faster)
   %(prog)s --all --skip-network                 All councils, no co-director mapping
+  %(prog)s --all --concurrency 8                All councils, 8 councillors at a time
+  %(prog)s --all --delta                        Re-check only councillors whose inputs changed
   %(prog)s --stubs-only                         Generate stub files (no API calls)
   %(prog)s --cross-council                      Cross-council analysis only
         """)
@@ -7139,6 +7481,13 @@ Examples:
     parser.add_argument("--skip-network", action="store_true", help="Skip co-director network")
     parser.add_argument("--quick-supplier-match", action="store_true",
                         help="Use top-20 supplier matching only (faster, less accurate)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Councillors processed in parallel per council (default 1)")
+    parser.add_argument("--delta", action="store_true",
+                        help="Only re-investigate councillors whose inputs changed since the last run")
+    parser.add_argument("--delta-max-age", type=int, default=DELTA_MAX_AGE_DAYS,
+                        help="With --delta, fully re-check councillors last checked this many days ago "
+                             "(default {})".format(DELTA_MAX_AGE_DAYS))
     args = parser.parse_args()
 
     if args.ch_key:
@@ -7155,7 +7504,7 @@ Examples:
         return
 
     if args.cross_council:
-        run_cross_council_analysis()
+        run_cross_council_analysis(delta=args.delta)
         return
 
     # Full supplier matching loads ALL suppliers from spending data (default)
@@ -7173,9 +7522,11 @@ Examples:
             process_council(council_id, all_supplier_data,
                           skip_ec=args.skip_ec, skip_fca=args.skip_fca,
                           skip_network=args.skip_network,
-                          full_supplier_match=full_supplier)
+                          full_supplier_match=full_supplier,
+                          concurrency=args.concurrency,
+                          delta=args.delta, delta_max_age=args.delta_max_age)
         # Run cross-council analysis after all councils processed
-        run_cross_council_analysis()
+        run_cross_council_analysis(delta=args.delta)
     elif args.council:
         if args.council not in ALL_COUNCILS:
             print("Unknown council: {}".format(args.council))
@@ -7184,7 +7535,9 @@ Examples:
         process_council(args.council, all_supplier_data,
                        skip_ec=args.skip_ec, skip_fca=args.skip_fca,
                        skip_network=args.skip_network,
-                       full_supplier_match=full_supplier)
+                       full_supplier_match=full_supplier,
+                       concurrency=args.concurrency,
+                       delta=args.delta, delta_max_age=args.delta_max_age)
     else:
         parser.print_help()
         sys.exit(1)
@@ -7193,6 +7546,7 @@ Examples:
     print("\n" + "=" * 70)
     print("COMPLETED in {:.1f}s ({:.1f} min)".format(elapsed, elapsed / 60))
     print("API calls: {}".format(dict(api_calls)))
+    print("Companies House: {}".format(get_ch_client(CH_KEY or "").summary()))
     print("=" * 70)
 
 
@@ -7,19 +7,37 @@ Usage:
     python scripts/doge_analysis.py                    # Run all analyses
     python scripts/doge_analysis.py --analysis duplicates  # Run specific analysis
     python scripts/doge_analysis.py --council burnley  # Analyse single council
+    python scripts/doge_analysis.py --workers 0        # Per-council analyses on every CPU
+    python scripts/doge_analysis.py --no-cache         # Ignore cached analysis results
 """
 
 import argparse
+import contextlib
+import io
 import json
 import os
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import benford
+from analysis_dag import Node, file_digest, run_nodes
+
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 DATA_DIR = PROJECT_DIR / "data"
+
+# Optional: memory-mapped columnar store written by council_etl.export_council()
+try:
+    from spending_store import load_spending_columns as _load_store
+    from spending_store import supplier_totals as _supplier_totals
+    HAS_SPENDING_STORE = True
+except ImportError:
+    HAS_SPENDING_STORE = False
+
 COUNCILS = ["burnley", "hyndburn", "pendle", "rossendale", "lancaster", "ribble_valley", "chorley", "south_ribble", "lancashire_cc", "blackpool", "west_lancashire", "blackburn", "wyre", "preston", "fylde", "lancashire_pcc", "lancashire_fire"]
 
 # GOV.UK SeRCOP budget categories used in budgets_govuk.json
@@ -57,6 +75,18 @@ def load_spending(council_id):
     return records
 
 
+def load_spending_columns(council_id):
+    """Memory-map the columnar spending store for a council.
+
+    Returns dict of numpy arrays (amount, date_ordinal, supplier_canonical,
+    department, financial_year codes) + dictionaries, or None if the store is
+    missing, stale, or numpy isn't installed — callers fall back to records.
+    """
+    if not HAS_SPENDING_STORE:
+        return None
+    return _load_store(DATA_DIR / council_id)
+
+
 def load_taxonomy():
     """Load shared taxonomy."""
     path = DATA_DIR / "taxonomy.json"
@@ -1081,28 +1111,37 @@ def analyse_procurement_compliance(councils):
 # ANALYSIS 6b: Supplier Contract Concentration
 # ═══════════════════════════════════════════════════════════════════════
 
-def analyse_supplier_concentration(all_spending):
+def analyse_supplier_concentration(all_spending, all_columns=None):
     """Analyse how concentrated spending is among top suppliers.
 
     Calculates Herfindahl-Hirschman Index (HHI) and top-N concentration
     metrics to identify whether spend is dominated by a few suppliers.
+    Councils with a columnar store are aggregated from its amount/supplier
+    columns (their records may be None).
     """
     results = {}
 
     for council_id, records in all_spending.items():
-        tx = [r for r in records if r.get("amount", 0) > 0]
-        if not tx:
-            continue
-
-        # Aggregate spend by supplier
-        supplier_spend = defaultdict(lambda: {"total": 0, "count": 0})
+        cols = (all_columns or {}).get(council_id)
+        supplier_spend = {}
         total_spend = 0
-        for r in tx:
-            supplier = r.get("supplier_canonical", r.get("supplier", "")) or "UNKNOWN"
-            amt = r["amount"]
-            supplier_spend[supplier]["total"] += amt
-            supplier_spend[supplier]["count"] += 1
-            total_spend += amt
+        if cols is not None:
+            for supplier, total, count in _supplier_totals(cols):
+                supplier_spend[supplier] = {"total": total, "count": count}
+                total_spend += total
+        else:
+            # Aggregate spend by supplier
+            supplier_spend = defaultdict(lambda: {"total": 0, "count": 0})
+            for r in records:
+                if not r.get("amount", 0) > 0:
+                    continue
+                supplier = r.get("supplier_canonical", r.get("supplier", "")) or "UNKNOWN"
+                amt = r["amount"]
+                supplier_spend[supplier]["total"] += amt
+                supplier_spend[supplier]["count"] += 1
+                total_spend += amt
+        if not supplier_spend:
+            continue
 
         if total_spend == 0:
             continue
@@ -2533,7 +2572,27 @@ def generate_doge_findings(council_id, duplicates, cross_council, patterns, comp
 # ANALYSIS 5: Benford's Law Forensic Analysis
 # ═══════════════════════════════════════════════════════════════════════
 
-def analyse_benfords_law(all_spending):
+def build_benford_features(all_spending, all_columns=None):
+    """Extract Benford digit features once per council (one vectorised pass).
+
+    Uses the memory-mapped columnar store when it matches the loaded records
+    (or when the records weren't loaded at all — None), otherwise builds the
+    amount/supplier arrays from the record dicts. The result is shared by all
+    six Benford analyses.
+    """
+    features = {}
+    for council_id, records in all_spending.items():
+        cols = (all_columns or {}).get(council_id)
+        if cols is not None and (records is None or cols["meta"].get("record_count") == len(records)):
+            features[council_id] = benford.digit_features(
+                cols["amount"], cols["supplier_canonical"],
+                cols["dictionaries"].get("supplier_canonical", []))
+        else:
+            features[council_id] = benford.features_from_records(records)
+    return features
+
+
+def analyse_benfords_law(all_spending, features=None):
     """Apply Benford's Law to detect anomalous digit distributions.
 
     Benford's Law predicts the frequency of leading digits in naturally occurring
@@ -2545,98 +2604,30 @@ def analyse_benfords_law(all_spending):
     6: 6.7%, 7: 5.8%, 8: 5.1%, 9: 4.6%
 
     Uses chi-squared goodness-of-fit test. p < 0.05 = significant deviation.
+    Also reports Nigrini's MAD for the council as a whole.
     """
-    import math
-
-    BENFORD_EXPECTED = {
-        1: 0.301, 2: 0.176, 3: 0.125, 4: 0.097, 5: 0.079,
-        6: 0.067, 7: 0.058, 8: 0.051, 9: 0.046,
-    }
-
+    features = features or build_benford_features(all_spending)
     results = {}
 
-    for council_id, records in all_spending.items():
+    for council_id in all_spending:
         # Use amounts > £100 (Benford's law works best with multi-digit numbers)
-        amounts = [r["amount"] for r in records if r.get("amount", 0) > 100]
-        if len(amounts) < 100:
-            results[council_id] = {"status": "insufficient_data", "count": len(amounts)}
+        result = benford.first_digit_test(features[council_id])
+        if result is None:
             continue
-
-        # Count first digits
-        digit_counts = defaultdict(int)
-        for amt in amounts:
-            first_digit = int(str(abs(amt)).lstrip('0').lstrip('.')[0])
-            if 1 <= first_digit <= 9:
-                digit_counts[first_digit] += 1
-
-        total = sum(digit_counts.values())
-        if total == 0:
+        results[council_id] = result
+        if "status" in result:
             continue
 
-        # Calculate observed vs expected frequencies
-        digit_analysis = []
-        chi_squared = 0
-        max_deviation = 0
-        max_deviation_digit = 0
-
-        for d in range(1, 10):
-            observed = digit_counts[d] / total
-            expected = BENFORD_EXPECTED[d]
-            deviation = observed - expected
-            deviation_pct = round((deviation / expected) * 100, 1) if expected > 0 else 0
-
-            # Chi-squared component
-            expected_count = expected * total
-            chi_sq_component = ((digit_counts[d] - expected_count) ** 2) / expected_count
-            chi_squared += chi_sq_component
-
-            if abs(deviation) > max_deviation:
-                max_deviation = abs(deviation)
-                max_deviation_digit = d
-
-            digit_analysis.append({
-                "digit": d,
-                "observed_count": digit_counts[d],
-                "observed_pct": round(observed * 100, 1),
-                "expected_pct": round(expected * 100, 1),
-                "deviation_pct": deviation_pct,
-            })
-
-        # Chi-squared test with 8 degrees of freedom (9 digits - 1)
-        # Critical values: 15.51 (p=0.05), 20.09 (p=0.01), 26.12 (p=0.001)
-        chi_squared = round(chi_squared, 2)
-        if chi_squared > 26.12:
-            conformity = "non_conforming"
-            conformity_label = "Significant deviation from Benford's Law (p < 0.001)"
-        elif chi_squared > 20.09:
-            conformity = "marginal"
-            conformity_label = "Marginal deviation (p < 0.01)"
-        elif chi_squared > 15.51:
-            conformity = "acceptable"
-            conformity_label = "Mild deviation (p < 0.05) — within normal range"
-        else:
-            conformity = "conforming"
-            conformity_label = "Conforms to Benford's Law (p > 0.05) — no anomaly"
-
-        results[council_id] = {
-            "total_amounts_tested": total,
-            "chi_squared": chi_squared,
-            "conformity": conformity,
-            "conformity_label": conformity_label,
-            "max_deviation_digit": max_deviation_digit,
-            "max_deviation_pct": round(max_deviation * 100, 1),
-            "digit_analysis": digit_analysis,
-        }
-
+        conformity = result["conformity"]
         emoji = "✓" if conformity in ("conforming", "acceptable") else "⚠" if conformity == "marginal" else "✗"
-        print(f"\n  {council_id.upper()}: {emoji} χ²={chi_squared} — {conformity_label}")
-        print(f"    Tested {total} amounts > £100")
-        print(f"    Largest deviation: digit {max_deviation_digit} ({round(max_deviation*100,1)}% off expected)")
+        print(f"\n  {council_id.upper()}: {emoji} χ²={result['chi_squared']} — {result['conformity_label']}")
+        print(f"    Tested {result['total_amounts_tested']} amounts > £100 (MAD={result['mad']}, {result['mad_conformity']})")
+        print(f"    Largest deviation: digit {result['max_deviation_digit']} ({result['max_deviation_pct']}% off expected)")
 
     return results
 
 
-def analyse_benfords_second_digit(all_spending):
+def analyse_benfords_second_digit(all_spending, features=None):
     """Apply second-digit Benford's Law analysis (Nigrini, 2012).
 
     The second-digit test is more discriminating than first-digit for detecting
@@ -2649,89 +2640,21 @@ def analyse_benfords_second_digit(all_spending):
 
     Uses chi-squared goodness-of-fit test with 9 degrees of freedom.
     """
-    EXPECTED_PCT = [0.1197, 0.1139, 0.1088, 0.1043, 0.1003,
-                    0.0967, 0.0934, 0.0904, 0.0876, 0.0850]
-
+    features = features or build_benford_features(all_spending)
     results = {}
 
-    for council_id, records in all_spending.items():
+    for council_id in all_spending:
         # Use amounts > £9 (need at least 2 significant digits)
-        amounts = [r["amount"] for r in records if r.get("amount", 0) > 9]
-        if len(amounts) < 100:
-            results[council_id] = {"status": "insufficient_data", "count": len(amounts)}
+        result = benford.second_digit_test(features[council_id])
+        results[council_id] = result
+        if "status" in result:
             continue
 
-        # Count second digits
-        digit_counts = [0] * 10
-        n = 0
-        for amt in amounts:
-            s = str(abs(amt)).replace('.', '').lstrip('0')
-            if len(s) < 2:
-                continue
-            d = int(s[1])
-            digit_counts[d] += 1
-            n += 1
-
-        if n < 50:
-            results[council_id] = {"status": "insufficient_data", "count": n}
-            continue
-
-        # Chi-squared goodness of fit
-        chi_squared = 0
-        digit_analysis = []
-        max_deviation = 0
-        max_deviation_digit = 0
-
-        for d in range(10):
-            observed_pct = digit_counts[d] / n
-            expected_pct = EXPECTED_PCT[d]
-            expected_count = expected_pct * n
-            chi_sq_component = ((digit_counts[d] - expected_count) ** 2) / expected_count
-            chi_squared += chi_sq_component
-
-            deviation = abs(observed_pct - expected_pct)
-            if deviation > max_deviation:
-                max_deviation = deviation
-                max_deviation_digit = d
-
-            digit_analysis.append({
-                "digit": d,
-                "observed_count": digit_counts[d],
-                "observed_pct": round(observed_pct * 100, 2),
-                "expected_pct": round(expected_pct * 100, 2),
-                "deviation_pct": round((observed_pct - expected_pct) / expected_pct * 100, 1) if expected_pct > 0 else 0,
-            })
-
-        # Chi-squared with 9 df: 16.92 (p=0.05), 21.67 (p=0.01), 27.88 (p=0.001)
-        chi_squared = round(chi_squared, 2)
-        if chi_squared > 27.88:
-            conformity = "non_conforming"
-            p_description = "p < 0.001 (highly significant)"
-        elif chi_squared > 21.67:
-            conformity = "marginal"
-            p_description = "p < 0.01 (very significant)"
-        elif chi_squared > 16.92:
-            conformity = "acceptable"
-            p_description = "p < 0.05 (significant)"
-        else:
-            conformity = "conforming"
-            p_description = "p > 0.05 (not significant)"
-
-        results[council_id] = {
-            "total_amounts_tested": n,
-            "chi_squared": chi_squared,
-            "df": 9,
-            "conformity": conformity,
-            "p_description": p_description,
-            "max_deviation_digit": max_deviation_digit,
-            "max_deviation_pct": round(max_deviation * 100, 2),
-            "digit_analysis": digit_analysis,
-        }
-
+        conformity = result["conformity"]
         emoji = "✓" if conformity in ("conforming", "acceptable") else "⚠" if conformity == "marginal" else "✗"
-        print(f"\n  {council_id.upper()} (2nd digit): {emoji} χ²={chi_squared} — {p_description}")
-        print(f"    Tested {n} amounts (2nd digit)")
-        print(f"    Largest deviation: digit {max_deviation_digit} ({round(max_deviation*100,2)}% off expected)")
+        print(f"\n  {council_id.upper()} (2nd digit): {emoji} χ²={result['chi_squared']} — {result['p_description']}")
+        print(f"    Tested {result['total_amounts_tested']} amounts (2nd digit)")
+        print(f"    Largest deviation: digit {result['max_deviation_digit']} ({result['max_deviation_pct']}% off expected)")
 
     return results
 
@@ -2742,7 +2665,7 @@ def analyse_benfords_second_digit(all_spending):
 # References: Nigrini (2012), ACFE Fraud Examiners Manual
 # ═══════════════════════════════════════════════════════════════════════
 
-def analyse_benfords_first_two_digits(all_spending):
+def analyse_benfords_first_two_digits(all_spending, features=None):
     """First-two digits test (Nigrini primary audit sample selection tool).
 
     Analyses the joint distribution of the first two digits (10-99) against
@@ -2752,104 +2675,26 @@ def analyse_benfords_first_two_digits(all_spending):
     Expected proportion for digits d1d2: log10(1 + 1/(d1d2))
     Chi-squared test with df=89.
     """
-    import math
-
-    # Pre-compute expected proportions for digits 10-99
-    expected = {}
-    for d in range(10, 100):
-        expected[d] = math.log10(1 + 1 / d)
-
+    features = features or build_benford_features(all_spending)
     results = {}
-    for council_id, records in all_spending.items():
-        amounts = [r["amount"] for r in records if r.get("amount", 0) >= 10]
-        if len(amounts) < 500:
-            results[council_id] = {"status": "insufficient_data", "count": len(amounts)}
-            continue
-
-        # Count first two digits
-        digit_counts = defaultdict(int)
-        n = 0
-        for amt in amounts:
-            s = str(abs(amt)).replace('.', '').lstrip('0')
-            if len(s) < 2:
-                continue
-            ft = int(s[:2])
-            if 10 <= ft <= 99:
-                digit_counts[ft] += 1
-                n += 1
 
-        if n < 500:
-            results[council_id] = {"status": "insufficient_data", "count": n}
+    for council_id in all_spending:
+        result = benford.first_two_digits_test(features[council_id])
+        results[council_id] = result
+        if "status" in result:
             continue
 
-        # Chi-squared goodness of fit (df=89)
-        chi_squared = 0
-        digit_analysis = []
-        spikes = []
-
-        for d in range(10, 100):
-            obs = digit_counts.get(d, 0)
-            exp_count = expected[d] * n
-            exp_pct = expected[d] * 100
-            obs_pct = (obs / n) * 100 if n > 0 else 0
-            chi_sq_component = ((obs - exp_count) ** 2) / exp_count if exp_count > 0 else 0
-            chi_squared += chi_sq_component
-            deviation = obs_pct - exp_pct
-
-            digit_analysis.append({
-                "digits": d,
-                "observed": obs,
-                "observed_pct": round(obs_pct, 2),
-                "expected_pct": round(exp_pct, 2),
-                "deviation": round(deviation, 2),
-            })
-
-            # Flag significant spikes (>50% above expected with 20+ observations)
-            if obs > 20 and exp_count > 0 and obs / exp_count > 1.5:
-                spikes.append({
-                    "digits": d,
-                    "observed": obs,
-                    "expected": round(exp_count, 1),
-                    "ratio": round(obs / exp_count, 2),
-                    "amount_range": f"£{d}0-£{d}9" if d < 100 else f"£{d}00+",
-                })
-
-        chi_squared = round(chi_squared, 2)
-        # Critical values for df=89: p=0.05→112.02, p=0.01→122.94, p=0.001→135.81
-        if chi_squared > 135.81:
-            conformity = "non_conforming"
-            p_desc = "p < 0.001 (highly significant)"
-        elif chi_squared > 122.94:
-            conformity = "marginal"
-            p_desc = "p < 0.01 (very significant)"
-        elif chi_squared > 112.02:
-            conformity = "acceptable"
-            p_desc = "p < 0.05 (significant)"
-        else:
-            conformity = "conforming"
-            p_desc = "p > 0.05 (not significant)"
-
-        spikes.sort(key=lambda x: -x["ratio"])
-
-        results[council_id] = {
-            "total_tested": n,
-            "chi_squared": chi_squared,
-            "df": 89,
-            "conformity": conformity,
-            "p_description": p_desc,
-            "digit_analysis": digit_analysis,
-            "spikes": spikes[:10],
-        }
-
+        conformity = result["conformity"]
+        spikes = result["spikes"]
         emoji = "✓" if conformity in ("conforming", "acceptable") else "⚠" if conformity == "marginal" else "✗"
-        print(f"\n  {council_id.upper()} (1st-2 digits): {emoji} χ²={chi_squared} — {p_desc}")
+        print(f"\n  {council_id.upper()} (1st-2 digits): {emoji} χ²={result['chi_squared']} — {result['p_description']}")
         if spikes:
             print(f"    Top spike: {spikes[0]['digits']} ({spikes[0]['ratio']}x expected)")
 
     return results
 
 
-def analyse_benfords_last_two_digits(all_spending):
+def analyse_benfords_last_two_digits(all_spending, features=None):
     """Last-two digits uniformity test (round-number fraud detection).
 
     In naturally occurring data, the last two digits should be uniformly
@@ -2859,90 +2704,25 @@ def analyse_benfords_last_two_digits(all_spending):
 
     Chi-squared test with df=99. Reference: Nigrini (2012) Ch. 7.
     """
+    features = features or build_benford_features(all_spending)
     results = {}
-    for council_id, records in all_spending.items():
-        # Need amounts with meaningful last two digits (>= £100)
-        amounts = [r["amount"] for r in records if r.get("amount", 0) >= 100]
-        if len(amounts) < 500:
-            results[council_id] = {"status": "insufficient_data", "count": len(amounts)}
-            continue
 
-        # Extract last two digits
-        digit_counts = defaultdict(int)
-        n = 0
-        for amt in amounts:
-            # Get integer part and extract last two digits
-            int_part = int(abs(amt))
-            last_two = int_part % 100
-            digit_counts[last_two] += 1
-            n += 1
-
-        if n < 500:
-            results[council_id] = {"status": "insufficient_data", "count": n}
+    for council_id in all_spending:
+        # Need amounts with meaningful last two digits (>= £100)
+        result = benford.last_two_digits_test(features[council_id])
+        results[council_id] = result
+        if "status" in result:
             continue
 
-        # Expected: uniform distribution = 1% each = n/100
-        expected_count = n / 100
-        chi_squared = 0
-        digit_analysis = []
-        round_number_excess = 0
-
-        for d in range(100):
-            obs = digit_counts.get(d, 0)
-            obs_pct = (obs / n) * 100
-            chi_sq_component = ((obs - expected_count) ** 2) / expected_count
-            chi_squared += chi_sq_component
-
-            digit_analysis.append({
-                "last_two": f"{d:02d}",
-                "observed": obs,
-                "observed_pct": round(obs_pct, 2),
-                "expected_pct": 1.0,
-                "excess": round(obs_pct - 1.0, 2),
-            })
-
-            # Track round-number excess (00, 50 endings)
-            if d in (0, 50):
-                round_number_excess += obs - expected_count
-
-        chi_squared = round(chi_squared, 2)
-        # Critical values for df=99: p=0.05→123.23, p=0.01→135.81, p=0.001→149.45
-        if chi_squared > 149.45:
-            conformity = "non_conforming"
-            p_desc = "p < 0.001 (highly significant)"
-        elif chi_squared > 135.81:
-            conformity = "marginal"
-            p_desc = "p < 0.01 (very significant)"
-        elif chi_squared > 123.23:
-            conformity = "acceptable"
-            p_desc = "p < 0.05 (significant)"
-        else:
-            conformity = "conforming"
-            p_desc = "p > 0.05 (not significant)"
-
-        # Top 10 over-represented endings
-        top_endings = sorted(digit_analysis, key=lambda x: -x["excess"])[:10]
-
-        results[council_id] = {
-            "total_tested": n,
-            "chi_squared": chi_squared,
-            "df": 99,
-            "conformity": conformity,
-            "p_description": p_desc,
-            "round_number_excess": round(round_number_excess, 1),
-            "round_number_excess_pct": round((round_number_excess / n) * 100, 2) if n > 0 else 0,
-            "top_endings": top_endings,
-            "digit_analysis": digit_analysis,
-        }
-
+        conformity = result["conformity"]
         emoji = "✓" if conformity in ("conforming", "acceptable") else "⚠" if conformity == "marginal" else "✗"
-        print(f"\n  {council_id.upper()} (last-2 digits): {emoji} χ²={chi_squared} — {p_desc}")
-        print(f"    Round-number excess (00/50): {round(round_number_excess, 0)} extra payments ({results[council_id]['round_number_excess_pct']}%)")
+        print(f"\n  {council_id.upper()} (last-2 digits): {emoji} χ²={result['chi_squared']} — {result['p_description']}")
+        print(f"    Round-number excess (00/50): {round(result['round_number_excess'], 0)} extra payments ({result['round_number_excess_pct']}%)")
 
     return results
 
 
-def analyse_benfords_summation(all_spending):
+def analyse_benfords_summation(all_spending, features=None):
     """Benford's Summation Test (large fraud detection).
 
     Instead of counting how often each first digit appears, this sums the
@@ -2954,73 +2734,19 @@ def analyse_benfords_summation(all_spending):
     misses — a single inflated invoice hides in normal digit frequencies
     but dominates the summation. Reference: Nigrini (2012) Ch. 6.
     """
+    features = features or build_benford_features(all_spending)
     results = {}
-    for council_id, records in all_spending.items():
-        amounts = [r["amount"] for r in records if r.get("amount", 0) > 0]
-        if len(amounts) < 100:
-            results[council_id] = {"status": "insufficient_data", "count": len(amounts)}
-            continue
 
-        # Sum values by first digit
-        digit_sums = defaultdict(float)
-        digit_counts = defaultdict(int)
-        total_sum = 0
-
-        for amt in amounts:
-            s = str(abs(amt)).replace('.', '').lstrip('0')
-            if not s:
-                continue
-            first_digit = int(s[0])
-            if 1 <= first_digit <= 9:
-                digit_sums[first_digit] += amt
-                digit_counts[first_digit] += 1
-                total_sum += amt
-
-        if total_sum == 0:
+    for council_id in all_spending:
+        result = benford.summation_test(features[council_id])
+        if result is None:
+            continue
+        results[council_id] = result
+        if "status" in result:
             continue
 
-        # Expected: ~11.1% per digit group (1/9 = 11.11%)
-        expected_pct = 100 / 9  # 11.11%
-        digit_analysis = []
-        distortions = []
-
-        for d in range(1, 10):
-            actual_pct = (digit_sums[d] / total_sum) * 100 if total_sum > 0 else 0
-            deviation = actual_pct - expected_pct
-
-            digit_analysis.append({
-                "digit": d,
-                "sum": round(digit_sums[d], 2),
-                "count": digit_counts[d],
-                "pct_of_total": round(actual_pct, 2),
-                "expected_pct": round(expected_pct, 2),
-                "deviation": round(deviation, 2),
-                "avg_amount": round(digit_sums[d] / digit_counts[d], 2) if digit_counts[d] > 0 else 0,
-            })
-
-            # Flag significant distortions (>5pp above expected)
-            if deviation > 5:
-                distortions.append({
-                    "digit": d,
-                    "pct_of_total": round(actual_pct, 2),
-                    "excess_pct": round(deviation, 2),
-                    "excess_value": round(digit_sums[d] - (expected_pct / 100 * total_sum), 2),
-                    "count": digit_counts[d],
-                    "avg_amount": round(digit_sums[d] / digit_counts[d], 2) if digit_counts[d] > 0 else 0,
-                })
-
-        distortions.sort(key=lambda x: -x["excess_pct"])
-
-        results[council_id] = {
-            "total_sum": round(total_sum, 2),
-            "total_amounts": len(amounts),
-            "digit_analysis": digit_analysis,
-            "distortions": distortions,
-            "max_digit_pct": max(d["pct_of_total"] for d in digit_analysis) if digit_analysis else 0,
-        }
-
-        print(f"\n  {council_id.upper()} (summation): Total {fmt_gbp(total_sum)}")
-        for da in digit_analysis:
+        print(f"\n  {council_id.upper()} (summation): Total {fmt_gbp(result['total_sum'])}")
+        for da in result["digit_analysis"]:
             bar = "█" * int(da["pct_of_total"] / 2)
             flag = " ⚠" if abs(da["deviation"]) > 5 else ""
             print(f"    Digit {da['digit']}: {da['pct_of_total']:5.1f}% (exp {da['expected_pct']:.1f}%) {bar}{flag}")
@@ -3028,7 +2754,7 @@ def analyse_benfords_summation(all_spending):
     return results
 
 
-def analyse_benfords_per_supplier_mad(all_spending):
+def analyse_benfords_per_supplier_mad(all_spending, features=None):
     """Per-supplier Benford's MAD (Mean Absolute Deviation) scoring.
 
     For each supplier with 50+ transactions, compute MAD from Benford's
@@ -3041,86 +2767,18 @@ def analyse_benfords_per_supplier_mad(all_spending):
       0.012-0.015 = Marginally acceptable
       >0.015 = Nonconforming
     """
-    import math
-
-    BENFORD_EXPECTED = {
-        1: 0.301, 2: 0.176, 3: 0.125, 4: 0.097, 5: 0.079,
-        6: 0.067, 7: 0.058, 8: 0.051, 9: 0.046,
-    }
-
+    features = features or build_benford_features(all_spending)
     results = {}
-    for council_id, records in all_spending.items():
-        # Group amounts by supplier
-        supplier_amounts = defaultdict(list)
-        for r in records:
-            if r.get("amount", 0) > 100:
-                s = r.get("supplier_canonical", r.get("supplier", "")) or ""
-                if s and s.upper() not in {"UNKNOWN", "NAME WITHHELD", "REDACTED", "VARIOUS", "SUNDRY"}:
-                    supplier_amounts[s].append(r["amount"])
-
-        supplier_scores = []
-        for supplier, amounts in supplier_amounts.items():
-            if len(amounts) < 50:
-                continue
 
-            # Count first digits
-            digit_counts = defaultdict(int)
-            n = 0
-            for amt in amounts:
-                s = str(abs(amt)).replace('.', '').lstrip('0')
-                if s and s[0].isdigit():
-                    fd = int(s[0])
-                    if 1 <= fd <= 9:
-                        digit_counts[fd] += 1
-                        n += 1
-
-            if n < 50:
-                continue
+    for council_id in all_spending:
+        result = benford.per_supplier_mad(features[council_id])
+        results[council_id] = result
+        outliers = result["top_20_outliers"]
 
-            # MAD = (1/K) * sum(|observed_pct - expected_pct|) where K=9
-            mad = 0
-            for d in range(1, 10):
-                obs_pct = digit_counts[d] / n
-                mad += abs(obs_pct - BENFORD_EXPECTED[d])
-            mad = mad / 9
-
-            # Classification
-            if mad < 0.006:
-                conformity = "close"
-            elif mad < 0.012:
-                conformity = "acceptable"
-            elif mad < 0.015:
-                conformity = "marginally_acceptable"
-            else:
-                conformity = "nonconforming"
-
-            supplier_scores.append({
-                "supplier": supplier,
-                "mad": round(mad, 4),
-                "conformity": conformity,
-                "transaction_count": n,
-                "total_spend": round(sum(amounts), 2),
-            })
-
-        # Sort by MAD descending (worst first)
-        supplier_scores.sort(key=lambda x: -x["mad"])
-
-        # Summary stats
-        nonconforming = [s for s in supplier_scores if s["conformity"] == "nonconforming"]
-        marginal = [s for s in supplier_scores if s["conformity"] == "marginally_acceptable"]
-
-        results[council_id] = {
-            "suppliers_tested": len(supplier_scores),
-            "nonconforming": len(nonconforming),
-            "nonconforming_spend": round(sum(s["total_spend"] for s in nonconforming), 2),
-            "marginally_acceptable": len(marginal),
-            "top_20_outliers": supplier_scores[:20],
-        }
-
-        print(f"\n  {council_id.upper()} (per-supplier MAD): {len(supplier_scores)} suppliers tested")
-        print(f"    Nonconforming (MAD>0.015): {len(nonconforming)} suppliers ({fmt_gbp(results[council_id]['nonconforming_spend'])})")
-        if supplier_scores:
-            top = supplier_scores[0]
+        print(f"\n  {council_id.upper()} (per-supplier MAD): {result['suppliers_tested']} suppliers tested")
+        print(f"    Nonconforming (MAD>0.015): {result['nonconforming']} suppliers ({fmt_gbp(result['nonconforming_spend'])})")
+        if outliers:
+            top = outliers[0]
             print(f"    Worst: {top['supplier'][:40]} MAD={top['mad']} ({top['transaction_count']} txns, {fmt_gbp(top['total_spend'])})")
 
     return results
@@ -4512,232 +4170,303 @@ def run_verification(council_id, records, duplicates, cross_council, patterns, c
 
 
 # ═══════════════════════════════════════════════════════════════════════
-# MAIN
+# ANALYSIS DAG (cached nodes; per-council map phase serial or --workers N)
 # ═══════════════════════════════════════════════════════════════════════
 
-def main():
-    parser = argparse.ArgumentParser(description="Cross-Council DOGE Analysis")
-    parser.add_argument("--council", help="Analyse single council (default: all)")
-    parser.add_argument("--analysis", help="Run specific analysis: duplicates, pricing, patterns, compliance")
-    parser.add_argument("--output", action="store_true", help="Write doge_findings.json files")
-    args = parser.parse_args()
+def _analyse_procurement_intelligence(all_spending):
+    return analyse_procurement_intelligence(all_spending, list(all_spending))
 
-    councils = [args.council] if args.council else COUNCILS
 
-    print("=" * 60)
-    print("AI DOGE — Cross-Council Investigation Engine")
-    print("=" * 60)
+def _analyse_budget_variance(all_spending, all_budgets):
+    return analyse_budget_variance(all_spending, all_budgets) if all_budgets else {}
 
-    # Load all data
-    print("\nLoading spending data...")
-    all_spending = {}
+
+def _analyse_departmental_efficiency(all_spending, all_budgets):
+    return analyse_departmental_efficiency(all_spending, all_budgets) if all_budgets else {}
+
+
+def _analyse_contract_budget_crossref(councils, all_budgets):
+    return analyse_contract_budget_crossref(councils, all_budgets) if all_budgets else {}
+
+
+def analyse_fraud_triangles(councils, all_spending, duplicates, cross_council, patterns, compliance, benfords, concentration, procurement_compliance, budget_variance):
+    """Fraud triangle risk score for every council (see analyse_fraud_triangle)."""
+    fraud_triangles = {}
     for c in councils:
-        records = load_spending(c)
-        all_spending[c] = records
-        print(f"  {c}: {len(records)} records")
+        ft = analyse_fraud_triangle(c, all_spending, duplicates, cross_council, patterns, compliance, benfords, concentration, procurement_compliance, budget_variance)
+        if ft:
+            fraud_triangles[c] = ft
+    return fraud_triangles
+
+
+def run_verifications(councils, all_spending, duplicates, cross_council, patterns, compliance, benfords):
+    """Self-verification for every council (see run_verification)."""
+    return {c: run_verification(c, all_spending[c], duplicates, cross_council, patterns, compliance, benfords)
+            for c in councils}
+
+
+# Every analysis main() runs, in dependency order. Per-council nodes only ever
+# look at one council's records ("features" = shared Benford digit features);
+# they are cached per council and can run in worker processes. The rest —
+# pricing, compliance and everything consuming their results — are
+# cross-council nodes run afterwards over the full inputs.
+# Node(name, fn, inputs, extra file inputs, per_council, --analysis option, header)
+ANALYSIS_NODES = [
+    Node("duplicates", analyse_duplicates, ("spending",), (), True, "duplicates", "ANALYSIS 1: Duplicate Payment Deep Dive"),
+    Node("patterns", analyse_payment_patterns, ("spending",), (), True, "patterns", "ANALYSIS 3: Payment Pattern Analysis"),
+    Node("benfords", analyse_benfords_law, ("spending", "features"), (), True, "benfords", "ANALYSIS 5: Benford's Law Forensic Screening (1st digit)"),
+    Node("benfords_2nd", analyse_benfords_second_digit, ("spending", "features"), (), True, "benfords", "ANALYSIS 5b: Benford's Law Second-Digit Analysis"),
+    Node("concentration", analyse_supplier_concentration, ("spending", "columns"), (), True, None, "ANALYSIS 6b: Supplier Contract Concentration"),
+    Node("benfords_first_two", analyse_benfords_first_two_digits, ("spending", "features"), (), True, None, "ANALYSIS 12a: Benford's First-Two Digits Test"),
+    Node("benfords_last_two", analyse_benfords_last_two_digits, ("spending", "features"), (), True, None, "ANALYSIS 12b: Benford's Last-Two Digits Test"),
+    Node("benfords_summation", analyse_benfords_summation, ("spending", "features"), (), True, None, "ANALYSIS 12c: Benford's Summation Test"),
+    Node("benfords_supplier_mad", analyse_benfords_per_supplier_mad, ("spending", "features"), (), True, None, "ANALYSIS 12d: Per-Supplier Benford's MAD"),
+    Node("same_same_different", analyse_same_same_different, ("spending",), (), True, None, "ANALYSIS 13a: Same-Same-Different Testing"),
+    Node("vendor_integrity", analyse_vendor_integrity, ("spending",), (), True, None, "ANALYSIS 13b: Vendor Integrity (Fictitious Vendor Detection)"),
+    Node("credit_patterns", analyse_credit_patterns, ("spending",), (), True, None, "ANALYSIS 13c: Credit/Refund Pattern Analysis"),
+    Node("description_quality", analyse_description_quality, ("spending",), (), True, None, "ANALYSIS 13d: Description Quality & Transparency"),
+    Node("supplier_lifecycle", analyse_supplier_lifecycle, ("spending",), (), True, None, "ANALYSIS 14b: Supplier Lifecycle Analysis"),
+    Node("temporal", analyse_temporal_intelligence, ("spending",), (), True, None, "ANALYSIS 15: Temporal & Statistical Intelligence"),
+    Node("procurement_intel", _analyse_procurement_intelligence, ("spending",), ("procurement",), True, None, "ANALYSIS 16: Procurement & Contract Intelligence"),
+    Node("cross_council", analyse_cross_council_pricing, ("spending", "taxonomy"), (), False, "pricing", "ANALYSIS 2: Cross-Council Supplier Price Comparison"),
+    Node("compliance", analyse_ch_compliance, ("spending", "taxonomy"), (), False, "compliance", "ANALYSIS 4: Companies House Compliance"),
+    Node("procurement_compliance", analyse_procurement_compliance, ("councils",), ("procurement",), False, None, "ANALYSIS 7: Procurement Compliance"),
+    Node("budget_variance", _analyse_budget_variance, ("spending", "budgets"), (), False, None, "ANALYSIS 9: Budget Variance Analysis"),
+    Node("budget_efficiency", _analyse_departmental_efficiency, ("spending", "budgets"), (), False, None, "ANALYSIS 10: Departmental Efficiency by Budget Category"),
+    Node("contract_crossref", _analyse_contract_budget_crossref, ("councils", "budgets"), ("procurement",), False, None, "ANALYSIS 11: Contract-Budget Cross-Reference"),
+    Node("fraud_triangles", analyse_fraud_triangles, ("councils", "spending", "duplicates", "cross_council", "patterns", "compliance", "benfords", "concentration", "procurement_compliance", "budget_variance"), (), False, None, "ANALYSIS 8: Fraud Triangle Risk Scoring"),
+    Node("supplier_risk", analyse_supplier_risk, ("spending", "compliance", "concentration", "benfords_supplier_mad", "vendor_integrity", "description_quality", "credit_patterns"), (), False, None, "ANALYSIS 14a: Composite Supplier Risk Score"),
+    Node("audit_standards", analyse_audit_standards, ("spending", "budgets", "fraud_triangles", "duplicates", "compliance", "vendor_integrity", "concentration", "benfords"), (), False, None, "ANALYSIS 17: Audit Standards & Materiality"),
+    Node("verification", run_verifications, ("councils", "spending", "duplicates", "cross_council", "patterns", "compliance", "benfords"), (), False, None, "ANALYSIS 6: Self-Verification Engine"),
+]
+NODES_BY_NAME = {node.name: node for node in ANALYSIS_NODES}
 
-    taxonomy = load_taxonomy()
-    print(f"  taxonomy: {len(taxonomy.get('suppliers', {}))} suppliers")
+# Per-council nodes that read only the columnar store (amount/supplier) when a
+# council has one, so their records never have to be json.load-ed
+COLUMNAR_NODES = {
+    "benfords", "benfords_2nd", "benfords_first_two", "benfords_last_two",
+    "benfords_summation", "benfords_supplier_mad", "concentration",
+}
 
-    # Run analyses
-    analyses = args.analysis.split(",") if args.analysis else ["duplicates", "pricing", "patterns", "compliance", "benfords"]
+ANALYSIS_CACHE_DIRNAME = ".analysis_cache"  # under DATA_DIR
 
-    duplicates = {}
-    cross_council = {}
-    patterns = {}
-    compliance = {}
-    benfords = {}
 
-    if "duplicates" in analyses:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 1: Duplicate Payment Deep Dive")
-        print("=" * 60)
-        duplicates = analyse_duplicates(all_spending)
+def analysis_source_keys(councils):
+    """Digests of every data file the nodes read, keyed as analysis_dag expects."""
+    spending = {c: file_digest(DATA_DIR / c / "spending.json") for c in councils}
+    return {
+        "spending": spending,
+        "features": spending,
+        "columns": spending,
+        "taxonomy": file_digest(DATA_DIR / "taxonomy.json"),
+        "budgets": {c: file_digest(DATA_DIR / c / "budget_mapping.json") + file_digest(DATA_DIR / c / "budgets_govuk.json")
+                    for c in councils},
+        "procurement": {c: file_digest(DATA_DIR / c / "procurement.json") for c in councils},
+        "councils": ",".join(councils),
+    }
 
-    if "pricing" in analyses:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 2: Cross-Council Supplier Price Comparison")
-        print("=" * 60)
-        cross_council = analyse_cross_council_pricing(all_spending, taxonomy)
 
-    if "patterns" in analyses:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 3: Payment Pattern Analysis")
-        print("=" * 60)
-        patterns = analyse_payment_patterns(all_spending)
+def needs_records(node_names, columns):
+    """True unless every named node can run from the council's columnar store."""
+    return columns is None or any(name not in COLUMNAR_NODES for name in node_names)
 
-    if "compliance" in analyses:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 4: Companies House Compliance")
-        print("=" * 60)
-        compliance = analyse_ch_compliance(all_spending, taxonomy)
 
-    benfords_2nd = {}
-    if "benfords" in analyses:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 5: Benford's Law Forensic Screening (1st digit)")
-        print("=" * 60)
-        benfords = analyse_benfords_law(all_spending)
-        print("\n" + "=" * 60)
-        print("ANALYSIS 5b: Benford's Law Second-Digit Analysis")
-        print("=" * 60)
-        benfords_2nd = analyse_benfords_second_digit(all_spending)
+def run_council_nodes(council_id, records, columns, node_names, features_memo=None, banner=True):
+    """Run the named per-council nodes for one council. Returns {name: {council_id: result}}.
 
-    # ── Supplier Concentration Analysis ──
-    concentration = {}
-    if True:  # Always run
-        print("\n" + "=" * 60)
-        print("ANALYSIS 6b: Supplier Contract Concentration")
-        print("=" * 60)
-        concentration = analyse_supplier_concentration(all_spending)
+    records may be None when needs_records() is False for node_names.
+    features_memo ({council_id: features}) lets a serial caller share the
+    Benford digit features across separate calls for the same council.
+    """
+    all_spending = {council_id: records}
+    all_columns = {council_id: columns} if columns is not None else {}
+    features_memo = {} if features_memo is None else features_memo
+    results = {}
+    for name in node_names:
+        node = NODES_BY_NAME[name]
+        if "features" in node.inputs and council_id not in features_memo:
+            # One vectorised digit-extraction pass, shared by all Benford tests
+            features_memo.update(build_benford_features(all_spending, all_columns))
+        if banner:
+            print("\n" + "=" * 60)
+            print(node.header)
+            print("=" * 60)
+        inputs = {"spending": all_spending, "features": features_memo, "columns": all_columns}
+        args = [inputs[i] for i in node.inputs]
+        results[name] = node.fn(*args)
+    return results
 
-    # ── Procurement Compliance Analysis ──
-    procurement_compliance = {}
-    if True:  # Always run
-        print("\n" + "=" * 60)
-        print("ANALYSIS 7: Procurement Compliance")
-        print("=" * 60)
-        procurement_compliance = analyse_procurement_compliance(councils)
 
-    # ── Budget Data Loading ──
-    print("\nLoading budget data...")
-    all_budgets = {}
-    for c in councils:
-        bd = load_budget_data(c)
-        if bd["mapping"] or bd["govuk"]:
-            all_budgets[c] = bd
-            has_m = "mapping" if bd["mapping"] else "-"
-            has_g = "govuk" if bd["govuk"] else "-"
-            print(f"  {c}: {has_m}, {has_g}")
-
-    # ── Budget Variance Analysis ──
-    budget_variance = {}
-    if all_budgets:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 9: Budget Variance Analysis")
-        print("=" * 60)
-        budget_variance = analyse_budget_variance(all_spending, all_budgets)
+def _council_worker(council_id, node_names):
+    """Process-pool entry point: load one council's data here (nothing big is
+    pickled) and run its missing per-council nodes. Returns (council_id, results, log)."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        columns = load_spending_columns(council_id)
+        records = load_spending(council_id) if needs_records(node_names, columns) else None
+        results = run_council_nodes(council_id, records, columns, node_names)
+    return council_id, results, log.getvalue()
 
-    # ── Departmental Efficiency Analysis ──
-    budget_efficiency = {}
-    if all_budgets:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 10: Departmental Efficiency by Budget Category")
-        print("=" * 60)
-        budget_efficiency = analyse_departmental_efficiency(all_spending, all_budgets)
 
-    # ── Contract-Budget Cross-Reference ──
-    contract_crossref = {}
-    if all_budgets:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 11: Contract-Budget Cross-Reference")
-        print("=" * 60)
-        contract_crossref = analyse_contract_budget_crossref(councils, all_budgets)
+def start_council_workers(jobs, workers):
+    """Submit one _council_worker job per {council_id: [node names]} entry. Returns (pool, futures)."""
+    pool = ProcessPoolExecutor(max_workers=workers)
+    futures = [pool.submit(_council_worker, c, names) for c, names in jobs.items()]
+    return pool, futures
 
-    # ── Fraud Triangle Risk Scoring ──
-    fraud_triangles = {}
-    if True:  # Always run
-        print("\n" + "=" * 60)
-        print("ANALYSIS 8: Fraud Triangle Risk Scoring")
-        print("=" * 60)
-        for c in councils:
-            ft = analyse_fraud_triangle(c, all_spending, duplicates, cross_council, patterns, compliance, benfords, concentration, procurement_compliance, budget_variance)
-            if ft:
-                fraud_triangles[c] = ft
-
-    # ═══════════════════════════════════════════════════════════════
-    # ADVANCED FORENSIC ANALYSES (Phases 12-17)
-    # ═══════════════════════════════════════════════════════════════
-
-    # ── Advanced Benford's Suite ──
-    benfords_first_two = {}
-    benfords_last_two = {}
-    benfords_summation = {}
-    benfords_supplier_mad = {}
-    if True:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 12a: Benford's First-Two Digits Test")
-        print("=" * 60)
-        benfords_first_two = analyse_benfords_first_two_digits(all_spending)
 
-        print("\n" + "=" * 60)
-        print("ANALYSIS 12b: Benford's Last-Two Digits Test")
-        print("=" * 60)
-        benfords_last_two = analyse_benfords_last_two_digits(all_spending)
+def collect_council_workers(pool, futures):
+    """Wait for the workers, replay their logs in council order and merge
+    results into {name: {council_id: result}}."""
+    merged = defaultdict(dict)
+    try:
+        outputs = [f.result() for f in futures]
+    finally:
+        pool.shutdown()
+    for council_id, results, log in outputs:
+        print(f"\n{'─' * 60}\n[{council_id}]")
+        print(log, end="")
+        for name, per_council in results.items():
+            if council_id in per_council:
+                merged[name][council_id] = per_council[council_id]
+    return merged
 
-        print("\n" + "=" * 60)
-        print("ANALYSIS 12c: Benford's Summation Test")
-        print("=" * 60)
-        benfords_summation = analyse_benfords_summation(all_spending)
 
-        print("\n" + "=" * 60)
-        print("ANALYSIS 12d: Per-Supplier Benford's MAD")
-        print("=" * 60)
-        benfords_supplier_mad = analyse_benfords_per_supplier_mad(all_spending)
-
-    # ── Forensic Accounting Classics ──
-    same_same_different = {}
-    vendor_integrity = {}
-    credit_patterns = {}
-    description_quality = {}
-    if True:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 13a: Same-Same-Different Testing")
-        print("=" * 60)
-        same_same_different = analyse_same_same_different(all_spending)
+# ═══════════════════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════════════════
 
-        print("\n" + "=" * 60)
-        print("ANALYSIS 13b: Vendor Integrity (Fictitious Vendor Detection)")
-        print("=" * 60)
-        vendor_integrity = analyse_vendor_integrity(all_spending)
+def main():
+    parser = argparse.ArgumentParser(description="Cross-Council DOGE Analysis")
+    parser.add_argument("--council", help="Analyse single council (default: all)")
+    parser.add_argument("--analysis", help="Run specific analysis: duplicates, pricing, patterns, compliance")
+    parser.add_argument("--output", action="store_true", help="Write doge_findings.json files")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Run per-council analyses in N processes (0 = one per CPU, default: 1 = serial)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Recompute every analysis instead of reusing data/.analysis_cache results")
+    args = parser.parse_args()
 
-        print("\n" + "=" * 60)
-        print("ANALYSIS 13c: Credit/Refund Pattern Analysis")
-        print("=" * 60)
-        credit_patterns = analyse_credit_patterns(all_spending)
+    councils = [args.council] if args.council else COUNCILS
+    workers = args.workers or os.cpu_count() or 1
 
-        print("\n" + "=" * 60)
-        print("ANALYSIS 13d: Description Quality & Transparency")
-        print("=" * 60)
-        description_quality = analyse_description_quality(all_spending)
+    print("=" * 60)
+    print("AI DOGE — Cross-Council Investigation Engine")
+    print("=" * 60)
 
-    # ── Supplier Risk Intelligence ──
-    supplier_risk = {}
-    supplier_lifecycle = {}
-    if True:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 14a: Composite Supplier Risk Score")
-        print("=" * 60)
-        supplier_risk = analyse_supplier_risk(all_spending, compliance, concentration, benfords_supplier_mad, vendor_integrity, description_quality, credit_patterns)
+    # Run analyses
+    analyses = args.analysis.split(",") if args.analysis else ["duplicates", "pricing", "patterns", "compliance", "benfords"]
+    cache_dir = None if args.no_cache else DATA_DIR / ANALYSIS_CACHE_DIRNAME
 
-        print("\n" + "=" * 60)
-        print("ANALYSIS 14b: Supplier Lifecycle Analysis")
-        print("=" * 60)
-        supplier_lifecycle = analyse_supplier_lifecycle(all_spending)
+    all_spending = {}
+    all_columns = {}
+    all_budgets = {}
+    taxonomy = {}
+    loaded = []
+
+    def council_records(c):
+        """One council's records, json.load-ed the first time anything needs them."""
+        if c not in all_spending:
+            all_spending[c] = load_spending(c)
+        return all_spending[c]
+
+    def council_columns(c):
+        if c not in all_columns:
+            all_columns[c] = load_spending_columns(c)
+        return all_columns[c]
+
+    def load_all():
+        """Load spending, taxonomy and budgets once, the first time a cross-council node needs them."""
+        if loaded or not councils:
+            return
+        loaded.append(True)
+        print("\nLoading spending data...")
+        ordered = {}
+        for c in councils:
+            ordered[c] = council_records(c)
+            print(f"  {c}: {len(ordered[c])} records")
+        # Keep council order for the cross-council nodes, whatever loaded first
+        all_spending.clear()
+        all_spending.update(ordered)
 
-    # ── Temporal Intelligence ──
-    temporal = {}
-    if True:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 15: Temporal & Statistical Intelligence")
-        print("=" * 60)
-        temporal = analyse_temporal_intelligence(all_spending)
+        taxonomy.update(load_taxonomy())
+        print(f"  taxonomy: {len(taxonomy.get('suppliers', {}))} suppliers")
 
-    # ── Procurement Intelligence ──
-    procurement_intel = {}
-    if True:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 16: Procurement & Contract Intelligence")
-        print("=" * 60)
-        procurement_intel = analyse_procurement_intelligence(all_spending, councils)
+        print("\nLoading budget data...")
+        for c in councils:
+            bd = load_budget_data(c)
+            if bd["mapping"] or bd["govuk"]:
+                all_budgets[c] = bd
+                has_m = "mapping" if bd["mapping"] else "-"
+                has_g = "govuk" if bd["govuk"] else "-"
+                print(f"  {c}: {has_m}, {has_g}")
+
+    def value_of(name):
+        load_all()
+        return {"spending": all_spending, "taxonomy": taxonomy, "budgets": all_budgets, "councils": councils}[name]
+
+    def compute_per_council(missing):
+        """Run per-council cache misses: in worker processes (each loads its own
+        council) or serially, one banner per analysis as before. Records are
+        only loaded for councils with a missing node that can't run from the
+        columnar store."""
+        jobs = defaultdict(list)
+        for name, council_ids in missing.items():
+            for c in council_ids:
+                jobs[c].append(name)
+        jobs = {c: jobs[c] for c in councils if c in jobs}
+        if workers > 1 and len(jobs) > 1:
+            print(f"\nStarting {min(workers, len(jobs))} workers for {len(jobs)} councils...")
+            pool, futures = start_council_workers(jobs, workers)
+            return collect_council_workers(pool, futures)
+
+        computed, features_memo = defaultdict(dict), {}
+        for name in missing:
+            node = NODES_BY_NAME[name]
+            print("\n" + "=" * 60)
+            print(node.header)
+            print("=" * 60)
+            for c in missing[name]:
+                columns = council_columns(c)
+                # Columnar nodes leave records unloaded unless another missing node needs them
+                records = council_records(c) if needs_records(jobs[c], columns) else None
+                result = run_council_nodes(c, records, columns, [name], features_memo, banner=False)
+                computed[name].update(result[name])
+        return computed
+
+    print("\nHashing inputs...")
+    results = run_nodes(
+        ANALYSIS_NODES, councils, value_of, analysis_source_keys(councils),
+        enabled=lambda node: node.option is None or node.option in analyses,
+        cache_dir=cache_dir, compute_per_council=compute_per_council,
+    )
 
-    # ── Audit Standards ──
-    audit_standards = {}
-    if True:
-        print("\n" + "=" * 60)
-        print("ANALYSIS 17: Audit Standards & Materiality")
-        print("=" * 60)
-        audit_standards = analyse_audit_standards(all_spending, all_budgets, fraud_triangles, duplicates, compliance, vendor_integrity, concentration, benfords)
+    duplicates = results["duplicates"]
+    cross_council = results["cross_council"]
+    patterns = results["patterns"]
+    compliance = results["compliance"]
+    benfords = results["benfords"]
+    benfords_2nd = results["benfords_2nd"]
+    concentration = results["concentration"]
+    procurement_compliance = results["procurement_compliance"]
+    budget_variance = results["budget_variance"]
+    budget_efficiency = results["budget_efficiency"]
+    contract_crossref = results["contract_crossref"]
+    fraud_triangles = results["fraud_triangles"]
+    benfords_first_two = results["benfords_first_two"]
+    benfords_last_two = results["benfords_last_two"]
+    benfords_summation = results["benfords_summation"]
+    benfords_supplier_mad = results["benfords_supplier_mad"]
+    same_same_different = results["same_same_different"]
+    vendor_integrity = results["vendor_integrity"]
+    credit_patterns = results["credit_patterns"]
+    description_quality = results["description_quality"]
+    supplier_risk = results["supplier_risk"]
+    supplier_lifecycle = results["supplier_lifecycle"]
+    temporal = results["temporal"]
+    procurement_intel = results["procurement_intel"]
+    audit_standards = results["audit_standards"]
+    verifications = results["verification"]
 
     # Generate output files
     if args.output or True:  # Always output for now
@@ -4781,12 +4510,10 @@ def main():
                 json.dump(findings, f, indent=2, default=str)
             print(f"  {c}: {len(findings['findings'])} findings, {len(findings['key_findings'])} key findings → {output_path}")
 
-        # Run self-verification on each council
-        print("\n" + "=" * 60)
-        print("ANALYSIS 6: Self-Verification Engine")
-        print("=" * 60)
+        # Write self-verification for each council (computed by the "verification" node)
+        print("\nSelf-verification:")
         for c in councils:
-            verification = run_verification(c, all_spending[c], duplicates, cross_council, patterns, compliance, benfords)
+            verification = verifications[c]
             verify_path = DATA_DIR / c / "doge_verification.json"
             with open(verify_path, "w") as f:
                 json.dump(verification, f, indent=2)
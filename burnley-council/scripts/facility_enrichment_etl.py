@@ -35,6 +35,9 @@ try:
 except ImportError:
     HAS_DEPS = False
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from name_index import NameIndex, jaccard as jaccard_similarity
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s',
@@ -311,21 +314,22 @@ def tokenize(text):
     return tokens
 
 
-def jaccard_similarity(set_a, set_b):
-    """Compute Jaccard similarity between two token sets."""
-    if not set_a or not set_b:
-        return 0.0
-    intersection = set_a & set_b
-    union = set_a | set_b
-    return len(intersection) / len(union) if union else 0.0
-
-
 def match_facilities_to_assets(facilities, assets):
     """Match scraped library facilities to property_assets records."""
     # Filter to library-category assets
     library_assets = [a for a in assets if (a.get('category') or '').lower() == 'library']
     log.info(f"Matching {len(facilities)} scraped libraries to {len(library_assets)} library assets")
 
+    # Blocking: only assets sharing the postcode, a name token or the slug
+    # text can score above 0, so only those are scored per facility
+    name_index = NameIndex(tokenize=tokenize, ngram=3)
+    by_postcode = {}
+    for i, asset in enumerate(library_assets):
+        name_index.add(i, asset.get('name', ''))
+        asset_pc = (asset.get('postcode') or '').upper().replace(' ', '')
+        if asset_pc:
+            by_postcode.setdefault(asset_pc, []).append(i)
+
     matches = {}
     unmatched_facilities = []
     matched_asset_ids = set()
@@ -351,7 +355,11 @@ def match_facilities_to_assets(facilities, assets):
                     break
 
         if not best_match:
-            for asset in library_assets:
+            candidates = set(by_postcode.get(fac_pc, ()))
+            candidates.update(i for i, _ in name_index.jaccard_matches(fac_tokens, 0.3))
+            candidates.update(name_index.containing(slug.replace('-', ' ')))
+            for i in sorted(candidates):
+                asset = library_assets[i]
                 if asset['id'] in matched_asset_ids:
                     continue  # Already matched
 
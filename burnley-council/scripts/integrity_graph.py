@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+integrity_graph.py — Councillor network graph for councillor_integrity_etl.py
+
+The network detectors (cliques, centrality, 2-hop triangulation, reciprocal
+cross-council supply) used to take one councillor's result plus the list of
+all results and rebuild every other councillor's company / associate /
+supplier sets on each call — O(n²) set building per council pass. Instead
+the results are loaded once into a bipartite graph:
+
+    councillor ── company ── supplier            (directorships, conflicts)
+        │  └──── associate ── company            (co-directors)
+        ├──── donor                              (shell / contract donors)
+        └──── MP                                 (mp_findings)
+
+Nodes are integer ids; after build_network_graph() the adjacency is frozen
+into CSR arrays (indptr / indices / weights) and the algorithms run on those:
+
+  - pagerank(): weighted PageRank (power iteration, dangling mass spread
+    uniformly). floor is the rank of an isolated node, so callers can scale
+    councillors to 0..1 with 0 meaning "no connections at all".
+  - betweenness(): Brandes over shortest paths between pairs of councillors.
+    Entity nodes with a single link are pruned first — they cannot lie on a
+    path between two other nodes — so the search runs on a small core.
+  - shared_entities() / clique_with(): councillors sharing an associate,
+    supplier or company (the councillor projection) and the best maximal
+    clique (Bron–Kerbosch with pivoting) containing a councillor.
+  - components() / component_digest(): connected components and a hash of
+    each, so a later run can reuse the findings of components that did not
+    change (betweenness(sources=...) then only searches the changed ones).
+
+With numpy the PageRank iteration is vectorised; without it the same loop
+runs over the CSR arrays in pure Python.
+
+Usage:
+    from integrity_graph import build_network_graph
+    graph = build_network_graph({council_id: results})           # one council
+    graph = build_network_graph({cid: integrity["councillors"] for ...})  # all bodies
+    c = graph.node_of(result)
+    pr, floor = graph.pagerank()
+"""
+
+import hashlib
+import json
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+COUNCILLOR = "councillor"
+COMPANY = "company"
+ASSOCIATE = "associate"
+SUPPLIER = "supplier"
+DONOR = "donor"
+MP = "mp"
+
+# Edge weights (importance for PageRank / weighted degree, not distances)
+WEIGHTS = {
+    "directorship": 2.0,       # councillor ── active company
+    "resigned": 1.0,           # councillor ── resigned company
+    "co_director": 2.0,        # councillor ── associate
+    "associate_company": 1.0,  # associate ── company
+    "supplier": 5.0,           # company / councillor ── own-council supplier
+    "cross_supplier": 3.0,     # company / councillor ── other council's supplier
+    "donor": 3.0,              # councillor ── donor
+    "donor_company": 1.0,      # donor ── company
+    "mp": 4.0,                 # councillor ── MP (mp_findings)
+}
+
+CLIQUE_KINDS = {ASSOCIATE: 2, SUPPLIER: 3, COMPANY: 5}  # shared entity → overlap weight
+
+
+class NetworkGraph:
+    """Undirected weighted graph of councillors and the entities around them."""
+
+    def __init__(self):
+        self.ids = {}        # (kind, key) → node id
+        self.kinds = []
+        self.keys = []
+        self.labels = []
+        self.councils = []   # council id (councillors, suppliers) or ""
+        self.councillors = []  # councillor node ids in insertion order
+        self.by_result = {}  # id(result dict) → node id
+        self._edges = {}     # (a, b), a < b → weight
+        self.indptr = self.indices = self.weights = None
+        self._cache = {}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def node(self, kind, key, label="", council=""):
+        nid = self.ids.get((kind, key))
+        if nid is None:
+            nid = len(self.kinds)
+            self.ids[(kind, key)] = nid
+            self.kinds.append(kind)
+            self.keys.append(key)
+            self.labels.append(label or str(key))
+            self.councils.append(council)
+            if kind == COUNCILLOR:
+                self.councillors.append(nid)
+        return nid
+
+    def link(self, a, b, weight):
+        """Undirected edge; a repeated edge keeps its strongest weight."""
+        if a == b:
+            return
+        edge = (a, b) if a < b else (b, a)
+        if weight > self._edges.get(edge, 0.0):
+            self._edges[edge] = weight
+
+    def freeze(self):
+        """Pack the edges into CSR arrays (neighbours of each node sorted by id)."""
+        n = len(self.kinds)
+        degree = [0] * (n + 1)
+        for a, b in self._edges:
+            degree[a + 1] += 1
+            degree[b + 1] += 1
+        for i in range(n):
+            degree[i + 1] += degree[i]
+        self.indptr = array("l", degree)
+        self.indices = array("l", bytes(self.indptr[n] * array("l").itemsize))
+        self.weights = array("d", bytes(self.indptr[n] * array("d").itemsize))
+        fill = list(degree[:n])
+        for (a, b), w in sorted(self._edges.items()):
+            for src, dst in ((a, b), (b, a)):
+                self.indices[fill[src]] = dst
+                self.weights[fill[src]] = w
+                fill[src] += 1
+        self._cache = {}
+        return self
+
+    def neighbours(self, nid, kind=None):
+        out = self.indices[self.indptr[nid]:self.indptr[nid + 1]]
+        return [j for j in out if self.kinds[j] == kind] if kind else list(out)
+
+    def node_of(self, result):
+        return self.by_result.get(id(result))
+
+    def strength(self, nid):
+        """Weighted degree."""
+        return sum(self.weights[self.indptr[nid]:self.indptr[nid + 1]])
+
+    def strength_peak(self):
+        """Highest councillor weighted degree."""
+        if "strength_peak" not in self._cache:
+            self._cache["strength_peak"] = max((self.strength(i) for i in self.councillors), default=0.0)
+        return self._cache["strength_peak"]
+
+    # ── PageRank ──
+
+    def pagerank(self, damping=0.85, tol=1e-10, max_iter=200):
+        """(rank per node, rank of an isolated node); ranks sum to 1."""
+        if "pagerank" in self._cache:
+            return self._cache["pagerank"]
+        n = len(self.kinds)
+        if not n:
+            return [], 0.0
+        strength = [self.strength(i) for i in range(n)]
+        if HAS_NUMPY:
+            ranks, floor = self._pagerank_numpy(strength, damping, tol, max_iter)
+        else:
+            ranks, floor = self._pagerank_python(strength, damping, tol, max_iter)
+        self._cache["pagerank"] = (ranks, floor)
+        return ranks, floor
+
+    def pagerank_peak(self):
+        """Highest councillor rank."""
+        if "pagerank_peak" not in self._cache:
+            pr, floor = self.pagerank()
+            self._cache["pagerank_peak"] = max((pr[i] for i in self.councillors), default=floor)
+        return self._cache["pagerank_peak"]
+
+    def councillor_pagerank(self, c):
+        """(raw rank, rank scaled 0..1 between an isolated node and the top councillor)."""
+        pr, floor = self.pagerank()
+        peak = self.pagerank_peak()
+        return pr[c], (max(0.0, (pr[c] - floor) / (peak - floor)) if peak - floor > 1e-15 else 0.0)
+
+    def _pagerank_numpy(self, strength, damping, tol, max_iter):
+        n = len(strength)
+        indptr = np.frombuffer(self.indptr, dtype=np.int_ if array("l").itemsize == 8 else np.int32)
+        indices = np.frombuffer(self.indices, dtype=indptr.dtype)
+        weights = np.frombuffer(self.weights, dtype=np.float64)
+        strength = np.asarray(strength, dtype=np.float64)
+        src = np.repeat(np.arange(n), np.diff(indptr))
+        share = weights / np.where(strength[src] > 0, strength[src], 1.0)
+        dangling = strength == 0
+        pr = np.full(n, 1.0 / n)
+        base = (1.0 - damping) / n
+        for _ in range(max_iter):
+            spread = base + damping * pr[dangling].sum() / n
+            new = spread + damping * np.bincount(indices, weights=pr[src] * share, minlength=n)
+            done = np.abs(new - pr).sum() < tol
+            pr = new
+            if done:
+                break
+        floor = base + damping * pr[dangling].sum() / n
+        return pr.tolist(), float(floor)
+
+    def _pagerank_python(self, strength, damping, tol, max_iter):
+        n = len(strength)
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        pr = [1.0 / n] * n
+        base = (1.0 - damping) / n
+        for _ in range(max_iter):
+            spread = base + damping * sum(pr[i] for i in range(n) if not strength[i]) / n
+            new = [spread] * n
+            for i in range(n):
+                if strength[i]:
+                    out = damping * pr[i] / strength[i]
+                    for k in range(indptr[i], indptr[i + 1]):
+                        new[indices[k]] += out * weights[k]
+            delta = sum(abs(a - b) for a, b in zip(new, pr))
+            pr = new
+            if delta < tol:
+                break
+        floor = base + damping * sum(pr[i] for i in range(n) if not strength[i]) / n
+        return pr, floor
+
+    # ── Betweenness between councillors ──
+
+    def _core(self):
+        """Mask of nodes left after repeatedly pruning entity nodes of degree ≤ 1."""
+        n = len(self.kinds)
+        degree = [self.indptr[i + 1] - self.indptr[i] for i in range(n)]
+        alive = [True] * n
+        queue = deque(i for i in range(n) if self.kinds[i] != COUNCILLOR and degree[i] <= 1)
+        while queue:
+            i = queue.popleft()
+            if not alive[i]:
+                continue
+            alive[i] = False
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                j = self.indices[k]
+                if alive[j]:
+                    degree[j] -= 1
+                    if self.kinds[j] != COUNCILLOR and degree[j] <= 1:
+                        queue.append(j)
+        return alive
+
+    def betweenness(self, sources=None):
+        """Per node: number of shortest (hop) paths between pairs of
+        councillors that pass through it, split evenly between equal paths.
+
+        sources limits the search to some councillors — pass every councillor
+        of a set of components() to get exact scores for those components only.
+        """
+        if sources is None and "betweenness" in self._cache:
+            return self._cache["betweenness"]
+        n = len(self.kinds)
+        alive = self._core()
+        is_councillor = [1.0 if k == COUNCILLOR else 0.0 for k in self.kinds]
+        # Core adjacency as plain lists: the BFS below touches it once per source
+        adj = [[j for j in self.indices[self.indptr[i]:self.indptr[i + 1]] if alive[j]] if alive[i] else []
+               for i in range(n)]
+        score = [0.0] * n
+        dist = [-1] * n
+        sigma = [0.0] * n
+        delta = [0.0] * n
+        for s in (self.councillors if sources is None else sources):
+            if not adj[s]:
+                continue
+            # Brandes: BFS from s, then accumulate dependencies in reverse order
+            order = [s]
+            dist[s] = 0
+            sigma[s] = 1.0
+            head = 0
+            while head < len(order):
+                v = order[head]
+                head += 1
+                dv = dist[v] + 1
+                sv = sigma[v]
+                for w in adj[v]:
+                    if dist[w] < 0:
+                        dist[w] = dv
+                        order.append(w)
+                    if dist[w] == dv:
+                        sigma[w] += sv
+            for w in reversed(order):
+                coeff = (is_councillor[w] + delta[w]) / sigma[w]
+                dw = dist[w] - 1
+                for v in adj[w]:
+                    if dist[v] == dw:
+                        delta[v] += sigma[v] * coeff
+                if w != s:
+                    score[w] += delta[w]
+            for v in order:
+                dist[v] = -1
+                sigma[v] = delta[v] = 0.0
+        # Each unordered pair was counted from both ends; endpoints don't count themselves
+        for i in range(n):
+            score[i] /= 2.0
+        if sources is None:
+            self._cache["betweenness"] = score
+        return score
+
+    def councillor_betweenness(self, c, raw=None):
+        """Betweenness of c (raw: precomputed betweenness()[c]) as a share of
+        the pairs of other councillors (0..1)."""
+        others = len(self.councillors) - 1
+        pairs = others * (others - 1) / 2
+        if raw is None:
+            raw = self.betweenness()[c]
+        return raw / pairs if pairs > 0 else 0.0
+
+    # ── Connected components ──
+
+    def components(self):
+        """Node ids of each connected component that holds a councillor, in
+        order of its first councillor."""
+        seen = [False] * len(self.kinds)
+        out = []
+        for c in self.councillors:
+            if seen[c]:
+                continue
+            seen[c] = True
+            comp = [c]
+            for v in comp:
+                for k in range(self.indptr[v], self.indptr[v + 1]):
+                    w = self.indices[k]
+                    if not seen[w]:
+                        seen[w] = True
+                        comp.append(w)
+            out.append(sorted(comp))
+        return out
+
+    def identity(self, nid):
+        """Stable identity of a node across builds (councillor node ids depend on
+        build order): councillors by council and councillor id, as
+        councillor_integrity_etl._councillor_key — names can repeat on a council."""
+        if self.kinds[nid] == COUNCILLOR:
+            return (COUNCILLOR, self.councils[nid], self.keys[nid][1])
+        return (self.kinds[nid], self.keys[nid])
+
+    def component_digest(self, nodes):
+        """sha256 of a component's nodes, labels and weighted edges — equal
+        digests mean the network detectors give the same results on it."""
+        h = hashlib.sha256()
+        ids = {v: json.dumps([self.identity(v), self.labels[v], self.councils[v]], default=str) for v in nodes}
+        for v in sorted(nodes, key=ids.get):
+            h.update(ids[v].encode("utf-8"))
+            h.update(b"\n")
+            for k in sorted(range(self.indptr[v], self.indptr[v + 1]), key=lambda k: ids[self.indices[k]]):
+                h.update(f"  {ids[self.indices[k]]} {self.weights[k]}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    # ── Councillor projection + cliques ──
+
+    def shared_entities(self, c):
+        """{other councillor: {kind: [entity ids]}} for councillors sharing an
+        associate, supplier or company with c (in node order)."""
+        shared = {}
+        for e in self.neighbours(c):
+            kind = self.kinds[e]
+            if kind not in CLIQUE_KINDS:
+                continue
+            for d in self.neighbours(e, COUNCILLOR):
+                if d != c:
+                    shared.setdefault(d, {}).setdefault(kind, []).append(e)
+        return dict(sorted(shared.items()))
+
+    def overlap(self, shared):
+        """Overlap score of one shared_entities() entry."""
+        return sum(CLIQUE_KINDS[kind] * len(ids) for kind, ids in shared.items())
+
+    def _projection(self):
+        if "projection" not in self._cache:
+            adj = {c: set() for c in self.councillors}
+            for e, kind in enumerate(self.kinds):
+                if kind in CLIQUE_KINDS:
+                    members = self.neighbours(e, COUNCILLOR)
+                    for i, a in enumerate(members):
+                        for b in members[i + 1:]:
+                            adj[a].add(b)
+                            adj[b].add(a)
+            self._cache["projection"] = adj
+        return self._cache["projection"]
+
+    def clique_with(self, c, weight=None):
+        """Other members of the largest maximal clique containing c in the
+        councillor projection (ties: highest total weight(d)), or []."""
+        adj = self._projection()
+        weight = weight or (lambda d: 0)
+        best, best_key = [], (0, 0)
+
+        def expand(r, p, x):
+            nonlocal best, best_key
+            if not p and not x:
+                key = (len(r), sum(weight(d) for d in r))
+                if key > best_key:
+                    best, best_key = sorted(r), key
+                return
+            pivot = max(p | x, key=lambda u: len(adj[u] & p))
+            for v in sorted(p - adj[pivot]):
+                expand(r | {v}, p & adj[v], x & adj[v])
+                p = p - {v}
+                x = x | {v}
+
+        expand(set(), set(adj.get(c, ())), set())
+        return best
+
+
+def _company_key(number, name):
+    return number or "name:" + (name or "").upper().strip()
+
+
+def build_network_graph(councils):
+    """Graph over {council_id: [councillor result, ...]}, frozen and ready to query."""
+    g = NetworkGraph()
+    for council_id, results in councils.items():
+        for r in results:
+            c = g.node(COUNCILLOR, (council_id, str(r.get("councillor_id") or r.get("name", "")),
+                                    len(g.councillors)),
+                       r.get("name", ""), council_id)
+            g.by_result[id(r)] = c
+
+            for comp in r.get("companies_house", {}).get("companies", []):
+                co = g.node(COMPANY, _company_key(comp.get("company_number", ""), comp.get("company_name")),
+                            comp.get("company_name", ""))
+                g.link(c, co, WEIGHTS["resigned" if comp.get("resigned_on") else "directorship"])
+
+            for assoc in r.get("co_director_network", {}).get("associates", []):
+                a = g.node(ASSOCIATE, assoc.get("name", "").lower().strip(), assoc.get("name", ""))
+                g.link(c, a, WEIGHTS["co_director"])
+                for sc in assoc.get("shared_companies", []):
+                    co = g.node(COMPANY, _company_key(sc.get("company_number", ""), sc.get("company_name")),
+                                sc.get("company_name", ""))
+                    g.link(a, co, WEIGHTS["associate_company"])
+
+            for mpf in r.get("mp_findings", []):
+                mp_name = mpf.get("mp_name") or ""
+                if mp_name:
+                    g.link(c, g.node(MP, mp_name.lower().strip(), mp_name), WEIGHTS["mp"])
+
+            for field, weight in (("supplier_conflicts", "supplier"), ("cross_council_conflicts", "cross_supplier")):
+                for conflict in r.get(field, []):
+                    supplier = (conflict.get("supplier_match", {}).get("supplier") or "").upper()
+                    other = conflict.get("other_council") or conflict.get("council_id") or council_id
+                    s = g.node(SUPPLIER, (other, supplier), supplier, other)
+                    co = g.node(COMPANY, _company_key(conflict.get("company_number", ""), conflict.get("company_name")),
+                                conflict.get("company_name", ""))
+                    g.link(c, s, WEIGHTS[weight])
+                    g.link(co, s, WEIGHTS[weight])
+
+            donors = [(f.get("donor_name"), f.get("company_number")) for f in r.get("shell_company_findings", [])]
+            donors += [(f.get("donor_name"), None) for f in r.get("donation_contract_correlation", [])]
+            for donor_name, number in donors:
+                if not donor_name:
+                    continue
+                d = g.node(DONOR, donor_name.upper().strip(), donor_name)
+                g.link(c, d, WEIGHTS["donor"])
+                if number and (COMPANY, number) in g.ids:
+                    g.link(d, g.ids[(COMPANY, number)], WEIGHTS["donor_company"])
+    return g.freeze()
@@ -12,14 +12,30 @@ Priority:
 4. Groq Llama 3.3 70B (500K tokens/day free)
 5. Ollama local (emergency fallback)
 
+Async router (needs httpx, used by chat_server.py and generate() when available):
+- One pooled httpx.AsyncClient per provider, reused across requests.
+- Streams tokens (OpenAI-style SSE / Gemini streamGenerateContent).
+- Hedged requests: if the leading provider hasn't produced its first token
+  within its p95 first-token latency, the next provider is started too and
+  whichever streams first wins (the loser is cancelled).
+- Per-provider EWMAs of first-token latency and error rate re-rank PROVIDERS
+  on every call, so a slow or failing provider drops down automatically.
+
 Usage:
     from llm_router import generate
     text, provider = generate("Write an article", system_prompt="You are a journalist")
+
+    # async callers
+    text, provider = await agenerate(messages, max_tokens=1500, timeout=30)
+    async for chunk, provider in astream(messages):
+        ...
 """
+import asyncio
 import json
 import os
 import time
 import logging
+from collections import deque
 
 try:
     import requests
@@ -27,6 +43,12 @@ except ImportError:
     os.system("pip3 install requests 2>/dev/null")
     import requests
 
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
 log = logging.getLogger("LLMRouter")
 
 # === PROVIDER CONFIGS ===
@@ -162,17 +184,8 @@ def _call_provider(provider, messages, max_tokens=4000, timeout=180):
         return _call_openai(provider, messages, max_tokens, timeout)
 
 
-def generate(prompt, system_prompt=None, max_tokens=4000, timeout=180):
-    """
-    Generate text using the best available free LLM.
-    Tries each provider in priority order, fails over on error.
-    Returns (text, provider_name) tuple.
-    """
-    messages = []
-    if system_prompt:
-        messages.append({"role": "system", "content": system_prompt})
-    messages.append({"role": "user", "content": prompt})
-
+def _generate_sequential(messages, max_tokens=4000, timeout=180, min_chars=50):
+    """Blocking failover through PROVIDERS in order (used when httpx is missing)."""
     errors = []
     for provider in PROVIDERS:
         if not provider["enabled"] or not provider["api_key"]:
@@ -180,7 +193,7 @@ def generate(prompt, system_prompt=None, max_tokens=4000, timeout=180):
         try:
             log.info("Trying {}...".format(provider["name"]))
             text = _call_provider(provider, messages, max_tokens, timeout)
-            if text and len(text.strip()) > 50:
+            if text and len(text.strip()) > min_chars:
                 log.info("Success via {} ({} chars)".format(provider["name"], len(text)))
                 return text, provider["name"]
             else:
@@ -198,12 +211,328 @@ def generate(prompt, system_prompt=None, max_tokens=4000, timeout=180):
     raise RuntimeError("All LLM providers failed: {}".format(errors))
 
 
+def generate(prompt, system_prompt=None, max_tokens=4000, timeout=180):
+    """
+    Generate text using the best available free LLM.
+    Tries each provider in priority order, fails over on error.
+    Returns (text, provider_name) tuple.
+    """
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+
+    try:
+        asyncio.get_running_loop()
+        in_event_loop = True
+    except RuntimeError:
+        in_event_loop = False
+    if HAS_HTTPX and not in_event_loop:
+        return asyncio.run(_agenerate_and_close(messages, max_tokens, timeout, min_chars=50))
+    return _generate_sequential(messages, max_tokens, timeout, min_chars=50)
+
+
 def generate_simple(prompt, max_tokens=4000):
     """Simple wrapper that just returns text."""
     text, _ = generate(prompt, max_tokens=max_tokens)
     return text
 
 
+# === ASYNC ROUTER ===
+# Hedge budget = p95 of a provider's recent first-token latencies, clamped;
+# providers with too few samples use HEDGE_DEFAULT_BUDGET.
+HEDGE_DEFAULT_BUDGET = 6.0
+HEDGE_MIN_BUDGET = 1.0
+HEDGE_MIN_SAMPLES = 5
+EWMA_ALPHA = 0.2
+# Ranking score (seconds): first-token EWMA + error penalty + priority bias,
+# so PROVIDERS order still wins between similarly healthy providers.
+ERROR_PENALTY = 30.0
+PRIORITY_STEP = 0.5
+
+POOL_LIMITS = {"max_connections": 20, "max_keepalive_connections": 10}
+
+
+class ProviderStats:
+    """Latency / error EWMAs and recent first-token samples for one provider."""
+
+    def __init__(self):
+        self.latency = None
+        self.errors = 0.0
+        self.samples = deque(maxlen=50)
+
+    def record_first_token(self, seconds):
+        self.samples.append(seconds)
+        self.latency = seconds if self.latency is None else (
+            EWMA_ALPHA * seconds + (1 - EWMA_ALPHA) * self.latency)
+        self.errors = (1 - EWMA_ALPHA) * self.errors
+
+    def record_error(self):
+        self.errors = EWMA_ALPHA + (1 - EWMA_ALPHA) * self.errors
+
+    def hedge_budget(self, timeout):
+        if len(self.samples) < HEDGE_MIN_SAMPLES:
+            return min(HEDGE_DEFAULT_BUDGET, timeout)
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+        return max(HEDGE_MIN_BUDGET, min(p95, timeout))
+
+    def score(self, rank):
+        latency = self.latency if self.latency is not None else HEDGE_DEFAULT_BUDGET / 2
+        return latency + ERROR_PENALTY * self.errors + PRIORITY_STEP * rank
+
+
+_stats = {}
+_clients = {}
+
+
+def provider_stats():
+    """{provider name: {"first_token_ewma", "error_ewma", "samples"}} for health endpoints."""
+    return {
+        name: {
+            "first_token_ewma": round(st.latency, 3) if st.latency is not None else None,
+            "error_ewma": round(st.errors, 3),
+            "samples": len(st.samples),
+        }
+        for name, st in _stats.items()
+    }
+
+
+def ranked_providers(exclude=()):
+    """Enabled providers with keys, best score first."""
+    usable = [(rank, p) for rank, p in enumerate(PROVIDERS)
+              if p["enabled"] and p["api_key"] and p["name"] not in exclude]
+    return [p for rank, p in sorted(
+        usable, key=lambda rp: _stats.setdefault(rp[1]["name"], ProviderStats()).score(rp[0]))]
+
+
+def _client_for(provider):
+    """Pooled AsyncClient per provider (re-created if the event loop changed)."""
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(provider["name"])
+    if entry is None or entry[0] is not loop or entry[1].is_closed:
+        client = httpx.AsyncClient(limits=httpx.Limits(**POOL_LIMITS))
+        _clients[provider["name"]] = (loop, client)
+        return client
+    return entry[1]
+
+
+async def aclose_clients():
+    """Close pooled clients (call on application shutdown)."""
+    for _, client in list(_clients.values()):
+        await client.aclose()
+    _clients.clear()
+
+
+async def _sse_events(resp):
+    """Parsed JSON payloads of an SSE response's data: lines."""
+    async for line in resp.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if not data or data == "[DONE]":
+            continue
+        try:
+            yield json.loads(data)
+        except ValueError:
+            continue
+
+
+async def _stream_openai(provider, messages, max_tokens, timeout):
+    headers = {
+        "Authorization": "Bearer {}".format(provider["api_key"]),
+        "Content-Type": "application/json",
+    }
+    payload = {
+        "model": provider["model"],
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": provider["temperature"],
+        "stream": True,
+    }
+    reasoning = []
+    produced = False
+    client = _client_for(provider)
+    async with client.stream("POST", "{}/chat/completions".format(provider["base_url"]),
+                             headers=headers, json=payload, timeout=timeout) as resp:
+        resp.raise_for_status()
+        async for event in _sse_events(resp):
+            choices = event.get("choices") or [{}]
+            delta = choices[0].get("delta") or {}
+            if delta.get("content"):
+                produced = True
+                yield delta["content"]
+            elif delta.get("reasoning_content"):
+                reasoning.append(delta["reasoning_content"])
+    if not produced and reasoning:
+        # Same fallback as _call_openai: reasoning models may only fill reasoning_content
+        yield "".join(reasoning)
+
+
+async def _stream_google(provider, messages, max_tokens, timeout):
+    url = "https://generativelanguage.googleapis.com/v1beta/models/{}:streamGenerateContent?alt=sse&key={}".format(
+        provider["model"], provider["api_key"]
+    )
+    system_instruction = None
+    contents = []
+    for msg in messages:
+        if msg["role"] == "system":
+            system_instruction = msg["content"]
+        elif msg["role"] in ("user", "assistant"):
+            role = "user" if msg["role"] == "user" else "model"
+            contents.append({"role": role, "parts": [{"text": msg["content"]}]})
+    payload = {
+        "contents": contents,
+        "generationConfig": {
+            "temperature": provider.get("temperature", 0.4),
+            "maxOutputTokens": max_tokens,
+        },
+    }
+    if system_instruction:
+        payload["systemInstruction"] = {"parts": [{"text": system_instruction}]}
+    client = _client_for(provider)
+    async with client.stream("POST", url, json=payload, timeout=timeout) as resp:
+        resp.raise_for_status()
+        async for event in _sse_events(resp):
+            for cand in (event.get("candidates") or [])[:1]:
+                text = "".join(p.get("text", "") for p in cand.get("content", {}).get("parts", []))
+                if text:
+                    yield text
+
+
+def _stream_provider(provider, messages, max_tokens, timeout):
+    if provider.get("type", "openai") == "google":
+        return _stream_google(provider, messages, max_tokens, timeout)
+    return _stream_openai(provider, messages, max_tokens, timeout)
+
+
+async def _open_stream(provider, messages, max_tokens, timeout):
+    """Start a provider stream and wait for its first chunk → (provider, stream, first)."""
+    stream = _stream_provider(provider, messages, max_tokens, timeout)
+    start = time.monotonic()
+    try:
+        first = await stream.__anext__()
+    except StopAsyncIteration:
+        raise RuntimeError("empty response")
+    _stats.setdefault(provider["name"], ProviderStats()).record_first_token(time.monotonic() - start)
+    return provider, stream, first
+
+
+async def _race(messages, max_tokens, timeout, hedge=True, exclude=(), errors=None):
+    """Hedged first-token race across ranked providers → (provider, stream, first chunk).
+    Failures are appended to errors (if given) as (provider name, message)."""
+    queue = ranked_providers(exclude)
+    pending = {}
+    errors = [] if errors is None else errors
+
+    def launch():
+        provider = queue.pop(0)
+        log.info("Trying {}...".format(provider["name"]))
+        task = asyncio.ensure_future(_open_stream(provider, messages, max_tokens, timeout))
+        pending[task] = (provider, time.monotonic())
+
+    if queue:
+        launch()
+    try:
+        while pending:
+            wait = None
+            if hedge and queue:
+                provider, started = max(pending.values(), key=lambda v: v[1])
+                budget = _stats.setdefault(provider["name"], ProviderStats()).hedge_budget(timeout)
+                wait = max(0.0, budget - (time.monotonic() - started))
+            done, _ = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                log.info("Hedging: {} slow to first token, starting {}".format(
+                    provider["name"], queue[0]["name"]))
+                launch()
+                continue
+            winner = None
+            for task in done:
+                provider, _ = pending.pop(task)
+                if task.exception() is not None:
+                    err_msg = str(task.exception())[:200] or type(task.exception()).__name__
+                    log.warning("{} failed: {}".format(provider["name"], err_msg))
+                    _stats[provider["name"]].record_error()
+                    errors.append((provider["name"], err_msg))
+                elif winner is None:
+                    winner = task.result()
+                else:
+                    await task.result()[1].aclose()
+            if winner:
+                return winner
+            if not pending and queue:
+                launch()
+    finally:
+        for task in pending:
+            task.cancel()
+    raise RuntimeError("All LLM providers failed: {}".format(errors))
+
+
+async def astream(messages, max_tokens=4000, timeout=180, hedge=True):
+    """Stream (chunk, provider_name) from the fastest healthy provider.
+    Failover/hedging happens before the first chunk; a failure mid-stream raises."""
+    if not HAS_HTTPX:
+        text, name = await asyncio.to_thread(_generate_sequential, messages, max_tokens, timeout, 0)
+        yield text, name
+        return
+    provider, stream, first = await _race(messages, max_tokens, timeout, hedge)
+    try:
+        yield first, provider["name"]
+        async for chunk in stream:
+            yield chunk, provider["name"]
+    except (httpx.HTTPError, RuntimeError):
+        _stats[provider["name"]].record_error()
+        raise
+    finally:
+        await stream.aclose()
+
+
+async def _agenerate_once(messages, max_tokens, timeout, min_chars, hedge=True):
+    """Collect a full response, moving on to the next provider on a short reply
+    or a mid-stream failure."""
+    tried = set()
+    errors = []
+    while True:
+        provider, stream, first = await _race(messages, max_tokens, timeout, hedge,
+                                              exclude=tried, errors=errors)
+        name = provider["name"]
+        # Providers that failed inside the race aren't raced again either
+        tried.add(name)
+        tried.update(n for n, _ in errors)
+        parts = [first]
+        try:
+            async for chunk in stream:
+                parts.append(chunk)
+        except Exception as e:
+            _stats[name].record_error()
+            log.warning("{} failed mid-stream: {}".format(name, str(e)[:200]))
+            errors.append((name, str(e)[:200]))
+            continue
+        finally:
+            await stream.aclose()
+        text = "".join(parts)
+        if len(text.strip()) > min_chars:
+            log.info("Success via {} ({} chars)".format(name, len(text)))
+            return text, name
+        log.warning("{} returned empty/short response ({} chars)".format(name, len(text)))
+        errors.append((name, "short response"))
+
+
+async def _agenerate_and_close(messages, max_tokens, timeout, min_chars):
+    """One-shot loop for the sync generate(): the pool dies with asyncio.run's loop."""
+    try:
+        return await _agenerate_once(messages, max_tokens, timeout, min_chars)
+    finally:
+        await aclose_clients()
+
+
+async def agenerate(messages, max_tokens=4000, timeout=180, min_chars=50, hedge=True):
+    """Async counterpart of generate() taking a full message list → (text, provider_name)."""
+    if not HAS_HTTPX:
+        return await asyncio.to_thread(_generate_sequential, messages, max_tokens, timeout, min_chars)
+    return await _agenerate_once(messages, max_tokens, timeout, min_chars, hedge)
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     text, provider = generate("Say hello and identify yourself in one sentence.")
@@ -6,6 +6,10 @@ Discovers meetings from ModernGov, downloads webcasts, transcribes,
 analyses, pre-clips, aggregates, and optionally pushes to git.
 
 Designed to run on vps-main as a cron job or manual batch processor.
+Each meeting is transcribed into TRANSCRIPTS_DIR/MEETING_ID, whose
+checkpoints/manifest.json (transcript_checkpoints.py) lets a failed or
+timed-out meeting resume where it stopped on the next run, and skips the
+transcriber and pre-clip steps that already finished.
 
 Usage:
     # Process all unprocessed Full Council meetings since May 2025
@@ -35,6 +39,8 @@ import fcntl
 from pathlib import Path
 from datetime import datetime
 
+from transcript_checkpoints import Checkpoints
+
 # Directories
 TRANSCRIPTS_DIR = Path("/opt/transcripts")
 LOCKFILE = TRANSCRIPTS_DIR / ".pipeline.lock"
@@ -240,38 +246,59 @@ def process_meeting(meeting, state, min_score=7):
 
     # Step 1: Transcribe (includes OCR speaker detection, vocab hints)
     # Full pipeline: download → transcribe → OCR → post-process → Tier 1 + Tier 2
-    print(f"\n  Step 1: Full transcription pipeline...")
-    cmd = [
-        sys.executable, str(TRANSCRIBER),
-        "--url", webcast_url,
-        "--council", "lancashire_cc",
-        "--model", "medium",
-        # No --no-llm: run Tier 2 as part of the pipeline
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10800)  # 3hr max
-    if result.returncode != 0:
-        print(f"  Transcription FAILED:")
-        print(f"  stdout: {result.stdout[-500:]}")
-        print(f"  stderr: {result.stderr[-500:]}")
-        return False
-    print(f"  Pipeline complete")
-    # Show key stats from output
-    for line in result.stdout.split('\n'):
-        if any(k in line for k in ['Tier ', 'OCR ', 'QC ', 'segments', 'moments', 'topics']):
-            print(f"    {line.strip()}")
-
-    # Step 2: Pre-clip high-value moments
-    print(f"\n  Step 2: Pre-clip score {min_score}+ moments...")
-    cmd = [
-        sys.executable, str(CLIP_SERVER),
-        "--preclip", meeting_id,
-        "--min-score", str(min_score),
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
-    if result.returncode != 0:
-        print(f"  Pre-clip FAILED: {result.stderr[-300:]}")
+    # The transcriber checkpoints each stage in output_dir/checkpoints, so a
+    # run that failed or timed out last night resumes where it stopped.
+    ckpt = Checkpoints(output_dir)
+    if ckpt.done("outputs"):
+        print(f"\n  Step 1: Transcript already complete (checkpoint {ckpt.stages['outputs']['created'][:16]})")
     else:
-        print(f"  {result.stdout.strip()}")
+        if ckpt.stages:
+            print(f"\n  Step 1: Resuming transcription pipeline ({', '.join(ckpt.stages)} checkpointed)...")
+        else:
+            print(f"\n  Step 1: Full transcription pipeline...")
+        cmd = [
+            sys.executable, str(TRANSCRIBER),
+            "--url", webcast_url,
+            "--council", "lancashire_cc",
+            "--model", "medium",
+            "--output", str(output_dir),
+            # No --no-llm: run Tier 2 as part of the pipeline
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10800)  # 3hr max
+        except subprocess.TimeoutExpired:
+            print(f"  Transcription TIMED OUT — the next run resumes from its checkpoints")
+            return False
+        if result.returncode != 0:
+            print(f"  Transcription FAILED:")
+            print(f"  stdout: {result.stdout[-500:]}")
+            print(f"  stderr: {result.stderr[-500:]}")
+            return False
+        print(f"  Pipeline complete")
+        # Show key stats from output
+        for line in result.stdout.split('\n'):
+            if any(k in line for k in ['Tier ', 'OCR ', 'QC ', 'segments', 'moments', 'topics', 'checkpoint']):
+                print(f"    {line.strip()}")
+        ckpt = Checkpoints(output_dir)
+
+    # Step 2: Pre-clip high-value moments (once per transcript + threshold)
+    outputs = ckpt.entry("outputs")
+    preclip_key = ckpt.key("preclip", outputs["key"] if outputs else None, min_score)
+    if ckpt.done("preclip", preclip_key):
+        print(f"\n  Step 2: Pre-clip score {min_score}+ already done (checkpoint)")
+    else:
+        print(f"\n  Step 2: Pre-clip score {min_score}+ moments...")
+        cmd = [
+            sys.executable, str(CLIP_SERVER),
+            "--preclip", meeting_id,
+            "--min-score", str(min_score),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
+        if result.returncode != 0:
+            print(f"  Pre-clip FAILED: {result.stderr[-300:]}")
+        else:
+            print(f"  {result.stdout.strip()}")
+            ckpt.mark("preclip", preclip_key, min_score=min_score)
 
     # Step 3: Cleanup temp video files
     print(f"\n  Step 3: Cleanup...")
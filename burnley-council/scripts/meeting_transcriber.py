@@ -29,6 +29,13 @@ Usage:
     # Use a specific model size (tiny/base/small/medium/large-v3)
     python3 meeting_transcriber.py --url "..." --model medium
 
+    # Parallel: split at pauses into ~10 min chunks, 4 worker processes x 2 threads
+    python3 meeting_transcriber.py --file meeting.mp4 --workers 4 --threads 2
+
+    # Re-running resumes from OUTPUT/checkpoints (download, sections, segments,
+    # post-processed transcript, OCR timeline, Tier 2 batches); --fresh starts over
+    python3 meeting_transcriber.py --url "..." --output /opt/transcripts/MEETING --fresh
+
 Designed for vps-main (8 vCPU, 32GB RAM, no GPU — uses CPU inference).
 """
 
@@ -40,14 +47,32 @@ import subprocess
 import argparse
 import tempfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+from transcript_checkpoints import Checkpoints, file_sha256
+
 # Output directory
 OUTPUT_DIR = Path("/opt/transcripts")
 FFMPEG = "ffmpeg"
 FFPROBE = "ffprobe"
 
+# Parallel transcription: audio is cut into ~CHUNK_SECONDS pieces at the
+# pause nearest each target cut (within CHUNK_SEARCH_SECONDS)
+CHUNK_SECONDS = 600
+CHUNK_SEARCH_SECONDS = 60
+CHUNK_MIN_SILENCE = 0.5
+
+# OCR speaker detection: name bar crop (w, h, x, y) of the 960x540 webcast;
+# a strip is only re-OCR'd when its difference hash moves by more than
+# OCR_HASH_TOLERANCE bits (hash cells: OCR_HASH_SIZE, edge margin 0-255)
+OCR_STRIP = (700, 40, 0, 330)
+OCR_HASH_SIZE = (141, 8)
+OCR_HASH_MARGIN = 24
+OCR_HASH_TOLERANCE = 6
+OCR_WORKERS = 4
+
 # ============================================================
 # TIER 1: Keyword detection (instant, free, regex)
 # ============================================================
@@ -366,7 +391,7 @@ def build_segment_context(moment, all_segments, context_lines=2):
 
 
 def tier2_llm_analysis(flagged_moments, all_segments=None, batch_size=6,
-                        council_id=None, max_retries=2, retry_delay=5):
+                        council_id=None, max_retries=2, retry_delay=5, batch_store=None):
     """Run LLM contextual analysis on Tier 1 flagged moments.
 
     Improvements over v1:
@@ -377,6 +402,9 @@ def tier2_llm_analysis(flagged_moments, all_segments=None, batch_size=6,
     - Three-tier clip classification (soundbite/full_speech/archive)
     - Topic tagging for cross-meeting searchability
     - Tier 1-only scores capped at 6 so LLM-analysed moments rank higher
+    - batch_store (transcript_checkpoints.BatchStore): parsed results are
+      saved per batch prompt and reused on re-runs, so an interrupted run
+      resumes after the last successful batch
     """
     try:
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -413,9 +441,15 @@ def tier2_llm_analysis(flagged_moments, all_segments=None, batch_size=6,
 
         prompt = TIER2_USER_PROMPT.format(segments_text=segments_text)
 
+        # Reuse this exact batch's result from an earlier (interrupted) run
+        batch_key = batch_store.batch_key(system_prompt, prompt) if batch_store is not None else None
+        analyses = batch_store.get(batch_key) if batch_key else None
+        if analyses:
+            print(f"    Batch {batch_num}/{total_batches} from checkpoint ({len(analyses)} results)")
+            success_count += 1
+
         # Retry loop with backoff
-        analyses = None
-        for attempt in range(max_retries + 1):
+        for attempt in range(0 if analyses else max_retries + 1):
             try:
                 response, provider = generate(
                     prompt,
@@ -426,6 +460,8 @@ def tier2_llm_analysis(flagged_moments, all_segments=None, batch_size=6,
                 if analyses:
                     print(f"    Batch {batch_num}/{total_batches} OK via {provider} ({len(analyses)} results)")
                     success_count += 1
+                    if batch_key:
+                        batch_store.put(batch_key, analyses)
                     break
                 else:
                     print(f"    Batch {batch_num}/{total_batches} via {provider}: could not parse JSON (attempt {attempt+1})")
@@ -822,7 +858,34 @@ def post_process_transcript(segments, batch_size=20):
     return segments
 
 
-def ocr_speaker_detection(video_path, interval=3, councillors_json=None):
+def strip_hash(img):
+    """Difference hash of a name-strip frame.
+
+    One bit per pair of horizontally adjacent cells of a downscaled strip,
+    set when their brightness differs by more than OCR_HASH_MARGIN — i.e.
+    where there is a text edge. Flat background gives stable 0 bits, so
+    compression noise barely moves the hash while a different name does.
+    """
+    w, h = OCR_HASH_SIZE
+    px = img.resize((w, h)).tobytes()
+    bits = 0
+    for y in range(h):
+        row = px[y * w:(y + 1) * w]
+        for x in range(w - 1):
+            bits = (bits << 1) | (abs(row[x] - row[x + 1]) > OCR_HASH_MARGIN)
+    return bits
+
+
+def _ocr_name_strip(pytesseract, img):
+    """OCR one name strip: grayscale → threshold → single text line."""
+    try:
+        bw = img.point(lambda x: 255 if x > 140 else 0)
+        return pytesseract.image_to_string(bw, config='--psm 7').strip()
+    except Exception:
+        return ""
+
+
+def ocr_speaker_detection(video_path, interval=3, councillors_json=None, workers=OCR_WORKERS):
     """Detect speaker names from on-screen overlay via OCR.
 
     Mediasite webcasts display "Cllr [Name]" on a white bar at the bottom
@@ -832,15 +895,23 @@ def ocr_speaker_detection(video_path, interval=3, councillors_json=None):
     Samples one frame every `interval` seconds, OCRs just the name strip,
     and returns a timeline of speaker changes.
 
+    ffmpeg streams the cropped grayscale strips as raw frames over a pipe.
+    The bar only changes when the speaker does, so a frame is only OCR'd
+    when its strip_hash() differs from the last OCR'd frame by more than
+    OCR_HASH_TOLERANCE bits; the OCR itself runs on `workers` threads
+    (each pytesseract call is its own tesseract process).
+
     Args:
         video_path: Path to video file
         interval: Seconds between OCR samples (default 3)
         councillors_json: Optional path to councillors.json for name matching
+        workers: Concurrent tesseract calls (default OCR_WORKERS)
 
     Returns:
         list of {timestamp: float, speaker: str, confidence: str}
     """
     import tempfile
+    from concurrent.futures import ThreadPoolExecutor
     try:
         import pytesseract
     except ImportError:
@@ -876,28 +947,44 @@ def ocr_speaker_detection(video_path, interval=3, councillors_json=None):
 
     print(f"  OCR speaker detection: {duration:.0f}s video, sampling every {interval}s...")
 
-    # Extract frames of just the name bar region
-    tmpdir = tempfile.mkdtemp(prefix="ocr_frames_")
-    total_samples = int(duration / interval)
-
-    # Extract name strip frames in batch (much faster than one-by-one)
+    # Stream name strip frames as raw 8-bit grayscale (no JPEGs on disk)
     # Video is 960x540. The councillor name text sits at y≈335, height≈35
     # Crop wide (700px) to catch long names like "Cllr Stephen Atkinson"
+    strip_w, strip_h, strip_x, strip_y = OCR_STRIP
     cmd = [
-        FFMPEG, "-y",
+        FFMPEG, "-v", "error",
         "-i", str(video_path),
-        "-vf", f"fps=1/{interval},crop=700:40:0:330",
-        "-q:v", "2",
-        os.path.join(tmpdir, "name_%06d.jpg"),
+        "-vf", f"fps=1/{interval},crop={strip_w}:{strip_h}:{strip_x}:{strip_y}",
+        "-f", "rawvideo", "-pix_fmt", "gray", "-",
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-    if result.returncode != 0:
-        print(f"  OCR: Frame extraction failed: {result.stderr[-200:]}")
-        import shutil
-        shutil.rmtree(tmpdir, ignore_errors=True)
-        return []
-
-    # OCR each frame
+    frame_size = strip_w * strip_h
+    texts = {}  # frame index → OCR future, only for frames whose strip changed
+    frames = 0
+    last_hash = None
+    with tempfile.TemporaryFile() as err, ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err)
+        while True:
+            raw = proc.stdout.read(frame_size)
+            if len(raw) < frame_size:
+                break
+            img = Image.frombytes("L", (strip_w, strip_h), raw)
+            h = strip_hash(img)
+            if last_hash is None or bin(h ^ last_hash).count("1") > OCR_HASH_TOLERANCE:
+                texts[frames] = pool.submit(_ocr_name_strip, pytesseract, img)
+                last_hash = h
+            frames += 1
+        proc.stdout.close()
+        if proc.wait() != 0 and not frames:
+            err.seek(0)
+            print(f"  OCR: Frame extraction failed: {err.read().decode(errors='replace')[-200:]}")
+            return []
+        texts = {i: f.result() for i, f in texts.items()}
+
+    print(f"  OCR: {len(texts)} of {frames} frames OCR'd "
+          f"({100 * (1 - len(texts) / max(frames, 1)):.0f}% skipped as unchanged)")
+
+    # Walk the OCR'd frames in order — a skipped frame shows the same strip
+    # as the OCR'd frame before it, so it could not start a new speaker
     speaker_timeline = []
     current_speaker = None
     # "Cllr" with common OCR misreads: Clir, Cir, C1lr, SC|ir, |ir, etc.
@@ -906,75 +993,56 @@ def ocr_speaker_detection(video_path, interval=3, councillors_json=None):
         r'(?:S?C?\s*[|lIi1]{1,3}r|C[li1I]{1,2}r)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z\'-]+)+)',
         re.IGNORECASE
     )
-
-    frame_files = sorted(Path(tmpdir).glob("name_*.jpg"))
     ocr_hits = 0
 
-    for i, frame_path in enumerate(frame_files):
+    for i, text in sorted(texts.items()):
         timestamp = i * interval
 
-        try:
-            img = Image.open(frame_path)
-            # Preprocess: grayscale → threshold → clean black text on white
-            gray = img.convert("L")
-            bw = gray.point(lambda x: 255 if x > 140 else 0)
-            # OCR with single line mode
-            text = pytesseract.image_to_string(
-                bw, config='--psm 7'
-            ).strip()
-
-            if not text or len(text) < 4:
+        if not text or len(text) < 4:
+            continue
+
+        # Look for "Cllr [Name]" pattern
+        match = cllr_pattern.search(text)
+        if match:
+            name = match.group(1).strip()
+            # Clean up OCR artifacts
+            name = re.sub(r'[^A-Za-z\s\'-]', '', name).strip()
+
+            if not name or len(name) < 3:
                 continue
 
-            # Look for "Cllr [Name]" pattern
-            match = cllr_pattern.search(text)
-            if match:
-                name = match.group(1).strip()
-                # Clean up OCR artifacts
-                name = re.sub(r'[^A-Za-z\s\'-]', '', name).strip()
-
-                if not name or len(name) < 3:
-                    continue
-
-                # Strip honours suffixes
-                name = re.sub(r'\s+(OBE|MBE|CBE|JP|DL)\b', '', name, flags=re.IGNORECASE).strip()
-
-                # Extract surname (last word)
-                parts = name.split()
-                surname = parts[-1] if parts else name
-
-                # Fuzzy match against known councillors
-                confidence = "ocr"
-                if known_surnames:
-                    # Try exact match first
-                    if surname in known_surnames:
-                        confidence = "ocr_verified"
-                    else:
-                        # Try close matches (Levenshtein distance 1)
-                        for known in known_surnames:
-                            if len(known) > 3 and len(surname) > 3:
-                                if known.lower()[:3] == surname.lower()[:3]:
-                                    surname = known  # Use the known spelling
-                                    confidence = "ocr_fuzzy"
-                                    break
-
-                if surname != current_speaker:
-                    speaker_timeline.append({
-                        "timestamp": timestamp,
-                        "speaker": surname,
-                        "full_name": name,
-                        "confidence": confidence,
-                        "source": "ocr",
-                    })
-                    current_speaker = surname
-                    ocr_hits += 1
-
-        except Exception:
-            continue
+            # Strip honours suffixes
+            name = re.sub(r'\s+(OBE|MBE|CBE|JP|DL)\b', '', name, flags=re.IGNORECASE).strip()
 
-    # Cleanup
-    import shutil
-    shutil.rmtree(tmpdir, ignore_errors=True)
+            # Extract surname (last word)
+            parts = name.split()
+            surname = parts[-1] if parts else name
+
+            # Fuzzy match against known councillors
+            confidence = "ocr"
+            if known_surnames:
+                # Try exact match first
+                if surname in known_surnames:
+                    confidence = "ocr_verified"
+                else:
+                    # Try close matches (Levenshtein distance 1)
+                    for known in known_surnames:
+                        if len(known) > 3 and len(surname) > 3:
+                            if known.lower()[:3] == surname.lower()[:3]:
+                                surname = known  # Use the known spelling
+                                confidence = "ocr_fuzzy"
+                                break
+
+            if surname != current_speaker:
+                speaker_timeline.append({
+                    "timestamp": timestamp,
+                    "speaker": surname,
+                    "full_name": name,
+                    "confidence": confidence,
+                    "source": "ocr",
+                })
+                current_speaker = surname
+                ocr_hits += 1
 
     verified = sum(1 for s in speaker_timeline if s["confidence"] == "ocr_verified")
     print(f"  OCR complete: {ocr_hits} speaker changes detected "
@@ -1040,17 +1108,11 @@ def merge_speaker_sources(segments, ocr_timeline, qc_speakers):
     return segments
 
 
-def detect_adjournments(video_path, min_silence_secs=120, noise_threshold=-40):
-    """Detect adjournment breaks in meeting recordings.
-
-    Uses ffmpeg silencedetect to find periods of silence >2 minutes,
-    which correspond to adjournment screens in council webcasts.
-    Returns list of (start, end) tuples for the ACTIVE sections.
-    """
-    print(f"  Detecting adjournments (silence >{min_silence_secs}s, threshold {noise_threshold}dB)...")
-
+def detect_silences(video_path, min_silence_secs, noise_threshold=-40):
+    """Run ffmpeg silencedetect. Returns (silence_starts, silence_ends) in seconds."""
     cmd = [
         FFMPEG, "-i", str(video_path),
+        "-vn",
         "-af", f"silencedetect=noise={noise_threshold}dB:d={min_silence_secs}",
         "-f", "null", "-"
     ]
@@ -1066,6 +1128,19 @@ def detect_adjournments(video_path, min_silence_secs=120, noise_threshold=-40):
         m = re.search(r"silence_end:\s*([\d.]+)", line)
         if m:
             silence_ends.append(float(m.group(1)))
+    return silence_starts, silence_ends
+
+
+def detect_adjournments(video_path, min_silence_secs=120, noise_threshold=-40):
+    """Detect adjournment breaks in meeting recordings.
+
+    Uses ffmpeg silencedetect to find periods of silence >2 minutes,
+    which correspond to adjournment screens in council webcasts.
+    Returns list of (start, end) tuples for the ACTIVE sections.
+    """
+    print(f"  Detecting adjournments (silence >{min_silence_secs}s, threshold {noise_threshold}dB)...")
+
+    silence_starts, silence_ends = detect_silences(video_path, min_silence_secs, noise_threshold)
 
     duration = get_video_duration(video_path)
 
@@ -1172,19 +1247,16 @@ WHISPER_VOCABULARY_PROMPT = (
 )
 
 
-def transcribe(video_path, model_size="small"):
-    """Transcribe video using faster-whisper. Returns list of segments."""
+def load_whisper_model(model_size, cpu_threads=0):
+    """faster-whisper model on CPU (int8). cpu_threads=0 lets CTranslate2 decide."""
     from faster_whisper import WhisperModel
+    return WhisperModel(model_size, device="cpu", compute_type="int8", cpu_threads=cpu_threads)
 
-    print(f"  Loading faster-whisper model '{model_size}' (CPU)...")
-    model = WhisperModel(model_size, device="cpu", compute_type="int8")
-
-    duration = get_video_duration(video_path)
-    print(f"  Video duration: {duration / 60:.1f} minutes")
-    print(f"  Transcribing (with vocabulary hints)...")
 
-    segments_raw, info = model.transcribe(
-        str(video_path),
+def run_whisper(model, audio_path):
+    """model.transcribe with our settings. Returns (segment generator, info)."""
+    return model.transcribe(
+        str(audio_path),
         language="en",
         beam_size=5,
         word_timestamps=True,
@@ -1196,26 +1268,51 @@ def transcribe(video_path, model_size="small"):
         ),
     )
 
+
+def segment_to_dict(seg, offset=0.0):
+    """faster-whisper Segment → our segment dict, timestamps shifted by offset."""
+    words = []
+    if seg.words:
+        for w in seg.words:
+            words.append({
+                "word": w.word.strip(),
+                "start": round(w.start + offset, 2),
+                "end": round(w.end + offset, 2),
+                "probability": round(w.probability, 3),
+            })
+    return {
+        "start": round(seg.start + offset, 2),
+        "end": round(seg.end + offset, 2),
+        "text": seg.text.strip(),
+        "words": words,
+    }
+
+
+def transcribe(video_path, model_size="small", workers=1, threads=0, chunk_secs=CHUNK_SECONDS):
+    """Transcribe video using faster-whisper. Returns list of segments.
+
+    workers > 1 splits the audio into chunks at pauses and transcribes them
+    in parallel (see transcribe_chunked); threads = CPU threads per model.
+    """
+    if workers > 1:
+        segments = transcribe_chunked(video_path, model_size, workers, threads, chunk_secs)
+        if segments is not None:
+            return segments
+
+    print(f"  Loading faster-whisper model '{model_size}' (CPU)...")
+    model = load_whisper_model(model_size, threads)
+
+    duration = get_video_duration(video_path)
+    print(f"  Video duration: {duration / 60:.1f} minutes")
+    print(f"  Transcribing (with vocabulary hints)...")
+
+    segments_raw, info = run_whisper(model, video_path)
+
     segments = []
     word_count = 0
     for seg in segments_raw:
-        words = []
-        if seg.words:
-            for w in seg.words:
-                words.append({
-                    "word": w.word.strip(),
-                    "start": round(w.start, 2),
-                    "end": round(w.end, 2),
-                    "probability": round(w.probability, 3),
-                })
-                word_count += 1
-
-        segment = {
-            "start": round(seg.start, 2),
-            "end": round(seg.end, 2),
-            "text": seg.text.strip(),
-            "words": words,
-        }
+        segment = segment_to_dict(seg)
+        word_count += len(segment["words"])
         segments.append(segment)
 
         # Progress update every 50 segments
@@ -1229,6 +1326,94 @@ def transcribe(video_path, model_size="small"):
     return segments
 
 
+def plan_chunks(video_path, duration, chunk_secs=CHUNK_SECONDS, search_secs=CHUNK_SEARCH_SECONDS):
+    """Split [0, duration] into ~chunk_secs pieces, cutting in the middle of the
+    pause closest to each target (hard cut if there is no pause nearby).
+    Returns [(start, end), ...]."""
+    if chunk_secs <= 0:
+        raise ValueError(f"chunk_secs must be positive, got {chunk_secs}")
+    starts, ends = detect_silences(video_path, CHUNK_MIN_SILENCE, noise_threshold=-35)
+    pauses = [(s + e) / 2 for s, e in zip(starts, ends)]
+    cuts = [0.0]
+    target = chunk_secs
+    while target < duration - chunk_secs / 4:  # no tiny final chunk
+        nearby = [p for p in pauses if abs(p - target) <= search_secs and p > cuts[-1] + chunk_secs / 2]
+        cut = min(nearby, key=lambda p: abs(p - target)) if nearby else target
+        cuts.append(round(cut, 2))
+        target = cut + chunk_secs
+    cuts.append(duration)
+    return list(zip(cuts, cuts[1:]))
+
+
+# Per-process model for the chunk pool (loaded once by the initializer)
+_worker_model = None
+
+
+def _init_chunk_worker(model_size, threads):
+    global _worker_model
+    _worker_model = load_whisper_model(model_size, threads)
+
+
+def _transcribe_chunk(index, video_path, start, end, tmp_dir):
+    """Worker: cut [start, end) to 16 kHz mono WAV, transcribe, shift to the
+    original timeline. Returns (index, segments, language, probability)."""
+    wav = os.path.join(tmp_dir, f"chunk_{index:03d}.wav")
+    cmd = [
+        FFMPEG, "-y", "-v", "error",
+        "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}",
+        "-i", str(video_path),
+        "-vn", "-ac", "1", "-ar", "16000",
+        wav,
+    ]
+    subprocess.run(cmd, capture_output=True, text=True, timeout=600, check=True)
+    try:
+        segments_raw, info = run_whisper(_worker_model, wav)
+        segments = [segment_to_dict(seg, offset=start) for seg in segments_raw]
+    finally:
+        os.unlink(wav)
+    return index, segments, info.language, info.language_probability
+
+
+def transcribe_chunked(video_path, model_size, workers, threads=0, chunk_secs=CHUNK_SECONDS):
+    """Transcribe chunks (split at pauses) on a process pool, one model per
+    worker. Returns segments on the original timeline, or None when the video
+    is too short to be worth splitting."""
+    duration = get_video_duration(video_path)
+    if duration < chunk_secs * 1.5:
+        return None
+    chunks = plan_chunks(video_path, duration, chunk_secs)
+    workers = min(workers, len(chunks))
+    threads = threads or max(1, (os.cpu_count() or 1) // workers)
+    print(f"  Video duration: {duration / 60:.1f} minutes")
+    print(f"  Transcribing {len(chunks)} chunks on {workers} workers x {threads} threads "
+          f"('{model_size}', with vocabulary hints)...")
+
+    results = {}
+    languages = []
+    tmp_dir = tempfile.mkdtemp(prefix="chunks_")
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_chunk_worker,
+                                 initargs=(model_size, threads)) as pool:
+            futures = [pool.submit(_transcribe_chunk, i, str(video_path), start, end, tmp_dir)
+                       for i, (start, end) in enumerate(chunks)]
+            for fut in as_completed(futures):
+                index, segments, language, prob = fut.result()
+                results[index] = segments
+                languages.append((prob, language))
+                start, end = chunks[index]
+                print(f"    Chunk {index + 1}/{len(chunks)} [{format_timestamp(start)}-{format_timestamp(end)}]: "
+                      f"{len(segments)} segments ({len(results)}/{len(chunks)} done)")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    segments = [seg for i in range(len(chunks)) for seg in results[i]]
+    word_count = sum(len(s["words"]) for s in segments)
+    print(f"  Done: {len(segments)} segments, {word_count} words")
+    prob, language = max(languages)
+    print(f"  Language: {language} (probability {prob:.2f})")
+    return segments
+
+
 # ============================================================
 # QUALITY CONTROL
 # ============================================================
@@ -1673,6 +1858,129 @@ def save_outputs(segments, flagged, output_dir, video_path=None, do_clip=False):
                 print(f"    FAILED: {clip_name}")
 
 
+def fetch_video(ckpt, source_key, url):
+    """Download the recording into the checkpoint dir, or reuse the copy an
+    earlier run left there (an interrupted yt-dlp .part file is resumed)."""
+    video_path = ckpt.media("download", source_key)
+    if video_path:
+        print(f"  Using downloaded recording from checkpoint: {video_path.name}")
+        return video_path
+    video_path = ckpt.path_for("download", source_key, ".mkv")
+    if not download_video(url, video_path):
+        print("Download failed!")
+        sys.exit(1)
+    ckpt.mark("download", source_key, video_path, media=True)
+    size_mb = video_path.stat().st_size / (1024 * 1024)
+    print(f"  Downloaded: {size_mb:.0f}MB")
+    return video_path
+
+
+def transcribe_checkpointed(ckpt, stage, key, media_path, args, whisper_opts, denoise_dir, label):
+    """(Denoise and) transcribe one input, reusing its segments — or its
+    denoised audio — from an earlier run."""
+    segments = ckpt.load_json(stage, key)
+    if segments is not None:
+        print(f"\nStep 2: {label} transcript from checkpoint ({len(segments)} segments)")
+        return segments
+
+    audio = str(media_path)
+    if args.denoise:
+        audio_stage = "audio" + stage[len("segments"):]
+        audio_key = ckpt.key(audio_stage, key)
+        vocals = ckpt.media(audio_stage, audio_key)
+        if vocals is None:
+            print(f"\n  Denoising {label}...")
+            os.makedirs(denoise_dir, exist_ok=True)
+            vocals = denoise_audio(media_path, denoise_dir)
+            if vocals:
+                vocals = ckpt.adopt_media(audio_stage, audio_key, vocals)
+        if vocals:
+            audio = str(vocals)
+
+    print(f"\nStep 2: Transcribing {label} with faster-whisper ({args.model})...")
+    segments = transcribe(audio, model_size=args.model, **whisper_opts)
+    return ckpt.save_json(stage, key, segments)
+
+
+def transcribe_recording(video_path, output_dir, ckpt, source_key, raw_key, args, whisper_opts):
+    """Adjournment split + transcription of a whole recording.
+
+    Returns {segments, sections, duration}; each section's transcript is
+    checkpointed on its own, so a crash in section 3 keeps sections 1-2.
+    """
+    duration = get_video_duration(video_path)
+    all_segments = []
+    section_info = []
+    sections = None
+
+    if duration > 600:  # Only split videos longer than 10 minutes
+        sections_key = ckpt.key("sections", source_key)
+        sections = ckpt.load_json("sections", sections_key)
+        if sections is None:
+            print(f"\nStep 1b: Detecting adjournments...")
+            active_sections, adjournments = detect_adjournments(video_path)
+            sections = ckpt.save_json("sections", sections_key, [list(s) for s in active_sections])
+        else:
+            print(f"\nStep 1b: Adjournments from checkpoint ({len(sections)} section(s))")
+
+    if sections and len(sections) > 1:
+        stage_keys = {}
+        for i, (start, end) in enumerate(sections):
+            stage = f"segments_s{i + 1:02d}"
+            stage_keys[i + 1] = (stage, ckpt.key(stage, raw_key, start, end))
+        sections_dir = str(output_dir / "sections")
+        if all(ckpt.load_json(stage, key) is not None for stage, key in stage_keys.values()):
+            section_paths = [{"path": None, "start_offset": start, "end": end, "index": i + 1}
+                             for i, (start, end) in enumerate(sections)]
+        else:
+            print(f"\nStep 1c: Splitting into {len(sections)} sections...")
+            os.makedirs(sections_dir, exist_ok=True)
+            section_paths = split_video_sections(video_path, sections, sections_dir)
+
+        # Transcribe each section
+        for sec in section_paths:
+            stage, key = stage_keys[sec["index"]]
+            sec_segments = transcribe_checkpointed(
+                ckpt, stage, key, sec["path"], args, whisper_opts,
+                str(output_dir / f"denoise_s{sec['index']:02d}"), f"section {sec['index']}")
+
+            # Adjust timestamps to original video timeline
+            offset = sec["start_offset"]
+            for seg in sec_segments:
+                seg["start"] = round(seg["start"] + offset, 2)
+                seg["end"] = round(seg["end"] + offset, 2)
+                seg["section"] = sec["index"]
+                if seg.get("words"):
+                    for w in seg["words"]:
+                        w["start"] = round(w["start"] + offset, 2)
+                        w["end"] = round(w["end"] + offset, 2)
+
+            all_segments.extend(sec_segments)
+            section_info.append({
+                "index": sec["index"],
+                "start": sec["start_offset"],
+                "end": sec["end"],
+                "segments": len(sec_segments),
+            })
+
+        # Clean up section video files (keep transcripts, delete videos)
+        for sec in section_paths:
+            if sec["path"] and os.path.exists(sec["path"]):
+                os.unlink(sec["path"])
+        # Clean up sections dir if empty
+        try:
+            os.rmdir(sections_dir)
+        except OSError:
+            pass
+    else:
+        # Short video, no adjournments or single section — transcribe whole thing
+        all_segments = transcribe_checkpointed(
+            ckpt, "segments", ckpt.key("segments", raw_key), video_path, args, whisper_opts,
+            str(output_dir / "denoise"), "recording")
+
+    return {"segments": all_segments, "sections": section_info, "duration": duration}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Download and transcribe council meeting webcasts"
@@ -1692,17 +2000,29 @@ def main():
     parser.add_argument("--output", help="Output directory (default: /opt/transcripts/MEETING_ID)")
     parser.add_argument("--keep-video", action="store_true",
                         help="Keep downloaded video after transcription")
+    parser.add_argument("--fresh", action="store_true",
+                        help="Discard checkpoints from earlier runs and start from scratch")
     parser.add_argument("--no-llm", action="store_true",
                         help="Skip Tier 2 LLM analysis (keyword flagging only)")
     parser.add_argument("--council", default="lancashire_cc",
                         help="Council ID for political context (default: lancashire_cc)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Transcribe chunks on this many processes, one model each (default: 1)")
+    parser.add_argument("--threads", type=int, default=0,
+                        help="CPU threads per model (default: all cores / workers)")
+    parser.add_argument("--chunk-minutes", type=float, default=CHUNK_SECONDS / 60,
+                        help=f"Target chunk length with --workers (default: {CHUNK_SECONDS // 60})")
+    parser.add_argument("--ocr-workers", type=int, default=OCR_WORKERS,
+                        help=f"Concurrent tesseract calls for OCR speaker detection (default: {OCR_WORKERS})")
 
     args = parser.parse_args()
+    if args.chunk_minutes <= 0:
+        parser.error("--chunk-minutes must be positive")
 
-    # Resolve video source
+    # Resolve source — the video itself is only fetched when a stage needs it
     video_path = None
+    mediasite_url = None
     meeting_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    cleanup_video = False
 
     if args.file:
         video_path = Path(args.file)
@@ -1710,6 +2030,8 @@ def main():
             print(f"File not found: {video_path}")
             sys.exit(1)
         meeting_id = video_path.stem
+        st = video_path.stat()
+        source = ("file", str(video_path.resolve()), st.st_size, st.st_mtime_ns)
         print(f"\nTranscribing local file: {video_path}")
 
     else:
@@ -1727,136 +2049,74 @@ def main():
         pres_match = re.search(r'Play/([a-f0-9-]+)', mediasite_url)
         if pres_match:
             meeting_id = pres_match.group(1)[:12]
+        source = ("url", mediasite_url)
 
-        # Download
-        print(f"\nStep 1: Downloading meeting recording...")
-        video_path = Path(tempfile.mktemp(suffix=".mkv", prefix="meeting_"))
-        if not download_video(mediasite_url, video_path):
-            print("Download failed!")
-            sys.exit(1)
-        cleanup_video = not args.keep_video
-
-        size_mb = video_path.stat().st_size / (1024 * 1024)
-        print(f"  Downloaded: {size_mb:.0f}MB")
-
-    # Set output directory
+    # Set output directory; checkpoints from earlier runs live in output_dir/checkpoints
     output_dir = Path(args.output) if args.output else OUTPUT_DIR / meeting_id
-
-    # Detect adjournments and split into sections
-    duration = get_video_duration(video_path)
-    all_segments = []
-    section_info = []
-
-    if duration > 600:  # Only split videos longer than 10 minutes
-        print(f"\nStep 1b: Detecting adjournments...")
-        active_sections, adjournments = detect_adjournments(video_path)
-
-        if len(active_sections) > 1:
-            print(f"\nStep 1c: Splitting into {len(active_sections)} sections...")
-            sections_dir = str(output_dir / "sections")
-            os.makedirs(sections_dir, exist_ok=True)
-            section_paths = split_video_sections(video_path, active_sections, sections_dir)
-
-            # Transcribe each section
-            for sec in section_paths:
-                sec_input = sec["path"]
-
-                # Denoise section if requested
-                if args.denoise:
-                    print(f"\n  Denoising section {sec['index']}...")
-                    denoise_dir = str(output_dir / f"denoise_s{sec['index']:02d}")
-                    os.makedirs(denoise_dir, exist_ok=True)
-                    vocals = denoise_audio(sec_input, denoise_dir)
-                    if vocals:
-                        sec_input = vocals
-
-                print(f"\nStep 2: Transcribing section {sec['index']} ({args.model})...")
-                sec_segments = transcribe(sec_input, model_size=args.model)
-
-                # Adjust timestamps to original video timeline
-                offset = sec["start_offset"]
-                for seg in sec_segments:
-                    seg["start"] = round(seg["start"] + offset, 2)
-                    seg["end"] = round(seg["end"] + offset, 2)
-                    seg["section"] = sec["index"]
-                    if seg.get("words"):
-                        for w in seg["words"]:
-                            w["start"] = round(w["start"] + offset, 2)
-                            w["end"] = round(w["end"] + offset, 2)
-
-                all_segments.extend(sec_segments)
-                section_info.append({
-                    "index": sec["index"],
-                    "start": sec["start_offset"],
-                    "end": sec["end"],
-                    "segments": len(sec_segments),
-                })
-
-            # Clean up section video files (keep transcripts, delete videos)
-            for sec in section_paths:
-                if os.path.exists(sec["path"]):
-                    os.unlink(sec["path"])
-            # Clean up sections dir if empty
-            try:
-                os.rmdir(sections_dir)
-            except OSError:
-                pass
-
-        else:
-            # No adjournments or single section — transcribe whole thing
-            transcribe_input = str(video_path)
-            if args.denoise:
-                print(f"\nStep 1b: Denoising audio...")
-                denoise_dir = str(output_dir / "denoise")
-                os.makedirs(denoise_dir, exist_ok=True)
-                vocals = denoise_audio(video_path, denoise_dir)
-                if vocals:
-                    transcribe_input = vocals
-            print(f"\nStep 2: Transcribing with faster-whisper ({args.model})...")
-            all_segments = transcribe(transcribe_input, model_size=args.model)
+    ckpt = Checkpoints(output_dir, fresh=args.fresh)
+    source_key = ckpt.key(*source)
+    whisper_opts = dict(workers=args.workers, threads=args.threads, chunk_secs=args.chunk_minutes * 60)
+    if ckpt.stages:
+        print(f"\nResuming from checkpoints: {', '.join(ckpt.stages)}")
+
+    # Steps 1-2: download, adjournments, (denoise), transcribe
+    raw_key = ckpt.key("raw", source_key, args.model, args.denoise)
+    raw = ckpt.load_json("raw", raw_key)
+    if raw is None:
+        if video_path is None:
+            print(f"\nStep 1: Downloading meeting recording...")
+            video_path = fetch_video(ckpt, source_key, mediasite_url)
+        raw = ckpt.save_json("raw", raw_key, transcribe_recording(
+            video_path, output_dir, ckpt, source_key, raw_key, args, whisper_opts))
     else:
-        # Short video — transcribe directly
-        transcribe_input = str(video_path)
-        if args.denoise:
-            print(f"\nStep 1b: Denoising audio...")
-            denoise_dir = str(output_dir / "denoise")
-            os.makedirs(denoise_dir, exist_ok=True)
-            vocals = denoise_audio(video_path, denoise_dir)
-            if vocals:
-                transcribe_input = vocals
-        print(f"\nStep 2: Transcribing with faster-whisper ({args.model})...")
-        all_segments = transcribe(transcribe_input, model_size=args.model)
+        print(f"\nStep 1-2: Raw transcript from checkpoint ({len(raw['segments'])} segments)")
+    section_info = raw["sections"]
+    duration = raw["duration"]
 
     # Post-process: punctuation, capitalisation, proper nouns
-    print(f"\nStep 2b: Post-processing (grammar, proper nouns)...")
-    all_segments = post_process_transcript(all_segments)
+    post_key = ckpt.key("postprocessed", ckpt.sha("raw"))
+    all_segments = ckpt.load_json("postprocessed", post_key)
+    if all_segments is None:
+        print(f"\nStep 2b: Post-processing (grammar, proper nouns)...")
+        all_segments = ckpt.save_json("postprocessed", post_key, post_process_transcript(raw["segments"]))
+    else:
+        print(f"\nStep 2b: Post-processed transcript from checkpoint")
 
     # Quality control
     print(f"\nStep 2c: Quality control...")
     all_segments, qc_report = qc_transcript(all_segments)
 
     # OCR speaker detection from video name overlay
-    if video_path and os.path.exists(video_path):
-        print(f"\nStep 2d: OCR speaker detection...")
-        councillors_path = None
-        if args.council:
-            # Try to find councillors.json for name verification
-            for search_dir in [
-                Path(__file__).parent.parent / "data" / args.council,
-                Path("/root/aidoge/burnley-council/data") / args.council,
-            ]:
-                candidate = search_dir / "councillors.json"
-                if candidate.exists():
-                    councillors_path = str(candidate)
-                    break
-        ocr_timeline = ocr_speaker_detection(
-            video_path, interval=3, councillors_json=councillors_path
-        )
+    councillors_path = None
+    if args.council:
+        # Try to find councillors.json for name verification
+        for search_dir in [
+            Path(__file__).parent.parent / "data" / args.council,
+            Path("/root/aidoge/burnley-council/data") / args.council,
+        ]:
+            candidate = search_dir / "councillors.json"
+            if candidate.exists():
+                councillors_path = str(candidate)
+                break
+    ocr_key = ckpt.key("ocr", source_key, 3, file_sha256(councillors_path) if councillors_path else None)
+    ocr_timeline = ckpt.load_json("ocr", ocr_key)
+    if ocr_timeline is not None:
+        print(f"\nStep 2d: OCR timeline from checkpoint ({len(ocr_timeline)} speaker changes)")
+    else:
+        if video_path is None and mediasite_url:
+            print(f"\nStep 2d: Fetching recording for OCR...")
+            video_path = fetch_video(ckpt, source_key, mediasite_url)
+        if video_path and os.path.exists(video_path):
+            print(f"\nStep 2d: OCR speaker detection...")
+            ocr_timeline = ckpt.save_json("ocr", ocr_key, ocr_speaker_detection(
+                video_path, interval=3, councillors_json=councillors_path, workers=args.ocr_workers
+            ))
+        else:
+            print(f"\n  Skipping OCR (no video file available)")
+    if ocr_timeline is not None:
         all_segments = merge_speaker_sources(
             all_segments, ocr_timeline, qc_report.get("speakers_detected", [])
         )
-    else:
-        print(f"\n  Skipping OCR (no video file available)")
 
     # Flag keywords (Tier 1)
     print(f"\nStep 3a: Tier 1 keyword flagging...")
@@ -1866,11 +2126,15 @@ def main():
     # LLM analysis (Tier 2) — only on Tier 1 hits to save tokens
     if flagged and not args.no_llm:
         print(f"\nStep 3b: Tier 2 LLM contextual analysis ({args.council})...")
-        flagged = tier2_llm_analysis(flagged, all_segments=all_segments, council_id=args.council)
+        batch_store = ckpt.batches("tier2", ckpt.key("tier2", source_key))
+        flagged = tier2_llm_analysis(flagged, all_segments=all_segments, council_id=args.council,
+                                     batch_store=batch_store)
     elif args.no_llm:
         print(f"\n  Skipping Tier 2 (--no-llm)")
 
     # Save outputs
+    if args.clip and video_path is None:
+        video_path = fetch_video(ckpt, source_key, mediasite_url)
     print(f"\nStep 4: Saving outputs to {output_dir}")
     save_outputs(all_segments, flagged, output_dir, video_path, do_clip=args.clip)
 
@@ -1886,10 +2150,15 @@ def main():
         with open(sec_path, "w") as f:
             json.dump(section_info, f, indent=2)
 
-    # Cleanup video files (keep only transcripts + clips)
-    if cleanup_video and video_path and video_path.exists():
-        video_path.unlink()
-        print(f"\n  Cleaned up video file ({duration/60:.0f} min video deleted, transcripts kept)")
+    outputs_key = ckpt.key("outputs", ckpt.sha("postprocessed"), ckpt.sha("ocr") if ocr_timeline is not None else None,
+                           ckpt.sha("tier2") if flagged and not args.no_llm else None, args.council, args.no_llm)
+    ckpt.mark("outputs", outputs_key, model=args.model, council=args.council, flagged=len(flagged),
+              llm=sum(1 for m in flagged if m.get("llm")))
+
+    # Cleanup downloaded video + denoised audio (keep only transcripts, clips, JSON checkpoints)
+    freed = ckpt.discard_media(keep=("download",) if args.keep_video else ())
+    if freed:
+        print(f"\n  Cleaned up media ({duration/60:.0f} min recording, {freed / (1024 * 1024):.0f}MB deleted, transcripts kept)")
 
     # Clean up denoise intermediates
     for d in output_dir.glob("denoise*"):
@@ -34,6 +34,9 @@ from urllib.parse import quote
 
 import requests
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from name_index import NameIndex
+
 # ─── Configuration ────────────────────────────────────────────────────────────
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -205,9 +208,18 @@ def normalise_name(name):
     return name
 
 
-def match_supplier(name, all_suppliers, threshold=0.75):
+def build_supplier_index(all_suppliers):
+    """Token index over normalised supplier names for match_supplier()."""
+    index = NameIndex(tokenize=str.split)
+    for sname in all_suppliers:
+        index.add(sname, sname)
+    return index
+
+
+def match_supplier(name, all_suppliers, threshold=0.75, index=None):
     """Match a company/employer name against all council suppliers.
-    Returns best match or None.
+    Returns best match or None. Pass index=build_supplier_index(all_suppliers)
+    when matching many names — only suppliers sharing rare tokens are scored.
     """
     if not name:
         return None
@@ -233,17 +245,15 @@ def match_supplier(name, all_suppliers, threshold=0.75):
         # Single-word names: require exact match only
         return None
 
+    if index is None:
+        index = build_supplier_index(all_suppliers)
+
     best_match = None
     best_score = 0
-    for sname, sdata in all_suppliers.items():
-        s_tokens = set(sname.split())
-        if not s_tokens:
-            continue
-        overlap = len(norm_tokens & s_tokens)
-        union = len(norm_tokens | s_tokens)
-        jaccard = overlap / union if union else 0
-        if jaccard > best_score and jaccard >= threshold:
+    for sname, jaccard in index.jaccard_matches(norm_tokens, threshold):
+        if jaccard > best_score:
             best_score = jaccard
+            sdata = all_suppliers[sname]
             total = sum(sdata["councils"].values())
             best_match = {
                 "matched_name": sdata["original_names"][0],
@@ -541,17 +551,19 @@ def extract_entities(interests):
 
 # ─── Cross-Reference Engine ──────────────────────────────────────────────────
 
-def cross_reference_mp(mp_data, all_suppliers, skip_ch=False):
+def cross_reference_mp(mp_data, all_suppliers, skip_ch=False, supplier_index=None):
     """Cross-reference an MP's declared interests against council suppliers and CH."""
     findings = []
     ch_lookups = []
+    if supplier_index is None:
+        supplier_index = build_supplier_index(all_suppliers)
 
     entities = mp_data["entities"]
     mp_name = mp_data["mp_name"]
 
     # 1. Match declared companies against council suppliers
     for company in entities["companies"]:
-        match = match_supplier(company, all_suppliers)
+        match = match_supplier(company, all_suppliers, index=supplier_index)
         if match:
             findings.append({
                 "type": "mp_company_is_supplier",
@@ -582,7 +594,7 @@ def cross_reference_mp(mp_data, all_suppliers, skip_ch=False):
 
     # 2. Match donors against council suppliers
     for donor in entities["donors"]:
-        match = match_supplier(donor, all_suppliers)
+        match = match_supplier(donor, all_suppliers, index=supplier_index)
         if match:
             findings.append({
                 "type": "mp_donor_is_supplier",
@@ -599,7 +611,7 @@ def cross_reference_mp(mp_data, all_suppliers, skip_ch=False):
 
     # 3. Match employers against council suppliers
     for employer in entities["employers"]:
-        match = match_supplier(employer, all_suppliers)
+        match = match_supplier(employer, all_suppliers, index=supplier_index)
         if match:
             findings.append({
                 "type": "mp_employer_is_supplier",
@@ -646,6 +658,7 @@ def main():
     # Load all supplier data for cross-referencing
     print("Loading supplier data from all 17 bodies...")
     all_suppliers = load_all_suppliers()
+    supplier_index = build_supplier_index(all_suppliers)
     print(f"  {len(all_suppliers)} unique suppliers loaded")
 
     # Process each MP
@@ -703,7 +716,7 @@ def main():
         }
 
         # Cross-reference against suppliers
-        findings, ch_lookups = cross_reference_mp(mp_data, all_suppliers, args.skip_ch)
+        findings, ch_lookups = cross_reference_mp(mp_data, all_suppliers, args.skip_ch, supplier_index)
         total_findings += len(findings)
 
         if findings:
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+name_index.py — Blocking index for supplier / company name matching
+
+Fuzzy matching a name against a large universe of names (all council
+suppliers, a council's property assets, ...) used to score every pair. The
+index keeps:
+
+  - an inverted token index (token → positions), queried with prefix
+    filtering: a name can only reach Jaccard ≥ t with the query if it shares
+    at least one of the query's rarest |Q| - ceil(t·|Q|) + 1 tokens, so only
+    those postings are probed and exact Jaccard runs on the short list. The
+    same filter serves overlap_matches (|Q ∩ S| / max(|Q|, |S|) ≥ t).
+  - an optional character n-gram index (ngram=3) for "text appears inside
+    the name" checks: a name can only contain the text if it has all of the
+    text's n-grams.
+
+Both filters are exact — they never drop a name that would have passed the
+full pairwise comparison — and results come back in insertion order so
+"first best match wins" tie-breaks stay the same as a linear scan.
+
+For comparing against a handful of strings (e.g. one Companies House search
+page) use sequence_ratio(): SequenceMatcher's cheap upper bounds reject most
+pairs before the full ratio is computed.
+
+Usage:
+    from name_index import NameIndex
+    index = NameIndex(tokenize=str.split)
+    for name in suppliers:
+        index.add(name, name)
+    for name, score in index.jaccard_matches("ACME BUILDING SERVICES", 0.75):
+        ...
+"""
+
+import math
+import re
+from difflib import SequenceMatcher
+
+
+def word_tokens(name):
+    """Upper-cased word tokens of a name (punctuation dropped)."""
+    return re.findall(r"\w+", (name or "").upper())
+
+
+def ngrams(text, n):
+    """Set of character n-grams of text (empty when shorter than n)."""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def jaccard(a, b):
+    """Jaccard similarity of two token sets (0.0 when either is empty)."""
+    if not a or not b:
+        return 0.0
+    overlap = len(a & b)
+    return overlap / (len(a) + len(b) - overlap)
+
+
+def sequence_ratio(a, b, threshold=0.0):
+    """SequenceMatcher(None, a, b).ratio(), or 0.0 when it is below threshold.
+
+    real_quick_ratio() and quick_ratio() are upper bounds on ratio(), so most
+    non-matching pairs are rejected without the full (quadratic) comparison.
+    """
+    sm = SequenceMatcher(None, a, b)
+    if threshold > 0 and (sm.real_quick_ratio() < threshold or sm.quick_ratio() < threshold):
+        return 0.0
+    ratio = sm.ratio()
+    return ratio if ratio >= threshold else 0.0
+
+
+class NameIndex:
+    """Inverted token index (+ optional character n-gram index) over names."""
+
+    def __init__(self, tokenize=word_tokens, ngram=0):
+        self.tokenize = tokenize
+        self.ngram = ngram
+        self.keys = []
+        self.token_sets = []
+        self.texts = []
+        self.postings = {}
+        self.gram_postings = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, key, name):
+        """Index one name under key (keys may repeat; each add is one entry)."""
+        pos = len(self.keys)
+        tokens = frozenset(self.tokenize(name or ""))
+        self.keys.append(key)
+        self.token_sets.append(tokens)
+        for token in tokens:
+            self.postings.setdefault(token, []).append(pos)
+        if self.ngram:
+            text = (name or "").lower()
+            self.texts.append(text)
+            for gram in ngrams(text, self.ngram):
+                self.gram_postings.setdefault(gram, []).append(pos)
+        return pos
+
+    def tokens_of(self, name):
+        return frozenset(self.tokenize(name or ""))
+
+    def jaccard_matches(self, query, threshold):
+        """[(key, jaccard)] for every indexed name with Jaccard ≥ threshold
+        (threshold > 0) against query (a name or a token set), in insertion order."""
+        q = query if isinstance(query, (set, frozenset)) else self.tokens_of(query)
+        if not q or threshold <= 0:
+            return []
+        min_overlap = max(1, math.ceil(threshold * len(q) - 1e-9))
+        max_len = len(q) / threshold + 1e-9
+        # Probe only the rarest tokens: any name reaching min_overlap shares one of them
+        probe = sorted(q, key=lambda t: (len(self.postings.get(t, ())), t))[:len(q) - min_overlap + 1]
+        seen = set()
+        for token in probe:
+            seen.update(self.postings.get(token, ()))
+        out = []
+        for pos in sorted(seen):
+            tokens = self.token_sets[pos]
+            if len(tokens) > max_len:
+                continue
+            score = jaccard(q, tokens)
+            if score >= threshold:
+                out.append((self.keys[pos], score))
+        return out
+
+    def overlap_matches(self, query, threshold):
+        """[(key, overlap)] for every indexed name where shared tokens over the
+        larger token count, |Q ∩ S| / max(|Q|, |S|), is ≥ threshold (> 0), in
+        insertion order. Same prefix filter as jaccard_matches: a match shares
+        at least ceil(threshold·|Q|) tokens with the query."""
+        q = query if isinstance(query, (set, frozenset)) else self.tokens_of(query)
+        if not q or threshold <= 0:
+            return []
+        min_overlap = max(1, math.ceil(threshold * len(q) - 1e-9))
+        max_len = len(q) / threshold + 1e-9
+        probe = sorted(q, key=lambda t: (len(self.postings.get(t, ())), t))[:len(q) - min_overlap + 1]
+        seen = set()
+        for token in probe:
+            seen.update(self.postings.get(token, ()))
+        out = []
+        for pos in sorted(seen):
+            tokens = self.token_sets[pos]
+            if len(tokens) > max_len:
+                continue
+            score = len(q & tokens) / max(len(q), len(tokens))
+            if score >= threshold:
+                out.append((self.keys[pos], score))
+        return out
+
+    def token_candidates(self, query, min_shared=1):
+        """[(key, shared token count)] for names sharing ≥ min_shared tokens, in insertion order."""
+        q = query if isinstance(query, (set, frozenset)) else self.tokens_of(query)
+        counts = {}
+        for token in q:
+            for pos in self.postings.get(token, ()):
+                counts[pos] = counts.get(pos, 0) + 1
+        return [(self.keys[pos], n) for pos, n in sorted(counts.items()) if n >= min_shared]
+
+    def containing(self, text):
+        """Keys whose lower-cased name contains text.lower(), in insertion order.
+        Needs ngram > 0; texts shorter than the n-gram size fall back to a scan."""
+        if not self.ngram:
+            raise ValueError("NameIndex built without ngram=...; substring lookups need it")
+        text = (text or "").lower()
+        grams = ngrams(text, self.ngram)
+        if grams:
+            lists = sorted((self.gram_postings.get(g, ()) for g in grams), key=len)
+            positions = set(lists[0])
+            for plist in lists[1:]:
+                if not positions:
+                    break
+                positions.intersection_update(plist)
+            positions = sorted(positions)
+        else:
+            positions = range(len(self.keys))
+        return [self.keys[pos] for pos in positions if text in self.texts[pos]]
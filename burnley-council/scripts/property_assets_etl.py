@@ -26,7 +26,11 @@ try:
     HAS_SHAPELY = True
 except ImportError:
     HAS_SHAPELY = False
-    print("WARNING: shapely not installed — CED mapping will be skipped")
+    print("WARNING: shapely not installed — CED mapping uses the pure-python grid index")
+
+# Spatial indexes (STRtree / grid polygons, k-d tree points)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from spatial_index import PolygonIndex, PointIndex
 
 # --- Configuration ---
 SCRIPT_DIR = Path(__file__).parent
@@ -177,9 +181,7 @@ def read_csv(path):
 
 
 def build_ced_lookup(ward_boundaries_path):
-    """Build CED polygons from ward_boundaries.json for point-in-polygon."""
-    if not HAS_SHAPELY:
-        return None
+    """Build a spatial index of CED polygons from ward_boundaries.json."""
     if not os.path.exists(ward_boundaries_path):
         print(f"  WARNING: Ward boundaries not found: {ward_boundaries_path}")
         return None
@@ -194,6 +196,9 @@ def build_ced_lookup(ward_boundaries_path):
         geom = feature.get('geometry')
         if not geom or not name:
             continue
+        if not HAS_SHAPELY:
+            polygons.append((name, geom))
+            continue
         try:
             poly = shape(geom)
             if poly.is_valid:
@@ -201,32 +206,29 @@ def build_ced_lookup(ward_boundaries_path):
         except Exception as e:
             print(f"  WARNING: Invalid geometry for {name}: {e}")
     print(f"  Loaded {len(polygons)} CED polygons")
-    return polygons
+    return PolygonIndex(polygons)
+
 
+# ~0.005 degrees ≈ ~500m: snap points just outside every CED to the nearest one
+CED_SNAP_DISTANCE = 0.005
 
-def find_ced(lat, lng, ced_polygons):
+
+def find_ceds(coords, ced_index):
+    """Batch CED lookup for [(lat, lng), ...]: the containing CED, else the
+    nearest CED within CED_SNAP_DISTANCE, else ''."""
+    if not ced_index:
+        return [''] * len(coords)
+    return ced_index.locate([(float(lng), float(lat)) for lat, lng in coords], CED_SNAP_DISTANCE)
+
+
+def find_ced(lat, lng, ced_index):
     """Find which CED a point falls in."""
-    if not ced_polygons or not lat or not lng:
+    if not ced_index or not lat or not lng:
         return ''
     try:
-        pt = Point(float(lng), float(lat))
-        for name, poly in ced_polygons:
-            if poly.contains(pt):
-                return name
-        # Fallback: nearest polygon within 500m
-        min_dist = float('inf')
-        nearest = ''
-        for name, poly in ced_polygons:
-            d = poly.distance(pt)
-            if d < min_dist:
-                min_dist = d
-                nearest = name
-        # ~0.005 degrees ≈ ~500m
-        if min_dist < 0.005:
-            return nearest
+        return find_ceds([(lat, lng)], ced_index)[0]
     except Exception:
-        pass
-    return ''
+        return ''
 
 
 def load_facility_enrichment(council_dir):
@@ -403,23 +405,18 @@ LANCASHIRE_FIRE_STATIONS = [
 ]
 
 
+_fire_station_index = None
+
+
 def compute_fire_proximity(lat, lng):
     """Compute distance to nearest LFRS fire station in km (Haversine)."""
-    import math
+    global _fire_station_index
     if not lat or not lng:
         return None, None
-    min_dist = float('inf')
-    nearest_name = None
-    for name, slat, slng in LANCASHIRE_FIRE_STATIONS:
-        R = 6371
-        dLat = math.radians(slat - lat)
-        dLng = math.radians(slng - lng)
-        a = math.sin(dLat/2)**2 + math.cos(math.radians(lat)) * math.cos(math.radians(slat)) * math.sin(dLng/2)**2
-        d = 2 * R * math.asin(math.sqrt(min(1, a)))
-        if d < min_dist:
-            min_dist = d
-            nearest_name = name
-    return round(min_dist, 2), nearest_name
+    if _fire_station_index is None:
+        _fire_station_index = PointIndex([(slat, slng) for _, slat, slng in LANCASHIRE_FIRE_STATIONS])
+    name, slat, slng = LANCASHIRE_FIRE_STATIONS[_fire_station_index.nearest(lat, lng)]
+    return round(_haversine_m(lat, lng, slat, slng) / 1000, 2), name
 
 
 # ── Live Enrichment Engine ───────────────────────────────────────────────────
@@ -725,6 +722,7 @@ def enrich_listed_buildings(primary_rows, listed_buildings, radius_m=200):
 
     print(f"  --- Listed buildings enrichment (radius={radius_m}m) ---")
     enriched = 0
+    lb_index = PointIndex([(lb['lat'], lb['lng']) for lb in listed_buildings])
 
     for row in primary_rows:
         lat = safe_float(row.get('latitude_wgs84'))
@@ -733,15 +731,13 @@ def enrich_listed_buildings(primary_rows, listed_buildings, radius_m=200):
             continue
 
         # Find closest listed building and all within radius
-        closest_dist = float('inf')
-        closest = None
+        closest = listed_buildings[lb_index.nearest(lat, lng)]
+        closest_dist = _haversine_m(lat, lng, closest['lat'], closest['lng'])
         within_radius = []
 
-        for lb in listed_buildings:
+        for i in lb_index.within(lat, lng, radius_m / 1000):
+            lb = listed_buildings[i]
             d = _haversine_m(lat, lng, lb['lat'], lb['lng'])
-            if d < closest_dist:
-                closest_dist = d
-                closest = lb
             if d <= radius_m:
                 within_radius.append({**lb, 'distance_m': round(d)})
 
@@ -3560,13 +3556,15 @@ def main():
         lat = safe_float(row.get('latitude_wgs84'))
         lng = safe_float(row.get('longitude_wgs84'))
         if lat and lng and ced_polygons:
-            cache_key = f"{round(lat, 5)},{round(lng, 5)}"
-            if cache_key in ced_cache:
-                row['_ced'] = ced_cache[cache_key]
-            else:
-                ced = find_ced(lat, lng, ced_polygons)
-                row['_ced'] = ced
-                ced_cache[cache_key] = ced
+            ced_cache.setdefault(f"{round(lat, 5)},{round(lng, 5)}", (lat, lng))
+    # One batch spatial query for every distinct location
+    keys = list(ced_cache)
+    ced_cache = dict(zip(keys, find_ceds([ced_cache[k] for k in keys], ced_polygons)))
+    for aid, row in primary_by_id.items():
+        lat = safe_float(row.get('latitude_wgs84'))
+        lng = safe_float(row.get('longitude_wgs84'))
+        if lat and lng and ced_polygons:
+            row['_ced'] = ced_cache[f"{round(lat, 5)},{round(lng, 5)}"]
             if row['_ced']:
                 ced_mapped += 1
         else:
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+spatial_index.py — Spatial indexes for property_assets_etl.py
+
+PolygonIndex answers "which polygon is this point in" (CED mapping, SSSI/AONB
+checks) for many points at once. With shapely >= 2.0 it is an STRtree over
+prepared geometries; without shapely it falls back to a uniform grid over
+the GeoJSON rings with ray casting, so CED mapping no longer needs shapely.
+
+PointIndex is a small k-d tree over lat/lng points (fire stations, listed
+buildings) on the unit sphere, so nearest / within-radius queries visit
+O(log n) points instead of all of them. Chord length is monotonic in
+great-circle distance, so the nearest point is the same one the Haversine
+linear scan would pick; callers re-measure hits with their own Haversine.
+
+Both keep linear-scan semantics: among several matching polygons the first
+in input order wins, and "nearest" ties go to the lower index.
+
+Usage:
+    from spatial_index import PolygonIndex, PointIndex
+    ceds = PolygonIndex([(name, geojson_geometry_or_shapely_geom), ...])
+    names = ceds.locate([(lng, lat), ...], max_distance=0.005)
+    stations = PointIndex([(lat, lng), ...])
+    i = stations.nearest(lat, lng)
+"""
+
+import math
+
+try:
+    import numpy as np
+    import shapely
+    from shapely.geometry import shape
+    from shapely.strtree import STRtree
+    HAS_STRTREE = hasattr(STRtree, "query_nearest")  # shapely >= 2.0
+except ImportError:
+    HAS_STRTREE = False
+
+EARTH_RADIUS_KM = 6371.0
+
+
+# ── Pure-python polygon helpers (GeoJSON coordinates, planar degrees) ──
+
+def _geojson_polygons(geom):
+    """GeoJSON Polygon/MultiPolygon → list of polygons, each a list of rings."""
+    kind = geom.get("type")
+    coords = geom.get("coordinates") or []
+    if kind == "Polygon":
+        return [coords]
+    if kind == "MultiPolygon":
+        return list(coords)
+    return []
+
+
+def _ring_crossings(x, y, ring):
+    inside = False
+    n = len(ring)
+    for i in range(n):
+        x1, y1 = ring[i][0], ring[i][1]
+        x2, y2 = ring[i - 1][0], ring[i - 1][1]
+        if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+            inside = not inside
+    return inside
+
+
+def _segment_distance(x, y, x1, y1, x2, y2):
+    dx, dy = x2 - x1, y2 - y1
+    if dx == 0 and dy == 0:
+        return math.hypot(x - x1, y - y1)
+    t = max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)))
+    return math.hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+
+class _GridPolygon:
+    """Rings + bbox for one (multi)polygon."""
+
+    def __init__(self, geom):
+        # shapely geometries (e.g. shapely 1.x, no query_nearest) expose GeoJSON too
+        self.polygons = _geojson_polygons(getattr(geom, "__geo_interface__", geom))
+        xs = [p[0] for poly in self.polygons for ring in poly for p in ring]
+        ys = [p[1] for poly in self.polygons for ring in poly for p in ring]
+        self.bounds = (min(xs), min(ys), max(xs), max(ys)) if xs else None
+
+    def contains(self, x, y):
+        b = self.bounds
+        if not b or not (b[0] <= x <= b[2] and b[1] <= y <= b[3]):
+            return False
+        for rings in self.polygons:
+            # Even-odd over exterior + holes: inside the shell and outside every hole
+            inside = False
+            for ring in rings:
+                if _ring_crossings(x, y, ring):
+                    inside = not inside
+            if inside:
+                return True
+        return False
+
+    def distance(self, x, y):
+        if self.contains(x, y):
+            return 0.0
+        best = float("inf")
+        for rings in self.polygons:
+            for ring in rings:
+                for i in range(1, len(ring)):
+                    d = _segment_distance(x, y, ring[i - 1][0], ring[i - 1][1], ring[i][0], ring[i][1])
+                    if d < best:
+                        best = d
+        return best
+
+
+class PolygonIndex:
+    """Named polygons with batch point-in-polygon and nearest-within lookups."""
+
+    def __init__(self, named_geoms, cell_size=0.02):
+        self.names = [name for name, _ in named_geoms]
+        geoms = [g for _, g in named_geoms]
+        self.use_strtree = HAS_STRTREE
+        if self.use_strtree:
+            self.geoms = np.array([g if hasattr(g, "geom_type") else shape(g) for g in geoms], dtype=object)
+            shapely.prepare(self.geoms)
+            self.tree = STRtree(self.geoms)
+        else:
+            self.geoms = [_GridPolygon(g) for g in geoms]
+            self.cell = cell_size
+            self.grid = {}
+            for i, poly in enumerate(self.geoms):
+                if poly.bounds:
+                    for key in self._cells(poly.bounds):
+                        self.grid.setdefault(key, []).append(i)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _cells(self, bounds):
+        x0, y0 = int(math.floor(bounds[0] / self.cell)), int(math.floor(bounds[1] / self.cell))
+        x1, y1 = int(math.floor(bounds[2] / self.cell)), int(math.floor(bounds[3] / self.cell))
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def _grid_candidates(self, x, y, radius=0.0):
+        found = set()
+        for key in self._cells((x - radius, y - radius, x + radius, y + radius)):
+            found.update(self.grid.get(key, ()))
+        return sorted(found)
+
+    def locate(self, points, max_distance=0.0):
+        """Name of the polygon containing each (x, y) point — the first one in
+        input order — else of the nearest polygon closer than max_distance,
+        else ''. Returns a list parallel to points."""
+        points = list(points)
+        if not points or not self.names:
+            return [""] * len(points)
+        if self.use_strtree:
+            return self._locate_strtree(points, max_distance)
+        out = []
+        for x, y in points:
+            hit = next((i for i in self._grid_candidates(x, y) if self.geoms[i].contains(x, y)), None)
+            if hit is None and max_distance > 0:
+                best = max_distance
+                for i in self._grid_candidates(x, y, max_distance):
+                    d = self.geoms[i].distance(x, y)
+                    if d < best:
+                        best, hit = d, i
+            out.append(self.names[hit] if hit is not None else "")
+        return out
+
+    def _locate_strtree(self, points, max_distance):
+        pts = shapely.points(np.asarray(points, dtype=float))
+        hit = [None] * len(points)
+        inp, idx = self.tree.query(pts)
+        if len(inp):
+            mask = shapely.contains(self.geoms[idx], pts[inp])
+            for i, t in zip(inp[mask].tolist(), idx[mask].tolist()):
+                if hit[i] is None or t < hit[i]:
+                    hit[i] = t
+        missing = [i for i, h in enumerate(hit) if h is None]
+        if missing and max_distance > 0:
+            (inp, idx), dist = self.tree.query_nearest(
+                pts[missing], max_distance=max_distance, return_distance=True, all_matches=True)
+            best = {}
+            for j, t, d in zip(inp.tolist(), idx.tolist(), dist.tolist()):
+                if d < max_distance and (j not in best or (d, t) < best[j]):
+                    best[j] = (d, t)
+            for j, (_, t) in best.items():
+                hit[missing[j]] = t
+        return [self.names[h] if h is not None else "" for h in hit]
+
+    def first_intersecting(self, geoms):
+        """For each shapely geometry, the name of the first indexed polygon it
+        intersects, or ''. Needs the STRtree backend (shapely >= 2.0)."""
+        geoms = np.asarray(list(geoms), dtype=object)
+        hit = [None] * len(geoms)
+        if len(geoms) and self.names:
+            inp, idx = self.tree.query(geoms, predicate="intersects")
+            for i, t in zip(inp.tolist(), idx.tolist()):
+                if hit[i] is None or t < hit[i]:
+                    hit[i] = t
+        return [self.names[h] if h is not None else "" for h in hit]
+
+
+# ── Points on the sphere: k-d tree over unit vectors ──
+
+def _unit_vector(lat, lng):
+    la, lo = math.radians(lat), math.radians(lng)
+    return (math.cos(la) * math.cos(lo), math.cos(la) * math.sin(lo), math.sin(la))
+
+
+def _chord2(a, b):
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+class PointIndex:
+    """k-d tree over (lat, lng) points for nearest and within-radius queries."""
+
+    def __init__(self, points):
+        self.vectors = [_unit_vector(lat, lng) for lat, lng in points]
+        self.root = self._build(list(range(len(self.vectors))), 0)
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def _build(self, idx, depth):
+        if not idx:
+            return None
+        axis = depth % 3
+        idx.sort(key=lambda i: self.vectors[i][axis])
+        mid = len(idx) // 2
+        return (idx[mid], axis, self._build(idx[:mid], depth + 1), self._build(idx[mid + 1:], depth + 1))
+
+    def nearest(self, lat, lng):
+        """Index of the closest point (lowest index on ties), or None when empty."""
+        q = _unit_vector(lat, lng)
+        best_d, best_i = float("inf"), None
+        stack = [(self.root, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if node is None or bound > best_d:
+                continue
+            i, axis, left, right = node
+            d = _chord2(q, self.vectors[i])
+            if d < best_d or (d == best_d and i < best_i):
+                best_d, best_i = d, i
+            diff = q[axis] - self.vectors[i][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append((far, diff * diff))
+            stack.append((near, 0.0))
+        return best_i
+
+    def within(self, lat, lng, radius_km, slack=1e-6):
+        """Indices (ascending) of points within radius_km great-circle distance.
+        Slightly inclusive (slack) — callers re-check with their own Haversine."""
+        q = _unit_vector(lat, lng)
+        chord = 2 * math.sin(min(math.pi, radius_km / EARTH_RADIUS_KM) / 2) + slack
+        limit = chord * chord
+        out = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            i, axis, left, right = node
+            if _chord2(q, self.vectors[i]) <= limit:
+                out.append(i)
+            diff = q[axis] - self.vectors[i][axis]
+            if diff <= chord:
+                stack.append(left)
+            if -diff <= chord:
+                stack.append(right)
+        return sorted(out)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+spending_store.py — Typed columnar spending store for AI DOGE
+
+council_etl.export_council() writes a NumPy .npy bundle per council next to
+spending.json so doge_analysis.py can memory-map the numeric columns instead
+of json.load-ing a multi-MB file and walking Python dicts for every pass.
+
+Layout (data/{council}/spending_columns/):
+    columns.json             meta + dictionaries for the encoded columns
+    amount.npy               float64, pounds (as in spending.json)
+    date_ordinal.npy         int32, date.toordinal() — 0 = missing/invalid date
+    supplier_canonical.npy   int32 codes into dictionaries["supplier_canonical"]
+    department.npy           int32 codes into dictionaries["department"]
+    financial_year.npy       int32 codes into dictionaries["financial_year"]
+
+Row order matches the records array in spending.json. Missing string values
+are encoded as "" (code 0 is not reserved — look the code up in the dictionary).
+
+Usage:
+    from spending_store import write_spending_columns, load_spending_columns
+    write_spending_columns(records, DATA_DIR / "burnley")
+    cols = load_spending_columns(DATA_DIR / "burnley")   # None if absent/stale
+    cols["amount"][cols["amount"] > 500].sum()
+"""
+
+import json
+import os
+from array import array
+from datetime import date
+from pathlib import Path
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+STORE_DIRNAME = "spending_columns"
+STORE_VERSION = 1
+
+# Columns dictionary-encoded as int32 codes (name → record field)
+ENCODED_COLUMNS = ("supplier_canonical", "department", "financial_year")
+
+
+def _date_ordinal(value):
+    """'2024-05-31' → proleptic Gregorian ordinal, 0 when missing/unparseable."""
+    if not value or len(value) < 10:
+        return 0
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except ValueError:
+        return 0
+
+
+def _source_signature(council_dir):
+    """Size + mtime of spending.json, used to detect a stale bundle."""
+    path = Path(council_dir) / "spending.json"
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def write_spending_columns(records, council_dir):
+    """Write the columnar bundle for one council. Returns the bundle path or None.
+
+    records may be any iterable (council_etl's streaming export passes a
+    generator), so columns grow in compact array.array buffers.
+    Call after spending.json has been written so the recorded source signature
+    matches the file the bundle was built from.
+    """
+    if not HAS_NUMPY:
+        print("  spending_columns: numpy not installed — skipping columnar store")
+        return None
+
+    store_dir = Path(council_dir) / STORE_DIRNAME
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    amount_buf = array("d")
+    date_buf = array("l")
+    code_bufs = {col: array("l") for col in ENCODED_COLUMNS}
+    lookups = {col: {} for col in ENCODED_COLUMNS}
+
+    for r in records:
+        try:
+            amount_buf.append(float(r.get("amount") or 0))
+        except (TypeError, ValueError):
+            amount_buf.append(0.0)
+        date_buf.append(_date_ordinal(r.get("date")))
+        for col in ENCODED_COLUMNS:
+            value = r.get(col)
+            if col == "supplier_canonical" and not value:
+                # Same fallback as doge_analysis.load_spending()
+                value = r.get("supplier", "UNKNOWN")
+            value = value or ""
+            lookup = lookups[col]
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(lookup)
+            code_bufs[col].append(code)
+
+    n = len(amount_buf)
+    amount = np.array(amount_buf, dtype=np.float64)
+    date_ordinal = np.array(date_buf, dtype=np.int32)
+    codes = {col: np.array(buf, dtype=np.int32) for col, buf in code_bufs.items()}
+
+    # Write arrays to temp names then rename, so a reader never maps a half-written file
+    arrays = {"amount": amount, "date_ordinal": date_ordinal, **codes}
+    for name, arr in arrays.items():
+        tmp = store_dir / f"{name}.tmp.npy"
+        np.save(tmp, arr)
+        os.replace(tmp, store_dir / f"{name}.npy")
+
+    meta = {
+        "version": STORE_VERSION,
+        "record_count": n,
+        "columns": list(arrays.keys()),
+        "source": _source_signature(council_dir),
+        "dictionaries": {col: list(lookups[col].keys()) for col in ENCODED_COLUMNS},
+    }
+    tmp = store_dir / "columns.json.tmp"
+    with open(tmp, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp, store_dir / "columns.json")
+
+    total_values = sum(len(v) for v in lookups.values())
+    print(f"  spending_columns: {n} rows, {len(arrays)} columns, {total_values} dictionary values → {store_dir}")
+    return store_dir
+
+
+def load_spending_columns(council_dir, mmap=True, check_source=True):
+    """Load (memory-map) the columnar bundle for one council.
+
+    Returns a dict of column name → ndarray plus "dictionaries" and "meta",
+    or None when numpy is missing, the bundle doesn't exist, or spending.json
+    has been rewritten since the bundle was built.
+    """
+    if not HAS_NUMPY:
+        return None
+    store_dir = Path(council_dir) / STORE_DIRNAME
+    meta_path = store_dir / "columns.json"
+    if not meta_path.exists():
+        return None
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if meta.get("version") != STORE_VERSION:
+        return None
+    if check_source and meta.get("source") != _source_signature(council_dir):
+        return None
+
+    mode = "r" if mmap else None
+    columns = {}
+    try:
+        for name in meta["columns"]:
+            arr = np.load(store_dir / f"{name}.npy", mmap_mode=mode)
+            if len(arr) != meta["record_count"]:
+                return None
+            columns[name] = arr
+    except (OSError, ValueError, KeyError):
+        return None
+
+    columns["dictionaries"] = meta.get("dictionaries", {})
+    columns["meta"] = meta
+    return columns
+
+
+def supplier_totals(columns, min_amount=0):
+    """Spend and payment count per supplier over rows with amount > min_amount.
+
+    Returns [(supplier, total, count), ...] in first-appearance order among
+    those rows — the order a dict-accumulating loop over the records sees.
+    "" (no supplier) is reported as "UNKNOWN", as doge_analysis does.
+    """
+    amount = columns["amount"]
+    mask = amount > min_amount
+    codes = columns["supplier_canonical"][mask]
+    names = columns["dictionaries"]["supplier_canonical"]
+    if not len(codes):
+        return []
+    totals = np.bincount(codes, weights=amount[mask], minlength=len(names))
+    counts = np.bincount(codes, minlength=len(names))
+    _, first_idx = np.unique(codes, return_index=True)
+    merged = {}
+    for code in codes[np.sort(first_idx)].tolist():
+        name = names[code] or "UNKNOWN"
+        total, count = merged.get(name, (0.0, 0))
+        merged[name] = (total + float(totals[code]), count + int(counts[code]))
+    return [(name, total, count) for name, (total, count) in merged.items()]
+
+
+def decode_column(columns, name):
+    """Materialise a dictionary-encoded column as a list of strings."""
+    values = columns["dictionaries"][name]
+    return [values[c] for c in columns[name].tolist()]
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+transcript_checkpoints.py — Stage checkpoints for meeting_transcriber.py
+
+A meeting run (download → denoise → Whisper → post-process → OCR → Tier 2)
+takes hours; a crash or timeout near the end used to throw all of it away.
+Each stage now leaves an artifact in OUTPUT_DIR/checkpoints/ and a line in
+checkpoints/manifest.json:
+
+    stage → {key, artifact, sha256, bytes, created}
+
+  - key: sha256 of everything the stage's result depends on (source URL or
+    file stamp, model, parameters, and the sha256 of upstream artifacts), so
+    a stage is reused only when its inputs are unchanged, and a changed
+    upstream artifact invalidates everything downstream of it.
+  - artifact: named stage-KEY.ext; JSON artifacts are checked against their
+    recorded sha256 before they are trusted.
+  - media artifacts (downloaded video, denoised audio) are deleted once a run
+    finishes — their manifest entries stay, so a later run that still needs
+    them fetches them again.
+
+BatchStore keeps per-batch LLM results keyed by the hash of the batch
+prompt, rewritten after every successful batch, so Tier 2 resumes after the
+last batch that completed.
+
+Usage:
+    ckpt = Checkpoints(output_dir)
+    key = ckpt.key("segments", source_key, model)
+    segments = ckpt.load_json("segments", key)
+    if segments is None:
+        segments = transcribe(...)
+        ckpt.save_json("segments", key, segments)
+    if ckpt.done("outputs"): ...
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+MANIFEST_VERSION = 1
+
+
+def stable_hash(*parts):
+    """sha256 hex of JSON-serialised parts (dict keys sorted)."""
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _write_atomic(path, data):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class Checkpoints:
+    """Manifest of completed stages + their artifacts under output_dir/checkpoints/."""
+
+    def __init__(self, output_dir, fresh=False):
+        self.dir = Path(output_dir) / "checkpoints"
+        self.manifest_path = self.dir / "manifest.json"
+        self.stages = {}
+        if fresh and self.dir.exists():
+            shutil.rmtree(self.dir, ignore_errors=True)
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path) as f:
+                    manifest = json.load(f)
+                if manifest.get("version") == MANIFEST_VERSION:
+                    self.stages = manifest.get("stages", {})
+            except (OSError, ValueError):
+                self.stages = {}
+
+    def key(self, *parts):
+        return stable_hash(*parts)
+
+    def _save_manifest(self):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        manifest = {"version": MANIFEST_VERSION, "updated": datetime.now().isoformat(), "stages": self.stages}
+        _write_atomic(self.manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+
+    def path_for(self, stage, key, suffix):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        return self.dir / f"{stage}-{key[:16]}{suffix}"
+
+    def entry(self, stage, key=None):
+        """Manifest entry for stage (only if its key matches, when key is given)."""
+        entry = self.stages.get(stage)
+        if entry and (key is None or entry.get("key") == key):
+            return entry
+        return None
+
+    def done(self, stage, key=None):
+        return self.entry(stage, key) is not None
+
+    def sha(self, stage):
+        entry = self.stages.get(stage)
+        return entry.get("sha256") if entry else None
+
+    def mark(self, stage, key, artifact=None, sha256=None, **info):
+        """Record stage as complete (artifact is a path inside the checkpoint dir, or None)."""
+        entry = {"key": key, "created": datetime.now().isoformat()}
+        if artifact is not None:
+            artifact = Path(artifact)
+            entry.update(artifact=artifact.name, bytes=artifact.stat().st_size)
+        if sha256:
+            entry["sha256"] = sha256
+        entry.update(info)
+        self.stages[stage] = entry
+        self._save_manifest()
+        return entry
+
+    # ── JSON artifacts (segments, OCR timeline, ...) ──
+
+    def save_json(self, stage, key, data):
+        raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        path = self.path_for(stage, key, ".json")
+        _write_atomic(path, raw)
+        self.mark(stage, key, path, sha256=hashlib.sha256(raw).hexdigest())
+        return data
+
+    def load_json(self, stage, key):
+        """Artifact data if stage completed with this key and the file is intact, else None."""
+        entry = self.entry(stage, key)
+        if not entry or not entry.get("artifact"):
+            return None
+        path = self.dir / entry["artifact"]
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(raw).hexdigest() != entry.get("sha256"):
+            print(f"  Checkpoint {stage} is corrupt, recomputing")
+            return None
+        return json.loads(raw)
+
+    # ── Media artifacts (downloaded video, denoised audio) ──
+
+    def media(self, stage, key):
+        """Path of a completed media artifact that still exists, else None."""
+        entry = self.entry(stage, key)
+        if not entry or not entry.get("artifact"):
+            return None
+        path = self.dir / entry["artifact"]
+        if not path.exists() or path.stat().st_size != entry.get("bytes"):
+            return None
+        return path
+
+    def adopt_media(self, stage, key, src):
+        """Move a finished media file into the checkpoint dir and record it."""
+        src = Path(src)
+        path = self.path_for(stage, key, src.suffix)
+        if src != path:
+            shutil.move(str(src), path)
+        self.mark(stage, key, path, media=True)
+        return path
+
+    def discard_media(self, keep=()):
+        """Delete media artifacts (manifest entries stay, so they can be re-fetched)."""
+        freed = 0
+        for stage, entry in self.stages.items():
+            if not entry.get("media") or stage in keep:
+                continue
+            path = self.dir / entry["artifact"]
+            if path.exists():
+                freed += path.stat().st_size
+                path.unlink()
+        return freed
+
+    def batches(self, stage, key):
+        return BatchStore(self, stage, key)
+
+    def summary(self):
+        return {stage: entry.get("created") for stage, entry in self.stages.items()}
+
+
+class BatchStore:
+    """batch key → result, persisted as one JSON artifact after every put()."""
+
+    def __init__(self, ckpt, stage, key):
+        self.ckpt = ckpt
+        self.stage = stage
+        self.key = key
+        self.results = ckpt.load_json(stage, key) or {}
+        self.reused = 0
+
+    def batch_key(self, *parts):
+        return stable_hash(*parts)
+
+    def get(self, batch_key):
+        result = self.results.get(batch_key)
+        if result is not None:
+            self.reused += 1
+        return result
+
+    def put(self, batch_key, result):
+        self.results[batch_key] = result
+        self.ckpt.save_json(self.stage, self.key, self.results)
+
+    def __len__(self):
+        return len(self.results)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+chat_cache.py — Semantic response cache for Ask Lancashire (chat_server.py)
+
+Many questions are near-repeats ("how much does Burnley spend on agency
+staff?" / "How much did Burnley spend on agency staff"). A cached answer is
+reused when a new question, for the same council and classified topics, is
+similar enough to one already answered:
+
+  - similarity: cosine over TF-IDF weighted word + character-trigram features
+    (IDF from the cached questions), or a local sentence-transformers model
+    when CHAT_CACHE_EMBED_MODEL is set and the package is installed;
+  - guard: numbers must match, and every content word in one question must
+    have a close (typo-level) counterpart in the other — "spend on parking"
+    never answers "spend on housing", however similar the rest is;
+  - TTL (CHAT_CACHE_TTL seconds, default 6h) and invalidation as soon as the
+    council's chat_briefing_*.json files change mtime.
+
+Only standalone questions are cached (chat_server skips the cache when the
+session already has history, since follow-ups depend on it).
+
+Usage:
+    cache = ResponseCache(DATA_ROOT)
+    hit = cache.lookup(council, topics, query)        # (answer, provider) or None
+    cache.store(council, topics, query, answer, provider)
+    hit = await cache.alookup(council, topics, query) # from async handlers
+"""
+
+import asyncio
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from pathlib import Path
+
+try:
+    from sentence_transformers import SentenceTransformer
+    HAS_EMBEDDINGS = True
+except ImportError:
+    HAS_EMBEDDINGS = False
+
+DEFAULT_TTL = int(os.environ.get("CHAT_CACHE_TTL", 6 * 3600))
+SIMILARITY_THRESHOLD = 0.8
+MAX_PER_BUCKET = 200
+BRIEFING_FILES = ("chat_briefing_core.json", "chat_briefing_detail.json")
+
+STOPWORDS = {
+    "a", "an", "the", "is", "are", "was", "were", "be", "been", "do", "does", "did",
+    "of", "on", "in", "at", "to", "for", "by", "with", "from", "about", "and", "or",
+    "what", "whats", "which", "who", "whom", "how", "much", "many", "when", "where", "why",
+    "me", "my", "i", "we", "our", "you", "your", "it", "its", "this", "that", "there",
+    "can", "could", "would", "should", "please", "tell", "show", "give", "list",
+    "council", "borough", "lancashire",
+}
+
+
+def normalise_query(query):
+    """Lower-case, strip punctuation/possessives, collapse whitespace."""
+    q = query.lower().replace("£", " £").replace("'s", "")
+    q = re.sub(r"[^\w£%.\s]", " ", q)
+    q = re.sub(r"(?<!\d)\.|\.(?!\d)", " ", q)
+    return " ".join(q.split())
+
+
+def _stem(word):
+    for suffix in ("ing", "ies", "es", "s", "ed"):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+
+def content_words(norm):
+    return {_stem(w) for w in norm.split() if w not in STOPWORDS}
+
+
+def _features(norm):
+    words = [_stem(w) for w in norm.split() if w not in STOPWORDS]
+    feats = Counter("w:" + w for w in words)
+    feats.update("b:" + a + "_" + b for a, b in zip(words, words[1:]))
+    for w in words:
+        padded = f" {w} "
+        feats.update("c:" + padded[i:i + 3] for i in range(len(padded) - 2))
+    return feats
+
+
+def _trigrams(word):
+    padded = f" {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def words_compatible(a, b):
+    """Same numbers, and each content word has a near-identical partner (typos)."""
+    nums_a = {w for w in a if any(ch.isdigit() for ch in w)}
+    nums_b = {w for w in b if any(ch.isdigit() for ch in w)}
+    if nums_a != nums_b:
+        return False
+    for src, dst in ((a - b, b), (b - a, a)):
+        for w in src:
+            tw = _trigrams(w)
+            if not any(len(tw & _trigrams(o)) / len(tw | _trigrams(o)) >= 0.5 for o in dst):
+                return False
+    return True
+
+
+class ResponseCache:
+    """In-process semantic cache: {(council, topics): OrderedDict(norm query → entry)}."""
+
+    def __init__(self, data_root, ttl=DEFAULT_TTL, threshold=SIMILARITY_THRESHOLD):
+        self.data_root = Path(data_root)
+        self.ttl = ttl
+        self.threshold = threshold
+        self.buckets = {}
+        self.df = Counter()
+        self.docs = 0
+        self.lock = threading.Lock()
+        self.stats = Counter()
+        self.model = None
+        model_name = os.environ.get("CHAT_CACHE_EMBED_MODEL")
+        if HAS_EMBEDDINGS and model_name:
+            self.model = SentenceTransformer(model_name)
+
+    def _stamp(self, council):
+        stamp = []
+        for name in BRIEFING_FILES:
+            try:
+                stamp.append(os.stat(self.data_root / council / name).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _embed(self, norm):
+        if self.model is None:
+            return None
+        vec = self.model.encode([norm], normalize_embeddings=True)[0]
+        return [float(x) for x in vec]
+
+    def _tfidf(self, feats):
+        n = self.docs + 1
+        vec = {f: c * (math.log((n + 1) / (self.df.get(f, 0) + 1)) + 1) for f, c in feats.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        return {f: v / norm for f, v in vec.items()}
+
+    def _similarity(self, q, entry):
+        if q["embedding"] is not None and entry["embedding"] is not None:
+            return sum(x * y for x, y in zip(q["embedding"], entry["embedding"]))
+        a, b = self._tfidf(q["features"]), self._tfidf(entry["features"])
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(v * b.get(f, 0.0) for f, v in a.items())
+
+    def _query(self, query):
+        norm = normalise_query(query)
+        return {"norm": norm, "words": content_words(norm), "features": _features(norm),
+                "embedding": self._embed(norm)}
+
+    def _drop(self, bucket, key):
+        entry = bucket.pop(key)
+        for f in entry["features"]:
+            self.df[f] -= 1
+            if not self.df[f]:
+                del self.df[f]
+        self.docs -= 1
+
+    def lookup(self, council, topics, query):
+        """(answer, provider) of the most similar fresh cached answer, or None."""
+        key = (council, tuple(sorted(topics)))
+        q = self._query(query)
+        now, stamp = time.time(), self._stamp(council)
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if not bucket:
+                self.stats["misses"] += 1
+                return None
+            for k in [k for k, e in bucket.items() if e["stamp"] != stamp or now - e["created"] > self.ttl]:
+                self._drop(bucket, k)
+                self.stats["expired"] += 1
+            entry = bucket.get(q["norm"])
+            if entry is None:
+                best, best_sim = None, self.threshold
+                for e in bucket.values():
+                    if not words_compatible(q["words"], e["words"]):
+                        continue
+                    sim = self._similarity(q, e)
+                    if sim >= best_sim:
+                        best, best_sim = e, sim
+                entry = best
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            bucket.move_to_end(entry["norm"])
+            self.stats["hits"] += 1
+            return entry["answer"], entry["provider"]
+
+    def store(self, council, topics, query, answer, provider):
+        key = (council, tuple(sorted(topics)))
+        q = self._query(query)
+        entry = {**q, "answer": answer, "provider": provider,
+                 "created": time.time(), "stamp": self._stamp(council)}
+        with self.lock:
+            bucket = self.buckets.setdefault(key, OrderedDict())
+            if q["norm"] in bucket:
+                self._drop(bucket, q["norm"])
+            bucket[q["norm"]] = entry
+            self.df.update(entry["features"].keys())
+            self.docs += 1
+            while len(bucket) > MAX_PER_BUCKET:
+                self._drop(bucket, next(iter(bucket)))
+
+    async def alookup(self, council, topics, query):
+        """lookup() for async handlers: with an embedding model loaded, the
+        encode runs in a worker thread instead of blocking the event loop."""
+        if self.model is None:
+            return self.lookup(council, topics, query)
+        return await asyncio.to_thread(self.lookup, council, topics, query)
+
+    async def astore(self, council, topics, query, answer, provider):
+        """store() for async handlers (see alookup)."""
+        if self.model is None:
+            return self.store(council, topics, query, answer, provider)
+        return await asyncio.to_thread(self.store, council, topics, query, answer, provider)
+
+    def summary(self):
+        with self.lock:
+            return {"entries": self.docs, "hits": self.stats["hits"],
+                    "misses": self.stats["misses"], "expired": self.stats["expired"]}
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+chat_context_index.py — Precompiled per-council context for Ask Lancashire (chat_server.py)
+
+build_context used to re-read councillor_profiles.json, spending-index.json,
+budget_mapping.json etc. through a 5-minute TTL cache on every request, scan
+every councillor for name matches and re-sort category tables. Instead each
+council's data is compiled once into an in-memory object (what goes in it is
+chat_server's business — compile_fn) and only recompiled when one of the
+files it was built from changes mtime:
+
+  - ContextIndex: council → compiled context, rebuilt when a watched file's
+    (mtime, size) changes; stat()s are polled at most every poll_interval
+    seconds per council, so a request normally costs one dict lookup.
+  - AhoCorasick: which of many names (surnames, full names) occur anywhere
+    in a query — one pass over the query, however many names are indexed.
+  - SubstringIndex: which names contain a given query word — every substring
+    of each name (≥ min_len chars) is a key, so a lookup is one dict probe.
+
+Usage:
+    index = ContextIndex(DATA_ROOT, compile_fn, files=INDEX_FILES)
+    index.warm(COUNCILS)                  # at startup
+    ctx = index.get(council)              # compiled object (rebuilt if stale)
+    names = AhoCorasick([("smith", 0), ("jones", 1)]).search("who is cllr smith")  # {0}
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+log = logging.getLogger("AskLancashire")
+
+POLL_INTERVAL = 30  # seconds between mtime checks per council
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher over (pattern, value) pairs; a pattern
+    may appear several times with different values."""
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        for pattern, value in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                state = nxt
+            self.out[state].append(value)
+        # Breadth-first failure links; outputs of the fail state are inherited
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def __len__(self):
+        return len(self.goto) - 1
+
+    def search(self, text):
+        """Set of values whose pattern occurs in text."""
+        found = set()
+        state = 0
+        goto, fail, out = self.goto, self.fail, self.out
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class SubstringIndex:
+    """word → positions of the names containing it (words of ≥ min_len chars)."""
+
+    def __init__(self, min_len=4):
+        self.min_len = min_len
+        self.postings = {}
+
+    def add(self, pos, text):
+        n = len(text)
+        for i in range(n - self.min_len + 1):
+            for j in range(i + self.min_len, n + 1):
+                self.postings.setdefault(text[i:j], set()).add(pos)
+
+    def lookup(self, words):
+        """Sorted positions whose text contains any of words (shorter words ignored)."""
+        hits = set()
+        for w in words:
+            if len(w) >= self.min_len:
+                hits.update(self.postings.get(w, ()))
+        return sorted(hits)
+
+
+class ContextIndex:
+    """council → compile_fn(council), recompiled when a watched file changes."""
+
+    def __init__(self, data_root, compile_fn, files, shared_files=(), poll_interval=POLL_INTERVAL):
+        self.data_root = Path(data_root)
+        self.compile_fn = compile_fn
+        self.files = tuple(files)
+        self.shared_files = tuple(shared_files)  # paths relative to data_root, e.g. county-level data
+        self.poll_interval = poll_interval
+        self.entries = {}  # council → (stamp, compiled, checked_at)
+        self.lock = threading.Lock()
+        self.builds = 0
+
+    def _stamp(self, council):
+        stamp = []
+        paths = [self.data_root / council / name for name in self.files]
+        paths += [self.data_root / rel for rel in self.shared_files]
+        for path in paths:
+            try:
+                st = os.stat(path)
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def get(self, council):
+        now = time.monotonic()
+        entry = self.entries.get(council)
+        if entry and now - entry[2] < self.poll_interval:
+            return entry[1]
+        with self.lock:
+            entry = self.entries.get(council)
+            if entry and now - entry[2] < self.poll_interval:
+                return entry[1]
+            stamp = self._stamp(council)
+            if entry and entry[0] == stamp:
+                self.entries[council] = (stamp, entry[1], now)
+                return entry[1]
+            started = time.monotonic()
+            compiled = self.compile_fn(council)
+            self.builds += 1
+            self.entries[council] = (stamp, compiled, now)
+            log.info(f"context index: compiled {council} in {time.monotonic() - started:.2f}s"
+                     + (" (data changed)" if entry else ""))
+            return compiled
+
+    def warm(self, councils):
+        for council in councils:
+            self.get(council)
+
+    def summary(self):
+        return {"councils": len(self.entries), "builds": self.builds}
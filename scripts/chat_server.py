@@ -6,6 +6,10 @@ FastAPI backend that answers natural language questions about Lancashire council
 Uses smart context selection (not RAG) — picks the right JSON files based on query keywords,
 extracts relevant stats, and sends to free LLM APIs via llm_router.py cascade.
 
+Endpoints:
+    POST /chat         → JSON ChatResponse once the answer is complete
+    POST /chat/stream  → server-sent events: meta, token..., done (or error)
+
 Usage:
     uvicorn chat_server:app --host 0.0.0.0 --port 8430
     # or: python3 chat_server.py
@@ -17,10 +21,8 @@ import json
 import os
 import re
 import sys
-import time
 import uuid
 import logging
-from datetime import datetime, timezone
 from pathlib import Path
 from collections import defaultdict
 
@@ -31,16 +33,19 @@ sys.path.insert(0, str(SCRIPT_DIR.parent / "burnley-council" / "scripts"))
 try:
     from fastapi import FastAPI, HTTPException, Request
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import JSONResponse, StreamingResponse
     from pydantic import BaseModel
 except ImportError:
     os.system("pip3 install fastapi uvicorn pydantic 2>/dev/null")
     from fastapi import FastAPI, HTTPException, Request
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import JSONResponse, StreamingResponse
     from pydantic import BaseModel
 
-from llm_router import PROVIDERS, _call_provider
+import llm_router
+from chat_cache import ResponseCache
+from chat_context_index import AhoCorasick, ContextIndex, SubstringIndex
+from chat_store import make_store
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(message)s")
 log = logging.getLogger("AskLancashire")
@@ -108,20 +113,12 @@ def classify_query(query: str, council: str = None) -> list[str]:
 
 def _looks_like_name_query(query: str, council: str) -> bool:
     """Check if query mentions a councillor name."""
-    raw = safe_load(council, "councillors.json")
-    if not raw:
+    ctx = context_index.get(council)
+    if not ctx.has_councillors:
         return False
-    councillors = raw if isinstance(raw, list) else raw.get("councillors", [])
-    for c in councillors:
-        name = (c.get("name") or "").lower()
-        # Strip title prefixes
-        clean = re.sub(r"^(county |borough )?councillor\s+", "", name)
-        parts = clean.split()
-        # Match if surname appears in query, or full name
-        if parts and len(parts[-1]) > 3 and parts[-1] in query:
-            return True
-        if clean and clean in query:
-            return True
+    # Surname (or full name) of any councillor appearing in the query
+    if ctx.mentions_councillor(query):
+        return True
     # Also check "tell me about X" / "who is X" patterns
     if re.search(r"\b(tell me|who is|about|know about)\b", query):
         words = [w for w in query.split() if len(w) > 3 and w not in ("tell", "about", "know", "everything", "what", "does", "their")]
@@ -131,24 +128,23 @@ def _looks_like_name_query(query: str, council: str) -> bool:
 
 
 # --- Data Loading & Caching ---
-_data_cache = {}  # path → (data, load_time)
-CACHE_TTL = 300  # 5 min
+_data_cache = {}  # path → (data, (mtime_ns, size))
 
 
 def load_json(path: Path):
-    """Load JSON with 5-min cache."""
+    """Load JSON, re-parsing only when the file's mtime or size has changed."""
     key = str(path)
-    now = time.time()
-    if key in _data_cache:
-        data, loaded_at = _data_cache[key]
-        if now - loaded_at < CACHE_TTL:
-            return data
     try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _data_cache.get(key)
+        if cached and cached[1] == stamp:
+            return cached[0]
         with open(path) as f:
             data = json.load(f)
-        _data_cache[key] = (data, now)
+        _data_cache[key] = (data, stamp)
         return data
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, json.JSONDecodeError) as e:
         log.warning(f"Failed to load {path}: {e}")
         return None
 
@@ -213,52 +209,8 @@ def build_spending_context(council: str, query: str) -> str:
 
 
 def build_councillor_context(council: str, query: str) -> str:
-    """Extract councillor info."""
-    raw = safe_load(council, "councillors.json")
-    if not raw:
-        return ""
-    councillors = raw if isinstance(raw, list) else raw.get("councillors", [])
-    lines = [f"COUNCILLORS ({council}): {len(councillors)} total"]
-    # Party breakdown
-    parties = defaultdict(int)
-    for c in councillors:
-        parties[c.get("party", "Unknown")] += 1
-    lines.append("By party: " + ", ".join(f"{p}: {n}" for p, n in sorted(parties.items(), key=lambda x: -x[1])))
-    # Search for specific councillor mentioned in query
-    q = query.lower()
-    matched = []
-    for c in councillors:
-        name = (c.get("name") or "").lower()
-        clean = re.sub(r"^(county |borough )?councillor\s+", "", name)
-        if any(word in clean for word in q.split() if len(word) > 3):
-            matched.append(c)
-    for c in matched:
-        lines.append(f"\nMATCHED COUNCILLOR: {c.get('name')}")
-        lines.append(f"  Party: {c.get('party', '?')}")
-        lines.append(f"  Ward/Division: {c.get('ward', c.get('division', '?'))}")
-        if c.get("email"):
-            lines.append(f"  Email: {c['email']}")
-        if c.get("phone"):
-            lines.append(f"  Phone: {c['phone']}")
-        # Add any extra fields
-        for key in ["committees", "roles", "appointed", "biography"]:
-            if c.get(key):
-                val = c[key] if isinstance(c[key], str) else json.dumps(c[key], default=str)[:300]
-                lines.append(f"  {key.title()}: {val}")
-    # Also check councillor_profiles.json for more detail
-    if matched:
-        profiles = safe_load(council, "councillor_profiles.json")
-        if profiles and isinstance(profiles, list):
-            for p in profiles:
-                pname = (p.get("name") or "").lower()
-                if any(word in pname for word in q.split() if len(word) > 3):
-                    lines.append(f"\nPROFILE DETAIL: {p.get('name')}")
-                    for key in ["occupation", "dob", "biography", "committees", "electoral_history", "employment", "land_interests", "securities"]:
-                        if p.get(key):
-                            val = p[key] if isinstance(p[key], str) else json.dumps(p[key], default=str)[:400]
-                            lines.append(f"  {key.replace('_', ' ').title()}: {val}")
-                    break
-    return "\n".join(lines)
+    """Extract councillor info (party breakdown + councillors named in the query)."""
+    return context_index.get(council).councillor_context(query)
 
 
 def build_integrity_context(council: str, query: str) -> str:
@@ -438,22 +390,170 @@ CONTEXT_BUILDERS = {
 }
 
 
+# --- Precompiled Context Index ---
+COUNCILLOR_TITLE = re.compile(r"^(county |borough )?councillor\s+")
+PROFILE_KEYS = ["party", "ward", "division", "email", "phone", "occupation", "dob",
+                "biography", "committees", "electoral_history", "employment",
+                "land_interests", "securities"]
+# Files a council's compiled context is built from (recompiled when any changes)
+INDEX_FILES = [
+    "chat_briefing_core.json", "chat_briefing_detail.json", "councillors.json",
+    "councillor_profiles.json", "config.json", "budgets_summary.json", "politics_summary.json",
+    "spending-index.json", "budget_mapping.json", "integrity.json", "budgets.json",
+    "elections.json", "roadworks_analytics.json", "planning.json", "health.json",
+    "deprivation.json", "demographics.json", "economy.json", "council_documents.json",
+    "constituencies.json",
+]
+
+
+def _profile_list(raw) -> list:
+    """councillor_profiles.json is a list, or {"councillors": {id: profile}}."""
+    if isinstance(raw, list):
+        return raw
+    if isinstance(raw, dict):
+        profiles = raw.get("councillors", [])
+        return list(profiles.values()) if isinstance(profiles, dict) else profiles
+    return []
+
+
+def _field(value, limit: int) -> str:
+    return value if isinstance(value, str) else json.dumps(value, default=str)[:limit]
+
+
+class CouncilContext:
+    """One council's chat context, compiled from its data files.
+
+    Everything that doesn't depend on the query is rendered here once, so a
+    request only matches names (Aho-Corasick / substring index) and joins
+    strings already built.
+    """
+
+    def __init__(self, council: str):
+        # Tier 1: core briefing, or the general overview if briefings aren't generated yet
+        core = safe_load(council, "chat_briefing_core.json")
+        if core and isinstance(core, dict):
+            self.core = core.get("briefing", "")
+        else:
+            self.core = build_general_context(council, "")
+
+        # Tier 2: per-topic detail briefings, else snippets from the old builders
+        detail = safe_load(council, "chat_briefing_detail.json")
+        self.detail_topics = detail.get("topics", {}) if detail and isinstance(detail, dict) else None
+        self.snippets = {}
+        if self.detail_topics is None:
+            for topic, builder in CONTEXT_BUILDERS.items():
+                if topic not in ("general", "councillors"):
+                    self.snippets[topic] = builder(council, "")
+
+        # Councillors: name matchers + pre-rendered blocks
+        raw = safe_load(council, "councillors.json")
+        self.has_councillors = bool(raw)
+        councillors = (raw if isinstance(raw, list) else raw.get("councillors", [])) if raw else []
+        names = []
+        self.councillor_index = SubstringIndex()
+        self.councillor_blocks = []
+        for i, c in enumerate(councillors):
+            clean = COUNCILLOR_TITLE.sub("", (c.get("name") or "").lower())
+            parts = clean.split()
+            if parts and len(parts[-1]) > 3:
+                names.append((parts[-1], i))
+            names.append((clean, i))
+            self.councillor_index.add(i, clean)
+            self.councillor_blocks.append(self._render_councillor(c))
+        self.name_matcher = AhoCorasick(names)
+
+        self.councillor_header = ""
+        if raw:
+            parties = defaultdict(int)
+            for c in councillors:
+                parties[c.get("party", "Unknown")] += 1
+            self.councillor_header = "\n".join([
+                f"COUNCILLORS ({council}): {len(councillors)} total",
+                "By party: " + ", ".join(f"{p}: {n}" for p, n in sorted(parties.items(), key=lambda x: -x[1])),
+            ])
+
+        profiles = _profile_list(safe_load(council, "councillor_profiles.json"))
+        surnames = []
+        self.profile_index = SubstringIndex()
+        self.profile_details = []
+        self.profile_blocks = []
+        for i, p in enumerate(profiles):
+            pname = (p.get("name") or "").lower()
+            parts = COUNCILLOR_TITLE.sub("", pname).split()
+            if parts and len(parts[-1]) > 3:
+                surnames.append((parts[-1], i))
+            self.profile_index.add(i, pname)
+            self.profile_details.append(self._render_profile_detail(p))
+            self.profile_blocks.append(self._render_profile(p))
+        self.surname_matcher = AhoCorasick(surnames)
+
+    @staticmethod
+    def _render_councillor(c: dict) -> str:
+        lines = [f"\nMATCHED COUNCILLOR: {c.get('name')}",
+                 f"  Party: {c.get('party', '?')}",
+                 f"  Ward/Division: {c.get('ward', c.get('division', '?'))}"]
+        if c.get("email"):
+            lines.append(f"  Email: {c['email']}")
+        if c.get("phone"):
+            lines.append(f"  Phone: {c['phone']}")
+        for key in ["committees", "roles", "appointed", "biography"]:
+            if c.get(key):
+                lines.append(f"  {key.title()}: {_field(c[key], 300)}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _render_profile_detail(p: dict) -> str:
+        lines = [f"\nPROFILE DETAIL: {p.get('name')}"]
+        for key in ["occupation", "dob", "biography", "committees", "electoral_history", "employment", "land_interests", "securities"]:
+            if p.get(key):
+                lines.append(f"  {key.replace('_', ' ').title()}: {_field(p[key], 400)}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _render_profile(p: dict) -> str:
+        lines = [f"\nDETAILED PROFILE: {p.get('name')}"]
+        for key in PROFILE_KEYS:
+            if p.get(key):
+                lines.append(f"  {key.replace('_', ' ').title()}: {_field(p[key], 400)}")
+        return "\n".join(lines)
+
+    def mentions_councillor(self, q: str) -> bool:
+        """True if any councillor's surname (> 3 chars) or full name occurs in q (lower-cased)."""
+        return bool(self.name_matcher.search(q))
+
+    def councillor_context(self, query: str) -> str:
+        if not self.has_councillors:
+            return ""
+        words = query.lower().split()
+        lines = [self.councillor_header]
+        matched = self.councillor_index.lookup(words)
+        lines.extend(self.councillor_blocks[i] for i in matched)
+        if matched:
+            hits = self.profile_index.lookup(words)
+            if hits:
+                lines.append(self.profile_details[hits[0]])
+        return "\n".join(lines)
+
+    def profile(self, q: str) -> str:
+        """Detailed profile of the first councillor whose surname occurs in q, or ''."""
+        hits = self.surname_matcher.search(q)
+        return self.profile_blocks[min(hits)] if hits else ""
+
+
+context_index = ContextIndex(DATA_ROOT, CouncilContext, INDEX_FILES,
+                             shared_files=["lancashire_cc/roadworks_analytics.json"])
+
+
 def build_context(council: str, query: str, topics: list[str]) -> str:
     """Build two-tier context: always-loaded core + topic-specific detail."""
-    parts = []
+    ctx = context_index.get(council)
 
     # Tier 1: Always-loaded core briefing (~130 tokens)
-    core = safe_load(council, "chat_briefing_core.json")
-    if core and isinstance(core, dict):
-        parts.append(core.get("briefing", ""))
-    else:
-        # Fallback to general context if briefing not generated yet
-        parts.append(build_general_context(council, query))
+    parts = [ctx.core]
 
     # Tier 2: Topic-specific detail (~500-800 tokens per topic)
-    detail = safe_load(council, "chat_briefing_detail.json")
-    if detail and isinstance(detail, dict):
-        topic_data = detail.get("topics", {})
+    topic_data = ctx.detail_topics
+    if topic_data is not None:
         for topic in topics:
             if topic in topic_data:
                 parts.append(topic_data[topic])
@@ -463,32 +563,15 @@ def build_context(council: str, query: str, topics: list[str]) -> str:
             elif topic == "planning" and "housing" in topic_data:
                 parts.append(topic_data["housing"])
     else:
-        # Fallback to old builders if briefings not generated
+        # Fallback to old builders (pre-rendered) if briefings not generated
         for topic in topics:
-            builder = CONTEXT_BUILDERS.get(topic)
-            if builder and topic != "general":
-                ctx = builder(council, query)
-                if ctx:
-                    parts.append(ctx)
+            if topic == "councillors":
+                parts.append(ctx.councillor_context(query))
+            elif topic != "general":
+                parts.append(ctx.snippets.get(topic, ""))
 
     # Name search: if query mentions a specific person, add councillor profile detail
-    q = query.lower()
-    profiles = safe_load(council, "councillor_profiles.json")
-    if profiles and isinstance(profiles, list):
-        for p in profiles:
-            pname = (p.get("name") or "").lower()
-            clean = re.sub(r"^(county |borough )?councillor\s+", "", pname)
-            parts_name = clean.split()
-            if parts_name and len(parts_name[-1]) > 3 and parts_name[-1] in q:
-                profile_lines = [f"\nDETAILED PROFILE: {p.get('name')}"]
-                for key in ["party", "ward", "division", "email", "phone", "occupation", "dob",
-                            "biography", "committees", "electoral_history", "employment",
-                            "land_interests", "securities"]:
-                    if p.get(key):
-                        val = p[key] if isinstance(p[key], str) else json.dumps(p[key], default=str)[:400]
-                        profile_lines.append(f"  {key.replace('_', ' ').title()}: {val}")
-                parts.append("\n".join(profile_lines))
-                break
+    parts.append(ctx.profile(query.lower()))
 
     combined = "\n\n".join(p for p in parts if p)
     # Truncate to fit context window
@@ -498,61 +581,33 @@ def build_context(council: str, query: str, topics: list[str]) -> str:
     return combined
 
 
-# --- Rate Limiting ---
-_rate_limits = {}  # ip → {"minute": [(timestamp, count)], "day": {date: count}}
+# --- Sessions & Rate Limiting ---
+# CHAT_STORE=sqlite (or a redis:// URL) to share them between uvicorn workers — see chat_store.py
+store = make_store(os.environ.get("CHAT_STORE", "memory"), DATA_ROOT,
+                   session_timeout=SESSION_TIMEOUT,
+                   limits=((60, RATE_LIMIT_PER_MIN), (86400, RATE_LIMIT_PER_DAY)))
 
 
 def check_rate_limit(ip: str) -> bool:
     """Return True if request is allowed."""
-    now = time.time()
-    today = datetime.now().strftime("%Y-%m-%d")
-    if ip not in _rate_limits:
-        _rate_limits[ip] = {"requests": [], "daily": {}}
-    rl = _rate_limits[ip]
-    # Clean old minute entries
-    rl["requests"] = [t for t in rl["requests"] if now - t < 60]
-    if len(rl["requests"]) >= RATE_LIMIT_PER_MIN:
-        return False
-    if rl["daily"].get(today, 0) >= RATE_LIMIT_PER_DAY:
-        return False
-    rl["requests"].append(now)
-    rl["daily"][today] = rl["daily"].get(today, 0) + 1
-    return True
-
-
-# --- Session Management ---
-_sessions = {}  # session_id → {"messages": [], "last_active": timestamp, "council": str}
+    return store.check_rate_limit(ip)
 
 
 def get_session(session_id: str, council: str) -> dict:
     """Get or create session."""
-    now = time.time()
-    # Clean expired sessions
-    expired = [k for k, v in _sessions.items() if now - v["last_active"] > SESSION_TIMEOUT]
-    for k in expired:
-        del _sessions[k]
-    if session_id not in _sessions:
-        _sessions[session_id] = {"messages": [], "last_active": now, "council": council}
-    session = _sessions[session_id]
-    session["last_active"] = now
-    session["council"] = council
-    return session
+    return store.get_session(session_id, council)
 
 
 # --- LLM Call ---
-def call_llm(messages: list[dict], max_tokens: int = 1500) -> tuple[str, str]:
-    """Call LLM with full message history. Returns (text, provider)."""
-    for provider in PROVIDERS:
-        if not provider["enabled"] or not provider["api_key"]:
-            continue
-        try:
-            text = _call_provider(provider, messages, max_tokens, timeout=30)
-            if text and len(text.strip()) > 10:
-                return text.strip(), provider["name"]
-        except Exception as e:
-            log.warning(f"{provider['name']} failed: {str(e)[:150]}")
-            time.sleep(0.5)
-    raise RuntimeError("All LLM providers failed")
+async def call_llm(messages: list[dict], max_tokens: int = 1500) -> tuple[str, str]:
+    """Call LLM with full message history. Returns (text, provider).
+    Hedged across providers on pooled async connections — never blocks the event loop."""
+    try:
+        text, provider = await llm_router.agenerate(messages, max_tokens, timeout=30, min_chars=10)
+    except RuntimeError as e:
+        log.warning(str(e)[:300])
+        raise RuntimeError("All LLM providers failed")
+    return text.strip(), provider
 
 
 # --- FastAPI App ---
@@ -577,11 +632,16 @@ class ChatResponse(BaseModel):
     provider: str
     topics: list[str]
     session_id: str
+    cached: bool = False
 
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat(req: ChatRequest, request: Request):
-    """Handle a chat query."""
+# Semantic answer cache for standalone questions (see chat_cache.py)
+response_cache = ResponseCache(DATA_ROOT)
+
+
+def prepare_chat(req: ChatRequest, request: Request):
+    """Validate a chat request and classify it.
+    Returns (council, query, session_id, session, topics)."""
     ip = request.client.host if request.client else "unknown"
     if not check_rate_limit(ip):
         raise HTTPException(429, "Rate limit exceeded. Try again in a minute.")
@@ -597,36 +657,123 @@ async def chat(req: ChatRequest, request: Request):
     session_id = req.session_id or str(uuid.uuid4())
     session = get_session(session_id, council)
 
-    # Classify and build context
     topics = classify_query(query, council)
-    context = build_context(council, query, topics)
     log.info(f"[{ip}] council={council} topics={topics} query={query[:80]}")
+    return council, query, session_id, session, topics
 
-    # Build messages
+
+async def cached_answer(council: str, query: str, session: dict, topics: list[str]):
+    """(answer, provider) from the response cache for a standalone question, else None."""
+    if session["messages"]:
+        return None  # follow-ups depend on the conversation so far
+    return await response_cache.alookup(council, topics, query)
+
+
+def build_messages(council: str, query: str, session: dict, topics: list[str]) -> list[dict]:
+    """System prompt + data context + recent history + the new question."""
+    context = build_context(council, query, topics)
     messages = [{"role": "system", "content": SYSTEM_PROMPT + f"\n\nDATA CONTEXT:\n{context}"}]
     # Add conversation history (last N messages)
     for msg in session["messages"][-MAX_HISTORY * 2:]:
         messages.append(msg)
     messages.append({"role": "user", "content": query})
+    return messages
 
-    try:
-        answer, provider = call_llm(messages)
-    except RuntimeError as e:
-        raise HTTPException(503, f"AI service temporarily unavailable: {e}")
 
-    # Store in session
+def remember_exchange(session_id: str, session: dict, query: str, answer: str):
+    """Append a completed question/answer pair to the session history and save it."""
     session["messages"].append({"role": "user", "content": query})
     session["messages"].append({"role": "assistant", "content": answer})
     # Trim history
     if len(session["messages"]) > MAX_HISTORY * 2:
         session["messages"] = session["messages"][-MAX_HISTORY * 2:]
+    store.save_session(session_id, session)
+
+
+@app.post("/chat", response_model=ChatResponse)
+async def chat(req: ChatRequest, request: Request):
+    """Handle a chat query."""
+    council, query, session_id, session, topics = prepare_chat(req, request)
+
+    hit = await cached_answer(council, query, session, topics)
+    if hit:
+        answer, provider = hit
+        remember_exchange(session_id, session, query, answer)
+        return ChatResponse(answer=answer, provider=provider, topics=topics,
+                            session_id=session_id, cached=True)
 
+    standalone = not session["messages"]
+    messages = build_messages(council, query, session, topics)
+    try:
+        answer, provider = await call_llm(messages)
+    except RuntimeError as e:
+        raise HTTPException(503, f"AI service temporarily unavailable: {e}")
+
+    if standalone:
+        await response_cache.astore(council, topics, query, answer, provider)
+    remember_exchange(session_id, session, query, answer)
     return ChatResponse(answer=answer, provider=provider, topics=topics, session_id=session_id)
 
 
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/chat/stream")
+async def chat_stream(req: ChatRequest, request: Request):
+    """Handle a chat query as server-sent events.
+
+    Events: meta {topics, session_id} → token {text} ... → done {provider}
+    (or error {detail}). The answer joins the session history only once the
+    stream completes.
+    """
+    council, query, session_id, session, topics = prepare_chat(req, request)
+    hit = await cached_answer(council, query, session, topics)
+    standalone = not session["messages"]
+    messages = None if hit else build_messages(council, query, session, topics)
+
+    async def events():
+        yield sse_event("meta", {"topics": topics, "session_id": session_id})
+        if hit:
+            remember_exchange(session_id, session, query, hit[0])
+            yield sse_event("token", {"text": hit[0]})
+            yield sse_event("done", {"provider": hit[1], "cached": True})
+            return
+        parts, provider = [], None
+        try:
+            async for chunk, provider in llm_router.astream(messages, max_tokens=1500, timeout=30):
+                parts.append(chunk)
+                yield sse_event("token", {"text": chunk})
+        except Exception as e:
+            log.warning(f"stream failed: {str(e)[:300]}")
+            yield sse_event("error", {"detail": "AI service temporarily unavailable"})
+            return
+        answer = "".join(parts).strip()
+        if answer:
+            if standalone:
+                await response_cache.astore(council, topics, query, answer, provider)
+            remember_exchange(session_id, session, query, answer)
+        yield sse_event("done", {"provider": provider})
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
 @app.get("/health")
 async def health():
-    return {"status": "ok", "sessions": len(_sessions), "councils": len(COUNCILS)}
+    return {"status": "ok", "sessions": store.session_count(), "councils": len(COUNCILS),
+            "providers": llm_router.provider_stats(), "cache": response_cache.summary(),
+            "context_index": context_index.summary()}
+
+
+@app.on_event("startup")
+async def warm_context_index():
+    context_index.warm(COUNCILS)
+
+
+@app.on_event("shutdown")
+async def close_llm_clients():
+    await llm_router.aclose_clients()
 
 
 if __name__ == "__main__":
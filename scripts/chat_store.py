@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+chat_store.py — Session + rate-limit storage for Ask Lancashire (chat_server.py)
+
+chat_server kept sessions and per-IP rate limits in module dicts: every
+request scanned all sessions to expire old ones and rebuilt the IP's list of
+request timestamps, and nothing was shared between uvicorn workers. Stores:
+
+  - MemoryStore (default): one process. Sessions in an LRU ordered by last
+    use, so expiry pops from the front and the size is capped; limits per IP
+    in a bounded LRU too.
+  - SQLiteStore: every worker on one host shares a WAL-mode database
+    (rate-limit updates run in BEGIN IMMEDIATE transactions).
+  - RedisStore: several hosts. Takes any client with the redis-py
+    get/set/decr/scan_iter methods and a MULTI pipeline (incr/expire/get),
+    so a local stand-in can replace a real server. Counters are incremented
+    first and the request is refused (and the increments undone) when the
+    returned counts are over the limit, so concurrent workers can't all pass
+    a read-then-increment check.
+
+Rate limits are sliding-window counters: a counter for the current fixed
+window and one for the previous window, weighted by how far into the current
+window we are — two integers per IP and limit, O(1) per request, instead of
+a list of timestamps. As before only allowed requests count.
+
+Pick with CHAT_STORE: "memory", "sqlite" (data/.chat_store.sqlite),
+"sqlite:////abs/path.sqlite" or "redis://host:6379/0".
+
+Usage:
+    store = make_store(os.environ.get("CHAT_STORE", "memory"), DATA_ROOT)
+    if not store.check_rate_limit(ip): ...
+    session = store.get_session(session_id, council)
+    session["messages"].append(...)
+    store.save_session(session_id, session)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+SESSION_TIMEOUT = 1800  # 30 min
+MAX_SESSIONS = 20000
+MAX_CLIENTS = 50000
+RATE_LIMITS = ((60, 10), (86400, 200))  # (window seconds, max requests): 10/min, 200/day
+PURGE_INTERVAL = 60
+
+
+def sliding_window(now, period, window, cur, prev):
+    """Roll fixed-window counters forward to now.
+    Returns (window, cur, prev, estimated requests in the last `period` seconds)."""
+    start = int(now // period)
+    if window != start:
+        prev = cur if window == start - 1 else 0
+        cur = 0
+    weight = 1.0 - (now - start * period) / period
+    return start, cur, prev, prev * weight + cur
+
+
+def _new_session(council, now):
+    return {"messages": [], "last_active": now, "council": council}
+
+
+class MemoryStore:
+    """Single-process store: LRU + TTL sessions, LRU rate-limit counters."""
+
+    def __init__(self, session_timeout=SESSION_TIMEOUT, limits=RATE_LIMITS,
+                 max_sessions=MAX_SESSIONS, max_clients=MAX_CLIENTS):
+        self.session_timeout = session_timeout
+        self.limits = limits
+        self.max_sessions = max_sessions
+        self.max_clients = max_clients
+        self.sessions = OrderedDict()  # session_id → session, least recently used first
+        self.counters = OrderedDict()  # ip → [[window, cur, prev] per limit]
+        self.lock = threading.Lock()
+
+    def check_rate_limit(self, ip):
+        now = time.time()
+        with self.lock:
+            counters = self.counters.pop(ip, None) or [[0, 0, 0] for _ in self.limits]
+            rolled = [sliding_window(now, period, *c) for (period, _), c in zip(self.limits, counters)]
+            allowed = all(est + 1 <= limit for (_, limit), (_, _, _, est) in zip(self.limits, rolled))
+            self.counters[ip] = [[w, cur + allowed, prev] for w, cur, prev, _ in rolled]
+            while len(self.counters) > self.max_clients:
+                self.counters.popitem(last=False)
+            return allowed
+
+    def get_session(self, session_id, council):
+        now = time.time()
+        with self.lock:
+            # Least recently used first, so expired sessions are all at the front
+            while self.sessions:
+                oldest = next(iter(self.sessions.values()))
+                if now - oldest["last_active"] <= self.session_timeout:
+                    break
+                self.sessions.popitem(last=False)
+            session = self.sessions.pop(session_id, None) or _new_session(council, now)
+            session["last_active"] = now
+            session["council"] = council
+            self.sessions[session_id] = session
+            while len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+            return session
+
+    def save_session(self, session_id, session):
+        with self.lock:
+            session["last_active"] = time.time()
+            if session_id in self.sessions:
+                self.sessions.move_to_end(session_id)
+            else:
+                self.sessions[session_id] = session
+
+    def session_count(self):
+        return len(self.sessions)
+
+
+class SQLiteStore:
+    """Sessions + counters in a WAL-mode SQLite file shared by every worker on a host."""
+
+    def __init__(self, path, session_timeout=SESSION_TIMEOUT, limits=RATE_LIMITS):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.session_timeout = session_timeout
+        self.limits = limits
+        self.lock = threading.Lock()
+        self.last_purge = 0.0
+        self.db = sqlite3.connect(str(path), check_same_thread=False, timeout=30, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id TEXT PRIMARY KEY,
+                council TEXT,
+                messages TEXT NOT NULL,
+                last_active REAL NOT NULL
+            )""")
+        self.db.execute("CREATE INDEX IF NOT EXISTS sessions_last_active ON sessions (last_active)")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                ip TEXT NOT NULL,
+                period INTEGER NOT NULL,
+                window INTEGER NOT NULL,
+                cur INTEGER NOT NULL,
+                prev INTEGER NOT NULL,
+                PRIMARY KEY (ip, period)
+            )""")
+
+    def _maybe_purge(self, now):
+        """Drop expired sessions and stale counters (at most once a minute per worker)."""
+        if now - self.last_purge < PURGE_INTERVAL:
+            return
+        self.last_purge = now
+        self.db.execute("DELETE FROM sessions WHERE last_active < ?", (now - self.session_timeout,))
+        self.db.execute("DELETE FROM rate_limits WHERE (window + 2) * period < ?", (now,))
+
+    def check_rate_limit(self, ip):
+        now = time.time()
+        with self.lock:
+            self._maybe_purge(now)
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = dict((period, (window, cur, prev)) for period, window, cur, prev in self.db.execute(
+                    "SELECT period, window, cur, prev FROM rate_limits WHERE ip = ?", (ip,)))
+                rolled = [sliding_window(now, period, *rows.get(period, (0, 0, 0))) for period, _ in self.limits]
+                allowed = all(est + 1 <= limit for (_, limit), (_, _, _, est) in zip(self.limits, rolled))
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO rate_limits (ip, period, window, cur, prev) VALUES (?, ?, ?, ?, ?)",
+                    [(ip, period, w, cur + allowed, prev) for (period, _), (w, cur, prev, _) in zip(self.limits, rolled)])
+                self.db.execute("COMMIT")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+            return allowed
+
+    def get_session(self, session_id, council):
+        now = time.time()
+        with self.lock:
+            row = self.db.execute("SELECT messages, last_active FROM sessions WHERE id = ?",
+                                  (session_id,)).fetchone()
+            messages = json.loads(row[0]) if row and now - row[1] <= self.session_timeout else []
+            self.db.execute(
+                "INSERT OR REPLACE INTO sessions (id, council, messages, last_active) VALUES (?, ?, ?, ?)",
+                (session_id, council, json.dumps(messages), now))
+        return {"messages": messages, "last_active": now, "council": council}
+
+    def save_session(self, session_id, session):
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO sessions (id, council, messages, last_active) VALUES (?, ?, ?, ?)",
+                (session_id, session.get("council"), json.dumps(session["messages"]), time.time()))
+
+    def session_count(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM sessions WHERE last_active >= ?",
+                                   (time.time() - self.session_timeout,)).fetchone()[0]
+
+
+class RedisStore:
+    """Sessions as JSON values with a TTL; counters as INCR keys per fixed window."""
+
+    def __init__(self, client, session_timeout=SESSION_TIMEOUT, limits=RATE_LIMITS, prefix="asklancs:"):
+        self.client = client
+        self.session_timeout = session_timeout
+        self.limits = limits
+        self.prefix = prefix
+
+    def check_rate_limit(self, ip):
+        now = time.time()
+        keys = []
+        pipe = self.client.pipeline(transaction=True)
+        for period, _ in self.limits:
+            start = int(now // period)
+            key = f"{self.prefix}rl:{ip}:{period}:"
+            keys.append(key + str(start))
+            pipe.incr(key + str(start))
+            pipe.expire(key + str(start), 2 * period)
+            pipe.get(key + str(start - 1))
+        replies = pipe.execute()
+        allowed = True
+        for i, (period, limit) in enumerate(self.limits):
+            cur, prev = int(replies[3 * i]), int(replies[3 * i + 2] or 0)
+            # cur already includes this request
+            _, _, _, est = sliding_window(now, period, int(now // period), cur, prev)
+            if est > limit:
+                allowed = False
+        if not allowed:
+            # Only allowed requests count
+            for key in keys:
+                self.client.decr(key)
+        return allowed
+
+    def get_session(self, session_id, council):
+        now = time.time()
+        key = f"{self.prefix}session:{session_id}"
+        raw = self.client.get(key)
+        session = json.loads(raw) if raw else _new_session(council, now)
+        session["last_active"] = now
+        session["council"] = council
+        self.client.set(key, json.dumps(session), ex=self.session_timeout)
+        return session
+
+    def save_session(self, session_id, session):
+        self.client.set(f"{self.prefix}session:{session_id}", json.dumps(session), ex=self.session_timeout)
+
+    def session_count(self):
+        return sum(1 for _ in self.client.scan_iter(match=f"{self.prefix}session:*"))
+
+
+def make_store(spec, data_root=None, **kwargs):
+    """Store for a CHAT_STORE spec ("memory", "sqlite", "sqlite:///path", "redis://...")."""
+    spec = (spec or "memory").strip()
+    if spec == "memory":
+        return MemoryStore(**kwargs)
+    if spec == "sqlite" or spec.startswith("sqlite:///"):
+        path = spec[len("sqlite:///"):] if spec != "sqlite" else Path(data_root) / ".chat_store.sqlite"
+        return SQLiteStore(path, **kwargs)
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        if not HAS_REDIS:
+            raise RuntimeError("CHAT_STORE is a Redis URL but the redis package is not installed (pip install redis)")
+        return RedisStore(redis.Redis.from_url(spec), **kwargs)
+    raise ValueError(f"Unknown CHAT_STORE: {spec}")